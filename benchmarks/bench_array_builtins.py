@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+배열 내장 함수 벤치마크
+MiniLang 반복문으로 구현한 정렬/탐색/합계/뒤집기와 내장 함수를 비교합니다.
+
+실행: python benchmarks/bench_array_builtins.py
+"""
+
+from benchutil import run_source, report
+
+
+SETUP = '''
+let data = []
+let seed = 12345
+for i in range(N) {
+    seed = (seed * 1103515245 + 12345) % 2147483648
+    push(data, seed % 100000)
+}
+'''
+
+CASES = [
+    ("sort", '''
+func bubbleSort(arr) {
+    let n = len(arr)
+    for let i = 0; i < n - 1; i = i + 1 {
+        for let j = 0; j < n - i - 1; j = j + 1 {
+            if arr[j] > arr[j + 1] {
+                let temp = arr[j]
+                arr[j] = arr[j + 1]
+                arr[j + 1] = temp
+            }
+        }
+    }
+    return arr
+}
+bubbleSort(data)
+''', 'sort(data)'),
+    ("sort (comparator)", '''
+func insertionSort(arr) {
+    for let i = 1; i < len(arr); i = i + 1 {
+        let key = arr[i]
+        let j = i - 1
+        while j >= 0 and arr[j] < key {
+            arr[j + 1] = arr[j]
+            j = j - 1
+        }
+        arr[j + 1] = key
+    }
+    return arr
+}
+insertionSort(data)
+''', '''
+func desc(a, b) {
+    return b - a
+}
+sort(data, desc)
+'''),
+    ("index_of", '''
+func indexOf(arr, value) {
+    for let i = 0; i < len(arr); i = i + 1 {
+        if arr[i] == value {
+            return i
+        }
+    }
+    return -1
+}
+for k in range(20) {
+    indexOf(data, -1)
+}
+''', '''
+for k in range(20) {
+    index_of(data, -1)
+}
+'''),
+    ("sum", '''
+let total = 0
+for k in range(20) {
+    for x in data {
+        total += x
+    }
+}
+''', '''
+let total = 0
+for k in range(20) {
+    total += sum(data)
+}
+'''),
+    ("reverse", '''
+func reverseArray(arr) {
+    let result = []
+    let i = len(arr) - 1
+    while i >= 0 {
+        push(result, arr[i])
+        i = i - 1
+    }
+    return result
+}
+for k in range(20) {
+    data = reverseArray(data)
+}
+''', '''
+for k in range(20) {
+    reverse(data)
+}
+'''),
+]
+
+
+def main():
+    size = 1000
+    print(f"배열 크기 {size}: MiniLang 구현 vs 내장 함수")
+    setup = SETUP.replace('N', str(size))
+    base, _ = run_source(setup)
+    for name, minilang, native in CASES:
+        slow, _ = run_source(setup + minilang)
+        fast, _ = run_source(setup + native)
+        report(f"{name} (MiniLang)", slow - base)
+        report(f"{name} (builtin)", max(fast - base, 1e-6), slow - base)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+번들 시작 시간 벤치마크
+여러 모듈을 import하는 큰 프로그램을 소스에서 시작할 때(어휘/구문 분석 포함)와
+미리 만든 번들(.mlb)에서 시작할 때의 시간을 비교합니다.
+
+실행: python benchmarks/bench_bundle.py [모듈 수]   (기본 64)
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from benchutil import report
+from bench_modules import FUNCTIONS_PER_MODULE, write_modules
+
+import modules
+from bundle import write_bundle, load_bundle
+from lexer import tokenize
+from parser import parse
+from interpreter import Interpreter
+
+
+def start_from_source(main: str) -> float:
+    modules.MODULE_CACHE.clear()
+    start = time.perf_counter()
+    with open(main, 'r', encoding='utf-8') as f:
+        program = parse(tokenize(f.read()))
+    interpreter = Interpreter(echo=False)
+    interpreter.script_path = main
+    interpreter.execute(program)
+    return time.perf_counter() - start
+
+
+def start_from_bundle(path: str) -> float:
+    modules.MODULE_CACHE.clear()
+    start = time.perf_counter()
+    entry, program = load_bundle(path)
+    interpreter = Interpreter(echo=False)
+    interpreter.script_path = entry
+    interpreter.execute(program)
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    with tempfile.TemporaryDirectory() as directory:
+        main_path = write_modules(directory, count)
+        bundle_path = os.path.join(directory, "app.mlb")
+        write_bundle(bundle_path, main_path)
+        source_size = sum(
+            os.path.getsize(os.path.join(directory, name))
+            for name in os.listdir(directory) if name.endswith('.ml')
+        )
+        print(f"모듈 {count}개 x 함수 {FUNCTIONS_PER_MODULE}개 "
+              f"(소스 {source_size // 1024} KB, 번들 {os.path.getsize(bundle_path) // 1024} KB)")
+
+        source = min(start_from_source(main_path) for _ in range(3))
+        bundled = min(start_from_bundle(bundle_path) for _ in range(3))
+
+    report("startup (sources)", source)
+    report("startup (bundle)", bundled, source)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+제너레이터와 협력적 작업 벤치마크
+1) 짝수의 제곱 합을 중간 배열을 만들어 계산할 때와 제너레이터 파이프라인으로 계산할 때의
+   실행 시간과 최대 메모리를 비교 (제너레이터 본문은 반복 엔진으로 실행되므로 더 느리지만,
+   중간 배열을 만들지 않음)
+2) 두 작업이 채널로 값을 주고받는 핑퐁의 작업 전환 시간
+3) 채널에서 멈춘 작업 N개를 만드는 시간과 작업 하나가 쓰는 메모리
+
+실행: python benchmarks/bench_generators.py [원소 수]   (기본 200000)
+"""
+
+import gc
+import sys
+import tracemalloc
+
+from benchutil import report, run_source
+
+
+ARRAYS = '''
+func evens(values) {
+    let out = []
+    for v in values { if v %% 2 == 0 { push(out, v) } }
+    return out
+}
+func squares(values) {
+    let out = []
+    for v in values { push(out, v * v) }
+    return out
+}
+let total = 0
+for v in squares(evens(range(%(n)d))) { total += v }
+'''
+
+GENERATORS = '''
+func evens(values) {
+    for v in values { if v %% 2 == 0 { yield v } }
+}
+func squares(values) {
+    for v in values { yield v * v }
+}
+let total = 0
+for v in squares(evens(range(%(n)d))) { total += v }
+'''
+
+PING_PONG = '''
+let ping = channel()
+let pong = channel()
+func player(inbox, outbox, rounds) {
+    for (let i = 0; i < rounds; i += 1) { send(outbox, recv(inbox) + 1) }
+}
+spawn(player, ping, pong, %(n)d)
+spawn(player, pong, ping, %(n)d)
+send(ping, 0)
+'''
+
+PARKED = '''
+let gate = channel()
+func waiter(i) { return recv(gate) + i }
+for (let i = 0; i < %(n)d; i += 1) { spawn(waiter, i) }
+'''
+
+
+def peak_memory(source: str) -> int:
+    """실행 중 최대 메모리 (바이트, tracemalloc)"""
+    gc.collect()
+    tracemalloc.start()
+    run_source(source)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    print(f"원소 {n}개")
+    arrays, first = run_source(ARRAYS % {'n': n})
+    pipeline, second = run_source(GENERATORS % {'n': n})
+    assert first.global_env.get('total') == second.global_env.get('total')
+    report("intermediate arrays", arrays)
+    report("generator pipeline", pipeline, arrays)
+    for label, source in (("intermediate arrays", ARRAYS), ("generator pipeline", GENERATORS)):
+        print(f"  {label + ' peak memory':<40} {peak_memory(source % {'n': n}) / 1024:10.1f} KB")
+
+    rounds = n // 4
+    elapsed, interpreter = run_source(PING_PONG % {'n': rounds})
+    switches = interpreter.scheduler.switches
+    report(f"ping-pong ({switches} task switches)", elapsed)
+    print(f"  {'per switch':<40} {elapsed / switches * 1e6:10.2f} us")
+
+    tasks = n // 10
+    gc.collect()
+    tracemalloc.start()
+    elapsed, interpreter = run_source(PARKED % {'n': tasks})
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    report(f"spawn and park {tasks} tasks (tracemalloc on)", elapsed)
+    print(f"  {'memory per parked task':<40} {used / tasks / 1024:10.2f} KB")
+
+
+if __name__ == "__main__":
+    main()
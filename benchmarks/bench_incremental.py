@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+증분 분석 벤치마크
+함수 선언으로 이루어진 큰 파일에서 한 글자씩 입력/삭제하면서, 매 편집마다
+전체를 다시 어휘/구문 분석하는 경우와 IncrementalDocument로 영향받는 선언만 다시 분석하는 경우를 비교합니다.
+
+실행: python benchmarks/bench_incremental.py [줄 수]   (기본 20000)
+"""
+
+import random
+import sys
+import time
+
+from benchutil import report
+
+from lexer import tokenize
+from parser import Parser
+from incremental import IncrementalDocument
+
+
+EDITS = 200
+
+FUNCTION = """func f{i}(a, b) {{
+    let total = 0
+    for (let k = 0; k < a; k += 1) {{
+        total += k * b + {i}
+    }}
+    if total > 100 {{
+        return total - a
+    }}
+    return total
+}}
+
+"""
+
+
+def make_source(lines: int) -> str:
+    per_function = FUNCTION.count("\n")
+    return "".join(FUNCTION.format(i=i) for i in range(lines // per_function))
+
+
+def make_edits(source: str):
+    """(오프셋, 삭제 길이, 삽입 문자열) 목록: 식별자 뒤에 한 글자 입력 후 삭제를 반복"""
+    rng = random.Random(41)
+    edits = []
+    for _ in range(EDITS // 2):
+        offset = source.find("total +=", rng.randrange(len(source) - 100)) + len("total")
+        edits.append((offset, 0, "x"))
+        edits.append((offset, 1, ""))
+    return edits
+
+
+def full_reparse(text: str):
+    parser = Parser(tokenize(text))
+    parser.parse()
+    return parser.errors
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    source = make_source(lines)
+    edits = make_edits(source)
+    print(f"{source.count(chr(10))}줄 파일에서 한 글자 편집 {len(edits)}번")
+
+    text = source
+    start = time.perf_counter()
+    for offset, deleted, inserted in edits[:20]:
+        text = text[:offset] + inserted + text[offset + deleted:]
+        full_reparse(text)
+    full = (time.perf_counter() - start) / 20
+
+    doc = IncrementalDocument(source)
+    start = time.perf_counter()
+    for offset, deleted, inserted in edits:
+        doc.edit(offset, deleted, inserted)
+        doc.errors
+    incremental = (time.perf_counter() - start) / len(edits)
+
+    if doc.program() != Parser(tokenize(doc.text)).parse():
+        raise SystemExit("incremental result differs from full parse")
+
+    report("full re-lex + re-parse (per edit)", full)
+    report("incremental (per edit)", incremental, full)
+    print(f"  마지막 편집에서 다시 분석: {doc.relexed_chars}자, 선언 {doc.reparsed_declarations}개")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+언어 서버 응답 시간 벤치마크
+2만 줄 파일을 열어 둔 언어 서버에 한 글자 편집(didChange) 직후 정의로 이동과 호버를 요청하는 데
+걸리는 시간을, 요청마다 문서 전체를 어휘/구문 분석하는 경우와 비교합니다 (진단 스레드 제외).
+
+실행: python benchmarks/bench_lsp.py [줄 수]   (기본 20000)
+"""
+
+import io
+import sys
+import time
+
+from benchutil import report
+
+from lexer import tokenize
+from parser import Parser
+from lsp import LanguageServer
+from bench_incremental import make_source
+
+
+EDITS = 100
+URI = 'file:///bench/large.ml'
+
+
+def request(server: LanguageServer, method: str, params: dict):
+    server.handle({'jsonrpc': '2.0', 'id': 1, 'method': method, 'params': params})
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    source = make_source(lines)
+    line_count = source.count("\n")
+    print(f"{line_count}줄 파일: 편집 + 정의로 이동 + 호버 {EDITS}번")
+
+    server = LanguageServer(io.BytesIO(), io.BytesIO())
+    server.handle({'jsonrpc': '2.0', 'method': 'textDocument/didOpen', 'params': {
+        'textDocument': {'uri': URI, 'languageId': 'minilang', 'version': 1, 'text': source}
+    }})
+
+    # 파일 중간쯤의 "total += ..." 줄에서 "total" 뒤에 x를 입력했다 지우기를 반복
+    target = line_count // 2 // 11 * 11 + 3
+    cursor = {'line': target, 'character': 8}
+    start = time.perf_counter()
+    for version in range(EDITS):
+        text = "x" if version % 2 == 0 else ""
+        end = 13 if version % 2 == 0 else 14
+        server.handle({'jsonrpc': '2.0', 'method': 'textDocument/didChange', 'params': {
+            'textDocument': {'uri': URI, 'version': version + 2},
+            'contentChanges': [{'range': {'start': {'line': target, 'character': 13},
+                                          'end': {'line': target, 'character': end}}, 'text': text}],
+        }})
+        position = {'textDocument': {'uri': URI}, 'position': cursor}
+        request(server, 'textDocument/definition', position)
+        request(server, 'textDocument/hover', position)
+    server_time = (time.perf_counter() - start) / EDITS
+
+    # 비교: 요청마다 전체 문서를 다시 분석
+    start = time.perf_counter()
+    for _ in range(5):
+        Parser(tokenize(source)).parse()
+    full = (time.perf_counter() - start) / 5
+
+    report("full re-lex + re-parse (per edit)", full)
+    report("language server (per edit + 2 requests)", server_time, full)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+행렬 곱셈 벤치마크
+중첩 배열과 삼중 반복문으로 구현한 MiniLang 행렬 곱셈과 matmul 내장 함수를 비교합니다.
+
+실행: python benchmarks/bench_matrix.py [크기]   (기본 200)
+"""
+
+import sys
+
+from benchutil import run_source, report
+
+
+SETUP = '''
+let n = N
+let a = []
+let b = []
+let ma = matrix(n, n)
+let mb = matrix(n, n)
+for i in range(n) {
+    let ra = []
+    let rb = []
+    for j in range(n) {
+        push(ra, (i + j) % 7)
+        push(rb, (i * j) % 5)
+        ma[i][j] = (i + j) % 7
+        mb[i][j] = (i * j) % 5
+    }
+    push(a, ra)
+    push(b, rb)
+}
+'''
+
+MINILANG = '''
+let c = []
+for i in range(n) {
+    let row = []
+    for j in range(n) {
+        let total = 0
+        for k in range(n) {
+            total += a[i][k] * b[k][j]
+        }
+        push(row, total)
+    }
+    push(c, row)
+}
+'''
+
+# 내장 함수는 설정 시간의 오차보다 빠르므로 여러 번 반복해 평균을 냄
+REPEAT = 20
+NATIVE = '''
+let c = null
+for r in range(REPEAT) {
+    c = matmul(ma, mb)
+}
+'''
+
+
+def main():
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    print(f"{size}x{size} 행렬 곱셈: MiniLang 반복문 vs matmul")
+    setup = SETUP.replace('N', str(size))
+    base, _ = run_source(setup)
+    slow, interp_slow = run_source(setup + MINILANG)
+    fast, interp_fast = run_source(setup + NATIVE.replace('REPEAT', str(REPEAT)))
+    fast = max((fast - base) / REPEAT, 1e-6)
+
+    expected = interp_slow.global_env.get('c')
+    result = interp_fast.global_env.get('c')
+    if [list(r) for r in result] != expected:
+        raise SystemExit("결과 불일치")
+
+    report("matmul (MiniLang)", slow - base)
+    report("matmul (builtin)", fast, slow - base)
+
+
+if __name__ == "__main__":
+    main()
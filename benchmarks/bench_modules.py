@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+모듈 캐시 벤치마크
+여러 모듈을 import하는 프로그램의 import 시간을 비교합니다.
+  - 첫 import (순차 파싱)
+  - 첫 import (의존 그래프 병렬 파싱)
+  - 캐시된 모듈 재사용 (다른 인터프리터에서 다시 import)
+
+실행: python benchmarks/bench_modules.py [모듈 수]   (기본 64)
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from benchutil import report
+
+import modules
+from lexer import tokenize
+from parser import parse
+from interpreter import Interpreter
+
+
+FUNCTIONS_PER_MODULE = 150
+
+
+def write_modules(directory: str, count: int) -> str:
+    """모듈 count개와 그것들을 모두 import하는 main.ml을 만들고 main.ml 경로를 반환"""
+    for m in range(count):
+        lines = []
+        for f in range(FUNCTIONS_PER_MODULE):
+            lines.append(f"func m{m}_f{f}(x) {{")
+            lines.append(f"    let y = x * {f} + {m}")
+            lines.append("    if y % 2 == 0 { return y / 2 } else { return 3 * y + 1 }")
+            lines.append("}")
+        with open(os.path.join(directory, f"mod{m}.ml"), 'w', encoding='utf-8') as out:
+            out.write("\n".join(lines) + "\n")
+    main = os.path.join(directory, "main.ml")
+    with open(main, 'w', encoding='utf-8') as out:
+        out.write("".join(f'import "mod{m}.ml"\n' for m in range(count)))
+        out.write(f"print(m{count - 1}_f1(3))\n")
+    return main
+
+
+def run_main(main: str) -> float:
+    with open(main, 'r', encoding='utf-8') as f:
+        program = parse(tokenize(f.read()))
+    interpreter = Interpreter(echo=False)
+    interpreter.script_path = main
+    start = time.perf_counter()
+    interpreter.execute(program)
+    return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    print(f"모듈 {count}개 x 함수 {FUNCTIONS_PER_MODULE}개 import")
+    with tempfile.TemporaryDirectory() as directory:
+        main_path = write_modules(directory, count)
+
+        threshold = modules.PARALLEL_PARSE_THRESHOLD
+        modules.PARALLEL_PARSE_THRESHOLD = count + 1
+        modules.MODULE_CACHE.clear()
+        serial = run_main(main_path)
+        modules.PARALLEL_PARSE_THRESHOLD = threshold
+
+        modules.MODULE_CACHE.clear()
+        parallel = run_main(main_path)
+        cached = run_main(main_path)
+
+    report("first import (serial parse)", serial)
+    report("first import (parallel parse)", parallel, serial)
+    report("cached import", cached, serial)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+파서 처리량 벤치마크
+연산자와 리터럴이 많은 표현식 위주의 코드를 생성해 구문 분석 속도를 측정합니다 (어휘 분석 제외).
+
+실행: python benchmarks/bench_parser.py [줄 수]   (기본 20000)
+"""
+
+import random
+import sys
+import time
+
+from benchutil import report
+
+from lexer import tokenize
+from parser import Parser
+
+
+TEMPLATES = [
+    "let v{i} = {a} + {b} * ({c} - {a}) / 7 % 3",
+    "v{j} = -{a} ** 2 + not {b} == {c} and {a} < {b} or {c} >= 10",
+    "v{j} += f({a}, {b} * 2, [{a}, {b}, {c}])[0] - g({c})",
+    "if {a} <= {b} and ({b} != {c} or !{a}) {{ v{j} = {a} * {b} ** 2 ** 2 }}",
+    "let w{i} = {{\"k\": {a} + 1, \"m\": [{b}, {c} / 2.5]}}",
+    "arr[{a} % 4][{b}:{c}] == arr[1:][:2] and x{i} > -{c} * (({a} + {b}) * ({c} - 1))",
+]
+
+
+def make_source(lines: int) -> str:
+    rng = random.Random(40)
+    out = []
+    for i in range(lines):
+        template = TEMPLATES[i % len(TEMPLATES)]
+        values = {
+            'i': i, 'j': rng.randrange(max(i, 1)),
+            'a': rng.choice(['x', 'y', str(rng.randrange(100)), 'v0']),
+            'b': rng.choice(['z', str(rng.randrange(1000)), '3.5', 'y']),
+            'c': rng.choice(['x', 'n', str(rng.randrange(10))]),
+        }
+        out.append(template.format(**values))
+    return "\n".join(out) + "\n"
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    tokens = tokenize(make_source(lines))
+    print(f"표현식 위주 코드 {lines}줄 ({len(tokens)} 토큰) 구문 분석")
+
+    best = float('inf')
+    for _ in range(3):
+        parser = Parser(tokens)
+        start = time.perf_counter()
+        parser.parse()
+        best = min(best, time.perf_counter() - start)
+        if parser.errors:
+            raise SystemExit(f"parse error: {parser.errors[0]}")
+
+    report("parse", best)
+    print(f"  {len(tokens) / best / 1000:.0f}K tokens/s, {lines / best / 1000:.1f}K lines/s")
+
+
+if __name__ == "__main__":
+    main()
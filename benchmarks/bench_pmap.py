@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+병렬 map 벤치마크
+원소마다 점수를 계산하는(CPU 위주) 함수를 큰 배열에 적용할 때, for-in으로 하나씩 호출하는 순차 실행과
+pmap을 작업자 1, 2, 4, 8개로 실행한 시간을 비교합니다. 작업자 풀을 처음 만드는 비용은 따로 재고,
+표의 시간은 풀이 만들어진 뒤(작업자의 인터프리터가 준비된 상태)의 호출입니다.
+입력은 정수 타입 배열이므로 공유 메모리로 전달됩니다.
+
+속도 향상은 실제 CPU 수를 넘지 못합니다 (결과 첫 줄에 사용할 수 있는 CPU 수를 표시).
+
+실행: python benchmarks/bench_pmap.py [원소 수]   (기본 40000)
+"""
+
+import sys
+import time
+
+from benchutil import report, run_source
+
+from lexer import tokenize
+from parser import parse
+import parallel
+from modules import _available_cpus
+
+
+SETUP = '''
+let weights = float_array(64)
+for (let i = 0; i < 64; i += 1) { weights[i] = i * 0.5 }
+func score(x) {
+    let acc = 0
+    let v = x
+    for (let k = 0; k < 60; k += 1) {
+        v = (v * 1103515245 + 12345) %% 2147483648
+        acc += weights[v %% 64]
+    }
+    return acc
+}
+let data = int_array(range(%(n)d))
+'''
+
+SERIAL = parse(tokenize('let serial = []\nfor x in data { push(serial, score(x)) }\n'))
+PARALLEL = parse(tokenize('let result = pmap(score, data)\n'))
+
+
+def timed(interpreter, program) -> float:
+    start = time.perf_counter()
+    interpreter.execute(program)
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 40000
+    _, interpreter = run_source(SETUP % {'n': n})
+    print(f"원소 {n}개, 사용할 수 있는 CPU {_available_cpus()}개")
+    serial = timed(interpreter, SERIAL)
+    report("serial for-in", serial)
+
+    try:
+        for workers in (1, 2, 4, 8):
+            parallel.configure(workers)
+            startup = timed(interpreter, PARALLEL)
+            warm = min(timed(interpreter, PARALLEL) for _ in range(2))
+            assert interpreter.global_env.get('result') == interpreter.global_env.get('serial')
+            report(f"pmap, {workers} worker(s)", warm, serial)
+            report(f"  first call (starts the pool)", startup)
+    finally:
+        parallel.shutdown()
+
+
+if __name__ == "__main__":
+    main()
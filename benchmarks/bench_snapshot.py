@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+스냅숏 시작 시간 벤치마크
+최상위에서 조회 테이블(소수 체, 제곱 테이블, 단어 -> 번호 맵)을 만드는 초기화 스크립트를 매번
+실행할 때와, 초기화 후 저장한 스냅숏에서 복원할 때의 시작 시간을 비교합니다.
+복원은 요청 하나를 처리하는 데 필요한 테이블만 읽는 경우와 모든 테이블을 읽는 경우를 따로 잽니다.
+
+실행: python benchmarks/bench_snapshot.py [테이블 크기]   (기본 200000)
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from benchutil import report, run_source
+
+from lexer import tokenize
+from parser import parse
+from interpreter import Interpreter
+
+
+INIT = '''
+let sieve = []
+for (let i = 0; i <= %(n)d; i += 1) { push(sieve, true) }
+sieve[0] = false
+sieve[1] = false
+for (let p = 2; p * p <= %(n)d; p += 1) {
+    if sieve[p] {
+        for (let m = p * p; m <= %(n)d; m += p) { sieve[m] = false }
+    }
+}
+let squares = []
+for (let i = 0; i < %(n)d; i += 1) { push(squares, i * i) }
+let words = {}
+for (let i = 0; i < %(n)d / 10; i += 1) { words["w" + str(i)] = i }
+func isPrime(k) { return sieve[k] }
+'''
+
+REQUEST = parse(tokenize('let answer = isPrime(97)\n'))
+ALL_TABLES = parse(tokenize('let answer = [isPrime(97), squares[12], words["w7"]]\n'))
+
+
+def restore(path: str, request) -> float:
+    start = time.perf_counter()
+    interpreter = Interpreter(echo=False)
+    interpreter.restore(path)
+    interpreter.execute(request)
+    return time.perf_counter() - start
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    init_time, interpreter = run_source(INIT % {'n': n})
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'init.snap')
+        start = time.perf_counter()
+        interpreter.snapshot(path)
+        write_time = time.perf_counter() - start
+        print(f"테이블 크기 {n} (스냅숏 {os.path.getsize(path) // 1024} KB)")
+
+        one = min(restore(path, REQUEST) for _ in range(3))
+        every = min(restore(path, ALL_TABLES) for _ in range(3))
+
+    report("init script", init_time)
+    report("write snapshot", write_time)
+    report("restore (one table used)", one, init_time)
+    report("restore (all tables used)", every, init_time)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+문자열 빌더 벤치마크
+반복문에서 s += line으로 문자열을 만드는 방식(O(n²))과
+builder()/+= 로 만드는 방식(O(n))을 비교하고, 빌더로 10MB 문자열을 만듭니다.
+
+실행: python benchmarks/bench_string_builder.py
+"""
+
+from benchutil import run_source, report
+
+
+LINE_SOURCE = 'let line = "0123456789" * 10\n'  # 100자
+
+NAIVE = LINE_SOURCE + '''
+let s = ""
+for i in range(N) {
+    s += line
+}
+let n = len(s)
+'''
+
+BUILDER = LINE_SOURCE + '''
+let sb = builder()
+for i in range(N) {
+    sb += line
+}
+let s = build(sb)
+let n = len(s)
+'''
+
+
+def main():
+    print("문자열 연결 (100자 x N)")
+    for megabytes in (1, 2, 4):
+        count = megabytes * 10000
+        naive, _ = run_source(NAIVE.replace('N', str(count)))
+        fast, _ = run_source(BUILDER.replace('N', str(count)))
+        report(f"{megabytes}MB  s += line", naive)
+        report(f"{megabytes}MB  builder", fast, naive)
+
+    seconds, interpreter = run_source(BUILDER.replace('N', '100000'))
+    size = interpreter.global_env.get('n')
+    report(f"10MB builder ({size} chars)", seconds)
+
+
+if __name__ == "__main__":
+    main()
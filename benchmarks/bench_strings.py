@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+문자열 라이브러리 벤치마크
+CSV 텍스트를 줄/필드 단위로 나누어 숫자 열을 합산하는 작업을,
+문자 단위 반복문 구현과 split 내장 함수 구현으로 비교합니다.
+
+실행: python benchmarks/bench_strings.py [줄 수]   (기본 100000)
+"""
+
+import sys
+
+from benchutil import run_source, report
+
+
+# 문자 하나씩 인덱싱하며 필드를 `+`로 이어 붙이는 구현
+CHAR_LOOP = '''
+let total = 0
+let rows = 0
+let field = ""
+let column = 0
+let n = len(text)
+for let i = 0; i < n; i = i + 1 {
+    let ch = text[i]
+    if ch == "," or ch == "\\n" {
+        if column == 2 {
+            total += int(field)
+        }
+        field = ""
+        column = column + 1
+        if ch == "\\n" {
+            rows = rows + 1
+            column = 0
+        }
+    } else {
+        field = field + ch
+    }
+}
+'''
+
+NATIVE = '''
+let total = 0
+let rows = 0
+for line in split(trim(text), "\\n") {
+    let fields = split(line, ",")
+    total += int(fields[2])
+    rows = rows + 1
+}
+'''
+
+
+def make_csv(lines: int) -> str:
+    cities = ["seoul", "busan", "incheon", "daegu", "daejeon"]
+    return "".join(
+        f"user{i},{cities[i % len(cities)]},{(i * 37) % 1000},{i % 3 == 0}\n"
+        for i in range(lines)
+    )
+
+
+def main():
+    lines = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    text = make_csv(lines)
+    print(f"CSV {lines}줄 ({len(text) // 1024} KB): 문자 단위 반복문 vs 문자열 내장 함수")
+
+    slow, interp_slow = run_source(CHAR_LOOP, {'text': text})
+    fast, interp_fast = run_source(NATIVE, {'text': text})
+
+    expected = sum((i * 37) % 1000 for i in range(lines))
+    for interp in (interp_slow, interp_fast):
+        env = interp.global_env
+        if env.get('total') != expected or env.get('rows') != lines:
+            raise SystemExit("결과 불일치")
+
+    report("parse CSV (character loop)", slow)
+    report("parse CSV (split)", fast, slow)
+
+
+if __name__ == "__main__":
+    main()
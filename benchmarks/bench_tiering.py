@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+단계별 실행 벤치마크
+자주 호출되는 작은 함수가 있는 프로그램을 트리 순회만으로 실행한 경우와 단계별 실행
+(임계값을 넘은 함수를 백그라운드에서 컴파일)으로 실행한 경우를 비교합니다.
+단계별 실행 시간에는 데워지는 구간과 컴파일 대기 시간이 모두 포함됩니다.
+
+실행: python benchmarks/bench_tiering.py
+"""
+
+from benchutil import report, run_source
+
+
+PROGRAMS = {
+    "fib(22)": """
+func fib(n) {
+    if n < 2 { return n }
+    return fib(n - 1) + fib(n - 2)
+}
+print(fib(22))
+""",
+    "hot helper in loop (200k calls)": """
+func clamp(x, lo, hi) {
+    if x < lo { return lo }
+    if x > hi { return hi }
+    return x
+}
+let total = 0
+for (let i = 0; i < 200000; i += 1) {
+    total += clamp(i % 100, 10, 90)
+}
+print(total)
+""",
+    "loop-heavy function (20 calls)": """
+func collatzSteps(limit) {
+    let best = 0
+    for (let n = 1; n < limit; n += 1) {
+        let x = n
+        let steps = 0
+        while x != 1 {
+            if x % 2 == 0 { x = x / 2 } else { x = 3 * x + 1 }
+            steps += 1
+        }
+        if steps > best { best = steps }
+    }
+    return best
+}
+let r = 0
+for (let k = 0; k < 20; k += 1) { r = collatzSteps(300) }
+print(r)
+""",
+    "polymorphic helper (deoptimized)": """
+func join(a, b) { return a + b }
+let n = 0
+for (let i = 0; i < 50000; i += 1) { n = join(n, 1) }
+let s = ""
+for (let i = 0; i < 50000; i += 1) { s = join(s, "x") }
+print(n, len(s))
+""",
+}
+
+
+def main():
+    for label, source in PROGRAMS.items():
+        print(label)
+        interpreted, interpreter = run_source(source, tiering=False)
+        tiered, tiered_interpreter = run_source(source)
+        assert interpreter.output == tiered_interpreter.output, label
+        report("tree-walking only", interpreted)
+        report("tiered (hot functions compiled)", tiered, interpreted)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+파이썬 변환 실행 벤치마크
+재귀 호출, 숫자 반복문, 배열 인덱싱, 문자열 연결 프로그램을 트리 순회 인터프리터와
+파이썬으로 변환해 실행한 경우(변환/컴파일 시간 제외)로 비교합니다.
+
+실행: python benchmarks/bench_transpiler.py
+"""
+
+import time
+from typing import Tuple
+
+from benchutil import report, run_source
+
+from lexer import tokenize
+from parser import parse
+from interpreter import Interpreter
+from transpiler import compile_program
+
+
+PROGRAMS = {
+    "fib(22)": """
+func fib(n) {
+    if n < 2 { return n }
+    return fib(n - 1) + fib(n - 2)
+}
+print(fib(22))
+""",
+    "numeric loop (300k)": """
+let total = 0
+for (let i = 0; i < 300000; i += 1) {
+    if i % 3 == 0 { total += i * 2 } else { total -= 1 }
+}
+print(total)
+""",
+    "bubble sort (300)": """
+let arr = []
+for (let i = 0; i < 300; i += 1) { push(arr, (i * 7919) % 300) }
+let n = len(arr)
+for (let i = 0; i < n; i += 1) {
+    for (let j = 0; j < n - i - 1; j += 1) {
+        if arr[j] > arr[j + 1] {
+            let t = arr[j]
+            arr[j] = arr[j + 1]
+            arr[j + 1] = t
+        }
+    }
+}
+print(arr[0], arr[n - 1])
+""",
+    "string concat (50k)": """
+let s = ""
+for i in range(50000) { s += "x" }
+print(len(s))
+""",
+}
+
+
+def run_transpiled(source: str) -> Tuple[float, Interpreter]:
+    compiled = compile_program(parse(tokenize(source)))
+    interpreter = Interpreter(echo=False)
+    start = time.perf_counter()
+    compiled.run(interpreter)
+    return time.perf_counter() - start, interpreter
+
+
+def main():
+    for label, source in PROGRAMS.items():
+        print(label)
+        interpreted, interpreter = run_source(source, tiering=False)
+        transpiled, compiled_interpreter = run_transpiled(source)
+        assert interpreter.output == compiled_interpreter.output, label
+        report("tree-walking interpreter", interpreted)
+        report("transpiled to Python", transpiled, interpreted)
+
+
+if __name__ == "__main__":
+    main()
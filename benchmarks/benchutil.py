@@ -0,0 +1,42 @@
+"""
+벤치마크 공용 도구
+MiniLang 소스를 파싱/실행하고 실행 시간을 측정합니다.
+"""
+
+import os
+import sys
+import time
+from typing import Any, Dict, Optional, Tuple
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from lexer import tokenize
+from parser import Parser
+from interpreter import Interpreter
+
+
+def run_source(source: str, variables: Optional[Dict[str, Any]] = None,
+               tiering: bool = True) -> Tuple[float, Interpreter]:
+    """소스를 실행하고 (실행 시간(초), 인터프리터)를 반환 (파싱 시간 제외)
+    
+    variables가 주어지면 실행 전에 전역 변수로 정의합니다 (큰 입력 데이터 전달용).
+    tiering이 False이면 단계별 실행(자주 쓰는 함수 컴파일) 없이 트리 순회만 합니다.
+    """
+    parser = Parser(tokenize(source))
+    program = parser.parse()
+    if parser.errors:
+        raise parser.errors[0]
+    interpreter = Interpreter(echo=False, tiering=tiering)
+    for name, value in (variables or {}).items():
+        interpreter.global_env.define(name, value)
+    start = time.perf_counter()
+    interpreter.execute(program)
+    return time.perf_counter() - start, interpreter
+
+
+def report(label: str, seconds: float, baseline: float = 0.0):
+    """결과 한 줄 출력 (baseline이 주어지면 배속도 표시)"""
+    line = f"  {label:<40} {seconds * 1000:10.1f} ms"
+    if baseline:
+        line += f"   x{baseline / seconds:.1f}"
+    print(line)
@@ -3,8 +3,8 @@ MiniLang AST (Abstract Syntax Tree) Nodes
 추상 구문 트리 노드 클래스들을 정의합니다.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Optional, Any, Union
+from dataclasses import dataclass, field, fields
+from typing import List, Optional, Any, Union, ClassVar, FrozenSet
 from abc import ABC, abstractmethod
 
 
@@ -12,6 +12,10 @@ class ASTNode(ABC):
     """AST 노드 기본 클래스"""
     line: int = 0
     column: int = 0
+    
+    def __reduce__(self):
+        # pickle(번들, 프로세스 간 전달)에서 필드 이름 딕셔너리 대신 위치 인자 튜플로 저장
+        return (self.__class__, tuple(getattr(self, f.name) for f in fields(self)))
 
 
 # ============================================
@@ -109,6 +113,15 @@ class ArrayLiteral(Expression):
     column: int = 0
 
 
+@dataclass
+class MapLiteral(Expression):
+    """맵 리터럴 ({key: value, ...})"""
+    keys: List[Expression]
+    values: List[Expression]
+    line: int = 0
+    column: int = 0
+
+
 @dataclass
 class ArrayAccess(Expression):
     """배열 인덱스 접근"""
@@ -118,6 +131,16 @@ class ArrayAccess(Expression):
     column: int = 0
 
 
+@dataclass
+class SliceAccess(Expression):
+    """슬라이스 접근 (arr[start:stop])"""
+    array: Expression
+    start: Optional[Expression]
+    stop: Optional[Expression]
+    line: int = 0
+    column: int = 0
+
+
 @dataclass
 class ArrayIndexAssignment(Expression):
     """배열 인덱스 대입"""
@@ -172,6 +195,8 @@ class Block(Statement):
     statements: List[Statement]
     line: int = 0
     column: int = 0
+    # 이 스코프에서 만들어지는 클로저가 쓰는 이름 (closures.py가 기록, None은 분석 전)
+    captures: ClassVar[Optional[FrozenSet[str]]] = None
 
 
 @dataclass
@@ -202,6 +227,18 @@ class ForStatement(Statement):
     body: Statement
     line: int = 0
     column: int = 0
+    captures: ClassVar[Optional[FrozenSet[str]]] = None  # Block.captures 참고
+
+
+@dataclass
+class ForInStatement(Statement):
+    """For-in 반복문 (배열, 문자열, range 순회)"""
+    variable: str
+    iterable: Expression
+    body: Statement
+    line: int = 0
+    column: int = 0
+    captures: ClassVar[Optional[FrozenSet[str]]] = None  # Block.captures 참고
 
 
 @dataclass
@@ -212,6 +249,9 @@ class FunctionDeclaration(Statement):
     body: Block
     line: int = 0
     column: int = 0
+    is_generator: bool = False  # 본문(중첩 함수 제외)에 yield가 있으면 제너레이터 함수
+    # 본문이 바깥 스코프에서 찾는 이름 (closures.py가 기록, None은 분석 전)
+    free_names: ClassVar[Optional[FrozenSet[str]]] = None
 
 
 @dataclass
@@ -222,6 +262,14 @@ class ReturnStatement(Statement):
     column: int = 0
 
 
+@dataclass
+class YieldStatement(Statement):
+    """Yield 문 (제너레이터 함수가 값을 하나 내보내고 멈춤)"""
+    value: Optional[Expression]
+    line: int = 0
+    column: int = 0
+
+
 @dataclass
 class BreakStatement(Statement):
     """Break 문"""
@@ -236,6 +284,14 @@ class ContinueStatement(Statement):
     column: int = 0
 
 
+@dataclass
+class ImportStatement(Statement):
+    """Import 문 (모듈의 함수들을 현재 스코프로 불러옴)"""
+    path: str
+    line: int = 0
+    column: int = 0
+
+
 @dataclass
 class PrintStatement(Statement):
     """Print 문 (내장 출력)"""
@@ -254,6 +310,7 @@ class Program(ASTNode):
     statements: List[Statement]
     line: int = 0
     column: int = 0
+    closures_annotated: ClassVar[bool] = False  # closures.annotate 완료 여부
 
 
 # ============================================
@@ -323,9 +380,18 @@ class ASTPrinter(ASTVisitor):
         elements = ", ".join(self.visit(elem) for elem in node.elements)
         return f"Array([{elements}])"
     
+    def visit_MapLiteral(self, node: MapLiteral) -> str:
+        entries = ", ".join(f"{self.visit(k)}: {self.visit(v)}" for k, v in zip(node.keys, node.values))
+        return f"Map({{{entries}}})"
+    
     def visit_ArrayAccess(self, node: ArrayAccess) -> str:
         return f"ArrayAccess({self.visit(node.array)}[{self.visit(node.index)}])"
     
+    def visit_SliceAccess(self, node: SliceAccess) -> str:
+        start = self.visit(node.start) if node.start else ""
+        stop = self.visit(node.stop) if node.stop else ""
+        return f"Slice({self.visit(node.array)}[{start}:{stop}])"
+    
     def visit_ArrayIndexAssignment(self, node: 'ArrayIndexAssignment') -> str:
         return f"ArrayIndexAssign({self.visit(node.array)}[{self.visit(node.index)}] {node.operator} {self.visit(node.value)})"
     
@@ -371,9 +437,17 @@ class ASTPrinter(ASTVisitor):
         self.indent_level -= 1
         return result
     
+    def visit_ForInStatement(self, node: ForInStatement) -> str:
+        result = f"ForIn({node.variable} in {self.visit(node.iterable)}):\n"
+        self.indent_level += 1
+        result += self.indent() + self.visit(node.body)
+        self.indent_level -= 1
+        return result
+    
     def visit_FunctionDeclaration(self, node: FunctionDeclaration) -> str:
         params = ", ".join(node.parameters)
-        result = f"FuncDecl({node.name}({params})):\n"
+        kind = "GeneratorDecl" if node.is_generator else "FuncDecl"
+        result = f"{kind}({node.name}({params})):\n"
         self.indent_level += 1
         result += self.indent() + self.visit(node.body)
         self.indent_level -= 1
@@ -384,12 +458,20 @@ class ASTPrinter(ASTVisitor):
             return f"Return({self.visit(node.value)})"
         return "Return"
     
+    def visit_YieldStatement(self, node: YieldStatement) -> str:
+        if node.value:
+            return f"Yield({self.visit(node.value)})"
+        return "Yield"
+    
     def visit_BreakStatement(self, node: BreakStatement) -> str:
         return "Break"
     
     def visit_ContinueStatement(self, node: ContinueStatement) -> str:
         return "Continue"
     
+    def visit_ImportStatement(self, node: ImportStatement) -> str:
+        return f"Import({node.path!r})"
+    
     def visit_PrintStatement(self, node: PrintStatement) -> str:
         args = ", ".join(self.visit(arg) for arg in node.arguments)
         return f"Print({args})"
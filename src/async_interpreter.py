@@ -0,0 +1,137 @@
+"""
+MiniLang Async Interpreter (비동기 인터프리터)
+asyncio 이벤트 루프에 인터프리터를 임베딩하기 위한 API를 제공합니다.
+
+스크립트는 별도의 스레드 없이 이벤트 루프 위에서 실행됩니다. 최상위 문장들을 반복 실행
+엔진(engine.py)의 프레임 하나로 만들고, run()이 그 프레임을 조금씩 이어서 실행합니다.
+반복문/함수 호출이 yield_interval 회 실행될 때마다 프레임이 멈춰 루프에 제어를 양보하고,
+input()은 프레임을 멈춘 채 루프 쪽에서 비동기 스트림으로 읽습니다. print는 출력을 모아 두었다가
+다음 멈춤 지점에서 비동기 스트림으로 씁니다.
+따라서 하나의 이벤트 루프에서 여러(수천 개의) 스크립트를 공정하게 번갈아 실행할 수 있고,
+run() 태스크를 취소하면 해당 스크립트만 다음 멈춤 지점에서 중단됩니다.
+
+제한: 제너레이터 본문, 작업(spawn), 내장 함수의 콜백, import한 모듈의 최상위 코드는 파이썬
+호출 안에서 실행되므로 그 안에서는 멈출 수 없습니다. 그곳의 양보는 다음 멈춤 지점으로 미뤄지고,
+input()은 에러입니다. stdin_lines의 스트림은 루프를 기다리지 않고는 읽을 수 없으므로 지원하지
+않습니다 (input()을 쓰세요).
+"""
+
+import asyncio
+from typing import Any, List, Optional
+
+from ast_nodes import Program
+from closures import annotate as annotate_closures
+from engine import Pause
+from interpreter import Interpreter
+from runtime import RuntimeError, Stream
+
+
+# step_hook이 반환하는 양보 표시 (상태가 없으므로 공유)
+YIELD = Pause()
+
+
+class AsyncInterpreter(Interpreter):
+    """asyncio용 인터프리터"""
+
+    def __init__(self, stdin: Optional[asyncio.StreamReader] = None,
+                 stdout: Optional[asyncio.StreamWriter] = None,
+                 yield_interval: int = 1000):
+        super().__init__()
+        self.stdin = stdin
+        self.stdout = stdout
+        self.yield_interval = yield_interval
+        self.step_hook = self._on_step
+        self._steps = 0
+        self._pending: List[str] = []  # 아직 stdout에 쓰지 않은 출력
+
+    async def run(self, program: Program) -> Any:
+        """프로그램을 실행하고 마지막 문장의 값을 반환"""
+        annotate_closures(program)
+        self.programs[id(program)] = program
+        self._steps = 0
+        engine = self.engine
+        frame = engine.program_frame(program, Pause)
+        try:
+            reply = None
+            while True:
+                marker = engine.resume(frame, reply)
+                if not frame.stack:
+                    result = marker
+                    break
+                reply = await self._serve(marker)
+            # 남은 작업은 하나씩 멈출 때까지 실행하고, 그 사이마다 루프에 양보
+            while self.scheduler.step():
+                await self._serve(YIELD)
+            await self._flush()
+            return result
+        except Exception:
+            await self._flush()  # 에러가 나기 전까지의 출력
+            raise
+        finally:
+            # 취소되었으면 멈춘 프레임의 계속을 닫음 (끝난 프레임이면 아무 일도 없음)
+            engine.discard(frame)
+            self.writers.close_all()
+            self.close_streams()
+
+    async def _serve(self, pause: Pause) -> Any:
+        """멈춘 프레임의 요청 처리 (출력을 쓰고, 양보하거나 입력한 줄을 반환)"""
+        await self._flush()
+        if pause.prompt is not None:
+            return await self._read_line_async(pause.prompt)
+        if self._steps >= self.yield_interval:
+            self._steps = 0
+            await asyncio.sleep(0)
+        return None
+
+    # =====================================================
+    # 루프 쪽 I/O
+    # =====================================================
+
+    async def _flush(self):
+        """모아 둔 출력을 stdout에 씀"""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        if self.stdout is None:
+            for text in pending:
+                print(text)
+            return
+        self.stdout.write(''.join(text + '\n' for text in pending).encode('utf-8'))
+        await self.stdout.drain()
+
+    async def _read_line_async(self, prompt: str) -> str:
+        if prompt and self.stdout is not None:
+            self.stdout.write(prompt.encode('utf-8'))
+            await self.stdout.drain()
+        if self.stdin is None:
+            return ""
+        line = await self.stdin.readline()
+        return line.decode('utf-8').rstrip('\r\n')
+
+    # =====================================================
+    # 인터프리터 쪽 (프레임 실행 중에 호출됨)
+    # =====================================================
+
+    def _on_step(self) -> Optional[Pause]:
+        self._steps += 1
+        if self._steps >= self.yield_interval or self._pending:
+            return YIELD
+        return None
+
+    def _write(self, text: str):
+        self.output.append(text)
+        self._pending.append(text)
+
+    def _read_line(self, prompt: str) -> str:
+        # 호스트 프레임 밖(제너레이터, 작업, 콜백)에서의 input(): 루프를 기다릴 수 없음
+        if self.stdin is None:
+            return ""
+        raise RuntimeError("input() cannot wait for the event loop inside a generator, task or callback")
+
+    def _stdin_lines(self) -> Stream:
+        raise RuntimeError("stdin_lines is not supported by AsyncInterpreter (use input())")
+
+
+async def interpret_async(program: Program, **kwargs: Any) -> Any:
+    """편의 함수: 프로그램을 비동기로 실행"""
+    return await AsyncInterpreter(**kwargs).run(program)
@@ -0,0 +1,149 @@
+"""
+MiniLang Bundle (번들)
+스크립트와 그 스크립트가 import하는 모든 모듈의 파싱된 AST를 하나의 파일(.mlb)로 묶습니다.
+배포한 곳에서는 번들을 한 번에 읽어(큰 파일은 mmap) 어휘/구문 분석 없이 바로 실행합니다.
+
+파일 형식:
+    MAGIC (8바이트) | 형식 버전 (u16) | 페이로드 해시 (sha256, 32바이트) | pickle 페이로드
+
+페이로드는 {'entry': 진입 스크립트 경로, 'modules': {경로: (소스 sha256, Program)}}이며,
+경로는 진입 스크립트의 디렉토리 기준 상대 경로입니다. 실행할 때는 번들 파일의 디렉토리를
+기준으로 경로를 해석하므로, 번들과 같은 위치에 소스가 있으면 해시를 비교해 번들이
+오래되었는지 검사합니다 (소스 없이 번들만 배포한 경우에는 검사하지 않음).
+헤더의 해시는 pickle한 페이로드 바이트의 sha256이며, 복원(pickle.loads)하기 전에 검사합니다.
+
+번들은 pickle을 사용하므로 신뢰할 수 있는 번들만 실행해야 합니다.
+AST 노드 정의가 바뀌면 BUNDLE_VERSION을 올려야 합니다.
+"""
+
+import gc
+import hashlib
+import mmap
+import os
+import pickle
+import struct
+from typing import Dict, List, Tuple
+
+from ast_nodes import Program
+from lexer import tokenize
+from parser import Parser
+from modules import MODULE_CACHE, resolve_path, find_imports
+
+
+MAGIC = b'MLBUNDLE'
+BUNDLE_VERSION = 3
+_HEADER = struct.Struct('<8sH32s')
+
+# 이 크기 이상인 번들은 mmap으로 읽음
+MMAP_THRESHOLD = 1 << 20
+
+
+class BundleError(Exception):
+    """번들 생성/로드 에러"""
+    pass
+
+
+def _hash_source(source: bytes) -> str:
+    return hashlib.sha256(source).hexdigest()
+
+
+def _parse_source(path: str, source: bytes) -> Program:
+    parser = Parser(tokenize(source.decode('utf-8')))
+    program = parser.parse()
+    if parser.errors:
+        raise BundleError(f"Cannot bundle '{path}': {parser.errors[0]}")
+    return program
+
+
+def write_bundle(output_path: str, script_path: str) -> List[str]:
+    """스크립트와 의존 모듈들을 번들로 저장하고, 포함된 모듈의 상대 경로 목록을 반환"""
+    entry = os.path.realpath(script_path)
+    root = os.path.dirname(entry)
+    modules: Dict[str, Tuple[str, Program]] = {}
+
+    pending = [entry]
+    seen = {entry}
+    while pending:
+        path = pending.pop()
+        try:
+            with open(path, 'rb') as f:
+                source = f.read()
+        except OSError as e:
+            raise BundleError(f"Cannot bundle '{path}': {e.strerror}")
+        program = _parse_source(path, source)
+        modules[os.path.relpath(path, root)] = (_hash_source(source), program)
+        for dependency in find_imports(program):
+            dependency = resolve_path(dependency, os.path.dirname(path))
+            if dependency not in seen:
+                seen.add(dependency)
+                pending.append(dependency)
+
+    payload = pickle.dumps(
+        {'entry': os.path.relpath(entry, root), 'modules': modules},
+        protocol=pickle.HIGHEST_PROTOCOL
+    )
+    with open(output_path, 'wb') as f:
+        f.write(_HEADER.pack(MAGIC, BUNDLE_VERSION, hashlib.sha256(payload).digest()))
+        f.write(payload)
+    return sorted(modules)
+
+
+def _read_payload(path: str) -> dict:
+    """번들 파일을 한 번에 읽어 헤더를 검사하고 페이로드를 복원"""
+    try:
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < MMAP_THRESHOLD:
+                data = f.read()
+                return _decode(path, memoryview(data))
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return _decode(path, view)
+    except OSError as e:
+        raise BundleError(f"Cannot read bundle '{path}': {e.strerror}")
+
+
+def _decode(path: str, data: memoryview) -> dict:
+    if len(data) < _HEADER.size:
+        raise BundleError(f"'{path}' is not a MiniLang bundle")
+    magic, version, payload_hash = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise BundleError(f"'{path}' is not a MiniLang bundle")
+    if version != BUNDLE_VERSION:
+        raise BundleError(
+            f"Bundle '{path}' has format version {version}, expected {BUNDLE_VERSION} (rebuild with --bundle)"
+        )
+    body = data[_HEADER.size:]
+    if hashlib.sha256(body).digest() != payload_hash:
+        raise BundleError(f"Corrupted bundle '{path}': payload hash mismatch")
+    # 수많은 AST 노드를 만드는 동안 순환 GC가 반복해서 도는 것을 막음
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return pickle.loads(body)
+    except Exception as e:
+        raise BundleError(f"Corrupted bundle '{path}': {e}")
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def load_bundle(path: str, check_sources: bool = True) -> Tuple[str, Program]:
+    """번들을 로드해 모듈들을 모듈 캐시에 등록하고 (진입 스크립트 경로, 프로그램)을 반환
+
+    check_sources가 참이면 번들 옆에 있는 소스 파일의 해시를 비교해,
+    번들을 만든 뒤 소스가 바뀌었으면 BundleError를 발생시킵니다.
+    """
+    payload = _read_payload(path)
+    root = os.path.dirname(os.path.realpath(path))
+
+    for name, (source_hash, program) in payload['modules'].items():
+        module_path = resolve_path(name, root)
+        if check_sources and os.path.isfile(module_path):
+            with open(module_path, 'rb') as f:
+                if _hash_source(f.read()) != source_hash:
+                    raise BundleError(f"Bundle '{path}' is stale: '{name}' changed since it was bundled")
+        MODULE_CACHE.pin(module_path, program)
+
+    entry = resolve_path(payload['entry'], root)
+    return entry, payload['modules'][payload['entry']][1]
@@ -0,0 +1,107 @@
+"""
+MiniLang Closure Analysis (클로저 변수 분석)
+함수 선언마다 본문이 바깥에서 찾는 이름(자유 변수)을 구하고, 스코프(블록, for, for-in)마다
+그 안에서 만들어지는 클로저가 쓰는 이름(캡처 변수)을 구해 AST 노드에 기록합니다.
+
+인터프리터는 캡처 변수를 스코프의 별도 층(runtime.Cells)에 두고, 함수 값은 스코프 전체 대신
+그 층만 붙잡습니다. 그래서 클로저가 쓰지 않는 큰 배열은 스코프가 끝나면 바로 해제되고,
+자유 변수가 없는 함수(최상위 함수 포함)는 최상위 환경만 참조합니다.
+
+분석은 보수적입니다: 자유 변수에서 빼는 이름은 매개변수와, 함수 본문 최상위에서 처음
+쓰이기 전에 let/func로 선언된 이름뿐입니다. 나머지는 모두 바깥 이름으로 취급합니다.
+"""
+
+from dataclasses import fields
+from typing import Dict, FrozenSet, List, Tuple
+
+from ast_nodes import (
+    ASTNode, Program, Block, ForStatement, ForInStatement, FunctionDeclaration,
+    VariableDeclaration, Identifier, FunctionCall,
+)
+
+
+EMPTY: FrozenSet[str] = frozenset()
+
+# 새 환경을 만드는 노드 (캡처 변수를 기록)
+SCOPE_NODES = (Block, ForStatement, ForInStatement)
+
+
+def child_nodes(node: ASTNode) -> List[ASTNode]:
+    """자식 노드 (함수 선언은 본문 블록 대신 본문의 문장들)"""
+    if isinstance(node, FunctionDeclaration):
+        return list(node.body.statements)
+    children = []
+    for f in fields(node):
+        value = getattr(node, f.name)
+        if isinstance(value, ASTNode):
+            children.append(value)
+        elif isinstance(value, list):
+            children.extend(item for item in value if isinstance(item, ASTNode))
+    return children
+
+
+def _free_names(node: FunctionDeclaration,
+                results: Dict[int, Tuple[FrozenSet[str], FrozenSet[str]]]) -> Tuple[FrozenSet[str], FrozenSet[str]]:
+    """(함수의 자유 변수, 본문에서 만들어지는 클로저가 쓰는 이름)"""
+    local = set(node.parameters)
+    free = set()
+    captured = set()
+    for stmt in node.body.statements:
+        used, closures = results.pop(id(stmt))
+        if isinstance(stmt, FunctionDeclaration):
+            local.add(stmt.name)  # 본문은 선언 뒤에 실행되므로 자기 자신(재귀)은 지역 이름
+        free |= used - local
+        captured |= closures
+        if isinstance(stmt, VariableDeclaration):
+            local.add(stmt.name)  # 초기화 식은 선언 전의 이름을 봄
+    return frozenset(free), frozenset(captured)
+
+
+def annotate(program: Program):
+    """프로그램의 함수 선언에 free_names, 스코프 노드에 captures를 기록 (한 번만)
+
+    스레드마다 같은 Program을 실행할 수 있으므로 모든 노드를 기록한 뒤에 완료 표시를 합니다.
+    결과는 각 노드의 서브트리로만 정해지므로 여러 번 기록해도 같습니다.
+    """
+    if program.closures_annotated:
+        return
+
+    # 노드 id -> (서브트리에서 쓰는 이름, 서브트리에서 만들어지는 클로저가 쓰는 이름)
+    results: Dict[int, Tuple[FrozenSet[str], FrozenSet[str]]] = {}
+    stack: List[Tuple[ASTNode, bool]] = [(program, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if not expanded:
+            stack.append((node, True))
+            stack.extend((child, False) for child in child_nodes(node))
+            continue
+
+        if isinstance(node, FunctionDeclaration):
+            free, captured = _free_names(node, results)
+            node.body.captures = captured
+            node.free_names = free
+            results[id(node)] = (free, free)
+            continue
+
+        used = EMPTY
+        closures = EMPTY
+        for child in child_nodes(node):
+            child_used, child_closures = results.pop(id(child))
+            if child_used:
+                used = used | child_used
+            if child_closures:
+                closures = closures | child_closures
+        if isinstance(node, (Identifier, FunctionCall)):
+            used = used | {node.name}
+        if isinstance(node, SCOPE_NODES):
+            node.captures = closures
+        results[id(node)] = (used, closures)
+
+    program.closures_annotated = True
+
+
+def function_free_names(name: str, parameters: List[str], body: Block) -> FrozenSet[str]:
+    """선언 노드 없이 함수 값(이름, 매개변수, 본문)만 있을 때의 자유 변수"""
+    declaration = FunctionDeclaration(name=name, parameters=parameters, body=body)
+    annotate(Program(statements=[declaration]))
+    return declaration.free_names
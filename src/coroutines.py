@@ -0,0 +1,275 @@
+"""
+MiniLang Coroutines (제너레이터와 협력적 작업)
+yield가 있는 함수(제너레이터 함수)와 spawn으로 만든 작업을 반복 실행 엔진(engine.py)의 멈춘
+프레임으로 실행합니다. 프레임은 엔진의 계속(continuation) 스택을 힙에 들고 있을 뿐이라,
+멈춘 제너레이터나 작업마다 OS 스레드나 파이썬 스택을 쓰지 않습니다.
+
+- 제너레이터: 호출하면 본문을 실행하지 않고 Generator(스트림)를 반환합니다. next()나 for-in이
+  값을 요청하면 본문을 다음 yield까지 실행하고, yield한 값을 돌려줍니다.
+- 작업: spawn(f, 인자...)은 f를 준비 큐에 넣습니다. 스케줄러는 준비된 작업을 차례로(라운드 로빈)
+  실행하고, 작업은 채널에서 값을 기다릴 때(recv, 가득 찬 채널에 send) 멈춰 다른 작업에 양보합니다.
+  최상위 코드가 끝나면 남은 작업을 모두 실행합니다.
+- 채널: channel()은 크기 제한이 없고, channel(n)은 n개가 차면 send가 기다립니다.
+
+작업이 아닌 곳(최상위 코드, 제너레이터 본문, 내장 함수의 콜백, 컴파일된 코드)에서 채널을 기다리면
+그 자리에서 멈출 수 없으므로, 값이 준비될 때까지 다른 작업을 실행합니다 (Scheduler.block).
+실행할 작업이 없는데도 기다려야 하면 교착 상태 에러입니다.
+"""
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, List, Optional, Tuple
+
+from runtime import (
+    RuntimeError, BuiltinFunction, Function, Generator, Channel, to_string,
+)
+
+
+class Yielded:
+    """yield 문이 엔진에 보내는 멈춤 표시"""
+    __slots__ = ('value',)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def block(self, interpreter) -> Any:
+        # 제너레이터 프레임 밖으로는 나올 수 없음 (visit_YieldStatement와 같은 에러)
+        raise RuntimeError("'yield' outside a generator")
+
+
+class Wait:
+    """바로 끝낼 수 없는 채널 연산이 엔진에 보내는 멈춤 표시"""
+    __slots__ = ('channel', 'value', 'sending')
+
+    def __init__(self, channel: Channel, value: Any, sending: bool):
+        self.channel = channel
+        self.value = value
+        self.sending = sending
+
+    def attempt(self, scheduler: 'Scheduler') -> Tuple[bool, Any]:
+        """연산을 다시 시도 (끝났으면 (True, 결과))"""
+        if self.sending:
+            return scheduler.try_send(self.channel, self.value), None
+        return scheduler.try_recv(self.channel)
+
+    def park(self, task: 'Task'):
+        """작업을 채널의 대기열에 넣음 (상대 연산이 준비 큐로 되돌림)"""
+        if self.sending:
+            self.channel.senders.append((task, self.value))
+        else:
+            self.channel.receivers.append(task)
+
+    def block(self, interpreter) -> Any:
+        return interpreter.scheduler.block(self)
+
+
+class GeneratorFrame:
+    """Generator의 원본: 값을 요청할 때마다 멈춘 본문을 다음 yield까지 실행"""
+    __slots__ = ('engine', 'frame')
+
+    def __init__(self, engine, func: Function, arguments: List[Any]):
+        self.engine = engine
+        self.frame = engine.frame(func, arguments, Yielded)
+
+    def __iter__(self) -> 'GeneratorFrame':
+        return self
+
+    def __next__(self) -> Any:
+        frame = self.frame
+        if frame is None:
+            raise StopIteration
+        if frame.running:
+            raise RuntimeError("Generator is already running")
+        try:
+            marker = self.engine.resume(frame)
+        except BaseException:
+            self.frame = None
+            raise
+        if not frame.stack:
+            self.frame = None
+            raise StopIteration
+        return marker.value
+
+    def close(self):
+        """끝나기 전에 닫으면 본문의 남은 계속을 정리 (close() 내장 함수, 스트림 끝)"""
+        frame, self.frame = self.frame, None
+        if frame is not None:
+            if frame.running:
+                self.frame = frame
+                raise RuntimeError("Cannot close a running generator")
+            self.engine.discard(frame)
+
+
+class Task:
+    """spawn으로 만든 작업 하나 (멈춘 엔진 프레임과 재개할 때 보낼 값)"""
+    __slots__ = ('name', 'frame', 'value')
+
+    def __init__(self, name: str, frame):
+        self.name = name
+        self.frame = frame
+        self.value = None
+
+
+class Scheduler:
+    """협력적 작업의 라운드 로빈 스케줄러 (인터프리터마다 하나)"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.ready: deque = deque()  # 실행할 수 있는 작업
+        self.switches = 0  # 작업을 재개한 횟수
+
+    def spawn(self, func: Function, arguments: List[Any]) -> Task:
+        task = Task(func.name, self.engine.frame(func, arguments, Wait))
+        self.ready.append(task)
+        return task
+
+    def step(self) -> bool:
+        """준비된 작업 하나를 다음 멈춤 지점(또는 끝)까지 실행 (준비된 작업이 없으면 False)"""
+        if not self.ready:
+            return False
+        task = self.ready.popleft()
+        value, task.value = task.value, None
+        self.switches += 1
+        wait = self.engine.resume(task.frame, value)
+        if task.frame.stack:
+            wait.park(task)
+        return True
+
+    def run(self):
+        """준비된 작업이 없을 때까지 실행 (채널에서 멈춘 채 남은 작업은 버림)"""
+        while self.step():
+            pass
+
+    def block(self, wait: Wait) -> Any:
+        """작업 프레임 밖에서 채널을 기다림: 연산이 끝날 때까지 다른 작업을 실행"""
+        while True:
+            done, value = wait.attempt(self)
+            if done:
+                return value
+            if not self.step():
+                operation = 'send' if wait.sending else 'recv'
+                raise RuntimeError(
+                    f"Deadlock: {operation} on {to_string(wait.channel)} can never complete "
+                    "(all tasks are blocked)"
+                )
+
+    # =====================================================
+    # 채널 연산 (끝났는지 반환, 멈춘 상대 작업은 준비 큐로)
+    # =====================================================
+
+    def try_send(self, channel: Channel, value: Any) -> bool:
+        if channel.receivers:
+            task = channel.receivers.popleft()
+            task.value = value
+            self.ready.append(task)
+            return True
+        if not channel.capacity or len(channel.items) < channel.capacity:
+            channel.items.append(value)
+            return True
+        return False
+
+    def try_recv(self, channel: Channel) -> Tuple[bool, Any]:
+        if not channel.items:
+            return False, None
+        value = channel.items.popleft()
+        if channel.senders:
+            task, pending = channel.senders.popleft()
+            channel.items.append(pending)
+            self.ready.append(task)
+        return True, value
+
+
+@dataclass
+class SuspendingBuiltin(BuiltinFunction):
+    """작업을 멈출 수 있는 내장 함수
+
+    반복 엔진은 attempt(interpreter, args)를 호출해 결과나 Wait를 받고, Wait이면 작업 프레임을
+    멈춥니다. 그 밖의 호출(방문자, 콜백, 컴파일된 코드)은 func(interpreter, args)로 그 자리에서
+    기다립니다.
+    """
+    attempt: Optional[Callable] = None
+
+
+def _channel_arg(name: str, value: Any) -> Channel:
+    if not isinstance(value, Channel):
+        raise RuntimeError(f"{name} requires a channel")
+    return value
+
+
+def register_coroutine_builtins(table: dict):
+    """작업/채널 내장 함수를 테이블에 등록"""
+
+    def spawn_func(interpreter, args):
+        if not args or not isinstance(args[0], Function):
+            raise RuntimeError("spawn requires a user-defined function")
+        func, arguments = args[0], list(args[1:])
+        if len(arguments) != len(func.parameters):
+            raise RuntimeError(
+                f"Function '{func.name}' expects {len(func.parameters)} arguments, got {len(arguments)}"
+            )
+        interpreter.scheduler.spawn(func, arguments)
+        return None
+
+    table['spawn'] = BuiltinFunction(
+        name='spawn',
+        func=spawn_func,
+        arity=-1,
+        needs_interpreter=True
+    )
+
+    def channel_func(args):
+        if len(args) > 1:
+            raise RuntimeError(f"Function 'channel' expects 0 or 1 arguments, got {len(args)}")
+        capacity = args[0] if args else 0
+        if isinstance(capacity, bool) or not isinstance(capacity, int) or capacity < 0:
+            raise RuntimeError("channel capacity must be a non-negative integer")
+        return Channel(capacity)
+
+    table['channel'] = BuiltinFunction(
+        name='channel',
+        func=channel_func,
+        arity=-1
+    )
+
+    def send_attempt(interpreter, args):
+        channel = _channel_arg('send', args[0])
+        if interpreter.scheduler.try_send(channel, args[1]):
+            return None
+        return Wait(channel, args[1], True)
+
+    def recv_attempt(interpreter, args):
+        channel = _channel_arg('recv', args[0])
+        done, value = interpreter.scheduler.try_recv(channel)
+        if done:
+            return value
+        return Wait(channel, None, False)
+
+    def blocking(attempt: Callable) -> Callable:
+        def func(interpreter, args):
+            result = attempt(interpreter, args)
+            if result.__class__ is Wait:
+                return interpreter.scheduler.block(result)
+            return result
+        return func
+
+    table['send'] = SuspendingBuiltin(
+        name='send',
+        func=blocking(send_attempt),
+        arity=2,
+        needs_interpreter=True,
+        attempt=send_attempt
+    )
+
+    table['recv'] = SuspendingBuiltin(
+        name='recv',
+        func=blocking(recv_attempt),
+        arity=1,
+        needs_interpreter=True,
+        attempt=recv_attempt
+    )
+
+
+def make_generator(interpreter, func: Function, arguments: List[Any]) -> Generator:
+    """제너레이터 함수 호출 결과 (본문은 첫 값을 요청할 때 시작)"""
+    source = GeneratorFrame(interpreter.engine, func, arguments)
+    return Generator(func.name, source, source.close)
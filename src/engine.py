@@ -0,0 +1,482 @@
+"""
+MiniLang Evaluation Engine (반복 실행 엔진)
+AST를 파이썬 재귀 없이 평가합니다. 노드마다 제너레이터 하나가 계속(continuation) 역할을 합니다.
+제너레이터는 자식 노드를 yield해 그 값을 돌려받고, 엔진은 실행 중인 제너레이터들을 힙에 있는
+리스트(명시적 스택)로 관리합니다. 그래서 표현식의 중첩 깊이와 MiniLang 호출 깊이는 메모리로만
+제한됩니다.
+
+인터프리터는 평소에는 빠른 재귀 방문자로 실행하고, 방문/호출 깊이가 한도(Interpreter.max_depth)에
+닿으면 그 아래 부분만 이 엔진으로 평가합니다. 스코프, 에러, break/continue/return의 동작은 방문자와
+같고, 피연산자를 평가한 뒤의 계산은 인터프리터의 메서드(_binary_op, _index, _call 등)를 그대로
+씁니다. 엔진 안의 사용자 함수 호출은 스택 프레임으로 실행하므로 단계별 실행의 컴파일된 코드와
+프로필 집계는 쓰지 않습니다 (컴파일된 코드는 파이썬 재귀로 호출하기 때문).
+
+스택이 힙에 있으므로 실행을 중간에 멈췄다가 이어 갈 수도 있습니다. 제너레이터와 작업(coroutines.py)은
+Frame으로 실행되며, yield 문과 채널 연산이 보내는 멈춤 표시(Yielded, Wait)에서 스택을 그대로 둔 채
+돌아옵니다. asyncio 임베딩(async_interpreter.py)은 프로그램 전체를 프레임으로 실행하고, step_hook이
+반환한 양보와 input()이 보내는 멈춤 표시(Pause)에서 이벤트 루프로 돌아갑니다.
+"""
+
+from types import GeneratorType
+from typing import Any, Callable, Dict, Generator, List, Optional
+
+from ast_nodes import (
+    ASTNode, NumberLiteral, StringLiteral, BooleanLiteral, NullLiteral, Identifier, BinaryOp,
+    UnaryOp, Assignment, FunctionCall, ArrayLiteral, MapLiteral, ArrayAccess, SliceAccess,
+    ArrayIndexAssignment, ExpressionStatement, VariableDeclaration, Block, IfStatement,
+    WhileStatement, ForStatement, ForInStatement, ReturnStatement, PrintStatement, YieldStatement,
+    Program,
+)
+from coroutines import Yielded, Wait, SuspendingBuiltin, make_generator
+from runtime import (
+    RuntimeError, ReturnValue, BreakException, ContinueException, Function, Stream,
+    ARRAY_TYPES, is_truthy,
+)
+
+
+# 제너레이터 없이 바로 값을 내는 리터럴
+LITERALS = (NumberLiteral, StringLiteral, BooleanLiteral)
+
+# 노드 평가 제너레이터: 자식 노드(또는 함수 본문 제너레이터)를 yield하고 결과를 return
+Continuation = Generator[Any, Any, Any]
+
+
+class Pause:
+    """프로그램을 실행하는 호스트(asyncio 이벤트 루프)에 제어를 넘기는 멈춤 표시
+
+    prompt가 None이면 양보(step_hook이 반환), 문자열이면 input()의 입력 요청입니다. 호스트 프레임
+    (program_frame)은 여기서 멈추고 호스트가 읽은 줄을 resume으로 돌려받습니다. 그 밖의 곳에서는
+    양보를 건너뛰고 입력은 그 자리에서 읽습니다.
+    """
+    __slots__ = ('prompt',)
+
+    def __init__(self, prompt: Optional[str] = None):
+        self.prompt = prompt
+
+    def block(self, interpreter) -> Any:
+        if self.prompt is None:
+            return None
+        return interpreter._read_line(self.prompt)
+
+
+# 프레임을 멈추게 하는 표시 (해당 종류의 프레임 밖에서는 marker.block(interpreter)으로 처리)
+MARKERS = (Yielded, Wait, Pause)
+
+
+class Frame:
+    """멈출 수 있는 실행 하나 (제너레이터 본문 또는 작업)
+
+    stack은 실행 중인 계속들이고, 비면 실행이 끝난 것입니다. env는 멈췄을 때의 현재 환경이며,
+    suspend_on은 이 프레임을 멈추게 하는 표시 클래스입니다 (다른 표시는 그 자리에서 처리).
+    """
+    __slots__ = ('stack', 'env', 'suspend_on', 'running')
+
+    def __init__(self, stack: List[Continuation], env, suspend_on: type):
+        self.stack = stack
+        self.env = env
+        self.suspend_on = suspend_on
+        self.running = False
+
+
+class Engine:
+    """명시적 스택으로 AST를 평가하는 엔진 (인터프리터마다 하나)"""
+
+    def __init__(self, interpreter):
+        self.interpreter = interpreter
+        # 노드 클래스 -> 평가 제너레이터를 만드는 메서드
+        # (없는 클래스는 자식 표현식이 없으므로 방문자 메서드를 바로 호출)
+        self.handlers: Dict[type, Callable[[ASTNode], Continuation]] = {
+            BinaryOp: self._binary_op,
+            UnaryOp: self._unary_op,
+            Assignment: self._assignment,
+            FunctionCall: self._function_call,
+            ArrayLiteral: self._array_literal,
+            MapLiteral: self._map_literal,
+            ArrayAccess: self._array_access,
+            SliceAccess: self._slice_access,
+            ArrayIndexAssignment: self._array_index_assignment,
+            ExpressionStatement: self._expression_statement,
+            VariableDeclaration: self._variable_declaration,
+            Block: self._block,
+            IfStatement: self._if_statement,
+            WhileStatement: self._while_statement,
+            ForStatement: self._for_statement,
+            ForInStatement: self._for_in_statement,
+            ReturnStatement: self._return_statement,
+            PrintStatement: self._print_statement,
+            YieldStatement: self._yield_statement,
+        }
+
+    def evaluate(self, node: ASTNode) -> Any:
+        """노드 하나를 현재 환경에서 평가"""
+        return self._run(node)
+
+    def call(self, func: Function, arguments: List[Any]) -> Any:
+        """사용자 정의 함수 실행 (인자 개수는 호출자가 확인)"""
+        return self._run(self._function(func, arguments))
+
+    def frame(self, func: Function, arguments: List[Any], suspend_on: type) -> Frame:
+        """함수 본문을 멈출 수 있는 프레임으로 준비 (첫 resume에서 시작)"""
+        return Frame([self._function(func, arguments, True)], func.closure, suspend_on)
+
+    def program_frame(self, program: Program, suspend_on: type) -> Frame:
+        """프로그램의 최상위 문장들을 현재 환경에서 실행할 프레임으로 준비 (끝나면 마지막 문장의 값)"""
+        return Frame([self._statements(program.statements)], self.interpreter.current_env, suspend_on)
+
+    def resume(self, frame: Frame, value: Any = None) -> Any:
+        """멈춘 프레임에 value를 보내고 다음 멈춤 지점까지 실행
+
+        멈추면 표시 객체를 반환하고, 끝나면 frame.stack이 빕니다 (본문의 에러는 그대로 전달).
+        """
+        interpreter = self.interpreter
+        previous_env = interpreter.current_env
+        interpreter.current_env = frame.env
+        frame.running = True
+        try:
+            return self._run(None, frame, value)
+        finally:
+            frame.running = False
+            frame.env = interpreter.current_env
+            interpreter.current_env = previous_env
+
+    def discard(self, frame: Frame):
+        """끝나기 전에 버리는 프레임의 계속들을 맨 위부터 닫음"""
+        stack = frame.stack
+        while stack:
+            stack.pop().close()
+
+    def _run(self, request: Any, frame: Frame = None, value: Any = None) -> Any:
+        """요청(노드 또는 제너레이터) 하나를 끝까지 실행
+
+        스택 맨 위의 제너레이터에 값(또는 예외)을 보내고, 제너레이터가 yield한 다음 요청을
+        처리합니다. 잎 노드는 바로 값으로 바꾸고, 나머지는 새 제너레이터를 스택에 올립니다.
+        예외는 스택을 따라 내려가며 각 제너레이터에 던져지므로 try/finally가 방문자와 같은
+        순서로 실행됩니다.
+
+        frame이 있으면 그 프레임의 스택을 이어서 실행하고, 프레임의 표시(suspend_on)를 만나면
+        스택을 그대로 두고 표시를 반환합니다.
+        """
+        interpreter = self.interpreter
+        handlers = self.handlers
+        stack: List[Continuation] = [] if frame is None else frame.stack
+        error = None
+        while True:
+            if request is not None:
+                node_class = request.__class__
+                try:
+                    if node_class is Identifier:
+                        value = interpreter.current_env.get(request.name)
+                    elif node_class in LITERALS:
+                        value = request.value
+                    elif node_class is NullLiteral:
+                        value = None
+                    elif node_class is GeneratorType:
+                        stack.append(request)
+                        value = None
+                    else:
+                        handler = handlers.get(node_class)
+                        if handler is not None:
+                            stack.append(handler(request))
+                            value = None
+                        elif node_class in MARKERS:
+                            if frame is not None and node_class is frame.suspend_on:
+                                return request
+                            value = request.block(interpreter)
+                        else:
+                            value = (interpreter._visitors.get(node_class)
+                                     or interpreter.visitor_for(node_class))(request)
+                except BaseException as e:
+                    error = e
+                request = None
+
+            if not stack:
+                if error is not None:
+                    raise error
+                return value
+
+            top = stack[-1]
+            try:
+                if error is None:
+                    request = top.send(value)
+                else:
+                    thrown, error = error, None
+                    request = top.throw(thrown)
+            except StopIteration as stop:
+                stack.pop()
+                value = stop.value
+            except BaseException as e:
+                stack.pop()
+                error = e
+
+    # =====================================================
+    # 함수 호출
+    # =====================================================
+
+    def _function(self, func: Function, arguments: List[Any], as_frame: bool = False) -> Continuation:
+        """함수 본문 실행 (Interpreter._execute_function과 같은 동작)
+
+        제너레이터 함수는 as_frame(제너레이터 프레임의 본문)일 때만 본문을 실행하고,
+        아니면 제너레이터를 반환합니다.
+        """
+        interpreter = self.interpreter
+        if func.generator and not as_frame:
+            return make_generator(interpreter, func, arguments)
+        if interpreter.step_hook:
+            pause = interpreter.step_hook()
+            if pause is not None:
+                yield pause
+        func_env = interpreter._function_env(func, arguments)
+        previous_env = interpreter.current_env
+        interpreter.current_env = func_env
+        statements = func.body.statements
+        try:
+            # 본문이 return 문 하나뿐이면 ReturnValue 예외 없이 바로 평가
+            if len(statements) == 1 and isinstance(statements[0], ReturnStatement):
+                value_node = statements[0].value
+                if value_node is None:
+                    return None
+                return (yield value_node)
+            for stmt in statements:
+                yield stmt
+            return None
+        except ReturnValue as ret:
+            return ret.value
+        finally:
+            # 버려진 프레임을 닫을 때는 다른 코드가 실행 중이므로 현재 환경을 건드리지 않음
+            if interpreter.current_env is func_env:
+                interpreter.current_env = previous_env
+
+    def _function_call(self, node: FunctionCall) -> Continuation:
+        interpreter = self.interpreter
+        # input 함수 특별 처리
+        if node.name == 'input':
+            prompt = ""
+            if node.arguments:
+                prompt = interpreter._to_string((yield node.arguments[0]))
+            # 호스트 프레임이면 입력을 기다리며 멈추고, 아니면 Pause.block이 그 자리에서 읽음
+            return (yield Pause(prompt))
+
+        callee = interpreter.current_env.get(node.name)
+        arguments = []
+        for arg in node.arguments:
+            arguments.append((yield arg))
+
+        # 사용자 함수는 새 파이썬 프레임 없이 스택에 올림 (내장 함수와 에러는 인터프리터가 처리)
+        if isinstance(callee, Function) and len(arguments) == len(callee.parameters):
+            return (yield self._function(callee, arguments))
+        # 채널 연산은 기다려야 하면 멈춤 표시를 보냄 (작업 프레임이면 작업이 멈춤)
+        if callee.__class__ is SuspendingBuiltin and len(arguments) == callee.arity:
+            result = callee.attempt(interpreter, arguments)
+            if result.__class__ is Wait:
+                return (yield result)
+            return result
+        return interpreter._call(node, callee, arguments)
+
+    # =====================================================
+    # 표현식
+    # =====================================================
+
+    def _binary_op(self, node: BinaryOp) -> Continuation:
+        # 단락 평가 (short-circuit evaluation)
+        if node.operator == 'and':
+            left = yield node.left
+            if not is_truthy(left):
+                return left
+            return (yield node.right)
+
+        if node.operator == 'or':
+            left = yield node.left
+            if is_truthy(left):
+                return left
+            return (yield node.right)
+
+        left = yield node.left
+        right = yield node.right
+        return self.interpreter._binary_op(node, left, right)
+
+    def _unary_op(self, node: UnaryOp) -> Continuation:
+        return self.interpreter._unary_op(node, (yield node.operand))
+
+    def _assignment(self, node: Assignment) -> Continuation:
+        return self.interpreter._assign(node, (yield node.value))
+
+    def _array_literal(self, node: ArrayLiteral) -> Continuation:
+        elements = []
+        for elem in node.elements:
+            elements.append((yield elem))
+        return elements
+
+    def _map_literal(self, node: MapLiteral) -> Continuation:
+        result = {}
+        for key_node, value_node in zip(node.keys, node.values):
+            key = yield key_node
+            self.interpreter._check_map_key(key, key_node)
+            result[key] = yield value_node
+        return result
+
+    def _array_access(self, node: ArrayAccess) -> Continuation:
+        array = yield node.array
+        index = yield node.index
+        return self.interpreter._index(node, array, index)
+
+    def _slice_access(self, node: SliceAccess) -> Continuation:
+        array = yield node.array
+        start = (yield node.start) if node.start else None
+        stop = (yield node.stop) if node.stop else None
+        return self.interpreter._slice(node, array, start, stop)
+
+    def _array_index_assignment(self, node: ArrayIndexAssignment) -> Continuation:
+        array = yield node.array
+        index = yield node.index
+        value = yield node.value
+        return self.interpreter._assign_index(node, array, index, value)
+
+    # =====================================================
+    # 문장
+    # =====================================================
+
+    def _expression_statement(self, node: ExpressionStatement) -> Continuation:
+        return (yield node.expression)
+
+    def _variable_declaration(self, node: VariableDeclaration) -> Continuation:
+        value = None
+        if node.initializer:
+            value = yield node.initializer
+        self.interpreter.current_env.define(node.name, value)
+
+    def _print_statement(self, node: PrintStatement) -> Continuation:
+        interpreter = self.interpreter
+        values = []
+        for arg in node.arguments:
+            values.append(interpreter._to_string((yield arg)))
+        interpreter._write(" ".join(values))
+
+    def _yield_statement(self, node: YieldStatement) -> Continuation:
+        value = None
+        if node.value:
+            value = yield node.value
+        yield Yielded(value)
+
+    def _return_statement(self, node: ReturnStatement) -> Continuation:
+        value = None
+        if node.value:
+            value = yield node.value
+        raise ReturnValue(value)
+
+    def _statements(self, statements: List[ASTNode]) -> Continuation:
+        result = None
+        for stmt in statements:
+            result = yield stmt
+        return result
+
+    def _block(self, node: Block) -> Continuation:
+        interpreter = self.interpreter
+        previous_env = interpreter.current_env
+        interpreter.current_env = block_env = interpreter._scope_env(node.captures)
+        try:
+            result = None
+            for stmt in node.statements:
+                result = yield stmt
+            return result
+        finally:
+            if interpreter.current_env is block_env:
+                interpreter.current_env = previous_env
+
+    def _if_statement(self, node: IfStatement) -> Continuation:
+        if is_truthy((yield node.condition)):
+            return (yield node.then_branch)
+        elif node.else_branch:
+            return (yield node.else_branch)
+        return None
+
+    def _while_statement(self, node: WhileStatement) -> Continuation:
+        interpreter = self.interpreter
+        result = None
+        while is_truthy((yield node.condition)):
+            try:
+                result = yield node.body
+            except BreakException:
+                break
+            except ContinueException:
+                pass
+            if interpreter.step_hook:
+                pause = interpreter.step_hook()
+                if pause is not None:
+                    yield pause
+        return result
+
+    def _for_statement(self, node: ForStatement) -> Continuation:
+        interpreter = self.interpreter
+        previous_env = interpreter.current_env
+        interpreter.current_env = loop_env = interpreter._scope_env(node.captures)
+        try:
+            if node.initializer:
+                yield node.initializer
+
+            result = None
+            while True:
+                if node.condition:
+                    if not is_truthy((yield node.condition)):
+                        break
+
+                try:
+                    result = yield node.body
+                except BreakException:
+                    break
+                except ContinueException:
+                    pass
+
+                if node.increment:
+                    yield node.increment
+
+                if interpreter.step_hook:
+                    pause = interpreter.step_hook()
+                    if pause is not None:
+                        yield pause
+
+            return result
+        finally:
+            if interpreter.current_env is loop_env:
+                interpreter.current_env = previous_env
+
+    def _for_in_statement(self, node: ForInStatement) -> Continuation:
+        interpreter = self.interpreter
+        iterable = yield node.iterable
+        if not isinstance(iterable, (ARRAY_TYPES, str, dict, Stream)):
+            raise RuntimeError(
+                f"Cannot iterate over type: {type(iterable).__name__}", node.line, node.column
+            )
+
+        captured = node.captures
+        new_env = interpreter._scope_env(captured)
+        previous_env = interpreter.current_env
+        interpreter.current_env = new_env
+
+        # 맵은 키를 순회 (본문에서 맵을 수정할 수 있도록 키 목록을 복사)
+        if isinstance(iterable, dict):
+            iterable = list(iterable)
+
+        try:
+            result = None
+            variables = new_env.variables
+            if captured and node.variable in captured:
+                variables = new_env.cells.variables
+            for item in iterable:
+                variables[node.variable] = item
+
+                try:
+                    result = yield node.body
+                except BreakException:
+                    break
+                except ContinueException:
+                    pass
+
+                if interpreter.step_hook:
+                    pause = interpreter.step_hook()
+                    if pause is not None:
+                        yield pause
+
+            return result
+        finally:
+            if interpreter.current_env is new_env:
+                interpreter.current_env = previous_env
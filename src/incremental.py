@@ -0,0 +1,316 @@
+"""
+MiniLang Incremental (증분 분석)
+편집기/REPL처럼 같은 문서를 조금씩 고쳐 가며 반복해서 분석하는 경우를 위한 증분 프런트엔드입니다.
+
+문서를 최상위 선언 단위의 조각(chunk)으로 나누어 각 조각의 토큰, AST, 파싱 에러를 보관합니다.
+텍스트 편집(오프셋, 삭제 길이, 삽입 문자열)이 들어오면 편집 위치를 포함한 조각과 그 앞 조각만
+다시 어휘/구문 분석하고, 나머지 조각의 토큰과 AST는 그대로 재사용합니다.
+다시 분석한 범위의 끝이 선언 경계와 맞지 않으면(예: 닫는 중괄호를 지운 경우) 경계가 맞을 때까지
+범위를 넓히므로, 결과는 항상 전체를 새로 분석한 것과 같습니다.
+
+편집 뒤쪽 조각들의 위치 변화(오프셋, 줄 번호)는 조각별로 모아 두었다가 tokens()/program()/errors로
+실제로 조회할 때 한 번에 반영합니다.
+
+recover=True이면 어휘 분석 에러에서도 멈추지 않고(Lexer의 복구 모드) 에러를 lexer_errors에
+모으므로, 편집 중인 잘못된 코드에서도 나머지 선언들의 토큰과 AST를 계속 사용할 수 있습니다.
+"""
+
+import bisect
+from dataclasses import dataclass, field, fields, replace
+from typing import List, Optional, Tuple
+
+from tokens import Token, TokenType
+from lexer import Lexer, LexerError
+from parser import Parser, ParseError
+from ast_nodes import ASTNode, Program, Statement
+
+
+@dataclass
+class _Chunk:
+    """최상위 선언 하나 (start/line/column은 다시 분석을 시작할 수 있는 현재 위치)"""
+    start: int
+    line: int
+    column: int
+    tokens: List[Token]
+    statement: Optional[Statement]
+    errors: List[ParseError] = field(default_factory=list)
+    lexer_errors: List[LexerError] = field(default_factory=list)
+    # 토큰/AST/에러에 아직 반영하지 않은 위치 변화
+    offset_shift: int = 0
+    line_shift: int = 0
+
+
+def _shift_node_lines(node: ASTNode, delta: int):
+    """AST 서브트리의 모든 줄 번호를 delta만큼 이동 (제자리 수정)"""
+    stack = [node]
+    while stack:
+        current = stack.pop()
+        current.line += delta
+        for f in fields(current):
+            value = getattr(current, f.name)
+            if isinstance(value, ASTNode):
+                stack.append(value)
+            elif isinstance(value, list):
+                stack.extend(item for item in value if isinstance(item, ASTNode))
+
+
+def _shift_token(token: Token, line_delta: int, offset_delta: int) -> Token:
+    return replace(token, line=token.line + line_delta, offset=token.offset + offset_delta)
+
+
+# 선언 사이의 경계로 안전하게 끝나는 토큰 (그 뒤의 토큰이 앞 선언에 이어질 수 없음)
+_BOUNDARY_TOKENS = (TokenType.NEWLINE, TokenType.SEMICOLON, TokenType.RBRACE)
+
+
+class IncrementalDocument:
+    """증분 분석 문서
+
+    사용 예:
+        doc = IncrementalDocument(source)
+        doc.edit(offset, 1, "x")      # offset 위치의 한 글자를 "x"로 바꿈
+        program = doc.program()       # 전체를 다시 파싱한 것과 같은 AST
+        errors = doc.errors           # 파싱 에러들
+
+    program()이 반환하는 AST의 노드는 문서가 계속 소유하며, 이후 편집에서 줄 번호가 갱신될 수 있습니다.
+    """
+
+    def __init__(self, text: str = "", recover: bool = False):
+        self.text = text
+        self.recover = recover
+        self.lexer_error: Optional[LexerError] = None
+        self._chunks: List[_Chunk] = []
+        self._starts: List[int] = []  # 조각 시작 오프셋 (이분 탐색용, _chunks와 같은 순서)
+        self._eof: Optional[Token] = None
+        # 마지막 편집에서 다시 분석한 양 (통계)
+        self.relexed_chars = 0
+        self.reparsed_declarations = 0
+        self._rebuild()
+
+    # =====================================================
+    # 조회
+    # =====================================================
+
+    def tokens(self) -> List[Token]:
+        """문서 전체의 토큰 (EOF 포함)"""
+        result: List[Token] = []
+        for chunk in self._chunks:
+            self._normalize(chunk)
+            result.extend(chunk.tokens)
+        if self._eof is not None:
+            result.append(self._eof)
+        return result
+
+    def program(self) -> Program:
+        """문서 전체의 AST"""
+        statements = []
+        for chunk in self._chunks:
+            self._normalize(chunk)
+            if chunk.statement is not None:
+                statements.append(chunk.statement)
+        return Program(statements=statements, line=1, column=1)
+
+    @property
+    def errors(self) -> List[ParseError]:
+        """파싱 에러들 (어휘 분석 에러는 lexer_error/lexer_errors)"""
+        result: List[ParseError] = []
+        for chunk in self._chunks:
+            if chunk.errors:
+                self._normalize(chunk)
+                result.extend(chunk.errors)
+        return result
+
+    @property
+    def lexer_errors(self) -> List[LexerError]:
+        """복구 모드에서 모은 어휘 분석 에러들"""
+        result: List[LexerError] = []
+        for chunk in self._chunks:
+            if chunk.lexer_errors:
+                self._normalize(chunk)
+                result.extend(chunk.lexer_errors)
+        return result
+
+    def statements(self) -> List[Optional[Statement]]:
+        """최상위 선언들 (위치 변화를 반영하지 않으므로 줄 번호가 필요하면 refresh 호출)"""
+        return [chunk.statement for chunk in self._chunks]
+
+    def refresh(self, statement: Statement) -> bool:
+        """최상위 선언 하나의 줄 번호를 현재 문서 기준으로 갱신"""
+        for chunk in self._chunks:
+            if chunk.statement is statement:
+                self._normalize(chunk)
+                return True
+        return False
+
+    def declaration_at(self, offset: int) -> Tuple[List[Token], Optional[Statement]]:
+        """offset 위치를 포함한 최상위 선언의 (토큰들, 문장)"""
+        if not self._chunks:
+            return [], None
+        chunk = self._chunks[max(bisect.bisect_right(self._starts, offset) - 1, 0)]
+        self._normalize(chunk)
+        return chunk.tokens, chunk.statement
+
+    # =====================================================
+    # 편집
+    # =====================================================
+
+    def edit(self, offset: int, deleted: int, inserted: str):
+        """text[offset:offset + deleted]를 inserted로 바꾸고 영향받는 부분만 다시 분석"""
+        if offset < 0 or deleted < 0 or offset + deleted > len(self.text):
+            raise ValueError(f"Edit out of range: offset={offset}, deleted={deleted}")
+
+        old_text = self.text
+        self.text = old_text[:offset] + inserted + old_text[offset + deleted:]
+
+        if self.lexer_error is not None or len(self._chunks) < 2:
+            self._rebuild()
+            return
+
+        delta = len(inserted) - deleted
+        line_delta = inserted.count('\n') - old_text.count('\n', offset, offset + deleted)
+        edit_end = offset + deleted
+
+        # 편집 위치를 포함한 조각과 그 앞 조각부터 (앞 선언이 다음 토큰을 미리 보기 때문)
+        first = max(bisect.bisect_right(self._starts, offset) - 1 - 1, 0)
+        last = max(bisect.bisect_right(self._starts, edit_end) - 1, first)
+        start_chunk = self._chunks[first]
+        edit_end_line = start_chunk.line + old_text.count('\n', start_chunk.start, edit_end)
+
+        while True:
+            # 범위 뒤의 조각이 편집 끝과 같은 줄에서 시작하면 열 위치가 바뀌므로 범위에 포함
+            while last + 1 < len(self._chunks) and self._chunks[last + 1].line <= edit_end_line:
+                last += 1
+
+            at_end = last + 1 >= len(self._chunks)
+            region_end = len(old_text) if at_end else self._chunks[last + 1].start
+            result = self._analyze(start_chunk, region_end + delta, at_end)
+            if result is not None:
+                break
+            # 범위 끝이 선언 경계와 맞지 않음: 다음 조각까지 넓혀서 다시 시도
+            last = min(last + max(last - first, 1), len(self._chunks) - 1)
+
+        new_chunks, eof = result
+        if self.lexer_error is not None:
+            # 문서 끝까지 다시 분석했지만 어휘 분석 에러: 다음 편집에서 전체를 다시 분석
+            self._chunks, self._starts, self._eof = [], [], None
+            return
+        following = self._chunks[last + 1:]
+        for chunk in following:
+            chunk.start += delta
+            chunk.line += line_delta
+            chunk.offset_shift += delta
+            chunk.line_shift += line_delta
+
+        if at_end:
+            self._eof = eof
+        else:
+            self._eof = _shift_token(self._eof, line_delta, delta)
+
+        self._chunks[first:last + 1] = new_chunks
+        self._starts[first:] = [chunk.start for chunk in new_chunks + following]
+        self._fix_first_chunk()
+
+    # =====================================================
+    # 내부 구현
+    # =====================================================
+
+    def _rebuild(self):
+        """문서 전체를 다시 분석"""
+        self._chunks = []
+        self._eof = None
+        start = _Chunk(start=0, line=1, column=1, tokens=[], statement=None)
+        result = self._analyze(start, len(self.text), True)
+        if result is not None:
+            self._chunks, self._eof = result
+            self._fix_first_chunk()
+        self._starts = [chunk.start for chunk in self._chunks]
+
+    def _fix_first_chunk(self):
+        # 첫 조각은 항상 문서 맨 앞(앞쪽의 공백/주석 포함)부터 다시 분석
+        if self._chunks:
+            first = self._chunks[0]
+            first.start, first.line, first.column = 0, 1, 1
+            if self._starts:
+                self._starts[0] = 0
+
+    def _analyze(self, start: _Chunk, end: int, at_end: bool) -> Optional[Tuple[List[_Chunk], Token]]:
+        """self.text[start.start:end]를 분석해 (조각들, EOF 토큰)을 반환
+
+        범위 끝이 선언 경계와 맞는지 확신할 수 없으면 None을 반환합니다.
+        """
+        self.relexed_chars = end - start.start
+        lexer = Lexer(self.text[start.start:end], start.line, start.column, start.start, self.recover)
+        try:
+            tokens = lexer.tokenize()
+            if at_end:
+                self.lexer_error = None
+        except LexerError as e:
+            if not at_end:
+                return None  # 문자열/주석이 범위 밖까지 이어질 수 있음
+            self.lexer_error = e
+            self.reparsed_declarations = 0
+            return [], None
+        eof = tokens[-1]
+        if not at_end and any(e.message == "Unterminated multi-line comment" for e in lexer.errors):
+            return None
+
+        parser = Parser(tokens)
+        declarations = []
+        error_count = 0
+        for token_start, statement in parser.iter_declarations():
+            errors = parser.errors[error_count:]
+            error_count = len(parser.errors)
+            declarations.append((token_start, statement, errors))
+
+        if not at_end:
+            body = tokens[:-1]
+            if not body or body[-1].type not in _BOUNDARY_TOKENS or (declarations and declarations[-1][2]):
+                return None
+
+        chunks = []
+        for i, (token_start, statement, errors) in enumerate(declarations):
+            token_end = declarations[i + 1][0] if i + 1 < len(declarations) else len(tokens) - 1
+            chunk_tokens = tokens[token_start:token_end]
+            head = chunk_tokens[0] if chunk_tokens else eof
+            chunks.append(_Chunk(
+                start=start.start if i == 0 else head.offset,
+                line=start.line if i == 0 else head.line,
+                column=start.column if i == 0 else head.column,
+                tokens=chunk_tokens,
+                statement=statement,
+                errors=errors,
+            ))
+        if lexer.errors:
+            self._attach_lexer_errors(chunks, lexer.errors, start)
+        self.reparsed_declarations = len(chunks)
+        return chunks, eof
+
+    @staticmethod
+    def _attach_lexer_errors(chunks: List[_Chunk], errors: List[LexerError], start: _Chunk):
+        """어휘 분석 에러를 위치에 따라 해당 선언의 조각에 배정"""
+        if not chunks:
+            chunks.append(_Chunk(start=start.start, line=start.line, column=start.column,
+                                 tokens=[], statement=None))
+        heads = [(chunk.tokens[0].line, chunk.tokens[0].column) if chunk.tokens else (0, 0)
+                 for chunk in chunks]
+        for error in errors:
+            index = max(bisect.bisect_right(heads, (error.line, error.column)) - 1, 0)
+            chunks[index].lexer_errors.append(error)
+
+    def _normalize(self, chunk: _Chunk):
+        """보류 중인 위치 변화를 조각의 토큰/AST/에러에 반영"""
+        line_delta, offset_delta = chunk.line_shift, chunk.offset_shift
+        if not line_delta and not offset_delta:
+            return
+        chunk.tokens = [_shift_token(t, line_delta, offset_delta) for t in chunk.tokens]
+        if line_delta and chunk.statement is not None:
+            _shift_node_lines(chunk.statement, line_delta)
+        if chunk.errors:
+            chunk.errors = [
+                ParseError(e.message, _shift_token(e.token, line_delta, offset_delta))
+                for e in chunk.errors
+            ]
+        if line_delta and chunk.lexer_errors:
+            chunk.lexer_errors = [
+                LexerError(e.message, e.line + line_delta, e.column) for e in chunk.lexer_errors
+            ]
+        chunk.line_shift = chunk.offset_shift = 0
@@ -4,312 +4,626 @@ AST를 순회하며 프로그램을 실행합니다.
 """
 
 from typing import Dict, List, Any, Optional, Callable
-from dataclasses import dataclass, field
 from ast_nodes import *
+from runtime import *
+from numeric import TypedArray, Matrix, BULK_TYPES, bulk_binary_op, register_numeric_builtins
+from strings import register_string_builtins
+from streams import WriterPool, register_stream_builtins, stdin_stream
+from modules import MODULE_CACHE, resolve_path
+from closures import annotate as annotate_closures
+from engine import Engine
+from coroutines import Scheduler, make_generator, register_coroutine_builtins
+from parallel import register_parallel_builtins
+import functools
+import math
+import os
+import sys
+import weakref
 
 
-class RuntimeError(Exception):
-    """런타임 에러"""
-    def __init__(self, message: str, line: int = 0, column: int = 0):
-        self.message = message
-        self.line = line
-        self.column = column
-        super().__init__(f"Runtime Error at line {line}: {message}")
-
-
-class ReturnValue(Exception):
-    """함수 반환을 위한 예외"""
-    def __init__(self, value: Any):
-        self.value = value
-
-
-class BreakException(Exception):
-    """break 문을 위한 예외"""
-    pass
-
-
-class ContinueException(Exception):
-    """continue 문을 위한 예외"""
-    pass
+def _create_builtins() -> Dict[str, BuiltinFunction]:
+    """내장 함수 테이블 생성 (모듈 로드 시 한 번만 실행되어 모든 인터프리터가 공유)"""
+    table: Dict[str, BuiltinFunction] = {}
+    
+    # len 함수
+    table['len'] = BuiltinFunction(
+        name='len',
+        func=lambda args: len(args[0]) if args else 0,
+        arity=1
+    )
+    
+    # type 함수
+    table['type'] = BuiltinFunction(
+        name='type',
+        func=lambda args: type_name(args[0]) if args else 'null',
+        arity=1
+    )
+    
+    # str 함수
+    table['str'] = BuiltinFunction(
+        name='str',
+        func=lambda args: to_string(args[0]) if args else '',
+        arity=1
+    )
+    
+    # int 함수
+    def int_func(args):
+        if not args:
+            return 0
+        val = args[0]
+        if isinstance(val, bool):
+            return 1 if val else 0
+        if isinstance(val, (int, float)):
+            return int(val)
+        if isinstance(val, str):
+            try:
+                return int(float(val))
+            except ValueError:
+                raise RuntimeError(f"Cannot convert '{val}' to integer")
+        raise RuntimeError(f"Cannot convert to integer")
+    
+    table['int'] = BuiltinFunction(
+        name='int',
+        func=int_func,
+        arity=1
+    )
+    
+    # float 함수
+    def float_func(args):
+        if not args:
+            return 0.0
+        val = args[0]
+        if isinstance(val, bool):
+            return 1.0 if val else 0.0
+        if isinstance(val, (int, float)):
+            return float(val)
+        if isinstance(val, str):
+            try:
+                return float(val)
+            except ValueError:
+                raise RuntimeError(f"Cannot convert '{val}' to float")
+        raise RuntimeError(f"Cannot convert to float")
+    
+    table['float'] = BuiltinFunction(
+        name='float',
+        func=float_func,
+        arity=1
+    )
+    
+    # abs 함수
+    table['abs'] = BuiltinFunction(
+        name='abs',
+        func=lambda args: abs(args[0]) if args else 0,
+        arity=1
+    )
+    
+    # min/max 함수 (배열 하나를 받으면 원소 중에서 선택)
+    def make_extreme(name, pick):
+        def extreme(args):
+            if not args:
+                return None
+            values = args
+            if len(args) == 1 and isinstance(args[0], ARRAY_TYPES):
+                if isinstance(args[0], BULK_TYPES):
+                    return getattr(args[0], name)()
+                values = args[0]
+                if not values:
+                    raise RuntimeError(f"{name} of empty array")
+            try:
+                return pick(values)
+            except TypeError:
+                raise RuntimeError(f"{name}: values are not comparable")
+        return extreme
+    
+    table['min'] = BuiltinFunction(
+        name='min',
+        func=make_extreme('min', min),
+        arity=-1
+    )
+    
+    table['max'] = BuiltinFunction(
+        name='max',
+        func=make_extreme('max', max),
+        arity=-1
+    )
+    
+    # push 함수 (배열에 요소 추가)
+    def push_func(args):
+        if len(args) < 2:
+            raise RuntimeError("push requires array and value")
+        arr, val = args[0], args[1]
+        if not isinstance(arr, ARRAY_TYPES):
+            raise RuntimeError("First argument must be an array")
+        arr.append(val)
+        return arr
+    
+    table['push'] = BuiltinFunction(
+        name='push',
+        func=push_func,
+        arity=2
+    )
+    
+    # pop 함수
+    def pop_func(args):
+        if not args:
+            raise RuntimeError("pop requires an array")
+        arr = args[0]
+        if not isinstance(arr, ARRAY_TYPES):
+            raise RuntimeError("Argument must be an array")
+        if not arr:
+            raise RuntimeError("Cannot pop from empty array")
+        return arr.pop()
+    
+    table['pop'] = BuiltinFunction(
+        name='pop',
+        func=pop_func,
+        arity=1
+    )
+    
+    # 배열 일괄 처리 함수들 (반복을 Python 내부에서 처리)
+    def array_arg(args, name):
+        if not args or not isinstance(args[0], ARRAY_TYPES):
+            raise RuntimeError(f"{name} requires an array")
+        arr = args[0]
+        return arr.materialize() if isinstance(arr, RangeValue) else arr
+    
+    def sort_func(interp, args):
+        if len(args) not in (1, 2):
+            raise RuntimeError(f"sort expects 1 or 2 arguments, got {len(args)}")
+        arr = array_arg(args, 'sort')
+        try:
+            if len(args) == 1:
+                arr.sort()
+            else:
+                arr.sort(key=functools.cmp_to_key(make_comparator(interp, args[1])))
+        except TypeError:
+            raise RuntimeError("sort: elements are not comparable")
+        return arr
+    
+    def make_comparator(interp, func):
+        """비교 함수 래퍼: 음수/0/양수 또는 a가 앞이면 true를 반환하는 함수"""
+        if isinstance(func, Function):
+            if len(func.parameters) != 2:
+                raise RuntimeError("sort comparator must take 2 arguments")
+            call = interp.call_user_function
+        elif isinstance(func, BuiltinFunction):
+            call = interp.call_function
+        else:
+            raise RuntimeError("sort comparator must be a function")
+        
+        def compare(a, b):
+            result = call(func, [a, b])
+            if isinstance(result, bool):
+                return -1 if result else 0
+            if not isinstance(result, (int, float)):
+                raise RuntimeError("sort comparator must return a number or boolean")
+            return result
+        return compare
+    
+    table['sort'] = BuiltinFunction(
+        name='sort',
+        func=sort_func,
+        arity=-1,
+        needs_interpreter=True
+    )
+    
+    def slice_func(args):
+        if len(args) not in (2, 3):
+            raise RuntimeError(f"slice expects 2 or 3 arguments, got {len(args)}")
+        seq = args[0]
+        if isinstance(seq, RangeValue):
+            seq = seq.materialize()
+        if not isinstance(seq, (list, str, TypedArray)):
+            raise RuntimeError("slice requires an array or string")
+        start = args[1]
+        end = args[2] if len(args) == 3 and args[2] is not None else len(seq)
+        for bound in (start, end):
+            if isinstance(bound, bool) or not isinstance(bound, int):
+                raise RuntimeError("slice indices must be integers")
+        return seq[start:end]
+    
+    table['slice'] = BuiltinFunction(
+        name='slice',
+        func=slice_func,
+        arity=-1
+    )
+    
+    def reverse_func(args):
+        if args and isinstance(args[0], str):
+            return args[0][::-1]
+        arr = array_arg(args, 'reverse')
+        arr.reverse()
+        return arr
+    
+    table['reverse'] = BuiltinFunction(
+        name='reverse',
+        func=reverse_func,
+        arity=1
+    )
+    
+    def index_of_func(args):
+        seq, value = args
+        if isinstance(seq, str):
+            return seq.find(to_string(value))
+        if not isinstance(seq, ARRAY_TYPES):
+            raise RuntimeError("index_of requires an array or string")
+        try:
+            return seq.index(value)
+        except ValueError:
+            return -1
+    
+    table['index_of'] = BuiltinFunction(
+        name='index_of',
+        func=index_of_func,
+        arity=2
+    )
+    
+    def contains_func(args):
+        seq, value = args
+        if isinstance(seq, str):
+            return to_string(value) in seq
+        if isinstance(seq, dict):
+            try:
+                return value in seq
+            except TypeError:
+                return False
+        if not isinstance(seq, ARRAY_TYPES):
+            raise RuntimeError("contains requires an array, string or map")
+        return value in seq
+    
+    table['contains'] = BuiltinFunction(
+        name='contains',
+        func=contains_func,
+        arity=2
+    )
+    
+    def sum_func(args):
+        if not args or not isinstance(args[0], ARRAY_TYPES):
+            raise RuntimeError("sum requires an array")
+        if isinstance(args[0], BULK_TYPES):
+            return args[0].sum()
+        try:
+            return sum(args[0])
+        except TypeError:
+            raise RuntimeError("sum: array elements must be numbers")
+    
+    table['sum'] = BuiltinFunction(
+        name='sum',
+        func=sum_func,
+        arity=1
+    )
+    
+    def extend_func(args):
+        arr = array_arg(args, 'extend')
+        other = args[1]
+        if not isinstance(other, ARRAY_TYPES):
+            raise RuntimeError("extend requires an array to append")
+        arr.extend(other)
+        return arr
+    
+    table['extend'] = BuiltinFunction(
+        name='extend',
+        func=extend_func,
+        arity=2
+    )
+    
+    def fill_func(args):
+        arr = array_arg(args, 'fill')
+        arr[:] = [args[1]] * len(arr)
+        return arr
+    
+    table['fill'] = BuiltinFunction(
+        name='fill',
+        func=fill_func,
+        arity=2
+    )
+    
+    # range 함수 (지연 평가)
+    def range_func(args):
+        if len(args) == 1:
+            return RangeValue(range(int(args[0])))
+        elif len(args) == 2:
+            return RangeValue(range(int(args[0]), int(args[1])))
+        elif len(args) >= 3:
+            if int(args[2]) == 0:
+                raise RuntimeError("range step cannot be zero")
+            return RangeValue(range(int(args[0]), int(args[1]), int(args[2])))
+        return []
+    
+    table['range'] = BuiltinFunction(
+        name='range',
+        func=range_func,
+        arity=-1
+    )
+    
+    # copy 함수 (뷰나 배열, 맵을 독립된 값으로 복사)
+    def copy_func(args):
+        value = args[0]
+        if isinstance(value, TypedArray):
+            return TypedArray(value.data[:])
+        if isinstance(value, Matrix):
+            return Matrix(value.rows, value.cols, value.data[:])
+        if isinstance(value, ArrayView) and isinstance(value.parent, TypedArray):
+            return TypedArray(value.parent.data[value.start:value.start + len(value)])
+        if isinstance(value, ARRAY_TYPES):
+            return list(value)
+        if isinstance(value, dict):
+            return dict(value)
+        if isinstance(value, StringBuilder):
+            return builder_func([value])
+        return value
+    
+    table['copy'] = BuiltinFunction(
+        name='copy',
+        func=copy_func,
+        arity=1
+    )
+    
+    # 맵 함수들
+    def map_arg(args, name):
+        if not args or not isinstance(args[0], dict):
+            raise RuntimeError(f"{name} requires a map")
+        return args[0]
+    
+    table['keys'] = BuiltinFunction(
+        name='keys',
+        func=lambda args: list(map_arg(args, 'keys').keys()),
+        arity=1
+    )
+    
+    table['values'] = BuiltinFunction(
+        name='values',
+        func=lambda args: list(map_arg(args, 'values').values()),
+        arity=1
+    )
+    
+    def has_func(args):
+        m, key = map_arg(args, 'has'), args[1]
+        if isinstance(key, bool):  # 불리언은 키가 될 수 없음 (1/0과 구별)
+            return False
+        try:
+            return key in m
+        except TypeError:  # 배열 등 키가 될 수 없는 값
+            return False
+    
+    table['has'] = BuiltinFunction(
+        name='has',
+        func=has_func,
+        arity=2
+    )
+    
+    def del_func(args):
+        m, key = map_arg(args, 'del'), args[1]
+        if not has_func(args):
+            raise RuntimeError(f"Key not found: {to_string(key)}")
+        return m.pop(key)
+    
+    table['del'] = BuiltinFunction(
+        name='del',
+        func=del_func,
+        arity=2
+    )
+    
+    # 문자열 빌더 함수들
+    def builder_func(args):
+        sb = StringBuilder()
+        for arg in args:
+            sb.append(to_string(arg))
+        return sb
+    
+    table['builder'] = BuiltinFunction(
+        name='builder',
+        func=builder_func,
+        arity=-1
+    )
+    
+    def append_func(args):
+        if not args or not isinstance(args[0], StringBuilder):
+            raise RuntimeError("append requires a string builder")
+        sb = args[0]
+        for arg in args[1:]:
+            sb.append(to_string(arg))
+        return sb
+    
+    table['append'] = BuiltinFunction(
+        name='append',
+        func=append_func,
+        arity=-1
+    )
+    
+    def build_func(args):
+        if not isinstance(args[0], StringBuilder):
+            raise RuntimeError("build requires a string builder")
+        return args[0].build()
+    
+    table['build'] = BuiltinFunction(
+        name='build',
+        func=build_func,
+        arity=1
+    )
+    
+    # sqrt 함수
+    table['sqrt'] = BuiltinFunction(
+        name='sqrt',
+        func=lambda args: math.sqrt(args[0]) if args else 0,
+        arity=1
+    )
+    
+    # floor/ceil 함수
+    table['floor'] = BuiltinFunction(
+        name='floor',
+        func=lambda args: math.floor(args[0]) if args else 0,
+        arity=1
+    )
+    
+    table['ceil'] = BuiltinFunction(
+        name='ceil',
+        func=lambda args: math.ceil(args[0]) if args else 0,
+        arity=1
+    )
+    
+    # 타입 배열 함수들
+    register_numeric_builtins(table)
+    
+    # 문자열 함수들
+    register_string_builtins(table)
+    
+    # 파일/표준 입력 함수들
+    register_stream_builtins(table)
+    
+    # 작업/채널 함수들
+    register_coroutine_builtins(table)
+    
+    # 병렬 map
+    register_parallel_builtins(table)
+    
+    return table
 
 
-@dataclass
-class Function:
-    """사용자 정의 함수"""
-    name: str
-    parameters: List[str]
-    body: Block
-    closure: 'Environment'
+# 공유 내장 함수 테이블 (읽기 전용)
+BUILTINS = _create_builtins()
 
 
-@dataclass
-class BuiltinFunction:
-    """내장 함수"""
-    name: str
-    func: Callable
-    arity: int  # 인자 개수 (-1은 가변)
+# 재귀 깊이 한 단계가 쓰는 파이썬 프레임 수의 상한
+# (컴파일된 함수끼리의 호출: 생성 코드, Runtime.call, call_user_function, invoke)
+FRAMES_PER_LEVEL = 4
+# 인터프리터 바깥(임베딩한 프로그램, 내장 함수 콜백)을 위해 남겨 두는 파이썬 프레임 수
+RESERVED_FRAMES = 200
 
 
-class Environment:
-    """변수 환경 (스코프)"""
-    
-    def __init__(self, parent: Optional['Environment'] = None):
-        self.variables: Dict[str, Any] = {}
-        self.parent = parent
-    
-    def define(self, name: str, value: Any):
-        """변수 정의"""
-        self.variables[name] = value
-    
-    def get(self, name: str) -> Any:
-        """변수 값 조회"""
-        if name in self.variables:
-            return self.variables[name]
-        if self.parent:
-            return self.parent.get(name)
-        raise RuntimeError(f"Undefined variable: '{name}'")
-    
-    def set(self, name: str, value: Any):
-        """변수 값 설정"""
-        if name in self.variables:
-            self.variables[name] = value
-            return
-        if self.parent:
-            self.parent.set(name, value)
-            return
-        raise RuntimeError(f"Undefined variable: '{name}'")
-    
-    def exists(self, name: str) -> bool:
-        """변수 존재 여부"""
-        if name in self.variables:
-            return True
-        if self.parent:
-            return self.parent.exists(name)
-        return False
+def max_visit_depth() -> int:
+    """재귀 방문 깊이 한도 (현재 파이썬 재귀 한도에서 계산)"""
+    return max(0, (sys.getrecursionlimit() - RESERVED_FRAMES) // FRAMES_PER_LEVEL)
 
 
 class Interpreter(ASTVisitor):
-    """인터프리터 클래스"""
+    """인터프리터 클래스
+    
+    내장 함수 테이블(BUILTINS)과 파싱된 Program은 읽기 전용으로 공유되고,
+    실행 상태(환경, 출력 버퍼)만 인스턴스에 저장됩니다. 따라서 하나의 Program을
+    스레드마다 별도의 인터프리터로 동시에 실행할 수 있으며, reset()으로
+    인스턴스를 재사용할 수 있습니다.
+    
+    tiering이면 자주 호출되는 함수를 파이썬 코드로 컴파일해 실행합니다 (tiering.py).
+    
+    평소에는 재귀 방문자로 실행하고, 방문/호출 깊이가 max_depth에 닿으면 그 아래를
+    명시적 스택을 쓰는 반복 엔진(engine.py)으로 평가하므로 깊은 표현식과 깊은 재귀도
+    파이썬 재귀 한도에 걸리지 않습니다. max_depth=0이면 모든 코드를 엔진으로 실행합니다.
+    """
     
-    def __init__(self):
+    def __init__(self, echo: bool = True, tiering: bool = True, max_depth: Optional[int] = None):
+        self.echo = echo  # False이면 출력을 버퍼에만 기록
+        self.tiering_enabled = tiering
+        self.max_depth = max_visit_depth() if max_depth is None else max_depth
+        self._visitors: Dict[type, Callable[[ASTNode], Any]] = {}  # 노드 클래스 -> 방문 메서드
+        self.engine = Engine(self)
+        # 반복문 1회/함수 호출 1회마다 호출되는 훅 (임베딩 시 협력적 양보에 사용)
+        # 멈춤 표시(engine.Pause)를 반환하면 반복 엔진의 호스트 프레임이 그 자리에서 멈춤
+        self.step_hook: Optional[Callable[[], Any]] = None
+        # 실행 중인 스크립트 경로 (상대 경로 import의 기준, 없으면 현재 디렉토리)
+        self.script_path: Optional[str] = None
+        self.reset()
+    
+    def reset(self):
+        """실행 상태 초기화 (내장 함수는 다시 만들지 않음)"""
         self.global_env = Environment()
         self.current_env = self.global_env
         self.output: List[str] = []  # 출력 버퍼
+        if getattr(self, 'writers', None) is not None:
+            self.writers.close_all()
+            self.close_streams()
+        self.writers = WriterPool()  # write_file/append_file이 열어 둔 파일
+        # read_lines가 연 파일 스트림 (약한 참조: 스크립트가 끝나거나 reset할 때 남은 것을 닫음)
+        self.streams: 'weakref.WeakSet[Stream]' = weakref.WeakSet()
+        self.modules: Dict[str, Dict[str, Function]] = {}  # 불러온 모듈 경로 -> 내보낸 함수들
+        self._import_stack: List[str] = []  # 불러오는 중인 모듈 경로 (순환 검사용)
+        # 실행한 프로그램 (스냅숏은 함수 본문을 프로그램 안의 위치로 저장)
+        self.programs: Dict[int, Program] = {}
+        self.tiering = None
+        if self.tiering_enabled:
+            from tiering import Tiering
+            self.tiering = Tiering(self)
+        self._active_profile = None  # 트리 순회로 실행 중인 함수의 프로필 (반복 횟수 집계)
+        self._depth = 0  # 현재 재귀 방문/호출 깊이
+        self.scheduler = Scheduler(self.engine)  # spawn으로 만든 작업 (coroutines.py)
         self._setup_builtins()
     
     def _setup_builtins(self):
-        """내장 함수 설정"""
-        # len 함수
-        self.global_env.define('len', BuiltinFunction(
-            name='len',
-            func=lambda args: len(args[0]) if args else 0,
-            arity=1
-        ))
-        
-        # type 함수
-        def type_func(args):
-            if not args:
-                return 'null'
-            val = args[0]
-            if val is None:
-                return 'null'
-            if isinstance(val, bool):
-                return 'boolean'
-            if isinstance(val, int):
-                return 'integer'
-            if isinstance(val, float):
-                return 'float'
-            if isinstance(val, str):
-                return 'string'
-            if isinstance(val, list):
-                return 'array'
-            if isinstance(val, (Function, BuiltinFunction)):
-                return 'function'
-            return 'unknown'
-        
-        self.global_env.define('type', BuiltinFunction(
-            name='type',
-            func=type_func,
-            arity=1
-        ))
-        
-        # str 함수
-        self.global_env.define('str', BuiltinFunction(
-            name='str',
-            func=lambda args: self._to_string(args[0]) if args else '',
-            arity=1
-        ))
-        
-        # int 함수
-        def int_func(args):
-            if not args:
-                return 0
-            val = args[0]
-            if isinstance(val, bool):
-                return 1 if val else 0
-            if isinstance(val, (int, float)):
-                return int(val)
-            if isinstance(val, str):
-                try:
-                    return int(float(val))
-                except ValueError:
-                    raise RuntimeError(f"Cannot convert '{val}' to integer")
-            raise RuntimeError(f"Cannot convert to integer")
-        
-        self.global_env.define('int', BuiltinFunction(
-            name='int',
-            func=int_func,
-            arity=1
-        ))
-        
-        # float 함수
-        def float_func(args):
-            if not args:
-                return 0.0
-            val = args[0]
-            if isinstance(val, bool):
-                return 1.0 if val else 0.0
-            if isinstance(val, (int, float)):
-                return float(val)
-            if isinstance(val, str):
-                try:
-                    return float(val)
-                except ValueError:
-                    raise RuntimeError(f"Cannot convert '{val}' to float")
-            raise RuntimeError(f"Cannot convert to float")
-        
-        self.global_env.define('float', BuiltinFunction(
-            name='float',
-            func=float_func,
-            arity=1
-        ))
-        
-        # abs 함수
-        self.global_env.define('abs', BuiltinFunction(
-            name='abs',
-            func=lambda args: abs(args[0]) if args else 0,
-            arity=1
-        ))
-        
-        # min/max 함수
-        self.global_env.define('min', BuiltinFunction(
-            name='min',
-            func=lambda args: min(args) if args else None,
-            arity=-1
-        ))
-        
-        self.global_env.define('max', BuiltinFunction(
-            name='max',
-            func=lambda args: max(args) if args else None,
-            arity=-1
-        ))
-        
-        # push 함수 (배열에 요소 추가)
-        def push_func(args):
-            if len(args) < 2:
-                raise RuntimeError("push requires array and value")
-            arr, val = args[0], args[1]
-            if not isinstance(arr, list):
-                raise RuntimeError("First argument must be an array")
-            arr.append(val)
-            return arr
-        
-        self.global_env.define('push', BuiltinFunction(
-            name='push',
-            func=push_func,
-            arity=2
-        ))
-        
-        # pop 함수
-        def pop_func(args):
-            if not args:
-                raise RuntimeError("pop requires an array")
-            arr = args[0]
-            if not isinstance(arr, list):
-                raise RuntimeError("Argument must be an array")
-            if not arr:
-                raise RuntimeError("Cannot pop from empty array")
-            return arr.pop()
-        
-        self.global_env.define('pop', BuiltinFunction(
-            name='pop',
-            func=pop_func,
-            arity=1
-        ))
-        
-        # range 함수
-        def range_func(args):
-            if len(args) == 1:
-                return list(range(int(args[0])))
-            elif len(args) == 2:
-                return list(range(int(args[0]), int(args[1])))
-            elif len(args) >= 3:
-                return list(range(int(args[0]), int(args[1]), int(args[2])))
-            return []
-        
-        self.global_env.define('range', BuiltinFunction(
-            name='range',
-            func=range_func,
-            arity=-1
-        ))
-        
-        # sqrt 함수
-        import math
-        self.global_env.define('sqrt', BuiltinFunction(
-            name='sqrt',
-            func=lambda args: math.sqrt(args[0]) if args else 0,
-            arity=1
-        ))
-        
-        # floor/ceil 함수
-        self.global_env.define('floor', BuiltinFunction(
-            name='floor',
-            func=lambda args: math.floor(args[0]) if args else 0,
-            arity=1
-        ))
-        
-        self.global_env.define('ceil', BuiltinFunction(
-            name='ceil',
-            func=lambda args: math.ceil(args[0]) if args else 0,
-            arity=1
-        ))
-    
-    def _to_string(self, value: Any) -> str:
-        """값을 문자열로 변환"""
-        if value is None:
-            return "null"
-        if isinstance(value, bool):
-            return "true" if value else "false"
-        if isinstance(value, list):
-            elements = ", ".join(self._to_string(e) for e in value)
-            return f"[{elements}]"
-        if isinstance(value, Function):
-            return f"<function {value.name}>"
-        if isinstance(value, BuiltinFunction):
-            return f"<builtin {value.name}>"
-        return str(value)
-    
-    def _is_truthy(self, value: Any) -> bool:
-        """값의 참/거짓 판단"""
-        if value is None:
-            return False
-        if isinstance(value, bool):
-            return value
-        if isinstance(value, (int, float)):
-            return value != 0
-        if isinstance(value, str):
-            return len(value) > 0
-        if isinstance(value, list):
-            return len(value) > 0
-        return True
+        """내장 함수 설정 (공유 테이블을 전역 환경에 복사)"""
+        self.global_env.variables.update(BUILTINS)
+    
+    # 값 변환 (모듈 함수를 그대로 사용)
+    _to_string = staticmethod(to_string)
+    _is_truthy = staticmethod(is_truthy)
+    
+    def _write(self, text: str):
+        """한 줄 출력"""
+        if self.echo:
+            print(text)
+        self.output.append(text)
+    
+    def _read_line(self, prompt: str) -> str:
+        """한 줄 입력 (EOF이면 빈 문자열)"""
+        try:
+            return input(prompt)
+        except EOFError:
+            return ""
+    
+    def _stdin_lines(self) -> Stream:
+        """표준 입력 줄 스트림 (stdin_lines 내장 함수)"""
+        return stdin_stream()
+    
+    def visit(self, node: ASTNode) -> Any:
+        """노드 방문 (깊이 한도에 닿으면 반복 엔진으로 평가)"""
+        depth = self._depth
+        if depth >= self.max_depth:
+            return self.engine.evaluate(node)
+        self._depth = depth + 1
+        try:
+            visitor = self._visitors.get(node.__class__) or self.visitor_for(node.__class__)
+            return visitor(node)
+        finally:
+            self._depth = depth
+    
+    def visitor_for(self, node_class: type) -> Callable[[ASTNode], Any]:
+        """노드 클래스의 방문 메서드 (클래스마다 한 번만 찾음)"""
+        visitor = getattr(self, f'visit_{node_class.__name__}', self.generic_visit)
+        self._visitors[node_class] = visitor
+        return visitor
     
     def execute(self, program: Program) -> Any:
-        """프로그램 실행"""
+        """프로그램 실행 (남은 작업을 마저 실행하고, 끝나면 열어 둔 쓰기 파일을 모두 닫음)"""
+        annotate_closures(program)
+        self.programs[id(program)] = program
         result = None
-        for stmt in program.statements:
-            result = self.visit(stmt)
+        try:
+            for stmt in program.statements:
+                result = self.visit(stmt)
+            self.scheduler.run()
+        finally:
+            self.writers.close_all()
         return result
     
+    def close_streams(self):
+        """아직 열려 있는 read_lines 스트림을 모두 닫음 (스크립트를 끝낼 때 호출)
+
+        스트림은 순회를 끝까지 하거나 close()를 부르면 닫히고, 반복문을 중간에 벗어나도
+        닫히지 않으므로(이어서 읽을 수 있음) 남은 것은 여기서 닫습니다.
+        """
+        streams, self.streams = list(self.streams), weakref.WeakSet()
+        for stream in streams:
+            stream.close()
+    
+    def snapshot(self, path: str):
+        """전역 상태(전역 변수, 불러온 모듈)를 스냅숏 파일로 저장 (snapshot.py)"""
+        from snapshot import write_snapshot
+        write_snapshot(self, path)
+    
+    def restore(self, path: str):
+        """스냅숏 파일의 전역 상태로 초기화 (변수는 처음 사용할 때 로드)"""
+        from snapshot import restore_snapshot
+        restore_snapshot(self, path)
+    
     def execute_block(self, block: Block, environment: Environment) -> Any:
         """블록 실행 (새 스코프에서)"""
         previous_env = self.current_env
@@ -339,9 +653,14 @@ class Interpreter(ASTVisitor):
             value = self.visit(node.initializer)
         self.current_env.define(node.name, value)
     
+    def _scope_env(self, captured: Optional[frozenset]) -> Environment:
+        """블록/반복문의 새 스코프 (클로저가 캡처하는 이름이 있으면 캡처 층을 따로 둠)"""
+        if captured:
+            return ScopeEnvironment(self.current_env, captured)
+        return Environment(parent=self.current_env)
+    
     def visit_Block(self, node: Block) -> Any:
-        new_env = Environment(parent=self.current_env)
-        return self.execute_block(node, new_env)
+        return self.execute_block(node, self._scope_env(node.captures))
     
     def visit_IfStatement(self, node: IfStatement) -> Any:
         condition = self.visit(node.condition)
@@ -355,18 +674,23 @@ class Interpreter(ASTVisitor):
     
     def visit_WhileStatement(self, node: WhileStatement) -> Any:
         result = None
+        profile = self._active_profile
         while self._is_truthy(self.visit(node.condition)):
             try:
                 result = self.visit(node.body)
             except BreakException:
                 break
             except ContinueException:
-                continue
+                pass
+            if profile is not None:
+                profile.back_edges += 1
+            if self.step_hook:
+                self.step_hook()
         return result
     
     def visit_ForStatement(self, node: ForStatement) -> Any:
         # for문을 위한 새 스코프 생성
-        new_env = Environment(parent=self.current_env)
+        new_env = self._scope_env(node.captures)
         previous_env = self.current_env
         self.current_env = new_env
         
@@ -376,6 +700,7 @@ class Interpreter(ASTVisitor):
                 self.visit(node.initializer)
             
             result = None
+            profile = self._active_profile
             while True:
                 # 조건 확인
                 if node.condition:
@@ -393,17 +718,69 @@ class Interpreter(ASTVisitor):
                 # 증감
                 if node.increment:
                     self.visit(node.increment)
+                
+                if profile is not None:
+                    profile.back_edges += 1
+                if self.step_hook:
+                    self.step_hook()
+            
+            return result
+        finally:
+            self.current_env = previous_env
+    
+    def visit_ForInStatement(self, node: ForInStatement) -> Any:
+        iterable = self.visit(node.iterable)
+        if not isinstance(iterable, (ARRAY_TYPES, str, dict, Stream)):
+            raise RuntimeError(
+                f"Cannot iterate over type: {type(iterable).__name__}", node.line, node.column
+            )
+        
+        # 루프 변수를 위한 새 스코프 생성
+        captured = node.captures
+        new_env = self._scope_env(captured)
+        previous_env = self.current_env
+        self.current_env = new_env
+        
+        # 맵은 키를 순회 (본문에서 맵을 수정할 수 있도록 키 목록을 복사)
+        if isinstance(iterable, dict):
+            iterable = list(iterable)
+        
+        try:
+            result = None
+            variables = new_env.variables
+            if captured and node.variable in captured:
+                variables = new_env.cells.variables
+            profile = self._active_profile
+            for item in iterable:
+                variables[node.variable] = item
+                
+                try:
+                    result = self.visit(node.body)
+                except BreakException:
+                    break
+                except ContinueException:
+                    pass
+                
+                if profile is not None:
+                    profile.back_edges += 1
+                if self.step_hook:
+                    self.step_hook()
             
             return result
         finally:
             self.current_env = previous_env
     
     def visit_FunctionDeclaration(self, node: FunctionDeclaration) -> None:
+        # 분석된 함수는 자유 변수가 있는 캡처 층만 붙잡음 (없으면 최상위 환경)
+        closure = self.current_env
+        if node.free_names is not None:
+            closure = closure_environment(closure, node.free_names)
         func = Function(
             name=node.name,
             parameters=node.parameters,
             body=node.body,
-            closure=self.current_env
+            closure=closure,
+            generator=node.is_generator
         )
         self.current_env.define(node.name, func)
     
@@ -413,17 +790,83 @@ class Interpreter(ASTVisitor):
             value = self.visit(node.value)
         raise ReturnValue(value)
     
+    def visit_YieldStatement(self, node: YieldStatement) -> None:
+        # 제너레이터 본문은 항상 반복 엔진의 프레임으로 실행되므로 여기에 오지 않음
+        raise RuntimeError("'yield' outside a generator", node.line, node.column)
+    
     def visit_BreakStatement(self, node: BreakStatement) -> None:
         raise BreakException()
     
     def visit_ContinueStatement(self, node: ContinueStatement) -> None:
         raise ContinueException()
     
+    def visit_ImportStatement(self, node: ImportStatement) -> None:
+        """모듈을 불러와 내보낸 함수들을 현재 스코프에 정의"""
+        exports = self.import_module(node.path, node.line, node.column)
+        for name, function in exports.items():
+            self.current_env.define(name, function)
+    
+    def import_module(self, module_path: str, line: int = 0, column: int = 0) -> Dict[str, Function]:
+        """모듈을 불러와 내보낸 함수들을 반환
+        
+        모듈은 인터프리터마다 한 번만 자신의 전역 환경에서 실행되고, 그 결과가 재사용됩니다.
+        """
+        stack = self._import_stack
+        if stack:
+            base_dir = os.path.dirname(stack[-1])
+        elif self.script_path:
+            base_dir = os.path.dirname(os.path.abspath(self.script_path))
+        else:
+            base_dir = os.getcwd()
+        path = resolve_path(module_path, base_dir)
+        
+        exports = self.modules.get(path)
+        if exports is None:
+            chain = ([os.path.realpath(self.script_path)] if self.script_path else []) + stack
+            if path in chain:
+                cycle = chain[chain.index(path):] + [path]
+                raise RuntimeError(
+                    "Import cycle detected: " + " -> ".join(os.path.basename(p) for p in cycle),
+                    line, column
+                )
+            try:
+                program = MODULE_CACHE.get(path)
+            except RuntimeError as e:
+                raise RuntimeError(e.message, line, column)
+            exports = self._load_module(path, program)
+        return exports
+    
+    def _load_module(self, path: str, program: Program) -> Dict[str, Function]:
+        """모듈을 새 전역 환경에서 실행하고 내보낸 함수들(_로 시작하지 않는 최상위 함수)을 반환"""
+        module_env = Environment()
+        module_env.variables.update(BUILTINS)
+        annotate_closures(program)
+        self.programs[id(program)] = program
+        
+        previous_env = self.current_env
+        self.current_env = module_env
+        self._import_stack.append(path)
+        try:
+            for stmt in program.statements:
+                self.visit(stmt)
+        except RuntimeError as e:
+            if e.message.startswith("In module "):
+                raise
+            raise RuntimeError(f"In module '{os.path.basename(path)}': {e.message}", e.line, e.column)
+        finally:
+            self._import_stack.pop()
+            self.current_env = previous_env
+        
+        exports = {
+            name: value for name, value in module_env.variables.items()
+            if isinstance(value, Function) and value.closure is module_env and not name.startswith('_')
+        }
+        self.modules[path] = exports
+        return exports
+    
     def visit_PrintStatement(self, node: PrintStatement) -> None:
         values = [self._to_string(self.visit(arg)) for arg in node.arguments]
-        output = " ".join(values)
-        print(output)
-        self.output.append(output)
+        self._write(" ".join(values))
     
     # =====================================================
     # 표현식 방문
@@ -447,17 +890,40 @@ class Interpreter(ASTVisitor):
     def visit_ArrayLiteral(self, node: ArrayLiteral) -> list:
         return [self.visit(elem) for elem in node.elements]
     
+    def visit_MapLiteral(self, node: MapLiteral) -> dict:
+        result = {}
+        for key_node, value_node in zip(node.keys, node.values):
+            key = self.visit(key_node)
+            self._check_map_key(key, key_node)
+            result[key] = self.visit(value_node)
+        return result
+    
+    def _check_map_key(self, key: Any, node: ASTNode):
+        """맵 키로 사용할 수 있는 값인지 확인 (true/false는 1/0과 같은 키가 되므로 거부)"""
+        if key is not None and (isinstance(key, bool) or not isinstance(key, (str, int, float))):
+            raise RuntimeError(f"Invalid map key type: {type_name(key)}", node.line, node.column)
+    
     def visit_ArrayAccess(self, node: ArrayAccess) -> Any:
-        array = self.visit(node.array)
-        index = self.visit(node.index)
+        return self._index(node, self.visit(node.array), self.visit(node.index))
+    
+    def _index(self, node: ArrayAccess, array: Any, index: Any) -> Any:
+        """인덱스 접근 (피연산자를 평가한 뒤의 계산, 반복 엔진과 공유)"""
+        if isinstance(array, dict):
+            self._check_map_key(index, node)
+            if index not in array:
+                raise RuntimeError(f"Key not found: {to_string(index)}", node.line, node.column)
+            return array[index]
         
-        if isinstance(array, list):
+        if isinstance(array, ARRAY_TYPES):
             if not isinstance(index, int):
                 raise RuntimeError(f"Array index must be an integer", node.line, node.column)
             if index < 0 or index >= len(array):
                 raise RuntimeError(f"Array index out of bounds: {index}", node.line, node.column)
             return array[index]
         
+        if isinstance(array, StringBuilder):
+            array = array.build()
+        
         if isinstance(array, str):
             if not isinstance(index, int):
                 raise RuntimeError(f"String index must be an integer", node.line, node.column)
@@ -467,18 +933,46 @@ class Interpreter(ASTVisitor):
         
         raise RuntimeError(f"Cannot index type: {type(array).__name__}", node.line, node.column)
     
+    def visit_SliceAccess(self, node: SliceAccess) -> Any:
+        """슬라이스: 배열은 저장 공간을 공유하는 뷰, 문자열은 부분 문자열"""
+        array = self.visit(node.array)
+        start = self.visit(node.start) if node.start else None
+        stop = self.visit(node.stop) if node.stop else None
+        return self._slice(node, array, start, stop)
+    
+    def _slice(self, node: SliceAccess, array: Any, start: Any, stop: Any) -> Any:
+        for bound in (start, stop):
+            if bound is not None and (isinstance(bound, bool) or not isinstance(bound, int)):
+                raise RuntimeError("Slice bounds must be integers", node.line, node.column)
+        
+        if isinstance(array, StringBuilder):
+            array = array.build()
+        if isinstance(array, str):
+            return array[start:stop]
+        if isinstance(array, ARRAY_TYPES):
+            start, stop, _ = slice(start, stop).indices(len(array))
+            return ArrayView(array, start, stop)
+        
+        raise RuntimeError(f"Cannot slice type: {type_name(array)}", node.line, node.column)
+    
     def visit_ArrayIndexAssignment(self, node: 'ArrayIndexAssignment') -> Any:
         """배열 인덱스 대입"""
         array = self.visit(node.array)
         index = self.visit(node.index)
-        value = self.visit(node.value)
-        
-        if not isinstance(array, list):
-            raise RuntimeError(f"Cannot assign to index of non-array type", node.line, node.column)
-        if not isinstance(index, int):
-            raise RuntimeError(f"Array index must be an integer", node.line, node.column)
-        if index < 0 or index >= len(array):
-            raise RuntimeError(f"Array index out of bounds: {index}", node.line, node.column)
+        return self._assign_index(node, array, index, self.visit(node.value))
+    
+    def _assign_index(self, node: 'ArrayIndexAssignment', array: Any, index: Any, value: Any) -> Any:
+        if isinstance(array, dict):
+            self._check_map_key(index, node)
+            if node.operator != '=' and index not in array:
+                raise RuntimeError(f"Key not found: {to_string(index)}", node.line, node.column)
+        else:
+            if not isinstance(array, ARRAY_TYPES):
+                raise RuntimeError(f"Cannot assign to index of non-array type", node.line, node.column)
+            if not isinstance(index, int):
+                raise RuntimeError(f"Array index must be an integer", node.line, node.column)
+            if index < 0 or index >= len(array):
+                raise RuntimeError(f"Array index out of bounds: {index}", node.line, node.column)
         
         if node.operator == '=':
             array[index] = value
@@ -511,15 +1005,21 @@ class Interpreter(ASTVisitor):
                 return left
             return self.visit(node.right)
         
-        left = self.visit(node.left)
-        right = self.visit(node.right)
+        return self._binary_op(node, self.visit(node.left), self.visit(node.right))
+    
+    def _binary_op(self, node: BinaryOp, left: Any, right: Any) -> Any:
+        """and/or를 제외한 이항 연산 (피연산자를 평가한 뒤의 계산, 반복 엔진과 공유)"""
+        # 타입 배열의 원소별 일괄 연산
+        if isinstance(left, BULK_TYPES) or isinstance(right, BULK_TYPES):
+            return bulk_binary_op(node.operator, left, right, node.line, node.column)
         
         # 산술 연산
         if node.operator == '+':
-            if isinstance(left, str) or isinstance(right, str):
+            # 빌더는 합친 문자열로 연결 (결과는 새 문자열)
+            if isinstance(left, (str, StringBuilder)) or isinstance(right, (str, StringBuilder)):
                 return self._to_string(left) + self._to_string(right)
-            if isinstance(left, list) and isinstance(right, list):
-                return left + right
+            if isinstance(left, ARRAY_TYPES) and isinstance(right, ARRAY_TYPES):
+                return [*left, *right]
             return left + right
         
         if node.operator == '-':
@@ -530,6 +1030,8 @@ class Interpreter(ASTVisitor):
                 return left * right
             if isinstance(left, int) and isinstance(right, str):
                 return left * right
+            if isinstance(left, ArrayLike) and isinstance(right, int):
+                return list(left) * right
             if isinstance(left, list) and isinstance(right, int):
                 return left * right
             return left * right
@@ -569,8 +1071,9 @@ class Interpreter(ASTVisitor):
         raise RuntimeError(f"Unknown operator: {node.operator}", node.line, node.column)
     
     def visit_UnaryOp(self, node: UnaryOp) -> Any:
-        operand = self.visit(node.operand)
-        
+        return self._unary_op(node, self.visit(node.operand))
+    
+    def _unary_op(self, node: UnaryOp, operand: Any) -> Any:
         if node.operator == '-':
             return -operand
         
@@ -580,8 +1083,9 @@ class Interpreter(ASTVisitor):
         raise RuntimeError(f"Unknown unary operator: {node.operator}", node.line, node.column)
     
     def visit_Assignment(self, node: Assignment) -> Any:
-        value = self.visit(node.value)
-        
+        return self._assign(node, self.visit(node.value))
+    
+    def _assign(self, node: Assignment, value: Any) -> Any:
         if node.operator == '=':
             # 변수가 없으면 새로 정의
             if not self.current_env.exists(node.target.name):
@@ -594,6 +1098,10 @@ class Interpreter(ASTVisitor):
         current = self.current_env.get(node.target.name)
         
         if node.operator == '+=':
+            if isinstance(current, StringBuilder):
+                # 빌더는 제자리에서 추가 (복사 없음)
+                current.append(self._to_string(value))
+                return current
             if isinstance(current, str) or isinstance(value, str):
                 new_value = self._to_string(current) + self._to_string(value)
             else:
@@ -618,17 +1126,17 @@ class Interpreter(ASTVisitor):
             prompt = ""
             if node.arguments:
                 prompt = self._to_string(self.visit(node.arguments[0]))
-            try:
-                return input(prompt)
-            except EOFError:
-                return ""
+            return self._read_line(prompt)
         
         # 함수 조회
         callee = self.current_env.get(node.name)
         
         # 인자 평가
         arguments = [self.visit(arg) for arg in node.arguments]
-        
+        return self._call(node, callee, arguments)
+    
+    def _call(self, node: FunctionCall, callee: Any, arguments: List[Any]) -> Any:
+        """호출 (인자를 평가한 뒤의 인자 개수 검사와 호출, 반복 엔진과 공유)"""
         # 내장 함수
         if isinstance(callee, BuiltinFunction):
             if callee.arity != -1 and len(arguments) != callee.arity:
@@ -636,6 +1144,8 @@ class Interpreter(ASTVisitor):
                     f"Function '{callee.name}' expects {callee.arity} arguments, got {len(arguments)}",
                     node.line, node.column
                 )
+            if callee.needs_interpreter:
+                return callee.func(self, arguments)
             return callee.func(arguments)
         
         # 사용자 정의 함수
@@ -645,20 +1155,99 @@ class Interpreter(ASTVisitor):
                     f"Function '{callee.name}' expects {len(callee.parameters)} arguments, got {len(arguments)}",
                     node.line, node.column
                 )
+            return self.call_user_function(callee, arguments)
+        
+        raise RuntimeError(f"'{node.name}' is not a function", node.line, node.column)
+    
+    def call_function(self, callee: Any, arguments: List[Any]) -> Any:
+        """함수 값 호출 (내장 함수가 콜백을 부를 때 사용, FunctionCall 노드 평가를 거치지 않음)"""
+        if isinstance(callee, BuiltinFunction):
+            if callee.arity != -1 and len(arguments) != callee.arity:
+                raise RuntimeError(
+                    f"Function '{callee.name}' expects {callee.arity} arguments, got {len(arguments)}"
+                )
+            if callee.needs_interpreter:
+                return callee.func(self, arguments)
+            return callee.func(arguments)
+        
+        if isinstance(callee, Function):
+            if len(arguments) != len(callee.parameters):
+                raise RuntimeError(
+                    f"Function '{callee.name}' expects {len(callee.parameters)} arguments, got {len(arguments)}"
+                )
+            return self.call_user_function(callee, arguments)
+        
+        raise RuntimeError(f"'{to_string(callee)}' is not a function")
+    
+    def call_user_function(self, func: Function, arguments: List[Any]) -> Any:
+        """사용자 정의 함수 실행 (인자 개수는 호출자가 확인)"""
+        if func.generator:
+            return make_generator(self, func, arguments)
+        depth = self._depth
+        if depth >= self.max_depth:
+            return self.engine.call(func, arguments)
+        
+        if self.step_hook:
+            self.step_hook()
+            profile = None
+        else:
+            profile = func.profile
+            if profile is None and self.tiering is not None:
+                profile = func.profile = self.tiering.profile(func)
+        
+        self._depth = depth + 1
+        previous_profile = self._active_profile
+        try:
+            # 단계별 실행: 컴파일된 코드가 있으면 사용 (가정이 어긋나면 트리 순회로)
+            if profile is not None:
+                code = profile.enter(arguments)
+                if code is not None:
+                    try:
+                        return code(arguments)
+                    except GuardFailure as failure:
+                        profile.deoptimize(failure)
             
-            # 새 환경 생성 (클로저 기반)
-            func_env = Environment(parent=callee.closure)
-            for param, arg in zip(callee.parameters, arguments):
-                func_env.define(param, arg)
-            
-            # 함수 본문 실행
-            try:
-                self.execute_block(callee.body, func_env)
+            self._active_profile = profile
+            return self._execute_function(func, arguments)
+        finally:
+            self._active_profile = previous_profile
+            self._depth = depth
+    
+    def _function_env(self, func: Function, arguments: List[Any]) -> Environment:
+        """호출마다 만드는 새 환경 (클로저 기반, 중첩 함수가 캡처하는 매개변수는 캡처 층에)"""
+        captured = func.body.captures
+        if captured:
+            func_env = ScopeEnvironment(func.closure, captured)
+            for name, value in zip(func.parameters, arguments):
+                func_env.define(name, value)
+        else:
+            func_env = Environment(parent=func.closure)
+            func_env.variables.update(zip(func.parameters, arguments))
+        return func_env
+    
+    def _execute_function(self, func: Function, arguments: List[Any]) -> Any:
+        """함수 본문을 트리 순회로 실행"""
+        func_env = self._function_env(func, arguments)
+        
+        # 본문이 return 문 하나뿐이면 ReturnValue 예외 없이 바로 평가
+        statements = func.body.statements
+        if len(statements) == 1 and isinstance(statements[0], ReturnStatement):
+            value_node = statements[0].value
+            if value_node is None:
                 return None
-            except ReturnValue as ret:
-                return ret.value
+            previous_env = self.current_env
+            self.current_env = func_env
+            try:
+                return self.visit(value_node)
+            finally:
+                self.current_env = previous_env
         
-        raise RuntimeError(f"'{node.name}' is not a function", node.line, node.column)
+        # 함수 본문 실행
+        try:
+            self.execute_block(func.body, func_env)
+            return None
+        except ReturnValue as ret:
+            return ret.value
 
 
 def interpret(program: Program) -> Any:
@@ -19,12 +19,27 @@ class LexerError(Exception):
 class Lexer:
     """어휘 분석기 클래스"""
     
-    def __init__(self, source: str):
+    def __init__(self, source: str, line: int = 1, column: int = 1, offset: int = 0,
+                 recover: bool = False):
+        """source가 더 큰 문서의 일부이면 그 시작 위치의 줄/열/오프셋을 함께 지정
+        
+        recover가 참이면 에러에서 멈추지 않고 errors에 기록한 뒤 계속 토큰화합니다 (편집기용).
+        """
         self.source = source
         self.pos = 0
-        self.line = 1
-        self.column = 1
+        self.line = line
+        self.column = column
+        self.base_offset = offset
+        self.recover = recover
         self.tokens: List[Token] = []
+        self.errors: List[LexerError] = []
+    
+    def error(self, message: str, line: int, column: int):
+        """에러 보고 (복구 모드가 아니면 예외 발생)"""
+        error = LexerError(message, line, column)
+        if not self.recover:
+            raise error
+        self.errors.append(error)
     
     @property
     def current_char(self) -> Optional[str]:
@@ -83,7 +98,8 @@ class Lexer:
                     return True
                 self.advance()
             
-            raise LexerError("Unterminated multi-line comment", start_line, start_col)
+            self.error("Unterminated multi-line comment", start_line, start_col)
+            return True
         
         return False
     
@@ -134,12 +150,14 @@ class Lexer:
                 if self.current_char:
                     self.advance()
             elif self.current_char == '\n':
-                raise LexerError("Unterminated string literal", start_line, start_col)
+                break
             else:
                 string_value += self.advance()
         
-        if not self.current_char:
-            raise LexerError("Unterminated string literal", start_line, start_col)
+        if self.current_char != quote_char:
+            # 복구 모드에서는 줄 끝까지를 문자열로 취급
+            self.error("Unterminated string literal", start_line, start_col)
+            return Token(TokenType.STRING, string_value, start_line, start_col)
         
         self.advance()  # 닫는 따옴표
         return Token(TokenType.STRING, string_value, start_line, start_col)
@@ -199,6 +217,8 @@ class Lexer:
             if self.skip_comment():
                 continue
             
+            offset = self.base_offset + self.pos
+            
             # 줄바꿈
             if self.current_char == '\n':
                 # 줄바꿈은 선택적으로 토큰화 (세미콜론 대신 사용 가능)
@@ -206,42 +226,41 @@ class Lexer:
                 self.advance()
                 # 연속된 빈 줄은 하나로 처리
                 if self.tokens and self.tokens[-1].type != TokenType.NEWLINE:
-                    self.tokens.append(Token(TokenType.NEWLINE, '\\n', line, col))
+                    self.tokens.append(Token(TokenType.NEWLINE, '\\n', line, col, offset))
                 continue
             
             # 숫자
             if self.current_char.isdigit():
-                self.tokens.append(self.read_number())
-                continue
+                token = self.read_number()
             
             # 문자열
-            if self.current_char in '"\'':
-                self.tokens.append(self.read_string())
-                continue
+            elif self.current_char in '"\'':
+                token = self.read_string()
             
             # 식별자/키워드
-            if self.current_char.isalpha() or self.current_char == '_':
-                self.tokens.append(self.read_identifier())
-                continue
+            elif self.current_char.isalpha() or self.current_char == '_':
+                token = self.read_identifier()
             
             # 구분자
-            if self.current_char in DELIMITERS:
+            elif self.current_char in DELIMITERS:
                 line, col = self.line, self.column
                 char = self.advance()
-                self.tokens.append(Token(DELIMITERS[char], char, line, col))
-                continue
+                token = Token(DELIMITERS[char], char, line, col)
             
             # 연산자
-            op_token = self.read_operator()
-            if op_token:
-                self.tokens.append(op_token)
-                continue
+            else:
+                token = self.read_operator()
+                if token is None:
+                    # 알 수 없는 문자 (복구 모드에서는 건너뜀)
+                    self.error(f"Unexpected character: '{self.current_char}'", self.line, self.column)
+                    self.advance()
+                    continue
             
-            # 알 수 없는 문자
-            raise LexerError(f"Unexpected character: '{self.current_char}'", self.line, self.column)
+            token.offset = offset
+            self.tokens.append(token)
         
         # EOF 토큰 추가
-        self.tokens.append(Token(TokenType.EOF, None, self.line, self.column))
+        self.tokens.append(Token(TokenType.EOF, None, self.line, self.column, self.base_offset + self.pos))
         
         return self.tokens
 
@@ -0,0 +1,635 @@
+"""
+MiniLang Language Server (언어 서버)
+편집기에서 진단(diagnostics), 정의로 이동(go-to-definition), 호버(hover), 문서 심볼을 제공하는
+Language Server Protocol 서버입니다. 표준 입출력으로 JSON-RPC 메시지를 주고받습니다.
+
+    python src/main.py --lsp
+
+문서마다 IncrementalDocument(복구 모드)로 토큰/AST를 캐시하고, didChange로 들어온 편집은
+영향받는 최상위 선언만 다시 분석합니다. 어휘 분석 에러가 있어도 나머지 코드는 계속 분석됩니다.
+함수/변수 선언(FunctionDeclaration, VariableDeclaration) 위치는 이름별 심볼 인덱스로 관리하며,
+바뀐 선언만 인덱스에서 빼고 다시 넣습니다.
+진단은 백그라운드 스레드에서 계산하며, 연속된 편집은 DIAGNOSTIC_DELAY 동안 모아 한 번만 계산합니다.
+"""
+
+import bisect
+import json
+import os
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass, fields
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlparse
+
+from tokens import Token, TokenType
+from ast_nodes import ASTNode, Statement, FunctionDeclaration, VariableDeclaration, ImportStatement
+from incremental import IncrementalDocument
+from modules import MODULE_CACHE, resolve_path
+from interpreter import BUILTINS
+
+
+# 마지막 편집 후 진단을 계산하기까지 기다리는 시간 (초)
+DIAGNOSTIC_DELAY = 0.3
+
+# LSP 상수
+SYNC_INCREMENTAL = 2
+SEVERITY_ERROR = 1
+SYMBOL_KIND_FUNCTION = 12
+SYMBOL_KIND_VARIABLE = 13
+
+# JSON-RPC 에러 코드
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INTERNAL_ERROR = -32603
+
+
+class LspError(Exception):
+    """요청 처리 에러 (JSON-RPC 에러 응답으로 변환)"""
+    def __init__(self, message: str, code: int = INTERNAL_ERROR):
+        self.message = message
+        self.code = code
+        super().__init__(message)
+
+
+# =====================================================
+# JSON-RPC 메시지 (Content-Length 헤더 + JSON 본문)
+# =====================================================
+
+def read_message(stream: BinaryIO) -> Optional[dict]:
+    """메시지 하나 읽기 (입력이 끝나면 None)"""
+    length = None
+    invalid = None
+    while True:
+        line = stream.readline()
+        if not line:
+            return None
+        line = line.strip()
+        if not line:
+            break
+        name, _, value = line.decode('ascii', errors='replace').partition(':')
+        if name.strip().lower() == 'content-length':
+            value = value.strip()
+            if value.isdigit():
+                length = int(value)
+            else:
+                invalid = value  # 헤더를 끝까지 읽은 뒤 에러 (다음 메시지와 어긋나지 않도록)
+    if invalid is not None:
+        raise LspError(f"Invalid Content-Length header: {invalid!r}", PARSE_ERROR)
+    if length is None:
+        raise LspError("Missing Content-Length header", PARSE_ERROR)
+    body = stream.read(length)
+    try:
+        return json.loads(body.decode('utf-8'))
+    except ValueError as e:
+        raise LspError(f"Invalid JSON: {e}", PARSE_ERROR)
+
+
+def write_message(stream: BinaryIO, message: dict):
+    body = json.dumps(message, ensure_ascii=False).encode('utf-8')
+    stream.write(b"Content-Length: %d\r\n\r\n" % len(body))
+    stream.write(body)
+    stream.flush()
+
+
+def uri_to_path(uri: str) -> Optional[str]:
+    parsed = urlparse(uri)
+    if parsed.scheme != 'file':
+        return None
+    return os.path.realpath(unquote(parsed.path))
+
+
+def path_to_uri(path: str) -> str:
+    return 'file://' + path
+
+
+def line_starts(text: str) -> List[int]:
+    """각 줄의 시작 오프셋"""
+    return [0] + [m.end() for m in re.finditer('\n', text)]
+
+
+# =====================================================
+# 심볼
+# =====================================================
+
+@dataclass
+class Symbol:
+    """선언 위치 (line/column은 1부터 시작)"""
+    name: str
+    kind: str  # 'function', 'variable', 'parameter'
+    line: int
+    column: int
+    detail: str
+    uri: str = ""
+
+
+def _describe(node: ASTNode) -> Tuple[str, str]:
+    """선언 노드 -> (종류, 설명)"""
+    if isinstance(node, FunctionDeclaration):
+        return 'function', f"func {node.name}({', '.join(node.parameters)})"
+    return 'variable', f"let {node.name}"
+
+
+def _symbol(node: ASTNode, uri: str = "") -> Symbol:
+    kind, detail = _describe(node)
+    return Symbol(node.name, kind, node.line, node.column, detail, uri)
+
+
+def declarations_in(statement: Statement) -> List[ASTNode]:
+    """문장 안의 모든 함수/변수 선언 노드 (중첩 포함, 소스 순서)"""
+    found = []
+    stack = [statement]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, (FunctionDeclaration, VariableDeclaration)):
+            found.append(node)
+        children = []
+        for f in fields(node):
+            value = getattr(node, f.name)
+            if isinstance(value, ASTNode):
+                children.append(value)
+            elif isinstance(value, list):
+                children.extend(item for item in value if isinstance(item, ASTNode))
+        stack.extend(reversed(children))
+    found.sort(key=lambda node: (node.line, node.column))
+    return found
+
+
+def _binding_tokens(tokens: List[Token]) -> List[Tuple[Token, str]]:
+    """매개변수와 for-in 변수 토큰 -> [(토큰, 설명)] (AST에 위치가 없는 바인딩)"""
+    found = []
+    for i, token in enumerate(tokens):
+        if token.type == TokenType.FUNC and i + 2 < len(tokens) and tokens[i + 2].type == TokenType.LPAREN:
+            function = tokens[i + 1].value
+            j = i + 3
+            while j < len(tokens) and tokens[j].type in (TokenType.IDENTIFIER, TokenType.COMMA):
+                if tokens[j].type == TokenType.IDENTIFIER:
+                    found.append((tokens[j], f"parameter {tokens[j].value} of {function}"))
+                j += 1
+        elif token.type == TokenType.FOR:
+            j = i + 1
+            if j < len(tokens) and tokens[j].type == TokenType.LPAREN:
+                j += 1
+            if j + 1 < len(tokens) and tokens[j].type == TokenType.IDENTIFIER \
+                    and tokens[j + 1].type == TokenType.IN:
+                found.append((tokens[j], f"for-in variable {tokens[j].value}"))
+    return found
+
+
+# =====================================================
+# 문서
+# =====================================================
+
+class Document:
+    """열린 문서: 증분 분석 문서, 줄 시작 오프셋, 최상위 심볼 인덱스"""
+
+    def __init__(self, uri: str, text: str, version: int = 0):
+        self.uri = uri
+        self.path = uri_to_path(uri)
+        self.version = version
+        self.source = IncrementalDocument(text, recover=True)
+        self.line_starts = line_starts(text)
+        # 이름 -> 그 이름을 선언하는 최상위 문장들, 인덱스에 들어 있는 문장들 (id -> 문장)
+        self.index: Dict[str, List[Statement]] = {}
+        self._indexed: Dict[int, Statement] = {}
+        self._declarations: Dict[int, List[ASTNode]] = {}
+        self.update_index()
+
+    @property
+    def text(self) -> str:
+        return self.source.text
+
+    # ----- 위치 변환 (LSP: 0부터 시작하는 줄/문자, MiniLang: 1부터 시작하는 줄/열) -----
+
+    def _line_text(self, line: int) -> str:
+        start = self.line_starts[line]
+        end = self.line_starts[line + 1] - 1 if line + 1 < len(self.line_starts) else len(self.text)
+        return self.text[start:end]
+
+    def offset_at(self, position: dict, utf16: bool) -> int:
+        line = min(max(position['line'], 0), len(self.line_starts) - 1)
+        character = position['character']
+        text = self._line_text(line)
+        if utf16 and not text.isascii():
+            units = 0
+            for index, char in enumerate(text):
+                if units >= character:
+                    character = index
+                    break
+                units += 2 if ord(char) > 0xFFFF else 1
+            else:
+                character = len(text)
+        return self.line_starts[line] + min(character, len(text))
+
+    def position(self, line: int, column: int, utf16: bool) -> dict:
+        line = max(line - 1, 0)
+        character = max(column - 1, 0)
+        if utf16 and line < len(self.line_starts):
+            prefix = self._line_text(line)[:character]
+            if not prefix.isascii():
+                character = len(prefix.encode('utf-16-le')) // 2
+        return {'line': line, 'character': character}
+
+    # ----- 편집 -----
+
+    def apply_change(self, change: dict, utf16: bool):
+        if 'range' not in change:
+            self.source = IncrementalDocument(change['text'], recover=True)
+            self.line_starts = line_starts(change['text'])
+            return
+        start = self.offset_at(change['range']['start'], utf16)
+        end = max(self.offset_at(change['range']['end'], utf16), start)
+        inserted = change['text']
+        self.source.edit(start, end - start, inserted)
+
+        # 줄 시작 오프셋 갱신: 지운 범위의 줄바꿈을 빼고, 삽입한 줄바꿈을 넣고, 뒤쪽은 이동
+        delta = len(inserted) - (end - start)
+        low = bisect.bisect_right(self.line_starts, start)
+        high = bisect.bisect_right(self.line_starts, end)
+        added = [start + i + 1 for i, c in enumerate(inserted) if c == '\n']
+        self.line_starts[low:] = added + [offset + delta for offset in self.line_starts[high:]]
+
+    def update_index(self):
+        """바뀐 최상위 선언만 심볼 인덱스에서 빼고 다시 넣기"""
+        current = {id(stmt): stmt for stmt in self.source.statements() if stmt is not None}
+        for key in [key for key in self._indexed if key not in current]:
+            stmt = self._indexed.pop(key)
+            self._declarations.pop(key, None)
+            if isinstance(stmt, (FunctionDeclaration, VariableDeclaration)):
+                sites = self.index[stmt.name]
+                sites.remove(stmt)
+                if not sites:
+                    del self.index[stmt.name]
+        for key, stmt in current.items():
+            if key not in self._indexed:
+                self._indexed[key] = stmt
+                if isinstance(stmt, (FunctionDeclaration, VariableDeclaration)):
+                    self.index.setdefault(stmt.name, []).append(stmt)
+
+    def declarations(self, statement: Statement) -> List[ASTNode]:
+        """최상위 문장 안의 선언 노드들 (문장이 다시 파싱될 때까지 캐시)"""
+        key = id(statement)
+        found = self._declarations.get(key)
+        if found is None:
+            found = self._declarations[key] = declarations_in(statement)
+        return found
+
+    # ----- 조회 -----
+
+    def token_at(self, offset: int) -> Tuple[Optional[Token], List[Token], Optional[Statement]]:
+        """offset 위치의 토큰과 그 토큰이 속한 최상위 선언의 (토큰들, 문장)"""
+        tokens, statement = self.source.declaration_at(offset)
+        for candidate in (offset, offset - 1):  # 식별자 바로 뒤에 커서가 있는 경우 포함
+            index = bisect.bisect_right([t.offset for t in tokens], candidate) - 1
+            if index >= 0:
+                token = tokens[index]
+                if token.type == TokenType.IDENTIFIER and candidate < token.offset + len(token.value):
+                    return token, tokens, statement
+        return None, tokens, statement
+
+    def top_level(self, name: str) -> Optional[Symbol]:
+        """최상위 선언 (함수 우선, 같은 종류면 앞의 것)"""
+        sites = self.index.get(name)
+        if not sites:
+            return None
+        for stmt in sites:
+            self.source.refresh(stmt)
+        best = min(sites, key=lambda s: (not isinstance(s, FunctionDeclaration), s.line, s.column))
+        return _symbol(best, self.uri)
+
+    def symbols(self) -> List[Symbol]:
+        """문서의 최상위 함수/변수 선언들"""
+        self.source.program()  # 모든 선언의 줄 번호를 현재 기준으로 갱신
+        return [
+            _symbol(stmt, self.uri) for stmt in self.source.statements()
+            if isinstance(stmt, (FunctionDeclaration, VariableDeclaration))
+        ]
+
+
+# =====================================================
+# 진단 (백그라운드 스레드, 디바운스)
+# =====================================================
+
+class DiagnosticWorker(threading.Thread):
+    """문서별 진단 예약을 모아, 마지막 편집 후 delay초가 지나면 한 번 계산해 발행"""
+
+    def __init__(self, publish: Callable[[str], None], delay: float = DIAGNOSTIC_DELAY):
+        super().__init__(name='minilang-diagnostics', daemon=True)
+        self.publish = publish
+        self.delay = delay
+        self._deadlines: Dict[str, float] = {}
+        self._condition = threading.Condition()
+        self._stopped = False
+
+    def schedule(self, uri: str):
+        with self._condition:
+            self._deadlines[uri] = time.monotonic() + self.delay
+            self._condition.notify()
+
+    def stop(self):
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+
+    def run(self):
+        while True:
+            with self._condition:
+                while True:
+                    if self._stopped:
+                        return
+                    if not self._deadlines:
+                        self._condition.wait()
+                        continue
+                    uri, deadline = min(self._deadlines.items(), key=lambda item: item[1])
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        del self._deadlines[uri]
+                        break
+                    self._condition.wait(remaining)
+            self.publish(uri)
+
+
+# =====================================================
+# 서버
+# =====================================================
+
+class LanguageServer:
+    """MiniLang 언어 서버
+
+    요청은 입력 스레드에서 순서대로 처리하고, 진단만 DiagnosticWorker 스레드에서 계산합니다.
+    문서 접근은 self.lock으로 보호합니다.
+    """
+
+    def __init__(self, input_stream: BinaryIO, output_stream: BinaryIO,
+                 diagnostic_delay: float = DIAGNOSTIC_DELAY):
+        self.input = input_stream
+        self.output = output_stream
+        self.documents: Dict[str, Document] = {}
+        self.lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self.utf16 = True
+        self.shutdown_requested = False
+        self.exited = False
+        self.diagnostics = DiagnosticWorker(self.publish_diagnostics, diagnostic_delay)
+
+        self.requests: Dict[str, Callable[[dict], Any]] = {
+            'initialize': self.initialize,
+            'shutdown': self.shutdown,
+            'textDocument/definition': self.definition,
+            'textDocument/hover': self.hover,
+            'textDocument/documentSymbol': self.document_symbols,
+        }
+        self.notifications: Dict[str, Callable[[dict], None]] = {
+            'initialized': lambda params: None,
+            'exit': self.exit,
+            'textDocument/didOpen': self.did_open,
+            'textDocument/didChange': self.did_change,
+            'textDocument/didClose': self.did_close,
+        }
+
+    # ----- 메시지 루프 -----
+
+    def serve(self) -> int:
+        """입력이 끝나거나 exit 알림을 받을 때까지 메시지 처리 (종료 코드 반환)"""
+        self.diagnostics.start()
+        try:
+            while not self.exited:
+                try:
+                    message = read_message(self.input)
+                except LspError as e:
+                    self.send({'jsonrpc': '2.0', 'id': None, 'error': {'code': e.code, 'message': e.message}})
+                    continue
+                if message is None:
+                    break
+                self.handle(message)
+        finally:
+            self.diagnostics.stop()
+        return 0 if self.shutdown_requested else 1
+
+    def handle(self, message: dict):
+        method = message.get('method')
+        params = message.get('params') or {}
+        if 'id' not in message:
+            handler = self.notifications.get(method)
+            if handler is not None:
+                # 알림에는 응답이 없으므로 에러는 표준 에러에 기록하고 계속 처리
+                try:
+                    with self.lock:
+                        handler(params)
+                except LspError as e:
+                    print(f"minilang-lsp: {method}: {e.message}", file=sys.stderr)
+                except Exception as e:
+                    print(f"minilang-lsp: {method}: {type(e).__name__}: {e}", file=sys.stderr)
+            return
+
+        response: Dict[str, Any] = {'jsonrpc': '2.0', 'id': message['id']}
+        try:
+            handler = self.requests.get(method)
+            if handler is None:
+                raise LspError(f"Unknown method: {method}", METHOD_NOT_FOUND)
+            if self.shutdown_requested and method != 'shutdown':
+                raise LspError("Server is shutting down", INVALID_REQUEST)
+            with self.lock:
+                response['result'] = handler(params)
+        except LspError as e:
+            response['error'] = {'code': e.code, 'message': e.message}
+        except Exception as e:
+            response['error'] = {'code': INTERNAL_ERROR, 'message': f"{type(e).__name__}: {e}"}
+        self.send(response)
+
+    def send(self, message: dict):
+        with self._write_lock:
+            write_message(self.output, message)
+
+    def notify(self, method: str, params: dict):
+        self.send({'jsonrpc': '2.0', 'method': method, 'params': params})
+
+    # ----- 수명 주기 -----
+
+    def initialize(self, params: dict) -> dict:
+        encodings = params.get('capabilities', {}).get('general', {}).get('positionEncodings', [])
+        self.utf16 = 'utf-32' not in encodings
+        return {
+            'capabilities': {
+                'positionEncoding': 'utf-16' if self.utf16 else 'utf-32',
+                'textDocumentSync': {'openClose': True, 'change': SYNC_INCREMENTAL},
+                'definitionProvider': True,
+                'hoverProvider': True,
+                'documentSymbolProvider': True,
+            },
+            'serverInfo': {'name': 'minilang-lsp'},
+        }
+
+    def shutdown(self, params: dict):
+        self.shutdown_requested = True
+        return None
+
+    def exit(self, params: dict):
+        self.exited = True
+
+    # ----- 문서 동기화 -----
+
+    def _document(self, params: dict) -> Document:
+        uri = params['textDocument']['uri']
+        document = self.documents.get(uri)
+        if document is None:
+            raise LspError(f"Document is not open: {uri}", INVALID_REQUEST)
+        return document
+
+    def did_open(self, params: dict):
+        item = params['textDocument']
+        self.documents[item['uri']] = Document(item['uri'], item['text'], item.get('version', 0))
+        self.diagnostics.schedule(item['uri'])
+
+    def did_change(self, params: dict):
+        document = self._document(params)
+        for change in params['contentChanges']:
+            document.apply_change(change, self.utf16)
+        document.version = params['textDocument'].get('version', document.version)
+        document.update_index()
+        self.diagnostics.schedule(document.uri)
+
+    def did_close(self, params: dict):
+        uri = params['textDocument']['uri']
+        self.documents.pop(uri, None)
+        self.notify('textDocument/publishDiagnostics', {'uri': uri, 'diagnostics': []})
+
+    def publish_diagnostics(self, uri: str):
+        """진단 계산 후 발행 (DiagnosticWorker 스레드에서 호출)"""
+        with self.lock:
+            document = self.documents.get(uri)
+            if document is None:
+                return
+            diagnostics = []
+            for error in document.source.lexer_errors:
+                diagnostics.append(self._diagnostic(document, error.line, error.column, 1, error.message))
+            for error in document.source.errors:
+                token = error.token
+                length = len(str(token.value)) if token.value is not None else 1
+                diagnostics.append(self._diagnostic(document, token.line, token.column, length, error.message))
+            version = document.version
+        self.notify('textDocument/publishDiagnostics', {
+            'uri': uri, 'version': version, 'diagnostics': diagnostics,
+        })
+
+    def _diagnostic(self, document: Document, line: int, column: int, length: int, message: str) -> dict:
+        return {
+            'range': {
+                'start': document.position(line, column, self.utf16),
+                'end': document.position(line, column + length, self.utf16),
+            },
+            'severity': SEVERITY_ERROR,
+            'source': 'minilang',
+            'message': message,
+        }
+
+    # ----- 언어 기능 -----
+
+    def resolve(self, document: Document, offset: int) -> Tuple[Optional[Token], Optional[Symbol]]:
+        """커서 위치의 식별자와 그 선언"""
+        token, tokens, statement = document.token_at(offset)
+        if token is None:
+            return None, None
+        name = token.value
+
+        # 1. 같은 최상위 선언 안에서 커서 앞의 가장 가까운 선언 (매개변수, for-in 변수 포함)
+        best: Optional[Symbol] = None
+        if statement is not None:
+            for node in document.declarations(statement):
+                if node.name == name and (node.line, node.column) <= (token.line, token.column):
+                    best = _symbol(node, document.uri)
+        for binding, detail in _binding_tokens(tokens):
+            if binding.value == name and binding.offset <= token.offset:
+                if best is None or (binding.line, binding.column) > (best.line, best.column):
+                    best = Symbol(name, 'parameter', binding.line, binding.column, detail, document.uri)
+        if best is not None:
+            return token, best
+
+        # 2. 문서의 최상위 선언
+        symbol = document.top_level(name)
+        if symbol is not None:
+            return token, symbol
+
+        # 3. import한 모듈의 공개 함수
+        return token, self._imported(document, name)
+
+    def _imported(self, document: Document, name: str) -> Optional[Symbol]:
+        if document.path is None or name.startswith('_'):
+            return None
+        base_dir = os.path.dirname(document.path)
+        for stmt in document.source.statements():
+            if not isinstance(stmt, ImportStatement):
+                continue
+            path = resolve_path(stmt.path, base_dir)
+            uri = path_to_uri(path)
+            opened = self.documents.get(uri)
+            if opened is not None:
+                symbol = opened.top_level(name)
+                if symbol is not None and symbol.kind == 'function':
+                    return symbol
+                continue
+            try:
+                program = MODULE_CACHE.get(path)
+            except Exception:
+                continue  # 없거나 에러가 있는 모듈
+            for module_stmt in program.statements:
+                if isinstance(module_stmt, FunctionDeclaration) and module_stmt.name == name:
+                    return _symbol(module_stmt, uri)
+        return None
+
+    def _location(self, symbol: Symbol) -> dict:
+        start = self._position_in(symbol.uri, symbol.line, symbol.column)
+        end = self._position_in(symbol.uri, symbol.line, symbol.column + len(symbol.name))
+        return {'uri': symbol.uri, 'range': {'start': start, 'end': end}}
+
+    def _position_in(self, uri: str, line: int, column: int) -> dict:
+        document = self.documents.get(uri)
+        if document is not None:
+            return document.position(line, column, self.utf16)
+        return {'line': line - 1, 'character': column - 1}
+
+    def definition(self, params: dict) -> Optional[dict]:
+        document = self._document(params)
+        _, symbol = self.resolve(document, document.offset_at(params['position'], self.utf16))
+        return self._location(symbol) if symbol is not None else None
+
+    def hover(self, params: dict) -> Optional[dict]:
+        document = self._document(params)
+        token, symbol = self.resolve(document, document.offset_at(params['position'], self.utf16))
+        if token is None:
+            return None
+        if symbol is not None:
+            where = "" if symbol.uri == document.uri else f" ({os.path.basename(uri_to_path(symbol.uri) or symbol.uri)})"
+            text = f"{symbol.detail}\n\nline {symbol.line}{where}"
+        elif token.value in BUILTINS:
+            text = f"builtin {token.value}"
+        else:
+            return None
+        return {
+            'contents': {'kind': 'plaintext', 'value': text},
+            'range': {
+                'start': document.position(token.line, token.column, self.utf16),
+                'end': document.position(token.line, token.column + len(token.value), self.utf16),
+            },
+        }
+
+    def document_symbols(self, params: dict) -> List[dict]:
+        document = self._document(params)
+        result = []
+        for symbol in document.symbols():
+            location = self._location(symbol)
+            result.append({
+                'name': symbol.name,
+                'detail': symbol.detail,
+                'kind': SYMBOL_KIND_FUNCTION if symbol.kind == 'function' else SYMBOL_KIND_VARIABLE,
+                'range': location['range'],
+                'selectionRange': location['range'],
+            })
+        return result
+
+
+def serve_stdio() -> int:
+    """표준 입출력으로 언어 서버 실행"""
+    return LanguageServer(sys.stdin.buffer, sys.stdout.buffer).serve()
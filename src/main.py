@@ -4,6 +4,7 @@ MiniLang - A Simple Programming Language Interpreter
 메인 실행 파일: REPL 및 파일 실행 지원
 """
 
+import gc
 import sys
 import os
 import argparse
@@ -16,6 +17,10 @@ from lexer import Lexer, LexerError, tokenize
 from parser import Parser, ParseError, parse
 from interpreter import Interpreter, RuntimeError as MiniLangRuntimeError, interpret
 from ast_nodes import print_ast
+from bundle import BundleError, write_bundle, load_bundle
+from transpiler import TranspileError, transpile, compile_program
+from typeinfer import InferenceError, infer_types
+from snapshot import SnapshotError
 
 
 VERSION = "1.0.0"
@@ -76,8 +81,13 @@ def show_ast(code: str):
         print(f"Parse Error: {e}")
 
 
-def run_file(filepath: str, show_debug: bool = False) -> bool:
-    """파일 실행"""
+def run_file(filepath: str, show_debug: bool = False, transpile: bool = False, stats: bool = False,
+             restore: Optional[str] = None, snapshot: Optional[str] = None) -> bool:
+    """파일 실행 (transpile이면 파이썬 코드로 변환해 실행, stats이면 단계별 실행 기록 출력)
+
+    restore이면 그 스냅숏의 전역 상태에서 이어서 실행하고, snapshot이면 실행이 끝난 뒤의
+    전역 상태를 스냅숏으로 저장합니다.
+    """
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
             code = f.read()
@@ -113,8 +123,25 @@ def run_file(filepath: str, show_debug: bool = False) -> bool:
         
         # 실행
         interpreter = Interpreter()
-        interpreter.execute(program)
-        
+        if restore:
+            interpreter.restore(restore)
+        interpreter.script_path = filepath
+        try:
+            if transpile:
+                compile_program(program, filepath).run(interpreter)
+            else:
+                try:
+                    interpreter.execute(program)
+                finally:
+                    if stats:
+                        print(interpreter.tiering.report())
+            
+            if snapshot:
+                interpreter.snapshot(snapshot)
+                size = os.path.getsize(snapshot)
+                print(f"Snapshot written: {snapshot} ({size / 1024:.1f} KB)")
+        finally:
+            interpreter.close_streams()
         return True
         
     except FileNotFoundError:
@@ -126,6 +153,12 @@ def run_file(filepath: str, show_debug: bool = False) -> bool:
     except ParseError as e:
         print(f"Parse Error: {e}")
         return False
+    except TranspileError as e:
+        print(f"{e}")
+        return False
+    except SnapshotError as e:
+        print(f"Error: {e}")
+        return False
     except MiniLangRuntimeError as e:
         print(f"Runtime Error: {e}")
         return False
@@ -134,6 +167,72 @@ def run_file(filepath: str, show_debug: bool = False) -> bool:
         return False
 
 
+def emit_python(output_path: str, filepath: str) -> bool:
+    """파이썬 코드로 변환해 파일로 저장"""
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            program = parse(tokenize(f.read()))
+        source = transpile(program, filepath)
+    except FileNotFoundError:
+        print(f"Error: File not found: {filepath}")
+        return False
+    except (LexerError, ParseError, TranspileError) as e:
+        print(f"Error: {e}")
+        return False
+    with open(output_path, 'w', encoding='utf-8') as f:
+        f.write(source)
+    print(f"Python written: {output_path} ({source.count(chr(10))} lines)")
+    return True
+
+
+def show_types(filepath: str) -> bool:
+    """타입 추론 결과와 범위 출력 (실행하지 않음)"""
+    try:
+        with open(filepath, 'r', encoding='utf-8') as f:
+            program = parse(tokenize(f.read()))
+        print(infer_types(program, filepath).dump(os.path.basename(filepath)))
+    except FileNotFoundError:
+        print(f"Error: File not found: {filepath}")
+        return False
+    except (LexerError, ParseError, InferenceError) as e:
+        print(f"Error: {e}")
+        return False
+    return True
+
+
+def make_bundle(output_path: str, filepath: str) -> bool:
+    """번들 생성"""
+    try:
+        modules = write_bundle(output_path, filepath)
+    except (BundleError, LexerError) as e:
+        print(f"Error: {e}")
+        return False
+    size = os.path.getsize(output_path)
+    print(f"Bundle written: {output_path} ({len(modules)} modules, {size / 1024:.1f} KB)")
+    return True
+
+
+def run_bundle(filepath: str) -> bool:
+    """번들 실행 (파싱 없이 저장된 AST를 실행)"""
+    try:
+        entry, program = load_bundle(filepath)
+        # 로드한 AST는 프로그램이 끝날 때까지 유지되므로 이후의 GC 검사 대상에서 제외
+        gc.freeze()
+        interpreter = Interpreter()
+        interpreter.script_path = entry
+        try:
+            interpreter.execute(program)
+        finally:
+            interpreter.close_streams()
+        return True
+    except BundleError as e:
+        print(f"Error: {e}")
+        return False
+    except MiniLangRuntimeError as e:
+        print(f"Runtime Error: {e}")
+        return False
+
+
 def repl():
     """대화형 REPL (Read-Eval-Print Loop)"""
     print(BANNER)
@@ -243,6 +342,15 @@ Examples:
   minilang -d script.ml       Run with debug output
   minilang -t "let x = 10"    Show tokens
   minilang -a "let x = 10"    Show AST
+  minilang --bundle app.mlb app.ml   Precompile app.ml and its imports
+  minilang app.mlb            Run a bundle
+  minilang --lsp              Start the language server (stdio)
+  minilang --transpile app.ml        Run app.ml as compiled Python
+  minilang --emit-python app.py app.ml   Write app.ml as a Python program
+  minilang --stats app.ml            Show which functions were compiled and when
+  minilang --types app.ml            Show inferred types without running
+  minilang --snapshot-after-init init.snap init.ml   Run init.ml and save its global state
+  minilang --restore init.snap app.ml                Run app.ml on the saved state
 """
     )
     
@@ -252,9 +360,23 @@ Examples:
     parser.add_argument('-t', '--tokens', metavar='CODE', help='Show tokens for code')
     parser.add_argument('-a', '--ast', metavar='CODE', help='Show AST for code')
     parser.add_argument('-c', '--code', metavar='CODE', help='Execute code directly')
+    parser.add_argument('--bundle', metavar='OUT', help='Write FILE and its imports to a precompiled bundle')
+    parser.add_argument('--lsp', action='store_true', help='Start the language server on stdin/stdout')
+    parser.add_argument('--transpile', action='store_true', help='Run FILE by translating it to Python')
+    parser.add_argument('--emit-python', metavar='OUT', help='Write FILE translated to Python source')
+    parser.add_argument('--types', action='store_true', help='Show inferred types of FILE and exit')
+    parser.add_argument('--stats', action='store_true', help='Report hot functions promoted to compiled code')
+    parser.add_argument('--snapshot-after-init', metavar='OUT',
+                        help='Run FILE and save the resulting global state to a snapshot')
+    parser.add_argument('--restore', metavar='SNAPSHOT', help='Run FILE starting from a saved snapshot')
     
     args = parser.parse_args()
     
+    # 언어 서버
+    if args.lsp:
+        from lsp import serve_stdio
+        sys.exit(serve_stdio())
+    
     # 토큰 출력
     if args.tokens:
         show_tokens(args.tokens)
@@ -276,9 +398,33 @@ Examples:
             sys.exit(1)
         return
     
-    # 파일 실행
+    # 번들 생성
+    if args.bundle:
+        if not args.file:
+            parser.error('--bundle requires a source file')
+        sys.exit(0 if make_bundle(args.bundle, args.file) else 1)
+    
+    # 파이썬 코드 생성
+    if args.emit_python:
+        if not args.file:
+            parser.error('--emit-python requires a source file')
+        sys.exit(0 if emit_python(args.emit_python, args.file) else 1)
+    
+    # 타입 추론 결과
+    if args.types:
+        if not args.file:
+            parser.error('--types requires a source file')
+        sys.exit(0 if show_types(args.file) else 1)
+    
+    if (args.snapshot_after_init or args.restore) and not args.file:
+        parser.error('--snapshot-after-init and --restore require a source file')
+    
+    # 파일 실행 (.mlb는 번들)
     if args.file:
-        success = run_file(args.file, show_debug=args.debug)
+        if args.file.endswith('.mlb'):
+            sys.exit(0 if run_bundle(args.file) else 1)
+        success = run_file(args.file, show_debug=args.debug, transpile=args.transpile,
+                           stats=args.stats, restore=args.restore, snapshot=args.snapshot_after_init)
         sys.exit(0 if success else 1)
     
     # REPL 시작
@@ -0,0 +1,162 @@
+"""
+MiniLang Modules (모듈 시스템)
+import 문으로 불러오는 모듈 파일의 경로 해석, 파싱, 캐시를 담당합니다.
+
+파싱된 모듈(Program)은 절대 경로를 키로 프로세스 전체에서 캐시되므로, 같은 모듈을
+여러 스크립트/인터프리터가 불러와도 한 번만 어휘/구문 분석합니다 (파일이 바뀌면 다시 파싱).
+캐시에 없는 모듈을 불러올 때는 그 모듈이 import하는 모듈들(함수 본문과 블록 안의 import 포함)까지
+의존 그래프를 단계별로 미리 파싱하며, 한 단계의 파일 수가 많으면 프로세스 풀에서 병렬로 파싱합니다.
+
+모듈의 실행(최상위 문장 평가)은 인터프리터마다 한 번씩 이루어집니다 (Interpreter.visit_ImportStatement).
+"""
+
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from ast_nodes import Program, ImportStatement
+from closures import child_nodes
+from lexer import tokenize, LexerError
+from parser import Parser
+from runtime import RuntimeError
+
+
+# 한 단계에서 파싱할 파일이 이 개수 이상이면 프로세스 풀 사용
+PARALLEL_PARSE_THRESHOLD = 8
+
+
+def _available_cpus() -> int:
+    """이 프로세스가 사용할 수 있는 CPU 수"""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def resolve_path(path: str, base_dir: str) -> str:
+    """import 경로를 절대 경로로 해석 (상대 경로는 base_dir 기준)"""
+    return os.path.realpath(os.path.join(base_dir, path))
+
+
+def find_imports(program: Program) -> List[str]:
+    """프로그램 전체(함수 본문, 블록 안 포함)의 import 경로들 (처음 나온 순서, 중복 제거)"""
+    paths: Dict[str, None] = {}
+    pending = list(reversed(program.statements))
+    while pending:
+        node = pending.pop()
+        if isinstance(node, ImportStatement):
+            paths[node.path] = None
+        pending.extend(reversed(child_nodes(node)))
+    return list(paths)
+
+
+def _parse_file(path: str) -> Tuple[int, Optional[Program], Optional[str]]:
+    """모듈 파일 파싱 -> (mtime_ns, 프로그램, 에러 메시지)
+
+    프로세스 풀에서도 실행되므로 예외 대신 에러 메시지를 반환합니다.
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+        with open(path, 'r', encoding='utf-8') as f:
+            source = f.read()
+    except OSError as e:
+        return 0, None, f"Cannot import '{path}': {e.strerror}"
+
+    try:
+        parser = Parser(tokenize(source))
+        program = parser.parse()
+    except LexerError as e:
+        return mtime, None, f"Error in module '{path}': {e}"
+    if parser.errors:
+        return mtime, None, f"Error in module '{path}': {parser.errors[0]}"
+    return mtime, program, None
+
+
+@dataclass
+class CachedModule:
+    """캐시된 모듈 (mtime_ns가 None이면 번들에서 고정된 모듈로, 파일을 확인하지 않음)"""
+    path: str
+    mtime_ns: Optional[int]
+    program: Program
+
+
+class ModuleCache:
+    """파싱된 모듈 캐시 (절대 경로 -> CachedModule)"""
+
+    def __init__(self):
+        self._modules: Dict[str, CachedModule] = {}
+        self._lock = threading.Lock()
+        self.parsed = 0  # 실제로 파싱한 파일 수 (통계)
+
+    def get(self, path: str) -> Program:
+        """모듈의 파싱된 프로그램 (캐시에 없거나 파일이 바뀌었으면 의존 모듈까지 파싱)"""
+        entry = self._fresh(path)
+        if entry is None:
+            self.load_graph([path])
+            entry = self._fresh(path)
+        if entry is None:
+            # 파싱 실패: 에러 메시지를 얻기 위해 다시 파싱
+            _, _, error = _parse_file(path)
+            raise RuntimeError(error or f"Cannot import '{path}'")
+        return entry.program
+
+    def _fresh(self, path: str) -> Optional[CachedModule]:
+        """캐시된 모듈이 파일과 일치하면 반환"""
+        with self._lock:
+            entry = self._modules.get(path)
+        if entry is None:
+            return None
+        if entry.mtime_ns is None:
+            return entry
+        try:
+            if os.stat(path).st_mtime_ns != entry.mtime_ns:
+                return None
+        except OSError:
+            return None
+        return entry
+
+    def load_graph(self, paths: List[str]):
+        """모듈들과 그 의존 모듈들을 단계별(너비 우선)로 파싱해 캐시에 저장"""
+        pending = [path for path in dict.fromkeys(paths) if self._fresh(path) is None]
+        seen = set(pending)
+        while pending:
+            next_level = []
+            for path, (mtime, program, error) in zip(pending, self._parse_all(pending)):
+                if program is None:
+                    continue  # 에러는 실제로 import할 때 보고
+                with self._lock:
+                    self._modules[path] = CachedModule(path, mtime, program)
+                base_dir = os.path.dirname(path)
+                for dependency in find_imports(program):
+                    dependency = resolve_path(dependency, base_dir)
+                    if dependency not in seen and os.path.isfile(dependency) \
+                            and self._fresh(dependency) is None:
+                        seen.add(dependency)
+                        next_level.append(dependency)
+            pending = next_level
+
+    def _parse_all(self, paths: List[str]) -> List[Tuple[int, Optional[Program], Optional[str]]]:
+        self.parsed += len(paths)
+        workers = min(len(paths), _available_cpus())
+        if len(paths) >= PARALLEL_PARSE_THRESHOLD and workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    return list(executor.map(_parse_file, paths))
+            except (OSError, ImportError, NotImplementedError, BrokenProcessPool):
+                pass  # 프로세스를 만들 수 없는 환경에서는 순차 파싱
+        return [_parse_file(path) for path in paths]
+
+    def pin(self, path: str, program: Program):
+        """파일 대신 주어진 프로그램을 모듈로 사용 (번들 로드용)"""
+        with self._lock:
+            self._modules[path] = CachedModule(path, None, program)
+
+    def clear(self):
+        with self._lock:
+            self._modules.clear()
+
+
+# 프로세스 전체에서 공유하는 모듈 캐시
+MODULE_CACHE = ModuleCache()
@@ -0,0 +1,531 @@
+"""
+MiniLang Numeric (수치 배열)
+array.array 버퍼에 저장되는 타입 배열(int_array, float_array), 2차원 행렬(matrix)과
+원소별 일괄 연산, 집계 연산, 행렬 곱셈을 제공합니다.
+
+NumPy를 불러올 수 있으면 버퍼를 복사 없이 NumPy 배열로 보고 일괄 연산을 수행하고,
+없으면 map/sum 등 C로 구현된 Python 내장 함수로 한 번에 처리합니다.
+"""
+
+import operator
+from array import array
+from itertools import repeat
+from typing import Any, Dict, Iterable, Union
+
+from runtime import ArrayLike, BuiltinFunction, RuntimeError, ARRAY_TYPES, to_string
+
+try:
+    import numpy as _np
+except ImportError:  # NumPy는 선택 의존성
+    _np = None
+
+
+INT_CODE = 'q'    # 64비트 정수
+FLOAT_CODE = 'd'  # 64비트 실수
+
+_NUMPY_DTYPES = {INT_CODE: 'int64', FLOAT_CODE: 'float64'}
+
+
+class TypedArray(ArrayLike):
+    """연속된 버퍼에 저장되는 정수/실수 배열"""
+    __slots__ = ('data',)
+
+    def __init__(self, data: array):
+        self.data = data
+
+    @property
+    def type_name(self) -> str:
+        return 'int_array' if self.data.typecode == INT_CODE else 'float_array'
+
+    @property
+    def is_float(self) -> bool:
+        return self.data.typecode == FLOAT_CODE
+
+    @classmethod
+    def zeros(cls, typecode: str, length: int) -> 'TypedArray':
+        return cls(array(typecode, bytes(array(typecode).itemsize * length)))
+
+    @classmethod
+    def from_values(cls, typecode: str, values: Iterable[Any]) -> 'TypedArray':
+        try:
+            return cls(array(typecode, values))
+        except TypeError:
+            kind = 'integers' if typecode == INT_CODE else 'numbers'
+            raise RuntimeError(f"Typed array elements must be {kind}")
+        except OverflowError:
+            raise RuntimeError("Integer too large for int_array")
+
+    def as_numpy(self):
+        """버퍼를 공유하는 NumPy 배열 (NumPy가 있을 때만 사용)"""
+        return _np.frombuffer(self.data, dtype=_NUMPY_DTYPES[self.data.typecode])
+
+    # ----- 배열 프로토콜 -----
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return TypedArray(self.data[index])
+        return self.data[index]
+
+    def __setitem__(self, index: Union[int, slice], value: Any):
+        try:
+            if isinstance(index, slice):
+                self.data[index] = array(self.data.typecode, value)
+            else:
+                self.data[index] = value
+        except TypeError:
+            raise RuntimeError(f"Cannot store {type(value).__name__} in {self.type_name}")
+        except OverflowError:
+            raise RuntimeError("Integer too large for int_array")
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __contains__(self, value: Any) -> bool:
+        return value in self.data
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ARRAY_TYPES):
+            return len(self) == len(other) and all(map(operator.eq, self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def index(self, value: Any) -> int:
+        return self.data.index(value)
+
+    def append(self, value: Any):
+        self[len(self.data):] = [value]
+
+    def extend(self, values: Iterable[Any]):
+        self[len(self.data):] = list(values)
+
+    def pop(self) -> Any:
+        return self.data.pop()
+
+    def reverse(self):
+        self.data.reverse()
+
+    def sort(self, key=None):
+        self.data[:] = array(self.data.typecode, sorted(self.data, key=key))
+
+    # ----- 집계 -----
+
+    def sum(self) -> Union[int, float]:
+        if _np is not None:
+            return self.as_numpy().sum().item()
+        return sum(self.data)
+
+    def min(self) -> Union[int, float]:
+        if not self.data:
+            raise RuntimeError("min of empty array")
+        if _np is not None:
+            return self.as_numpy().min().item()
+        return min(self.data)
+
+    def max(self) -> Union[int, float]:
+        if not self.data:
+            raise RuntimeError("max of empty array")
+        if _np is not None:
+            return self.as_numpy().max().item()
+        return max(self.data)
+
+    def dot(self, other: 'TypedArray') -> Union[int, float]:
+        if len(self) != len(other):
+            raise RuntimeError(f"dot: length mismatch ({len(self)} vs {len(other)})")
+        if _np is not None:
+            return self.as_numpy().dot(other.as_numpy()).item()
+        return sum(map(operator.mul, self.data, other.data))
+
+
+class Matrix(ArrayLike):
+    """2차원 실수 행렬 (행 우선 순서로 하나의 버퍼에 저장)
+    
+    m[i]는 i번째 행을 가리키는 MatrixRow 뷰를 반환하므로 m[i][j]로 읽고 쓸 수 있습니다.
+    """
+    __slots__ = ('rows', 'cols', 'data')
+    type_name = 'matrix'
+
+    def __init__(self, rows: int, cols: int, data: array):
+        self.rows = rows
+        self.cols = cols
+        self.data = data
+
+    @classmethod
+    def zeros(cls, rows: int, cols: int) -> 'Matrix':
+        return cls(rows, cols, TypedArray.zeros(FLOAT_CODE, rows * cols).data)
+
+    @classmethod
+    def from_rows(cls, values: Any) -> 'Matrix':
+        rows = [list(row) if isinstance(row, ARRAY_TYPES) else None for row in values]
+        if not rows or any(row is None for row in rows):
+            raise RuntimeError("matrix requires a non-empty array of arrays")
+        cols = len(rows[0])
+        if any(len(row) != cols for row in rows):
+            raise RuntimeError("matrix rows must all have the same length")
+        flat = TypedArray.from_values(FLOAT_CODE, [x for row in rows for x in row])
+        return cls(len(rows), cols, flat.data)
+
+    def as_numpy(self):
+        return _np.frombuffer(self.data, dtype='float64').reshape(self.rows, self.cols)
+
+    def flat(self) -> TypedArray:
+        """원소 전체를 공유하는 1차원 타입 배열"""
+        return TypedArray(self.data)
+
+    def row(self, i: int) -> TypedArray:
+        if isinstance(i, bool) or not isinstance(i, int):
+            raise RuntimeError("Matrix row index must be an integer")
+        if not 0 <= i < self.rows:
+            raise RuntimeError(f"Matrix row out of bounds: {i}")
+        return TypedArray(self.data[i * self.cols:(i + 1) * self.cols])
+
+    def col(self, j: int) -> TypedArray:
+        if isinstance(j, bool) or not isinstance(j, int):
+            raise RuntimeError("Matrix column index must be an integer")
+        if not 0 <= j < self.cols:
+            raise RuntimeError(f"Matrix column out of bounds: {j}")
+        return TypedArray(self.data[j::self.cols])
+
+    def transpose(self) -> 'Matrix':
+        if _np is not None:
+            result = _np.ascontiguousarray(self.as_numpy().T)
+            data = array(FLOAT_CODE)
+            data.frombytes(result.tobytes())
+            return Matrix(self.cols, self.rows, data)
+        data = array(FLOAT_CODE)
+        for j in range(self.cols):
+            data.extend(self.data[j::self.cols])
+        return Matrix(self.cols, self.rows, data)
+
+    # ----- 배열 프로토콜 (행 단위) -----
+
+    def __len__(self) -> int:
+        return self.rows
+
+    def __getitem__(self, i: int) -> 'MatrixRow':
+        return MatrixRow(self, i * self.cols)
+
+    def __setitem__(self, i: int, values: Any):
+        if not isinstance(values, ARRAY_TYPES) or len(values) != self.cols:
+            raise RuntimeError(f"Matrix row assignment requires an array of length {self.cols}")
+        row = TypedArray.from_values(FLOAT_CODE, values)
+        self.data[i * self.cols:(i + 1) * self.cols] = row.data
+
+    def __iter__(self):
+        return (self[i] for i in range(self.rows))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Matrix):
+            return (self.rows, self.cols) == (other.rows, other.cols) and self.data == other.data
+        return NotImplemented
+
+    __hash__ = None
+
+    def sum(self):
+        return self.flat().sum()
+
+    def min(self):
+        return self.flat().min()
+
+    def max(self):
+        return self.flat().max()
+
+
+class MatrixRow(ArrayLike):
+    """행렬의 한 행을 가리키는 뷰 (대입은 행렬 버퍼에 반영)"""
+    __slots__ = ('matrix', 'offset')
+
+    def __init__(self, matrix: Matrix, offset: int):
+        self.matrix = matrix
+        self.offset = offset
+
+    def to_typed(self) -> TypedArray:
+        return TypedArray(self.matrix.data[self.offset:self.offset + self.matrix.cols])
+
+    def __len__(self) -> int:
+        return self.matrix.cols
+
+    def __getitem__(self, j: int) -> float:
+        return self.matrix.data[self.offset + j]
+
+    def __setitem__(self, j: Any, value: Any):
+        if isinstance(j, slice):
+            start, stop, _ = j.indices(self.matrix.cols)
+            j = slice(self.offset + start, self.offset + stop)
+            self.matrix.data[j] = TypedArray.from_values(FLOAT_CODE, value).data
+            return
+        try:
+            self.matrix.data[self.offset + j] = value
+        except TypeError:
+            raise RuntimeError(f"Cannot store {type(value).__name__} in matrix")
+
+    def __iter__(self):
+        return iter(self.matrix.data[self.offset:self.offset + self.matrix.cols])
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ARRAY_TYPES):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def sum(self):
+        return self.to_typed().sum()
+
+    def min(self):
+        return self.to_typed().min()
+
+    def max(self):
+        return self.to_typed().max()
+
+
+# 행렬 곱셈의 블록 크기 (순수 Python 커널)
+MATMUL_BLOCK = 64
+
+
+def matmul(a: Matrix, b: Matrix) -> Matrix:
+    """행렬 곱셈"""
+    if a.cols != b.rows:
+        raise RuntimeError(f"matmul: shape mismatch ({a.rows}x{a.cols} * {b.rows}x{b.cols})")
+    if _np is not None:
+        result = a.as_numpy() @ b.as_numpy()
+        data = array(FLOAT_CODE)
+        data.frombytes(_np.ascontiguousarray(result).tobytes())
+        return Matrix(a.rows, b.cols, data)
+
+    # 순수 Python 블록 커널: A의 행과 B^T의 행(= B의 열)의 내적을 sum(map(mul))로
+    # C 수준에서 계산하고, 블록 단위로 순회해 같은 행/열 조각을 연속해서 재사용
+    n, k, m = a.rows, a.cols, b.cols
+    a_rows = [a.data[i * k:(i + 1) * k] for i in range(n)]
+    b_cols = [b.data[j::m] for j in range(m)]
+    out = TypedArray.zeros(FLOAT_CODE, n * m).data
+    mul = operator.mul
+    block = MATMUL_BLOCK
+    for i0 in range(0, n, block):
+        i1 = min(i0 + block, n)
+        for j0 in range(0, m, block):
+            j1 = min(j0 + block, m)
+            cols = b_cols[j0:j1]
+            for i in range(i0, i1):
+                row = a_rows[i]
+                base = i * m + j0
+                out[base:base + (j1 - j0)] = array(
+                    FLOAT_CODE, [sum(map(mul, row, col)) for col in cols]
+                )
+    return Matrix(n, m, out)
+
+
+# 일괄 연산으로 처리하는 값의 타입들
+BULK_TYPES = (TypedArray, Matrix, MatrixRow)
+
+
+_OPERATORS = {
+    '+': operator.add,
+    '-': operator.sub,
+    '*': operator.mul,
+    '/': operator.truediv,
+    '%': operator.mod,
+    '**': operator.pow,
+}
+
+
+def _result_code(op: str, left: Any, right: Any) -> str:
+    """결과 배열의 타입 코드 결정 (정수끼리의 /만 실수가 됨)"""
+    if op == '/':
+        return FLOAT_CODE
+    for operand in (left, right):
+        if isinstance(operand, TypedArray):
+            if operand.is_float:
+                return FLOAT_CODE
+        elif isinstance(operand, float):
+            return FLOAT_CODE
+    return INT_CODE
+
+
+def bulk_binary_op(op: str, left: Any, right: Any, line: int = 0, column: int = 0) -> Any:
+    """타입 배열이 포함된 이항 연산 (원소별 일괄 처리)"""
+    if op == '+' and (isinstance(left, str) or isinstance(right, str)):
+        return to_string(left) + to_string(right)
+    if op in ('==', '!='):
+        equal = isinstance(left, ARRAY_TYPES) and isinstance(right, ARRAY_TYPES) and left == right
+        return equal if op == '==' else not equal
+
+    # 행 뷰는 타입 배열로, 행렬은 같은 모양끼리 평탄화한 버퍼로 계산
+    if isinstance(left, MatrixRow):
+        left = left.to_typed()
+    if isinstance(right, MatrixRow):
+        right = right.to_typed()
+    if isinstance(left, Matrix) or isinstance(right, Matrix):
+        return _matrix_binary_op(op, left, right, line, column)
+
+    func = _OPERATORS.get(op)
+    if func is None:
+        raise RuntimeError(f"Operator '{op}' is not supported for typed arrays", line, column)
+
+    for operand in (left, right):
+        if not isinstance(operand, TypedArray) and (
+                isinstance(operand, bool) or not isinstance(operand, (int, float))):
+            raise RuntimeError(
+                f"Typed array arithmetic requires typed arrays or numbers", line, column
+            )
+    if isinstance(left, TypedArray) and isinstance(right, TypedArray) and len(left) != len(right):
+        raise RuntimeError(f"Typed array length mismatch ({len(left)} vs {len(right)})", line, column)
+    if op in ('/', '%') and _has_zero(right):
+        raise RuntimeError("Division by zero" if op == '/' else "Modulo by zero", line, column)
+
+    code = _result_code(op, left, right)
+    try:
+        if _np is not None:
+            return _numpy_op(op, left, right, code)
+        return TypedArray(array(code, _python_op(func, left, right)))
+    except OverflowError:
+        raise RuntimeError("Integer overflow in int_array arithmetic", line, column)
+    except (TypeError, ValueError) as e:
+        raise RuntimeError(f"Typed array arithmetic failed: {e}", line, column)
+
+
+def _matrix_binary_op(op: str, left: Any, right: Any, line: int, column: int) -> Matrix:
+    shape = None
+    for operand in (left, right):
+        if isinstance(operand, Matrix):
+            if shape is not None and shape != (operand.rows, operand.cols):
+                raise RuntimeError(
+                    f"Matrix shape mismatch ({shape[0]}x{shape[1]} vs {operand.rows}x{operand.cols})",
+                    line, column
+                )
+            shape = (operand.rows, operand.cols)
+        elif isinstance(operand, TypedArray):
+            raise RuntimeError("Matrix arithmetic requires matrices or numbers", line, column)
+    result = bulk_binary_op(
+        op,
+        left.flat() if isinstance(left, Matrix) else left,
+        right.flat() if isinstance(right, Matrix) else right,
+        line, column
+    )
+    if result.data.typecode != FLOAT_CODE:
+        result = TypedArray.from_values(FLOAT_CODE, result.data)
+    return Matrix(shape[0], shape[1], result.data)
+
+
+def _has_zero(value: Any) -> bool:
+    if isinstance(value, TypedArray):
+        return 0 in value.data
+    return value == 0
+
+
+def _python_op(func, left: Any, right: Any) -> Iterable[Any]:
+    """순수 Python 일괄 연산: map으로 원소별 연산을 C 수준에서 반복"""
+    if isinstance(left, TypedArray) and isinstance(right, TypedArray):
+        return map(func, left.data, right.data)
+    if isinstance(left, TypedArray):
+        return map(func, left.data, repeat(right))
+    return map(func, repeat(left), right.data)
+
+
+def _numpy_op(op: str, left: Any, right: Any, code: str) -> TypedArray:
+    a = left.as_numpy() if isinstance(left, TypedArray) else left
+    b = right.as_numpy() if isinstance(right, TypedArray) else right
+    if op == '**' and code == INT_CODE and _np.any(_np.asarray(b) < 0):
+        raise ValueError("negative integer exponent")
+    result = _np.asarray(_OPERATORS[op](a, b), dtype=_NUMPY_DTYPES[code])
+    data = array(code)
+    data.frombytes(result.tobytes())
+    return TypedArray(data)
+
+
+def register_numeric_builtins(table: Dict[str, BuiltinFunction]):
+    """타입 배열 내장 함수 등록"""
+
+    def make_constructor(name: str, code: str):
+        def construct(args):
+            source = args[0]
+            if isinstance(source, bool) or not isinstance(source, (int,) + ARRAY_TYPES):
+                raise RuntimeError(f"{name} requires a length or an array")
+            if isinstance(source, int):
+                if source < 0:
+                    raise RuntimeError(f"{name} length must not be negative")
+                return TypedArray.zeros(code, source)
+            return TypedArray.from_values(code, source)
+        return construct
+
+    table['int_array'] = BuiltinFunction(
+        name='int_array',
+        func=make_constructor('int_array', INT_CODE),
+        arity=1
+    )
+
+    table['float_array'] = BuiltinFunction(
+        name='float_array',
+        func=make_constructor('float_array', FLOAT_CODE),
+        arity=1
+    )
+
+    def dot_func(args):
+        a, b = args
+        if isinstance(a, TypedArray) and isinstance(b, TypedArray):
+            return a.dot(b)
+        if not isinstance(a, ARRAY_TYPES) or not isinstance(b, ARRAY_TYPES):
+            raise RuntimeError("dot requires arrays")
+        if len(a) != len(b):
+            raise RuntimeError(f"dot: length mismatch ({len(a)} vs {len(b)})")
+        try:
+            return sum(map(operator.mul, a, b))
+        except TypeError:
+            raise RuntimeError("dot: array elements must be numbers")
+
+    table['dot'] = BuiltinFunction(
+        name='dot',
+        func=dot_func,
+        arity=2
+    )
+
+    # 행렬 함수들
+    def matrix_func(args):
+        if len(args) == 2:
+            rows, cols = args
+            if isinstance(rows, bool) or isinstance(cols, bool) \
+                    or not isinstance(rows, int) or not isinstance(cols, int) or rows < 0 or cols < 0:
+                raise RuntimeError("matrix size must be non-negative integers")
+            return Matrix.zeros(rows, cols)
+        if len(args) == 1 and isinstance(args[0], ARRAY_TYPES):
+            return Matrix.from_rows(args[0])
+        raise RuntimeError("matrix expects (rows, cols) or an array of arrays")
+
+    table['matrix'] = BuiltinFunction(
+        name='matrix',
+        func=matrix_func,
+        arity=-1
+    )
+
+    def matrix_arg(value: Any, name: str) -> Matrix:
+        if not isinstance(value, Matrix):
+            raise RuntimeError(f"{name} requires a matrix")
+        return value
+
+    table['matmul'] = BuiltinFunction(
+        name='matmul',
+        func=lambda args: matmul(matrix_arg(args[0], 'matmul'), matrix_arg(args[1], 'matmul')),
+        arity=2
+    )
+
+    table['transpose'] = BuiltinFunction(
+        name='transpose',
+        func=lambda args: matrix_arg(args[0], 'transpose').transpose(),
+        arity=1
+    )
+
+    table['row'] = BuiltinFunction(
+        name='row',
+        func=lambda args: matrix_arg(args[0], 'row').row(args[1]),
+        arity=2
+    )
+
+    table['col'] = BuiltinFunction(
+        name='col',
+        func=lambda args: matrix_arg(args[0], 'col').col(args[1]),
+        arity=2
+    )
+
@@ -0,0 +1,444 @@
+"""
+MiniLang Parallel Map (병렬 map)
+pmap(f, arr, chunk)은 arr의 원소마다 f를 호출한 결과 배열을 여러 작업자 프로세스에서 계산합니다.
+
+- 함수는 본문 AST와 자유 변수의 현재 값(캡처한 값, 호출하는 다른 사용자 함수)을 묶어 공유 메모리에
+  한 번 올리고, 조각 작업에는 그 위치만 넣습니다. 작업자 프로세스는 한 번 만든 인터프리터를 계속
+  쓰므로(자주 호출되는 함수는 단계별 실행으로 컴파일됨), 같은 pmap의 조각들은 함수를 작업자마다
+  한 번만 읽어 복원합니다.
+- 배열은 chunk개씩 나눠 보내고, 결과는 원래 순서대로 합칩니다. 정수/실수 타입 배열과 실수만
+  담은 큰 배열은 pickle 대신 공유 메모리(multiprocessing.shared_memory)로 전달하고, 작업자는
+  자기 조각만 읽습니다.
+- 작업자에서의 실행은 호출한 프로세스에 보이지 않으므로 함수는 순수해야 합니다. 보내기 전에
+  함수와 함수가 부르는 사용자 함수들을 정적으로 검사합니다: 출력/입력/파일/스트림/작업 함수,
+  캡처한 변수에 대입, 매개변수나 캡처한 배열/맵의 수정(인덱스 대입, push 등)은 에러입니다.
+
+조각이 하나뿐이면(배열이 chunk보다 작으면), 또는 프로세스를 만들 수 없는 환경에서는 그 자리에서
+순서대로 실행합니다. 작업자 수는 MINILANG_WORKERS 환경 변수나 configure()로 정하고, 기본은
+사용할 수 있는 CPU 수입니다.
+"""
+
+import atexit
+import io
+import itertools
+import math
+import os
+import pickle
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+from ast_nodes import (
+    ASTNode, Assignment, ArrayIndexAssignment, ArrayAccess, SliceAccess, FunctionCall, Identifier,
+    PrintStatement, ImportStatement, YieldStatement, FunctionDeclaration,
+)
+from runtime import (
+    RuntimeError, BuiltinFunction, Function, Environment, Stream, Channel, ARRAY_TYPES, type_name,
+)
+from numeric import TypedArray
+from closures import function_free_names
+from modules import _available_cpus
+
+
+# 이 개수 이상인 숫자 배열은 공유 메모리로 전달
+SHARED_MIN = 1 << 15
+
+# 작업자에서 실행하면 결과가 달라지는 내장 함수 (입출력, 스트림 상태, 작업, 중첩 pmap)
+IMPURE_BUILTINS = frozenset({
+    'input', 'read_lines', 'stdin_lines', 'read_file', 'write_file', 'append_file', 'remove_file',
+    'next', 'close', 'spawn', 'channel', 'send', 'recv', 'pmap',
+})
+
+# 첫 인자를 제자리에서 수정하는 내장 함수
+MUTATING_BUILTINS = frozenset({'push', 'pop', 'sort', 'reverse', 'fill', 'extend', 'del', 'append'})
+
+# 작업자 프로세스가 유지하는 복원한 함수 수
+FUNCTION_CACHE_SIZE = 8
+
+
+# =====================================================
+# 순수성 검사
+# =====================================================
+
+def _children(node: ASTNode) -> List[ASTNode]:
+    children = []
+    for value in vars(node).values():
+        if isinstance(value, ASTNode):
+            children.append(value)
+        elif isinstance(value, list):
+            children.extend(item for item in value if isinstance(item, ASTNode))
+    return children
+
+
+def _root_name(node: ASTNode) -> Optional[str]:
+    """arr[i][j], arr[a:b] 같은 식이 가리키는 변수 이름"""
+    while isinstance(node, (ArrayAccess, SliceAccess)):
+        node = node.array
+    return node.name if isinstance(node, Identifier) else None
+
+
+def check_pure(func: Function, captured: Dict[str, Any]):
+    """함수 본문(중첩 함수 포함)이 작업자에서 실행해도 같은 결과를 내는지 검사
+
+    captured는 자유 변수 이름 -> 값입니다. 이름만으로 판단하므로 보수적이며, 지역 변수를 통한
+    별칭(let a = param; push(a, 1))까지는 찾지 않습니다.
+    """
+    outside = set(captured)
+    shared = outside | set(func.parameters)
+    from interpreter import BUILTINS
+
+    def fail(node: ASTNode, reason: str):
+        raise RuntimeError(f"pmap requires a pure function: '{func.name}' {reason}",
+                           node.line, node.column)
+
+    stack: List[ASTNode] = [func.body]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, PrintStatement):
+            fail(node, "prints output")
+        elif isinstance(node, (ImportStatement, YieldStatement)):
+            fail(node, f"uses '{'import' if isinstance(node, ImportStatement) else 'yield'}'")
+        elif isinstance(node, Assignment):
+            if node.target.name in outside:
+                fail(node, f"assigns to captured variable '{node.target.name}'")
+        elif isinstance(node, ArrayIndexAssignment):
+            name = _root_name(node.array)
+            if name in shared:
+                fail(node, f"modifies '{name}' which is shared with the caller")
+        elif isinstance(node, FunctionCall):
+            builtin = captured.get(node.name, BUILTINS.get(node.name))
+            if node.name == 'input' or (node.name in IMPURE_BUILTINS and builtin is BUILTINS.get(node.name)):
+                fail(node, f"calls '{node.name}'")
+            if node.name in MUTATING_BUILTINS and node.arguments and builtin is BUILTINS[node.name]:
+                name = _root_name(node.arguments[0])
+                if name in shared:
+                    fail(node, f"modifies '{name}' which is shared with the caller")
+        elif isinstance(node, FunctionDeclaration):
+            stack.append(node.body)
+            continue
+        stack.extend(_children(node))
+
+
+# =====================================================
+# 함수와 값 보내기 (호출한 프로세스)
+# =====================================================
+
+class Shipment:
+    """작업자에게 보낼 함수들과 공유 메모리 (pmap 호출 하나)
+
+    함수는 (이름, 매개변수, 본문, 자유 변수 값) 항목으로 차례로 pickle되고, 항목 안에서 다른
+    사용자 함수는 ('fn', 번호)로, 내장 함수는 ('b', 이름)으로, 큰 타입 배열은 ('shm', 번호)로
+    가리킵니다.
+    """
+
+    def __init__(self):
+        self.functions: List[Tuple[Function, Dict[str, Any]]] = []
+        self._keys: Dict[int, int] = {}
+        self.segments: List[shared_memory.SharedMemory] = []
+        self.layouts: List[Tuple[str, str, int]] = []  # (공유 메모리 이름, 타입 코드, 길이)
+
+    def add(self, func: Function) -> int:
+        key = self._keys.get(id(func))
+        if key is not None:
+            return key
+        if func.generator:
+            raise RuntimeError(f"pmap cannot run generator function '{func.name}'")
+        from interpreter import BUILTINS
+        captured = {}
+        for name in sorted(function_free_names(func.name, func.parameters, func.body)):
+            try:
+                value = func.closure.get(name)
+            except RuntimeError:
+                continue  # 정의되지 않은 이름은 작업자에서도 같은 에러
+            if value is not BUILTINS.get(name):
+                captured[name] = value
+        check_pure(func, captured)
+        key = self._keys[id(func)] = len(self.functions)
+        self.functions.append((func, captured))
+        return key
+
+    def share(self, data: array) -> int:
+        """숫자 버퍼를 공유 메모리에 복사 (번호 반환)"""
+        self.layouts.append(self._copy(data))
+        return len(self.layouts) - 1
+
+    def share_payload(self, payload: bytes) -> Tuple[str, str, int]:
+        """pickle한 함수들을 공유 메모리에 복사 (조각 작업에는 위치만 넣고, 작업자는 key마다 한 번 읽음)"""
+        return self._copy(array('B', payload))
+
+    def _copy(self, data: array) -> Tuple[str, str, int]:
+        segment = shared_memory.SharedMemory(create=True, size=max(1, len(data) * data.itemsize))
+        self.segments.append(segment)
+        segment.buf[:len(data) * data.itemsize] = memoryview(data).cast('B')
+        return (segment.name, data.typecode, len(data))
+
+    def pack(self, root: Function) -> bytes:
+        self.add(root)
+        buffer = io.BytesIO()
+        packer = _Packer(buffer, self)
+        index = 0
+        while index < len(self.functions):  # 항목을 쓰는 동안 부르는 함수가 추가될 수 있음
+            func, captured = self.functions[index]
+            packer.dump((func.name, func.parameters, func.body, captured))
+            index += 1
+        packer.dump(None)
+        return buffer.getvalue()
+
+    def release(self):
+        for segment in self.segments:
+            segment.close()
+            segment.unlink()
+        self.segments = []
+
+
+class _Packer(pickle.Pickler):
+    def __init__(self, file, shipment: Shipment):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.shipment = shipment
+
+    def persistent_id(self, obj: Any):
+        if isinstance(obj, Function):
+            return ('fn', self.shipment.add(obj))
+        if isinstance(obj, BuiltinFunction):
+            from interpreter import BUILTINS
+            if BUILTINS.get(obj.name) is not obj:
+                raise RuntimeError(f"pmap cannot send function '{obj.name}' to worker processes")
+            return ('b', obj.name)
+        if obj.__class__ is TypedArray and len(obj) >= SHARED_MIN:
+            return ('shm', self.shipment.share(obj.data))
+        if isinstance(obj, (Stream, Channel, Environment)):
+            raise RuntimeError(f"pmap cannot send a {type_name(obj)} to worker processes")
+        return None
+
+
+class _ResultPacker(pickle.Pickler):
+    """작업자의 결과 배열 (내장 함수는 이름으로, 사용자 함수와 스트림은 보낼 수 없음)"""
+
+    def __init__(self, file):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def persistent_id(self, obj: Any):
+        if isinstance(obj, BuiltinFunction):
+            return ('b', obj.name)
+        if isinstance(obj, (Function, Stream, Channel, Environment)):
+            raise RuntimeError(f"pmap results cannot contain a {type_name(obj)}")
+        return None
+
+
+def _numeric_buffer(values: Any) -> Optional[array]:
+    """공유 메모리로 보낼 수 있는 큰 숫자 배열의 버퍼 (아니면 None)"""
+    if isinstance(values, TypedArray):
+        return values.data if len(values) >= SHARED_MIN else None
+    if isinstance(values, list) and len(values) >= SHARED_MIN:
+        if all(v.__class__ is float for v in values):
+            return array('d', values)
+    return None
+
+
+# =====================================================
+# 작업자 프로세스
+# =====================================================
+
+_worker_interpreter = None
+_worker_functions: Dict[str, Function] = {}
+
+
+def _init_worker():
+    global _worker_interpreter
+    from interpreter import Interpreter
+    _worker_interpreter = Interpreter(echo=False)
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    return shared_memory.SharedMemory(name=name)
+
+
+def _read_shared(layout: Tuple[str, str, int], start: int, stop: int) -> array:
+    name, typecode, _ = layout
+    segment = _attach(name)
+    try:
+        itemsize = array(typecode).itemsize
+        data = array(typecode)
+        data.frombytes(segment.buf[start * itemsize:stop * itemsize])
+        return data
+    finally:
+        segment.close()
+
+
+class _Unpacker(pickle.Unpickler):
+    def __init__(self, file, functions: List[Function], layouts: List[Tuple[str, str, int]]):
+        super().__init__(file)
+        self.functions = functions
+        self.layouts = layouts
+
+    def persistent_load(self, pid: tuple) -> Any:
+        tag = pid[0]
+        if tag == 'fn':
+            while len(self.functions) <= pid[1]:
+                self.functions.append(Function(name='', parameters=[], body=None, closure=None))
+            return self.functions[pid[1]]
+        if tag == 'b':
+            from interpreter import BUILTINS
+            return BUILTINS[pid[1]]
+        layout = self.layouts[pid[1]]
+        return TypedArray(_read_shared(layout, 0, layout[2]))
+
+
+def _load_function(payload: bytes, layouts: List[Tuple[str, str, int]]) -> Function:
+    """보낸 함수들을 작업자 인터프리터의 전역 환경 아래에 복원 (첫 함수 반환)"""
+    functions: List[Function] = []
+    unpacker = _Unpacker(io.BytesIO(payload), functions, layouts)
+    index = 0
+    while True:
+        entry = unpacker.load()
+        if entry is None:
+            break
+        name, parameters, body, captured = entry
+        while len(functions) <= index:
+            functions.append(Function(name='', parameters=[], body=None, closure=None))
+        closure = Environment(parent=_worker_interpreter.global_env)
+        closure.variables.update(captured)
+        func = functions[index]
+        func.name, func.parameters, func.body, func.closure = name, parameters, body, closure
+        index += 1
+    return functions[0]
+
+
+def _run_chunk(task: tuple) -> tuple:
+    """조각 하나를 계산: ('ok', pickle한 결과 배열) 또는 ('error', 메시지, 줄, 열)"""
+    key, location, layouts, items = task
+    func = _worker_functions.get(key)
+    if func is None:
+        if len(_worker_functions) >= FUNCTION_CACHE_SIZE:
+            _worker_functions.clear()
+        payload = _read_shared(location, 0, location[2]).tobytes()
+        func = _worker_functions[key] = _load_function(payload, layouts)
+    if items[0] == 'shm':
+        _, layout, start, stop = items
+        values = _read_shared(layouts[layout], start, stop).tolist()
+    else:
+        values = items[1]
+    call = _worker_interpreter.call_function
+    try:
+        buffer = io.BytesIO()
+        _ResultPacker(buffer).dump([call(func, [value]) for value in values])
+        return ('ok', buffer.getvalue())
+    except RuntimeError as e:
+        return ('error', e.message, e.line, e.column)
+
+
+# =====================================================
+# 작업자 풀 (호출한 프로세스)
+# =====================================================
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_size = 0
+_workers: Optional[int] = None
+_call_ids = itertools.count()
+
+
+def worker_count() -> int:
+    if _workers is not None:
+        return _workers
+    return int(os.environ.get('MINILANG_WORKERS', 0)) or _available_cpus()
+
+
+def configure(workers: Optional[int] = None):
+    """작업자 수 설정 (None이면 기본값, 바뀌면 기존 풀을 닫음)"""
+    global _workers
+    _workers = workers
+    if _executor is not None and _executor_size != worker_count():
+        shutdown()
+
+
+def shutdown():
+    """작업자 풀 종료 (다음 pmap이 새로 만듦)"""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(cancel_futures=True)
+        _executor = None
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """작업자 풀 (pmap 호출 사이에 유지되므로 작업자의 인터프리터가 계속 쓰임)"""
+    global _executor, _executor_size
+    if _executor is None:
+        # 작업자가 공유 메모리를 열 때 부모와 같은 자원 추적 프로세스에 등록하도록 먼저 시작
+        # (작업자마다 따로 시작하면 작업자가 끝날 때 부모의 공유 메모리를 지우려 함)
+        resource_tracker.ensure_running()
+        _executor_size = worker_count()
+        _executor = ProcessPoolExecutor(max_workers=_executor_size, initializer=_init_worker)
+    return _executor
+
+
+atexit.register(shutdown)
+
+
+def parallel_map(interpreter, func: Any, values: Any, chunk: Optional[int] = None) -> list:
+    """pmap 내장 함수 본체"""
+    if not isinstance(func, Function):
+        raise RuntimeError("pmap requires a user-defined function")
+    if len(func.parameters) != 1:
+        raise RuntimeError(f"pmap function '{func.name}' must take 1 argument, "
+                           f"takes {len(func.parameters)}")
+    if not isinstance(values, ARRAY_TYPES):
+        raise RuntimeError("pmap requires an array")
+    length = len(values)
+    if chunk is None:
+        chunk = max(1, math.ceil(length / (worker_count() * 4)))
+    elif isinstance(chunk, bool) or not isinstance(chunk, int) or chunk < 1:
+        raise RuntimeError("pmap chunk size must be a positive integer")
+
+    shipment = Shipment()
+    try:
+        payload = shipment.pack(func)
+        if length <= chunk:
+            # 조각이 하나면 프로세스 없이 (검사는 같게)
+            return [interpreter.call_function(func, [value]) for value in values]
+
+        buffer = _numeric_buffer(values)
+        if buffer is not None:
+            layout = shipment.share(buffer)
+            chunks = [('shm', layout, start, min(start + chunk, length))
+                      for start in range(0, length, chunk)]
+        else:
+            if not isinstance(values, list):
+                values = list(values)
+            chunks = [('items', values[start:start + chunk]) for start in range(0, length, chunk)]
+
+        # 함수들은 공유 메모리로 한 번만 보내고, 조각 작업에는 그 위치와 원소만 넣음
+        key = f"{os.getpid()}:{next(_call_ids)}"
+        location = shipment.share_payload(payload)
+        tasks = [(key, location, shipment.layouts, items) for items in chunks]
+        try:
+            outcomes = list(_get_executor().map(_run_chunk, tasks))
+        except (OSError, ImportError, NotImplementedError, BrokenProcessPool):
+            # 프로세스를 만들 수 없는 환경에서는 순차 실행
+            shutdown()
+            return [interpreter.call_function(func, [value]) for value in values]
+        results = []
+        for outcome in outcomes:
+            if outcome[0] == 'error':
+                raise RuntimeError(outcome[1], outcome[2], outcome[3])
+            results.extend(_Unpacker(io.BytesIO(outcome[1]), [], []).load())
+        return results
+    finally:
+        shipment.release()
+
+
+def register_parallel_builtins(table: dict):
+    """병렬 map 내장 함수를 테이블에 등록"""
+
+    def pmap_func(interpreter, args):
+        if len(args) not in (2, 3):
+            raise RuntimeError(f"Function 'pmap' expects 2 or 3 arguments, got {len(args)}")
+        return parallel_map(interpreter, args[0], args[1], args[2] if len(args) == 3 else None)
+
+    table['pmap'] = BuiltinFunction(
+        name='pmap',
+        func=pmap_func,
+        arity=-1,
+        needs_interpreter=True
+    )
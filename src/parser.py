@@ -1,14 +1,48 @@
 """
 MiniLang Parser (구문 분석기)
 토큰 스트림을 AST(추상 구문 트리)로 변환합니다.
-재귀 하강 파서(Recursive Descent Parser) 방식으로 구현합니다.
+재귀 하강 파서(Recursive Descent Parser) 방식으로 구현하며,
+이항 연산자는 우선순위 표를 사용하는 Pratt 파서로 처리합니다.
 """
 
-from typing import List, Optional, Callable
+from typing import Iterator, List, Optional, Callable, Tuple
 from tokens import Token, TokenType
 from ast_nodes import *
 
 
+# 이항 연산자 우선순위 (클수록 강하게 결합)
+BINARY_PRECEDENCE = {
+    TokenType.OR: 1,
+    TokenType.AND: 2,
+    TokenType.EQ: 3,
+    TokenType.NEQ: 3,
+    TokenType.LT: 4,
+    TokenType.GT: 4,
+    TokenType.LTE: 4,
+    TokenType.GTE: 4,
+    TokenType.PLUS: 5,
+    TokenType.MINUS: 5,
+    TokenType.MULTIPLY: 6,
+    TokenType.DIVIDE: 6,
+    TokenType.MODULO: 6,
+    TokenType.POWER: 7,  # 우결합
+}
+
+# 토큰 값과 다른 이름을 쓰는 연산자 (&&, || 도 and, or 로 정규화)
+OPERATOR_NAMES = {
+    TokenType.OR: 'or',
+    TokenType.AND: 'and',
+}
+
+ASSIGNMENT_OPERATORS = frozenset({
+    TokenType.ASSIGN,
+    TokenType.PLUS_ASSIGN,
+    TokenType.MINUS_ASSIGN,
+    TokenType.MULT_ASSIGN,
+    TokenType.DIV_ASSIGN,
+})
+
+
 class ParseError(Exception):
     """파서 에러 클래스"""
     def __init__(self, message: str, token: Token):
@@ -24,6 +58,8 @@ class Parser:
         self.tokens = tokens
         self.pos = 0
         self.errors: List[ParseError] = []
+        # 파싱 중인 함수마다 본문에서 yield를 만났는지 (바깥 함수가 앞)
+        self.function_yields: List[bool] = []
     
     @property
     def current(self) -> Token:
@@ -89,10 +125,12 @@ class Parser:
             if self.current.type in (
                 TokenType.LET,
                 TokenType.FUNC,
+                TokenType.IMPORT,
                 TokenType.IF,
                 TokenType.WHILE,
                 TokenType.FOR,
                 TokenType.RETURN,
+                TokenType.YIELD,
                 TokenType.PRINT,
             ):
                 return
@@ -105,22 +143,28 @@ class Parser:
     
     def parse(self) -> Program:
         """프로그램 파싱"""
-        statements = []
+        statements = [stmt for _, stmt in self.iter_declarations() if stmt]
+        return Program(statements=statements, line=1, column=1)
+    
+    def iter_declarations(self) -> Iterator[Tuple[int, Optional[Statement]]]:
+        """최상위 선언을 하나씩 파싱해 (시작 토큰 위치, 문장)을 반환
         
+        에러가 난 선언은 errors에 기록하고 문장 자리에 None을 반환합니다.
+        각 선언은 다음 선언의 시작 위치(또는 EOF) 직전까지의 토큰을 차지합니다.
+        """
         self.skip_newlines()
         
         while not self.is_at_end():
+            start = self.pos
+            stmt = None
             try:
                 stmt = self.parse_declaration()
-                if stmt:
-                    statements.append(stmt)
             except ParseError as e:
                 self.errors.append(e)
                 self.synchronize()
             
             self.skip_newlines()
-        
-        return Program(statements=statements, line=1, column=1)
+            yield start, stmt
     
     def parse_declaration(self) -> Optional[Statement]:
         """선언문 파싱"""
@@ -128,6 +172,8 @@ class Parser:
             return self.parse_variable_declaration()
         if self.match(TokenType.FUNC):
             return self.parse_function_declaration()
+        if self.match(TokenType.IMPORT):
+            return self.parse_import_statement()
         return self.parse_statement()
     
     def parse_variable_declaration(self) -> VariableDeclaration:
@@ -148,6 +194,18 @@ class Parser:
             column=name_token.column
         )
     
+    def parse_import_statement(self) -> ImportStatement:
+        """import 문 파싱: import "path.ml" (파일 경로는 문자열 리터럴)"""
+        import_token = self.previous
+        path_token = self.consume(TokenType.STRING, "Expected module path string after 'import'")
+        self.consume_statement_terminator()
+        
+        return ImportStatement(
+            path=path_token.value,
+            line=import_token.line,
+            column=import_token.column
+        )
+    
     def parse_function_declaration(self) -> FunctionDeclaration:
         """함수 선언 파싱: func name(params) { body }"""
         name_token = self.consume(TokenType.IDENTIFIER, "Expected function name")
@@ -166,14 +224,19 @@ class Parser:
         self.skip_newlines()
         self.consume(TokenType.LBRACE, "Expected '{' before function body")
         
-        body = self.parse_block()
+        self.function_yields.append(False)
+        try:
+            body = self.parse_block()
+        finally:
+            is_generator = self.function_yields.pop()
         
         return FunctionDeclaration(
             name=name,
             parameters=parameters,
             body=body,
             line=name_token.line,
-            column=name_token.column
+            column=name_token.column,
+            is_generator=is_generator
         )
     
     def parse_statement(self) -> Statement:
@@ -186,6 +249,8 @@ class Parser:
             return self.parse_for_statement()
         if self.match(TokenType.RETURN):
             return self.parse_return_statement()
+        if self.match(TokenType.YIELD):
+            return self.parse_yield_statement()
         if self.match(TokenType.BREAK):
             return self.parse_break_statement()
         if self.match(TokenType.CONTINUE):
@@ -249,12 +314,15 @@ class Parser:
             column=token.column
         )
     
-    def parse_for_statement(self) -> ForStatement:
-        """For 반복문 파싱: for init; cond; incr { body }"""
+    def parse_for_statement(self) -> Statement:
+        """For 반복문 파싱: for init; cond; incr { body } 또는 for x in expr { body }"""
         token = self.previous
         
         has_paren = self.match(TokenType.LPAREN)
         
+        if self.check(TokenType.IDENTIFIER) and self.peek().type == TokenType.IN:
+            return self.parse_for_in_statement(token, has_paren)
+        
         # 초기화
         initializer = None
         if self.match(TokenType.SEMICOLON):
@@ -299,6 +367,26 @@ class Parser:
             column=token.column
         )
     
+    def parse_for_in_statement(self, token: Token, has_paren: bool) -> ForInStatement:
+        """For-in 반복문 파싱: for name in expression { body }"""
+        variable = self.consume(TokenType.IDENTIFIER, "Expected loop variable name").value
+        self.consume(TokenType.IN, "Expected 'in' after loop variable")
+        iterable = self.parse_expression()
+        if has_paren:
+            self.consume(TokenType.RPAREN, "Expected ')' after for-in clause")
+        
+        self.skip_newlines()
+        self.consume(TokenType.LBRACE, "Expected '{' after for-in clause")
+        body = self.parse_block()
+        
+        return ForInStatement(
+            variable=variable,
+            iterable=iterable,
+            body=body,
+            line=token.line,
+            column=token.column
+        )
+    
     def parse_variable_declaration_no_terminator(self) -> VariableDeclaration:
         """변수 선언 파싱 (종결자 없이)"""
         name_token = self.consume(TokenType.IDENTIFIER, "Expected variable name")
@@ -327,6 +415,21 @@ class Parser:
         
         return ReturnStatement(value=value, line=token.line, column=token.column)
     
+    def parse_yield_statement(self) -> YieldStatement:
+        """Yield 문 파싱 (이 문장이 있는 함수는 제너레이터 함수)"""
+        token = self.previous
+        if not self.function_yields:
+            raise ParseError("'yield' outside function", token)
+        self.function_yields[-1] = True
+        
+        value = None
+        if not self.check(TokenType.SEMICOLON, TokenType.NEWLINE, TokenType.RBRACE, TokenType.EOF):
+            value = self.parse_expression()
+        
+        self.consume_statement_terminator()
+        
+        return YieldStatement(value=value, line=token.line, column=token.column)
+    
     def parse_break_statement(self) -> BreakStatement:
         """Break 문 파싱"""
         token = self.previous
@@ -395,12 +498,11 @@ class Parser:
         return self.parse_assignment_expr()
     
     def parse_assignment_expr(self) -> Expression:
-        """대입 표현식 파싱"""
-        expr = self.parse_or_expr()
+        """대입 표현식 파싱 (우결합, 가장 낮은 우선순위)"""
+        expr = self.parse_binary_expr()
         
-        if self.match(TokenType.ASSIGN, TokenType.PLUS_ASSIGN, TokenType.MINUS_ASSIGN,
-                      TokenType.MULT_ASSIGN, TokenType.DIV_ASSIGN):
-            operator = self.previous.value
+        if self.current.type in ASSIGNMENT_OPERATORS:
+            operator = self.advance().value
             value = self.parse_assignment_expr()
             
             if isinstance(expr, Identifier):
@@ -427,87 +529,39 @@ class Parser:
         
         return expr
     
-    def parse_or_expr(self) -> Expression:
-        """OR 논리 연산"""
-        expr = self.parse_and_expr()
-        
-        while self.match(TokenType.OR):
-            operator = self.previous.value
-            right = self.parse_and_expr()
-            expr = BinaryOp(left=expr, operator='or', right=right, line=expr.line, column=expr.column)
-        
-        return expr
-    
-    def parse_and_expr(self) -> Expression:
-        """AND 논리 연산"""
-        expr = self.parse_equality_expr()
-        
-        while self.match(TokenType.AND):
-            operator = self.previous.value
-            right = self.parse_equality_expr()
-            expr = BinaryOp(left=expr, operator='and', right=right, line=expr.line, column=expr.column)
-        
-        return expr
-    
-    def parse_equality_expr(self) -> Expression:
-        """등호 비교 연산"""
-        expr = self.parse_comparison_expr()
-        
-        while self.match(TokenType.EQ, TokenType.NEQ):
-            operator = self.previous.value
-            right = self.parse_comparison_expr()
-            expr = BinaryOp(left=expr, operator=operator, right=right, line=expr.line, column=expr.column)
-        
-        return expr
-    
-    def parse_comparison_expr(self) -> Expression:
-        """비교 연산"""
-        expr = self.parse_additive_expr()
-        
-        while self.match(TokenType.LT, TokenType.GT, TokenType.LTE, TokenType.GTE):
-            operator = self.previous.value
-            right = self.parse_additive_expr()
-            expr = BinaryOp(left=expr, operator=operator, right=right, line=expr.line, column=expr.column)
-        
-        return expr
-    
-    def parse_additive_expr(self) -> Expression:
-        """덧셈/뺄셈 연산"""
-        expr = self.parse_multiplicative_expr()
-        
-        while self.match(TokenType.PLUS, TokenType.MINUS):
-            operator = self.previous.value
-            right = self.parse_multiplicative_expr()
-            expr = BinaryOp(left=expr, operator=operator, right=right, line=expr.line, column=expr.column)
+    def parse_binary_expr(self, min_precedence: int = 1) -> Expression:
+        """이항 연산 (Pratt 파서: 우선순위 표를 보고 한 함수에서 모든 이항 연산자를 처리)
         
-        return expr
-    
-    def parse_multiplicative_expr(self) -> Expression:
-        """곱셈/나눗셈/나머지 연산"""
-        expr = self.parse_power_expr()
-        
-        while self.match(TokenType.MULTIPLY, TokenType.DIVIDE, TokenType.MODULO):
-            operator = self.previous.value
-            right = self.parse_power_expr()
-            expr = BinaryOp(left=expr, operator=operator, right=right, line=expr.line, column=expr.column)
-        
-        return expr
-    
-    def parse_power_expr(self) -> Expression:
-        """거듭제곱 연산 (우결합)"""
+        min_precedence 이상의 연산자만 소비하며, 왼쪽 결합 연산자는 오른쪽 피연산자를
+        한 단계 높은 우선순위로, 우결합인 **는 같은 우선순위로 파싱합니다.
+        """
         expr = self.parse_unary_expr()
         
-        if self.match(TokenType.POWER):
-            operator = self.previous.value
-            right = self.parse_power_expr()  # 우결합이므로 재귀 호출
-            expr = BinaryOp(left=expr, operator=operator, right=right, line=expr.line, column=expr.column)
-        
-        return expr
+        while True:
+            token = self.current
+            precedence = BINARY_PRECEDENCE.get(token.type)
+            if precedence is None or precedence < min_precedence:
+                return expr
+            self.advance()
+            
+            if token.type is TokenType.POWER:
+                right = self.parse_binary_expr(precedence)
+            else:
+                right = self.parse_binary_expr(precedence + 1)
+            
+            expr = BinaryOp(
+                left=expr,
+                operator=OPERATOR_NAMES.get(token.type, token.value),
+                right=right,
+                line=expr.line,
+                column=expr.column
+            )
     
     def parse_unary_expr(self) -> Expression:
-        """단항 연산"""
-        if self.match(TokenType.NOT, TokenType.MINUS):
-            operator = self.previous.value
+        """단항 연산 (모든 이항 연산자보다 강하게 결합: -x ** 2 는 (-x) ** 2)"""
+        token_type = self.current.type
+        if token_type is TokenType.NOT or token_type is TokenType.MINUS:
+            operator = self.advance().value
             if operator == '!':
                 operator = 'not'
             operand = self.parse_unary_expr()
@@ -525,14 +579,26 @@ class Parser:
         expr = self.parse_primary_expr()
         
         while True:
-            if self.match(TokenType.LPAREN):
+            token_type = self.current.type
+            if token_type is TokenType.LPAREN:
                 # 함수 호출
+                self.advance()
                 expr = self.finish_call(expr)
-            elif self.match(TokenType.LBRACKET):
-                # 배열 접근
-                index = self.parse_expression()
-                self.consume(TokenType.RBRACKET, "Expected ']' after index")
-                expr = ArrayAccess(array=expr, index=index, line=expr.line, column=expr.column)
+            elif token_type is TokenType.LBRACKET:
+                self.advance()
+                # 배열 접근 또는 슬라이스
+                index = None
+                if not self.check(TokenType.COLON):
+                    index = self.parse_expression()
+                if self.match(TokenType.COLON):
+                    stop = None
+                    if not self.check(TokenType.RBRACKET):
+                        stop = self.parse_expression()
+                    self.consume(TokenType.RBRACKET, "Expected ']' after slice")
+                    expr = SliceAccess(array=expr, start=index, stop=stop, line=expr.line, column=expr.column)
+                else:
+                    self.consume(TokenType.RBRACKET, "Expected ']' after index")
+                    expr = ArrayAccess(array=expr, index=index, line=expr.line, column=expr.column)
             else:
                 break
         
@@ -559,43 +625,56 @@ class Parser:
         
         raise ParseError("Can only call functions", self.previous)
     
+    def finish_map_literal(self) -> MapLiteral:
+        """맵 리터럴 완성: { key: value, ... }"""
+        token = self.previous
+        keys = []
+        values = []
+        
+        self.skip_newlines()
+        while not self.check(TokenType.RBRACE):
+            keys.append(self.parse_expression())
+            self.consume(TokenType.COLON, "Expected ':' after map key")
+            self.skip_newlines()
+            values.append(self.parse_expression())
+            self.skip_newlines()
+            if not self.match(TokenType.COMMA):
+                break
+            self.skip_newlines()
+        
+        self.consume(TokenType.RBRACE, "Expected '}' after map entries")
+        
+        return MapLiteral(keys=keys, values=values, line=token.line, column=token.column)
+    
     def parse_primary_expr(self) -> Expression:
         """기본 표현식"""
+        token = self.current
+        token_type = token.type
+        
+        # 식별자
+        if token_type is TokenType.IDENTIFIER:
+            self.advance()
+            return Identifier(name=token.value, line=token.line, column=token.column)
+        
         # 숫자 리터럴
-        if self.match(TokenType.INTEGER, TokenType.FLOAT):
-            return NumberLiteral(
-                value=self.previous.value,
-                line=self.previous.line,
-                column=self.previous.column
-            )
+        if token_type is TokenType.INTEGER or token_type is TokenType.FLOAT:
+            self.advance()
+            return NumberLiteral(value=token.value, line=token.line, column=token.column)
         
         # 문자열 리터럴
-        if self.match(TokenType.STRING):
-            return StringLiteral(
-                value=self.previous.value,
-                line=self.previous.line,
-                column=self.previous.column
-            )
+        if token_type is TokenType.STRING:
+            self.advance()
+            return StringLiteral(value=token.value, line=token.line, column=token.column)
         
         # 불리언 리터럴
-        if self.match(TokenType.BOOLEAN):
-            return BooleanLiteral(
-                value=self.previous.value,
-                line=self.previous.line,
-                column=self.previous.column
-            )
+        if token_type is TokenType.BOOLEAN:
+            self.advance()
+            return BooleanLiteral(value=token.value, line=token.line, column=token.column)
         
         # Null 리터럴
-        if self.match(TokenType.NULL):
-            return NullLiteral(line=self.previous.line, column=self.previous.column)
-        
-        # 식별자
-        if self.match(TokenType.IDENTIFIER):
-            return Identifier(
-                name=self.previous.value,
-                line=self.previous.line,
-                column=self.previous.column
-            )
+        if token_type is TokenType.NULL:
+            self.advance()
+            return NullLiteral(line=token.line, column=token.column)
         
         # 괄호 표현식
         if self.match(TokenType.LPAREN):
@@ -617,6 +696,10 @@ class Parser:
                 column=self.previous.column
             )
         
+        # 맵 리터럴
+        if self.match(TokenType.LBRACE):
+            return self.finish_map_literal()
+        
         # input() 함수 (내장)
         if self.match(TokenType.INPUT):
             self.consume(TokenType.LPAREN, "Expected '(' after 'input'")
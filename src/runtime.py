@@ -0,0 +1,514 @@
+"""
+MiniLang Runtime (런타임)
+인터프리터와 내장 함수 라이브러리가 공유하는 값 타입, 환경, 값 변환 함수를 정의합니다.
+"""
+
+from collections import deque
+from typing import Dict, List, Any, Optional, Callable, ClassVar, Iterator
+from dataclasses import dataclass, field
+from ast_nodes import Block
+
+
+class RuntimeError(Exception):
+    """런타임 에러"""
+    def __init__(self, message: str, line: int = 0, column: int = 0):
+        self.message = message
+        self.line = line
+        self.column = column
+        super().__init__(f"Runtime Error at line {line}: {message}")
+
+
+class ReturnValue(Exception):
+    """함수 반환을 위한 예외"""
+    def __init__(self, value: Any):
+        self.value = value
+
+
+class BreakException(Exception):
+    """break 문을 위한 예외"""
+    pass
+
+
+class ContinueException(Exception):
+    """continue 문을 위한 예외"""
+    pass
+
+
+class GuardFailure(Exception):
+    """단계별 실행: 컴파일할 때의 가정이 호출 시점에 맞지 않음 (함수 시작에서만 발생)"""
+    def __init__(self, reason: str, parameter: int = -1):
+        self.reason = reason
+        self.parameter = parameter  # 숫자가 아니었던 인자의 위치 (-1은 인자와 무관)
+        super().__init__(reason)
+
+
+@dataclass
+class Function:
+    """사용자 정의 함수"""
+    name: str
+    parameters: List[str]
+    body: Block
+    closure: 'Environment'
+    profile: Any = field(default=None, compare=False, repr=False)  # 단계별 실행 프로필 (tiering.py)
+    generator: bool = False  # True이면 호출하면 본문을 실행하지 않고 제너레이터를 반환
+
+
+@dataclass
+class BuiltinFunction:
+    """내장 함수"""
+    name: str
+    func: Callable
+    arity: int  # 인자 개수 (-1은 가변)
+    needs_interpreter: bool = False  # True이면 func(interpreter, args)로 호출
+    display_kind: ClassVar[str] = 'builtin'  # 출력 형식 (<builtin len>)
+
+
+class ArrayLike:
+    """배열처럼 동작하는 내장 값의 기반 클래스
+    
+    하위 클래스는 __len__, __getitem__, __setitem__, __iter__를 구현하며,
+    인터프리터와 내장 함수는 ARRAY_TYPES로 리스트와 함께 배열로 취급합니다.
+    """
+    __slots__ = ()
+    type_name = 'array'  # type()이 반환하는 이름
+    
+    def _unsupported(self, operation: str):
+        raise RuntimeError(f"{operation} is not supported for {self.type_name}")
+    
+    def append(self, value: Any):
+        self._unsupported('push')
+    
+    def extend(self, values: Any):
+        self._unsupported('extend')
+    
+    def pop(self) -> Any:
+        self._unsupported('pop')
+    
+    def sort(self, key=None):
+        self._unsupported('sort')
+    
+    def reverse(self):
+        self._unsupported('reverse')
+    
+    def index(self, value: Any) -> int:
+        for i, item in enumerate(self):
+            if item == value:
+                return i
+        raise ValueError(value)
+
+
+class RangeValue(ArrayLike):
+    """지연 range 값
+    
+    배열처럼 동작하지만 원소를 미리 만들지 않습니다. 길이/인덱스 접근/순회는
+    Python range로 처리하고, 수정(대입, push, pop)되는 시점에만 리스트로 바뀝니다.
+    """
+    __slots__ = ('_range', '_items')
+    
+    def __init__(self, r: range):
+        self._range = r
+        self._items: Optional[list] = None
+    
+    def materialize(self) -> list:
+        """원소를 리스트로 만들어 반환"""
+        if self._items is None:
+            self._items = list(self._range)
+            self._range = None
+        return self._items
+    
+    def _seq(self):
+        return self._items if self._items is not None else self._range
+    
+    def __len__(self) -> int:
+        return len(self._seq())
+    
+    def __getitem__(self, index: int) -> Any:
+        return self._seq()[index]
+    
+    def __setitem__(self, index: int, value: Any):
+        self.materialize()[index] = value
+    
+    def __iter__(self):
+        return iter(self._seq())
+    
+    def __contains__(self, value: Any) -> bool:
+        return value in self._seq()
+    
+    def index(self, value: Any) -> int:
+        return self._seq().index(value)
+    
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ARRAY_TYPES):
+            return list(self) == list(other)
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def append(self, value: Any):
+        self.materialize().append(value)
+    
+    def pop(self) -> Any:
+        return self.materialize().pop()
+
+
+class ArrayView(ArrayLike):
+    """배열 뷰 (arr[a:b])
+    
+    부모 배열의 저장 공간을 공유하는 O(1) 슬라이스입니다. 인덱스 접근, len,
+    순회를 지원하고 대입은 부모 배열에 그대로 반영됩니다. 독립된 배열이
+    필요하면 copy()로 복사합니다.
+    """
+    __slots__ = ('parent', 'start', 'stop')
+    
+    def __init__(self, parent: Any, start: int, stop: int):
+        # 뷰의 뷰는 원래 부모를 직접 가리킴
+        if isinstance(parent, ArrayView):
+            start += parent.start
+            stop += parent.start
+            parent = parent.parent
+        self.parent = parent
+        self.start = start
+        self.stop = max(start, stop)
+    
+    def _position(self, index: int) -> int:
+        position = self.start + index
+        if position >= len(self.parent):
+            raise RuntimeError(f"Array view index out of bounds: {index} (parent array shrank)")
+        return position
+    
+    def __len__(self) -> int:
+        return max(0, min(self.stop, len(self.parent)) - self.start)
+    
+    def __getitem__(self, index: int) -> Any:
+        return self.parent[self._position(index)]
+    
+    def __setitem__(self, index: Any, value: Any):
+        if isinstance(index, slice):
+            start, stop, _ = index.indices(len(self))
+            self.parent[self.start + start:self.start + stop] = value
+            return
+        self.parent[self._position(index)] = value
+    
+    def __iter__(self):
+        return map(self.parent.__getitem__, range(self.start, self.start + len(self)))
+    
+    def __contains__(self, value: Any) -> bool:
+        return any(item == value for item in self)
+    
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, ARRAY_TYPES):
+            return list(self) == list(other)
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def sort(self, key=None):
+        self[:] = sorted(self, key=key)
+    
+    def reverse(self):
+        self[:] = list(self)[::-1]
+    
+    def append(self, value: Any):
+        raise RuntimeError("Cannot resize an array view (use copy() first)")
+    
+    extend = append
+    
+    def pop(self) -> Any:
+        raise RuntimeError("Cannot resize an array view (use copy() first)")
+
+
+# 배열로 취급하는 타입들
+ARRAY_TYPES = (list, ArrayLike)
+
+
+class Stream:
+    """지연 평가 스트림 (파일의 줄, 표준 입력 등)
+    
+    원소를 미리 배열로 만들지 않고 요청할 때마다 하나씩 읽습니다.
+    for-in으로 순회하거나 next()로 하나씩 꺼낼 수 있으며, 끝에 도달하면
+    원본(파일 등)을 닫습니다.
+    """
+    __slots__ = ('name', '_source', '_on_close', 'closed', '__weakref__')
+    
+    def __init__(self, name: str, source: Iterator[Any], on_close: Optional[Callable[[], None]] = None):
+        self.name = name
+        self._source = source
+        self._on_close = on_close
+        self.closed = False
+    
+    def __iter__(self) -> 'Stream':
+        return self
+    
+    def __next__(self) -> Any:
+        if self.closed:
+            raise StopIteration
+        try:
+            return next(self._source)
+        except StopIteration:
+            self.close()
+            raise
+    
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            if self._on_close:
+                self._on_close()
+    
+    def __str__(self) -> str:
+        return f"<stream {self.name}>"
+
+
+class Generator(Stream):
+    """제너레이터 (yield가 있는 함수를 호출한 결과)
+    
+    스트림처럼 for-in이나 next()로 값을 하나씩 꺼냅니다. 값을 요청할 때마다 멈춰 있던
+    함수 본문을 다음 yield까지 실행합니다 (coroutines.GeneratorFrame).
+    """
+    __slots__ = ()
+    
+    def __str__(self) -> str:
+        return f"<generator {self.name}>"
+
+
+class Channel:
+    """작업(spawn) 사이에 값을 전달하는 채널 (coroutines.py)
+    
+    capacity가 0이면 크기 제한이 없고, 아니면 가득 찼을 때 send가 기다립니다.
+    receivers/senders는 값을 기다리며 멈춘 작업들입니다.
+    """
+    __slots__ = ('items', 'capacity', 'receivers', 'senders')
+    
+    def __init__(self, capacity: int = 0):
+        self.items: deque = deque()
+        self.capacity = capacity
+        self.receivers: deque = deque()  # 멈춘 작업
+        self.senders: deque = deque()  # (멈춘 작업, 보낼 값)
+    
+    def __str__(self) -> str:
+        return f"<channel {len(self.items)}/{self.capacity or 'unbounded'}>"
+
+
+class StringBuilder:
+    """문자열 빌더
+    
+    추가된 조각을 리스트에 모아 두었다가 build() 시점에 한 번만 합칩니다.
+    반복문에서 s += x로 문자열을 만들면 매번 전체를 복사하지만(O(n²)),
+    빌더를 사용하면 전체 비용이 O(n)입니다.
+    """
+    __slots__ = ('_parts', '_length')
+    
+    def __init__(self):
+        self._parts: List[str] = []
+        self._length = 0
+    
+    def append(self, text: str):
+        self._parts.append(text)
+        self._length += len(text)
+    
+    def build(self) -> str:
+        """지금까지의 내용을 문자열로 반환 (합친 결과를 캐시)"""
+        parts = self._parts
+        if len(parts) > 1:
+            parts[:] = [''.join(parts)]
+        return parts[0] if parts else ''
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (str, StringBuilder)):
+            return self.build() == str(other)
+        return NotImplemented
+    
+    # 크기 비교도 문자열로 합친 내용으로 (문자열 쪽이 왼쪽이면 파이썬이 반대 연산자로 호출)
+    def __lt__(self, other: Any) -> bool:
+        if isinstance(other, (str, StringBuilder)):
+            return self.build() < str(other)
+        return NotImplemented
+    
+    def __le__(self, other: Any) -> bool:
+        if isinstance(other, (str, StringBuilder)):
+            return self.build() <= str(other)
+        return NotImplemented
+    
+    def __gt__(self, other: Any) -> bool:
+        if isinstance(other, (str, StringBuilder)):
+            return self.build() > str(other)
+        return NotImplemented
+    
+    def __ge__(self, other: Any) -> bool:
+        if isinstance(other, (str, StringBuilder)):
+            return self.build() >= str(other)
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def __str__(self) -> str:
+        return self.build()
+
+
+class Environment:
+    """변수 환경 (스코프)"""
+    
+    def __init__(self, parent: Optional['Environment'] = None):
+        self.variables: Dict[str, Any] = {}
+        self.parent = parent
+    
+    def define(self, name: str, value: Any):
+        """변수 정의"""
+        self.variables[name] = value
+    
+    def get(self, name: str) -> Any:
+        """변수 값 조회"""
+        if name in self.variables:
+            return self.variables[name]
+        if self.parent:
+            return self.parent.get(name)
+        raise RuntimeError(f"Undefined variable: '{name}'")
+    
+    def set(self, name: str, value: Any):
+        """변수 값 설정"""
+        if name in self.variables:
+            self.variables[name] = value
+            return
+        if self.parent:
+            self.parent.set(name, value)
+            return
+        raise RuntimeError(f"Undefined variable: '{name}'")
+    
+    def exists(self, name: str) -> bool:
+        """변수 존재 여부"""
+        if name in self.variables:
+            return True
+        if self.parent:
+            return self.parent.exists(name)
+        return False
+
+
+class Cells(Environment):
+    """클로저가 캡처하는 변수만 담는 층 (ScopeEnvironment마다 하나)
+
+    부모는 바깥 스코프의 Cells 또는 최상위 환경이므로, 함수 값이 이 층을 붙잡아도
+    스코프의 나머지 변수는 살아남지 않습니다.
+    """
+    pass
+
+
+class ScopeEnvironment(Environment):
+    """클로저가 캡처하는 이름(captured)을 cells에 따로 두는 스코프
+
+    스코프 안의 코드는 일반 환경처럼 variables, cells, 부모 순으로 이름을 찾습니다.
+    """
+
+    def __init__(self, parent: Environment, captured: frozenset):
+        super().__init__(parent)
+        self.captured = captured
+        self.cells = Cells(parent=closure_environment(parent, captured))
+
+    def define(self, name: str, value: Any):
+        if name in self.captured:
+            self.cells.variables[name] = value
+        else:
+            self.variables[name] = value
+
+    def get(self, name: str) -> Any:
+        if name in self.variables:
+            return self.variables[name]
+        cells = self.cells.variables
+        if name in cells:
+            return cells[name]
+        return self.parent.get(name)
+
+    def set(self, name: str, value: Any):
+        if name in self.variables:
+            self.variables[name] = value
+            return
+        cells = self.cells.variables
+        if name in cells:
+            cells[name] = value
+            return
+        self.parent.set(name, value)
+
+    def exists(self, name: str) -> bool:
+        return name in self.variables or name in self.cells.variables or self.parent.exists(name)
+
+
+def closure_environment(env: Environment, free: frozenset) -> Environment:
+    """env에서 만들어지는 함수가 붙잡을 환경
+
+    자유 변수가 없으면 최상위 환경, 있으면 가장 가까운 캡처 층(Cells)입니다.
+    캡처 층이 없는 스코프는 클로저가 쓰는 이름을 정의하지 않으므로 건너뜁니다.
+    """
+    while env.parent is not None:
+        if free:
+            if isinstance(env, ScopeEnvironment):
+                return env.cells
+            if isinstance(env, Cells):
+                return env
+        env = env.parent
+    return env
+
+
+def to_string(value: Any) -> str:
+    """값을 문자열로 변환"""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, ARRAY_TYPES):
+        elements = ", ".join(to_string(e) for e in value)
+        return f"[{elements}]"
+    if isinstance(value, dict):
+        entries = ", ".join(f"{to_string(k)}: {to_string(v)}" for k, v in value.items())
+        return f"{{{entries}}}"
+    if isinstance(value, Function):
+        return f"<function {value.name}>"
+    if isinstance(value, BuiltinFunction):
+        return f"<{value.display_kind} {value.name}>"
+    return str(value)
+
+
+def type_name(value: Any) -> str:
+    """값의 MiniLang 타입 이름"""
+    if value is None:
+        return 'null'
+    if isinstance(value, bool):
+        return 'boolean'
+    if isinstance(value, int):
+        return 'integer'
+    if isinstance(value, float):
+        return 'float'
+    if isinstance(value, str):
+        return 'string'
+    if isinstance(value, ArrayLike):
+        return value.type_name
+    if isinstance(value, list):
+        return 'array'
+    if isinstance(value, dict):
+        return 'map'
+    if isinstance(value, StringBuilder):
+        return 'builder'
+    if isinstance(value, Generator):
+        return 'generator'
+    if isinstance(value, Stream):
+        return 'stream'
+    if isinstance(value, Channel):
+        return 'channel'
+    if isinstance(value, (Function, BuiltinFunction)):
+        return 'function'
+    return 'unknown'
+
+
+def is_truthy(value: Any) -> bool:
+    """값의 참/거짓 판단"""
+    if value is None:
+        return False
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, (int, float)):
+        return value != 0
+    if isinstance(value, str):
+        return len(value) > 0
+    if isinstance(value, (ARRAY_TYPES, dict, StringBuilder)):
+        return len(value) > 0
+    return True
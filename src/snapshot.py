@@ -0,0 +1,527 @@
+"""
+MiniLang Snapshot (인터프리터 상태 스냅숏)
+초기화 단계(최상위에서 조회 테이블 등을 만드는 부분)를 실행한 인터프리터의 전역 상태를 파일로
+저장하고, 다른 프로세스가 초기화를 다시 실행하지 않고 그 상태에서 이어서 실행하게 합니다.
+
+저장하는 것:
+    - 전역 환경과 불러온 모듈의 환경에 있는 값 (숫자, 문자열, 배열, 맵, 타입 배열, 행렬, 뷰, 빌더 등)
+    - 사용자 함수와 그 클로저 환경 (함수 본문은 AST를 복사하지 않고 프로그램 안의 위치로 가리킴)
+    - 내장 함수는 이름으로 저장 (내장 함수 테이블은 다시 만들지 않음)
+  스트림(열린 파일, 표준 입력)은 저장할 수 없으므로 SnapshotError가 발생합니다.
+
+파일 형식:
+    MAGIC (8바이트) | 형식 버전 (u16) | 색인 위치 (u64) | 색인 길이 (u64) | 레코드들 | 프로그램들 | 색인
+
+두 곳 이상에서 참조되는 객체와 전역 변수의 값은 각각 별도의 레코드(pickle)로 저장되고, 레코드
+사이의 참조는 레코드 번호로 저장되므로 공유 구조와 순환이 그대로 복원됩니다. 복원할 때는 색인만
+읽고, 전역 변수는 처음 사용될 때 그 값이 참조하는 레코드들만 읽습니다 (큰 파일은 mmap).
+함수 본문이 있는 프로그램도 그 함수가 처음 로드될 때 읽습니다.
+
+스냅숏은 pickle을 사용하므로 신뢰할 수 있는 파일만 복원해야 합니다.
+AST 노드나 런타임 값의 정의가 바뀌면 SNAPSHOT_VERSION을 올려야 합니다.
+"""
+
+import gc
+import io
+import mmap
+import os
+import pickle
+import struct
+from dataclasses import fields
+from typing import Any, Dict, List, Optional, Tuple
+
+from ast_nodes import ASTNode, Program, Block, FunctionDeclaration
+from closures import annotate as annotate_closures
+from runtime import (
+    Function, BuiltinFunction, Environment, ArrayLike, StringBuilder, Stream, Generator, Channel,
+)
+
+
+MAGIC = b'MLSNAPSH'
+SNAPSHOT_VERSION = 2
+_HEADER = struct.Struct('<8sHQQ')
+
+# 이 크기 이상인 스냅숏은 mmap으로 읽음
+MMAP_THRESHOLD = 1 << 20
+
+# 여러 곳에서 참조될 수 있는 (값이 아니라 정체성이 의미 있는) 객체
+SHAREABLE = (list, dict, Function, Environment, ArrayLike, StringBuilder)
+
+# 레코드 안에 중첩해서 저장하는 최대 깊이 (더 깊은 객체는 별도 레코드로 나눠 pickle 재귀를 제한)
+INLINE_DEPTH = 64
+
+# 레코드 종류 (객체 레코드는 클래스 자체)
+LIST, DICT, VALUE = 'list', 'dict', 'value'
+
+# 색인에 바로 저장하는 작은 값
+_SCALARS = (bool, int, float, type(None))
+
+
+class SnapshotError(Exception):
+    """스냅숏 저장/복원 에러"""
+    pass
+
+
+_slot_names: Dict[type, Tuple[str, ...]] = {}
+
+
+def _slots(cls: type) -> Tuple[str, ...]:
+    """클래스와 기반 클래스들이 선언한 __slots__ 이름"""
+    names = _slot_names.get(cls)
+    if names is None:
+        names = tuple(name for klass in reversed(cls.__mro__)
+                      for name in klass.__dict__.get('__slots__', ()))
+        _slot_names[cls] = names
+    return names
+
+
+def _state(obj: Any) -> Dict[str, Any]:
+    """객체 레코드에 저장할 속성들"""
+    if isinstance(obj, Function):
+        # 단계별 실행 프로필(컴파일된 코드)은 저장하지 않음
+        return {'name': obj.name, 'parameters': obj.parameters, 'body': obj.body,
+                'closure': obj.closure, 'profile': None, 'generator': obj.generator}
+    if hasattr(obj, '__dict__'):
+        return dict(obj.__dict__)
+    return {name: getattr(obj, name) for name in _slots(obj.__class__) if hasattr(obj, name)}
+
+
+def _references(obj: Any) -> List[Any]:
+    """객체가 직접 참조하는 값들"""
+    if isinstance(obj, list):
+        return obj
+    if isinstance(obj, dict):
+        return list(obj.values())
+    if isinstance(obj, Function):
+        return [obj.closure]  # 본문은 AST, 매개변수는 이름 목록
+    if isinstance(obj, Environment):
+        return list(obj.__dict__.values())
+    return list(_state(obj).values())
+
+
+def _function_bodies(program: Program) -> List[Block]:
+    """프로그램 안의 함수 본문 블록들 (저장과 복원에서 같은 순서)"""
+    bodies = []
+    stack: List[ASTNode] = [program]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, FunctionDeclaration):
+            bodies.append(node.body)
+        children = []
+        for f in fields(node):
+            value = getattr(node, f.name)
+            if isinstance(value, ASTNode):
+                children.append(value)
+            elif isinstance(value, list):
+                children.extend(item for item in value if isinstance(item, ASTNode))
+        stack.extend(reversed(children))
+    return bodies
+
+
+# =====================================================
+# 저장
+# =====================================================
+
+class _Writer:
+    """인터프리터 상태를 레코드로 나눠 스냅숏 파일에 기록"""
+
+    def __init__(self, interpreter):
+        from interpreter import BUILTINS
+        self.builtins = BUILTINS
+        self.interpreter = interpreter
+        self.envs: List[Environment] = []  # 최상위 환경 (0은 전역 환경, 나머지는 모듈 환경)
+        self.env_ids: Dict[int, int] = {}
+        self.indegree: Dict[int, int] = {}  # 공유 가능한 객체 id -> 참조 수
+        self.objects: Dict[int, Any] = {}  # 공유 가능한 객체 id -> 객체
+        self.records: List[Any] = []
+        self.record_kinds: List[Any] = []
+        self.record_ids: Dict[int, int] = {}  # 객체 id -> 레코드 번호
+        # 함수 본문 블록 id -> (프로그램 번호, 본문 번호)
+        self.programs = list(interpreter.programs.values())
+        self.block_ids: Dict[int, Tuple[int, int]] = {}
+        for p, program in enumerate(self.programs):
+            for i, block in enumerate(_function_bodies(program)):
+                self.block_ids[id(block)] = (p, i)
+        self.used_programs: set = set()
+
+    def _add_env(self, env: Environment) -> int:
+        k = self.env_ids.get(id(env))
+        if k is None:
+            if isinstance(env, LazyEnvironment):
+                env.load_all()  # 복원한 상태를 다시 저장할 때는 아직 읽지 않은 변수부터 로드
+            k = len(self.envs)
+            self.envs.append(env)
+            self.env_ids[id(env)] = k
+        return k
+
+    def _root_values(self, env: Environment) -> Dict[str, Any]:
+        """최상위 환경의 변수 중 저장할 것 (그대로인 내장 함수는 제외)"""
+        builtins = self.builtins
+        return {name: value for name, value in env.variables.items() if builtins.get(name) is not value}
+
+    # 1단계: 최상위 환경에서 닿는 객체마다 참조 수를 셈 (공유와 순환 찾기)
+    def count(self):
+        interpreter = self.interpreter
+        self._add_env(interpreter.global_env)
+        roots: List[Tuple[str, Any]] = []
+        for exports in interpreter.modules.values():
+            roots.extend(exports.items())
+
+        k = 0
+        while True:
+            for name, value in roots:
+                self._walk(name, value)
+            if k == len(self.envs):
+                break
+            roots = list(self._root_values(self.envs[k]).items())
+            k += 1
+
+    def _walk(self, name: str, value: Any):
+        indegree = self.indegree
+        stack = [value]
+        while stack:
+            obj = stack.pop()
+            if isinstance(obj, Environment) and obj.parent is None:
+                self._add_env(obj)
+            elif isinstance(obj, SHAREABLE):
+                count = indegree.get(id(obj))
+                indegree[id(obj)] = (count or 0) + 1
+                if count is None:
+                    self.objects[id(obj)] = obj
+                    stack.extend(_references(obj))
+            elif isinstance(obj, BuiltinFunction):
+                if self.builtins.get(obj.name) is not obj:
+                    raise SnapshotError(f"Cannot snapshot '{name}': unknown builtin function '{obj.name}'")
+            elif isinstance(obj, Generator):
+                raise SnapshotError(f"Cannot snapshot '{name}': {obj} is a suspended generator")
+            elif isinstance(obj, Stream):
+                raise SnapshotError(f"Cannot snapshot '{name}': {obj} is an open stream")
+            elif isinstance(obj, Channel):
+                raise SnapshotError(f"Cannot snapshot '{name}': {obj} is a channel between tasks")
+
+    # 2단계: 레코드로 나눌 객체 선택
+    def split(self):
+        for obj_id, obj in self.objects.items():
+            if self.indegree[obj_id] > 1:
+                self._add_record(obj)
+        for env in self.envs:
+            for value in self._root_values(env).values():
+                if isinstance(value, SHAREABLE) and not self._is_root_env(value):
+                    self._add_record(value)
+
+        # 레코드 안의 객체가 INLINE_DEPTH보다 깊으면 그 객체부터 새 레코드
+        r = 0
+        while r < len(self.records):
+            stack = [(child, 1) for child in _references(self.records[r])]
+            r += 1
+            while stack:
+                obj, depth = stack.pop()
+                if (not isinstance(obj, SHAREABLE) or id(obj) in self.record_ids
+                        or self._is_root_env(obj)):
+                    continue
+                if depth >= INLINE_DEPTH:
+                    self._add_record(obj)
+                else:
+                    stack.extend((child, depth + 1) for child in _references(obj))
+
+    def _is_root_env(self, obj: Any) -> bool:
+        return id(obj) in self.env_ids
+
+    def _add_record(self, obj: Any) -> int:
+        rid = self.record_ids.get(id(obj))
+        if rid is None:
+            rid = len(self.records)
+            self.records.append(obj)
+            self.record_kinds.append(LIST if isinstance(obj, list) else
+                                     DICT if isinstance(obj, dict) else obj.__class__)
+            self.record_ids[id(obj)] = rid
+        return rid
+
+    def _encode_root(self, value: Any) -> tuple:
+        """최상위 변수 값의 색인 항목"""
+        if isinstance(value, _SCALARS):
+            return ('v', value)
+        if isinstance(value, BuiltinFunction):
+            return ('b', value.name)
+        if id(value) in self.record_ids:
+            return ('r', self.record_ids[id(value)])
+        # 문자열 등 값 레코드 (처음 사용할 때 읽음)
+        rid = len(self.records)
+        self.records.append(value)
+        self.record_kinds.append(VALUE)
+        return ('r', rid)
+
+    def write(self, path: str):
+        self.count()
+        self.split()
+        envs = [{name: self._encode_root(value) for name, value in self._root_values(env).items()}
+                for env in self.envs]
+        modules = {path: {name: self._encode_root(value) for name, value in exports.items()}
+                   for path, exports in self.interpreter.modules.items()}
+
+        temp_path = path + '.tmp'
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(_HEADER.pack(MAGIC, SNAPSHOT_VERSION, 0, 0))
+                buffer = io.BytesIO()
+                pickler = _Pickler(buffer, self)
+                records = []
+                for rid, obj in enumerate(self.records):
+                    kind = self.record_kinds[rid]
+                    payload = (list(obj) if kind == LIST else dict(obj) if kind == DICT
+                               else obj if kind == VALUE else _state(obj))
+                    records.append((f.tell(), self._dump(pickler, buffer, payload, rid), kind))
+                    f.write(buffer.getbuffer())
+
+                programs: List[Optional[Tuple[int, int]]] = [None] * len(self.programs)
+                for p in sorted(self.used_programs):
+                    data = pickle.dumps(self.programs[p], protocol=pickle.HIGHEST_PROTOCOL)
+                    programs[p] = (f.tell(), len(data))
+                    f.write(data)
+
+                index = pickle.dumps({'envs': envs, 'modules': modules, 'records': records,
+                                      'programs': programs}, protocol=pickle.HIGHEST_PROTOCOL)
+                index_offset = f.tell()
+                f.write(index)
+                f.seek(0)
+                f.write(_HEADER.pack(MAGIC, SNAPSHOT_VERSION, index_offset, len(index)))
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def _dump(self, pickler: '_Pickler', buffer: io.BytesIO, payload: Any, rid: int) -> int:
+        buffer.seek(0)
+        buffer.truncate()
+        pickler.clear_memo()
+        try:
+            pickler.dump(payload)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            raise SnapshotError(f"Cannot snapshot {type(self.records[rid]).__name__} value: {e}")
+        return buffer.tell()
+
+
+class _Pickler(pickle.Pickler):
+    """레코드, 최상위 환경, 내장 함수, 함수 본문을 참조로 저장하는 pickler"""
+
+    def __init__(self, file: io.BytesIO, writer: _Writer):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.writer = writer
+
+    def persistent_id(self, obj: Any) -> Optional[tuple]:
+        writer = self.writer
+        key = id(obj)
+        rid = writer.record_ids.get(key)
+        if rid is not None:
+            return ('r', rid)
+        k = writer.env_ids.get(key)
+        if k is not None:
+            return ('env', k)
+        if isinstance(obj, BuiltinFunction):
+            return ('b', obj.name)
+        location = writer.block_ids.get(key)
+        if location is not None:
+            writer.used_programs.add(location[0])
+            return ('ast',) + location
+        return None
+
+    def reducer_override(self, obj: Any):
+        # 레코드 안에 중첩된 함수도 프로필 없이 저장
+        if isinstance(obj, Function):
+            return (Function, (obj.name, obj.parameters, obj.body, obj.closure, None, obj.generator))
+        return NotImplemented
+
+
+def write_snapshot(interpreter, path: str):
+    """인터프리터의 전역 상태(전역 변수, 불러온 모듈)를 스냅숏 파일로 저장"""
+    _Writer(interpreter).write(path)
+
+
+# =====================================================
+# 복원
+# =====================================================
+
+class LazyEnvironment(Environment):
+    """스냅숏에서 복원한 최상위 환경
+
+    변수는 처음 조회/대입될 때 스냅숏에서 읽습니다. 내장 함수는 미리 들어 있습니다.
+    """
+
+    def __init__(self, loader: 'SnapshotLoader', pending: Dict[str, tuple]):
+        super().__init__()
+        self.variables.update(loader.builtins)
+        for name in pending:
+            self.variables.pop(name, None)  # 내장 함수 이름을 덮어쓴 변수
+        self.loader = loader
+        self.pending = dict(pending)  # 아직 읽지 않은 변수 -> 색인 항목
+
+    def _load(self, name: str):
+        self.variables[name] = self.loader.decode(self.pending.pop(name))
+
+    def load_all(self):
+        """아직 읽지 않은 변수를 모두 로드"""
+        for name in list(self.pending):
+            self._load(name)
+
+    def define(self, name: str, value: Any):
+        self.pending.pop(name, None)
+        self.variables[name] = value
+
+    def get(self, name: str) -> Any:
+        if name in self.pending:
+            self._load(name)
+        return super().get(name)
+
+    def set(self, name: str, value: Any):
+        if name in self.pending:
+            self.pending.pop(name)
+            self.variables[name] = value
+            return
+        super().set(name, value)
+
+    def exists(self, name: str) -> bool:
+        return name in self.pending or super().exists(name)
+
+
+class _Unpickler(pickle.Unpickler):
+    def __init__(self, data: bytes, loader: 'SnapshotLoader'):
+        super().__init__(io.BytesIO(data))
+        self.loader = loader
+
+    def persistent_load(self, pid: tuple) -> Any:
+        return self.loader.reference(pid)
+
+
+class SnapshotLoader:
+    """스냅숏 파일의 색인을 읽고, 요청된 레코드만 복원"""
+
+    def __init__(self, interpreter, path: str):
+        from interpreter import BUILTINS
+        self.builtins = BUILTINS
+        self.interpreter = interpreter
+        self.path = path
+        self.data = self._open(path)
+        magic, version, index_offset, index_length = _HEADER.unpack_from(self.data)
+        if magic != MAGIC:
+            raise SnapshotError(f"'{path}' is not a MiniLang snapshot")
+        if version != SNAPSHOT_VERSION:
+            raise SnapshotError(
+                f"Snapshot '{path}' has format version {version}, expected {SNAPSHOT_VERSION}"
+            )
+        try:
+            index = pickle.loads(self.data[index_offset:index_offset + index_length])
+        except Exception as e:
+            raise SnapshotError(f"Corrupted snapshot '{path}': {e}")
+        self.records: List[Tuple[int, int, Any]] = index['records']
+        self.programs: List[Optional[Tuple[int, int]]] = index['programs']
+        self.objects: Dict[int, Any] = {}  # 레코드 번호 -> 복원한(또는 채우는 중인) 객체
+        self.blocks: Dict[int, List[Block]] = {}  # 프로그램 번호 -> 함수 본문 블록들
+        self._unfilled: List[int] = []
+        self.loaded_records = 0  # 실제로 읽은 레코드 수 (통계)
+        self.envs = [LazyEnvironment(self, pending) for pending in index['envs']]
+        self._modules = index['modules']
+
+    def _open(self, path: str):
+        try:
+            with open(path, 'rb') as f:
+                size = os.fstat(f.fileno()).st_size
+                if size < _HEADER.size:
+                    raise SnapshotError(f"'{path}' is not a MiniLang snapshot")
+                if size < MMAP_THRESHOLD:
+                    return f.read()
+                # 매핑은 파일을 닫은 뒤에도 유효 (지연 로드가 끝날 때까지 유지)
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except OSError as e:
+            raise SnapshotError(f"Cannot read snapshot '{path}': {e.strerror}")
+
+    def modules(self) -> Dict[str, Dict[str, Function]]:
+        """불러온 모듈 경로 -> 내보낸 함수들 (모듈을 다시 실행하지 않도록)"""
+        return {path: {name: self.decode(entry) for name, entry in exports.items()}
+                for path, exports in self._modules.items()}
+
+    def decode(self, entry: tuple) -> Any:
+        """색인 항목의 값 (레코드이면 참조하는 레코드들까지 복원)"""
+        tag = entry[0]
+        if tag == 'v':
+            return entry[1]
+        value = self.reference(entry)
+        self._fill()
+        return value
+
+    def reference(self, pid: tuple) -> Any:
+        """참조 하나를 객체로 (레코드는 빈 객체를 먼저 만들어 두고 나중에 채움)"""
+        tag = pid[0]
+        if tag == 'r':
+            rid = pid[1]
+            obj = self.objects.get(rid)
+            if rid not in self.objects:
+                kind = self.records[rid][2]
+                if kind == VALUE:
+                    obj = self._payload(rid)
+                else:
+                    obj = [] if kind == LIST else {} if kind == DICT else kind.__new__(kind)
+                    self._unfilled.append(rid)
+                self.objects[rid] = obj
+            return obj
+        if tag == 'b':
+            return self.builtins[pid[1]]
+        if tag == 'env':
+            return self.envs[pid[1]]
+        if tag == 'ast':
+            return self._program_blocks(pid[1])[pid[2]]
+        raise SnapshotError(f"Corrupted snapshot '{self.path}': unknown reference {pid!r}")
+
+    def _payload(self, rid: int) -> Any:
+        offset, length, _ = self.records[rid]
+        self.loaded_records += 1
+        try:
+            return _Unpickler(self.data[offset:offset + length], self).load()
+        except SnapshotError:
+            raise
+        except Exception as e:
+            raise SnapshotError(f"Corrupted snapshot '{self.path}': {e}")
+
+    def _fill(self):
+        """만들어 둔 빈 객체들을 채움 (레코드 사이의 참조는 재귀 없이 작업 목록으로 처리)"""
+        unfilled = self._unfilled
+        if not unfilled:
+            return
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            while unfilled:
+                rid = unfilled.pop()
+                obj = self.objects[rid]
+                payload = self._payload(rid)
+                if isinstance(obj, list):
+                    obj.extend(payload)
+                elif isinstance(obj, dict):
+                    obj.update(payload)
+                else:
+                    for name, value in payload.items():
+                        setattr(obj, name, value)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    def _program_blocks(self, p: int) -> List[Block]:
+        blocks = self.blocks.get(p)
+        if blocks is None:
+            location = self.programs[p]
+            if location is None:
+                raise SnapshotError(f"Corrupted snapshot '{self.path}': missing program {p}")
+            offset, length = location
+            program = pickle.loads(self.data[offset:offset + length])
+            annotate_closures(program)
+            self.interpreter.programs[id(program)] = program
+            blocks = self.blocks[p] = _function_bodies(program)
+        return blocks
+
+
+def restore_snapshot(interpreter, path: str):
+    """인터프리터를 초기화하고 스냅숏의 전역 상태로 바꿈 (변수는 처음 사용할 때 로드)"""
+    loader = SnapshotLoader(interpreter, path)
+    interpreter.reset()
+    interpreter.global_env = interpreter.current_env = loader.envs[0]
+    interpreter.modules = loader.modules()
@@ -0,0 +1,197 @@
+"""
+MiniLang Streams (파일/표준 입력 I/O)
+파일과 표준 입력을 줄 단위로 지연 순회하는 스트림과 파일 읽기/쓰기 내장 함수를 제공합니다.
+
+- read_lines/stdin_lines는 전체를 배열로 읽지 않고 버퍼 단위로 읽으며 한 줄씩 내보냅니다.
+- read_file은 큰 파일을 mmap으로 매핑해 중간 bytes 복사 없이 바로 디코딩합니다.
+- write_file/append_file은 인터프리터마다 열린 버퍼 쓰기 파일을 재사용하므로,
+  반복문에서 한 줄씩 추가해도 매번 파일을 다시 열지 않습니다.
+  버퍼는 같은 파일을 읽을 때와 프로그램 실행이 끝날 때 비워집니다.
+"""
+
+import mmap
+import os
+import sys
+from typing import Any, Dict, IO, Iterator
+
+from runtime import BuiltinFunction, RuntimeError, Stream, to_string
+
+
+# 이 크기 이상인 파일은 mmap으로 읽음
+MMAP_THRESHOLD = 1 << 20
+# 줄 단위 읽기/쓰기 버퍼 크기
+IO_BUFFER_SIZE = 1 << 16
+
+
+def _path_arg(value: Any, name: str) -> str:
+    if not isinstance(value, str):
+        raise RuntimeError(f"{name} requires a file path string")
+    return value
+
+
+def _open(path: str, mode: str) -> IO:
+    try:
+        if 'b' in mode:
+            return open(path, mode)
+        return open(path, mode, encoding='utf-8', buffering=IO_BUFFER_SIZE)
+    except OSError as e:
+        raise RuntimeError(f"Cannot open file '{path}': {e.strerror}")
+
+
+def _strip_newlines(lines: Iterator[str]) -> Iterator[str]:
+    for line in lines:
+        yield line[:-1] if line.endswith('\n') else line
+
+
+def read_text(path: str) -> str:
+    """파일 전체를 문자열로 읽음 (큰 파일은 mmap 사용)"""
+    with _open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_THRESHOLD:
+            data = f.read()
+            return data.decode('utf-8').replace('\r\n', '\n')
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            text = str(memoryview(mapped), 'utf-8')
+    return text.replace('\r\n', '\n')
+
+
+def line_stream(path: str) -> Stream:
+    """파일의 줄을 지연 순회하는 스트림"""
+    f = _open(path, 'r')
+    return Stream(path, _strip_newlines(f), f.close)
+
+
+def stdin_stream() -> Stream:
+    """표준 입력의 줄을 지연 순회하는 스트림"""
+    return Stream('stdin', _strip_newlines(sys.stdin))
+
+
+class WriterPool:
+    """인터프리터별로 열어 둔 버퍼 쓰기 파일들 (절대 경로 -> 파일)"""
+
+    def __init__(self):
+        self._files: Dict[str, IO] = {}
+
+    def write(self, path: str, text: str, append: bool):
+        key = os.path.abspath(path)
+        f = self._files.get(key)
+        if not append and f is not None:
+            f.close()
+            f = None
+        if f is None:
+            f = _open(path, 'a' if append else 'w')
+            self._files[key] = f
+        f.write(text)
+
+    def flush(self, path: str):
+        """경로의 쓰기 버퍼를 비움 (같은 파일을 읽기 전에 호출)"""
+        f = self._files.get(os.path.abspath(path))
+        if f is not None:
+            f.flush()
+
+    def close(self, path: str):
+        f = self._files.pop(os.path.abspath(path), None)
+        if f is not None:
+            f.close()
+
+    def close_all(self):
+        files, self._files = self._files, {}
+        for f in files.values():
+            f.close()
+
+
+def register_stream_builtins(table: Dict[str, BuiltinFunction]):
+    """스트림/파일 내장 함수를 테이블에 등록"""
+
+    def read_lines_func(interp, args):
+        path = _path_arg(args[0], 'read_lines')
+        interp.writers.flush(path)
+        stream = line_stream(path)
+        interp.streams.add(stream)
+        return stream
+
+    table['read_lines'] = BuiltinFunction(
+        name='read_lines',
+        func=read_lines_func,
+        arity=1,
+        needs_interpreter=True
+    )
+
+    table['stdin_lines'] = BuiltinFunction(
+        name='stdin_lines',
+        func=lambda interp, args: interp._stdin_lines(),
+        arity=0,
+        needs_interpreter=True
+    )
+
+    def read_file_func(interp, args):
+        path = _path_arg(args[0], 'read_file')
+        interp.writers.flush(path)
+        return read_text(path)
+
+    table['read_file'] = BuiltinFunction(
+        name='read_file',
+        func=read_file_func,
+        arity=1,
+        needs_interpreter=True
+    )
+
+    def make_writer(name: str, append: bool):
+        def write_func(interp, args):
+            path = _path_arg(args[0], name)
+            interp.writers.write(path, to_string(args[1]), append)
+            return None
+        return write_func
+
+    table['write_file'] = BuiltinFunction(
+        name='write_file',
+        func=make_writer('write_file', False),
+        arity=2,
+        needs_interpreter=True
+    )
+
+    table['append_file'] = BuiltinFunction(
+        name='append_file',
+        func=make_writer('append_file', True),
+        arity=2,
+        needs_interpreter=True
+    )
+
+    def remove_file_func(interp, args):
+        path = _path_arg(args[0], 'remove_file')
+        interp.writers.close(path)
+        try:
+            os.remove(path)
+        except OSError as e:
+            raise RuntimeError(f"Cannot remove file '{path}': {e.strerror}")
+        return None
+
+    table['remove_file'] = BuiltinFunction(
+        name='remove_file',
+        func=remove_file_func,
+        arity=1,
+        needs_interpreter=True
+    )
+
+    def next_func(args):
+        if not isinstance(args[0], Stream):
+            raise RuntimeError("next requires a stream")
+        return next(args[0], None)
+
+    table['next'] = BuiltinFunction(
+        name='next',
+        func=next_func,
+        arity=1
+    )
+
+    def close_func(args):
+        if not isinstance(args[0], Stream):
+            raise RuntimeError("close requires a stream")
+        args[0].close()
+        return None
+
+    table['close'] = BuiltinFunction(
+        name='close',
+        func=close_func,
+        arity=1
+    )
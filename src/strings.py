@@ -0,0 +1,365 @@
+"""
+MiniLang Strings (문자열 라이브러리)
+split, join, find, replace, substr 등 문자열 처리 내장 함수와
+match, search, find_all, regex_replace 정규식 내장 함수를 제공합니다.
+
+각 함수는 Python 문자열 메서드 한 번의 호출로 처리되므로, 문자 단위 인덱싱과
+`+` 연결을 반복하는 MiniLang 코드보다 훨씬 빠릅니다.
+문자열 인자 자리에는 문자열 빌더도 넘길 수 있습니다.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from runtime import BuiltinFunction, RuntimeError, StringBuilder, ARRAY_TYPES, to_string
+
+
+def _str_arg(value: Any, name: str) -> str:
+    """문자열 인자 검증 (문자열 빌더는 문자열로 변환)"""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, StringBuilder):
+        return value.build()
+    raise RuntimeError(f"{name} requires a string")
+
+
+def _int_arg(value: Any, name: str) -> int:
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise RuntimeError(f"{name}: expected an integer, got {to_string(value)}")
+    return value
+
+
+def _check_arity(args: List[Any], name: str, low: int, high: int):
+    if not low <= len(args) <= high:
+        expected = str(low) if low == high else f"{low} to {high}"
+        raise RuntimeError(f"{name} expects {expected} arguments, got {len(args)}")
+
+
+# format의 자리표시자: {}, {0}, {:>8}, {1:.2f} (중괄호 자체는 {{ }})
+_PLACEHOLDER = re.compile(r'\{\{|\}\}|\{(\d*)(?::([^{}]*))?\}|[{}]')
+
+
+def format_string(template: str, values: List[Any]) -> str:
+    """format 내장 함수 구현
+
+    자리표시자의 형식 지정자(`:` 뒤)는 Python 형식 지정 문법을 따르며,
+    숫자는 그대로, 그 외의 값은 to_string으로 변환한 문자열에 적용됩니다.
+    """
+    auto_index = 0
+
+    def substitute(match: 're.Match') -> str:
+        nonlocal auto_index
+        text = match.group(0)
+        if text == '{{':
+            return '{'
+        if text == '}}':
+            return '}'
+        if text in ('{', '}'):
+            raise RuntimeError(f"format: unmatched '{text}' in template")
+        position, spec = match.group(1), match.group(2)
+        if position:
+            index = int(position)
+        else:
+            index = auto_index
+            auto_index += 1
+        if index >= len(values):
+            raise RuntimeError(f"format: missing argument for placeholder {index}")
+        value = values[index]
+        if not spec:
+            return to_string(value)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            value = to_string(value)
+        try:
+            return format(value, spec)
+        except ValueError as e:
+            raise RuntimeError(f"format: invalid format spec '{spec}' ({e})")
+
+    return _PLACEHOLDER.sub(substitute, template)
+
+
+# =====================================================
+# 정규식
+# =====================================================
+
+# 플래그 문자열의 각 문자 -> re 플래그
+_REGEX_FLAGS = {
+    'i': re.IGNORECASE,
+    'm': re.MULTILINE,
+    's': re.DOTALL,
+    'x': re.VERBOSE,
+}
+
+# 컴파일된 패턴 캐시의 최대 크기
+REGEX_CACHE_SIZE = 128
+
+
+class PatternCache:
+    """컴파일된 정규식의 LRU 캐시 ((패턴, 플래그) -> re.Pattern)
+    
+    내장 함수 테이블은 모든 인터프리터(스레드)가 공유하므로 잠금으로 보호합니다.
+    """
+
+    def __init__(self, capacity: int = REGEX_CACHE_SIZE):
+        self.capacity = capacity
+        self.hits = 0
+        self.misses = 0
+        self._patterns: 'OrderedDict[Tuple[str, str], re.Pattern]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, pattern: str, flags: str = "") -> 're.Pattern':
+        key = (pattern, flags)
+        with self._lock:
+            compiled = self._patterns.get(key)
+            if compiled is not None:
+                self._patterns.move_to_end(key)
+                self.hits += 1
+                return compiled
+            self.misses += 1
+
+        compiled = self._compile(pattern, flags)
+        with self._lock:
+            self._patterns[key] = compiled
+            self._patterns.move_to_end(key)
+            while len(self._patterns) > self.capacity:
+                self._patterns.popitem(last=False)
+        return compiled
+
+    @staticmethod
+    def _compile(pattern: str, flags: str) -> 're.Pattern':
+        value = 0
+        for flag in flags:
+            if flag not in _REGEX_FLAGS:
+                raise RuntimeError(f"Unknown regex flag: '{flag}'")
+            value |= _REGEX_FLAGS[flag]
+        try:
+            return re.compile(pattern, value)
+        except re.error as e:
+            raise RuntimeError(f"Invalid regex '{pattern}': {e}")
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._patterns),
+                'capacity': self.capacity,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._patterns.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+PATTERN_CACHE = PatternCache()
+
+
+def _match_to_map(m: 're.Match') -> Dict[str, Any]:
+    """re.Match -> MiniLang 맵 {text, start, end, groups, named}"""
+    return {
+        'text': m.group(0),
+        'start': m.start(),
+        'end': m.end(),
+        'groups': list(m.groups()),
+        'named': m.groupdict(),
+    }
+
+
+def _regex_args(args: List[Any], name: str, count: int) -> Tuple['re.Pattern', List[str]]:
+    """(패턴, 문자열 인자들..., 플래그?) 인자를 검증하고 컴파일된 패턴을 반환"""
+    _check_arity(args, name, count, count + 1)
+    flags = _str_arg(args[count], name) if len(args) > count else ""
+    pattern = PATTERN_CACHE.get(_str_arg(args[0], name), flags)
+    return pattern, [_str_arg(arg, name) for arg in args[1:count]]
+
+
+def register_string_builtins(table: Dict[str, BuiltinFunction]):
+    """문자열 내장 함수를 테이블에 등록"""
+
+    def split_func(args):
+        _check_arity(args, 'split', 1, 2)
+        text = _str_arg(args[0], 'split')
+        if len(args) == 1 or args[1] is None:
+            return text.split()
+        sep = _str_arg(args[1], 'split')
+        if sep == "":
+            return list(text)
+        return text.split(sep)
+
+    table['split'] = BuiltinFunction(
+        name='split',
+        func=split_func,
+        arity=-1
+    )
+
+    def join_func(args):
+        _check_arity(args, 'join', 1, 2)
+        if not isinstance(args[0], ARRAY_TYPES):
+            raise RuntimeError("join requires an array")
+        sep = _str_arg(args[1], 'join') if len(args) == 2 else ""
+        return sep.join(item if isinstance(item, str) else to_string(item) for item in args[0])
+
+    table['join'] = BuiltinFunction(
+        name='join',
+        func=join_func,
+        arity=-1
+    )
+
+    def find_func(args):
+        _check_arity(args, 'find', 2, 3)
+        text = _str_arg(args[0], 'find')
+        start = _int_arg(args[2], 'find') if len(args) == 3 else 0
+        return text.find(_str_arg(args[1], 'find'), start)
+
+    table['find'] = BuiltinFunction(
+        name='find',
+        func=find_func,
+        arity=-1
+    )
+
+    def replace_func(args):
+        _check_arity(args, 'replace', 3, 4)
+        text = _str_arg(args[0], 'replace')
+        old = _str_arg(args[1], 'replace')
+        new = _str_arg(args[2], 'replace')
+        count = _int_arg(args[3], 'replace') if len(args) == 4 else -1
+        return text.replace(old, new, count)
+
+    table['replace'] = BuiltinFunction(
+        name='replace',
+        func=replace_func,
+        arity=-1
+    )
+
+    def substr_func(args):
+        _check_arity(args, 'substr', 2, 3)
+        text = _str_arg(args[0], 'substr')
+        start = _int_arg(args[1], 'substr')
+        if start < 0:
+            start = max(len(text) + start, 0)
+        if len(args) == 3 and args[2] is not None:
+            length = _int_arg(args[2], 'substr')
+            if length < 0:
+                raise RuntimeError("substr: length must be non-negative")
+            return text[start:start + length]
+        return text[start:]
+
+    table['substr'] = BuiltinFunction(
+        name='substr',
+        func=substr_func,
+        arity=-1
+    )
+
+    def trim_func(args):
+        _check_arity(args, 'trim', 1, 2)
+        text = _str_arg(args[0], 'trim')
+        chars: Optional[str] = _str_arg(args[1], 'trim') if len(args) == 2 else None
+        return text.strip(chars)
+
+    table['trim'] = BuiltinFunction(
+        name='trim',
+        func=trim_func,
+        arity=-1
+    )
+
+    table['upper'] = BuiltinFunction(
+        name='upper',
+        func=lambda args: _str_arg(args[0], 'upper').upper(),
+        arity=1
+    )
+
+    table['lower'] = BuiltinFunction(
+        name='lower',
+        func=lambda args: _str_arg(args[0], 'lower').lower(),
+        arity=1
+    )
+
+    table['starts_with'] = BuiltinFunction(
+        name='starts_with',
+        func=lambda args: _str_arg(args[0], 'starts_with').startswith(_str_arg(args[1], 'starts_with')),
+        arity=2
+    )
+
+    table['ends_with'] = BuiltinFunction(
+        name='ends_with',
+        func=lambda args: _str_arg(args[0], 'ends_with').endswith(_str_arg(args[1], 'ends_with')),
+        arity=2
+    )
+
+    def repeat_func(args):
+        text = _str_arg(args[0], 'repeat')
+        count = _int_arg(args[1], 'repeat')
+        return text * max(count, 0)
+
+    table['repeat'] = BuiltinFunction(
+        name='repeat',
+        func=repeat_func,
+        arity=2
+    )
+
+    def format_func(args):
+        if not args:
+            raise RuntimeError("format requires a template string")
+        return format_string(_str_arg(args[0], 'format'), args[1:])
+
+    table['format'] = BuiltinFunction(
+        name='format',
+        func=format_func,
+        arity=-1
+    )
+
+    # 정규식 함수들: 일치 결과는 맵, 일치하지 않으면 null
+    def match_func(args):
+        pattern, (text,) = _regex_args(args, 'match', 2)
+        m = pattern.match(text)
+        return _match_to_map(m) if m else None
+
+    table['match'] = BuiltinFunction(
+        name='match',
+        func=match_func,
+        arity=-1
+    )
+
+    def search_func(args):
+        pattern, (text,) = _regex_args(args, 'search', 2)
+        m = pattern.search(text)
+        return _match_to_map(m) if m else None
+
+    table['search'] = BuiltinFunction(
+        name='search',
+        func=search_func,
+        arity=-1
+    )
+
+    def find_all_func(args):
+        # 그룹이 없거나 하나면 문자열 배열, 여러 개면 그룹 배열의 배열
+        pattern, (text,) = _regex_args(args, 'find_all', 2)
+        return [list(item) if isinstance(item, tuple) else item for item in pattern.findall(text)]
+
+    table['find_all'] = BuiltinFunction(
+        name='find_all',
+        func=find_all_func,
+        arity=-1
+    )
+
+    def regex_replace_func(args):
+        pattern, (text, replacement) = _regex_args(args, 'regex_replace', 3)
+        try:
+            return pattern.sub(replacement, text)
+        except re.error as e:
+            raise RuntimeError(f"regex_replace: invalid replacement '{replacement}': {e}")
+
+    table['regex_replace'] = BuiltinFunction(
+        name='regex_replace',
+        func=regex_replace_func,
+        arity=-1
+    )
+
+    table['regex_cache_stats'] = BuiltinFunction(
+        name='regex_cache_stats',
+        func=lambda args: PATTERN_CACHE.stats(),
+        arity=0
+    )
@@ -0,0 +1,198 @@
+"""
+MiniLang Tiered Execution (단계별 실행)
+자주 실행되는 함수를 찾아 파이썬 코드로 컴파일하고, 이후 호출부터 컴파일된 코드로 실행합니다.
+
+- 인터프리터는 함수(Function)마다 호출 횟수와 반복문 반복 횟수(back-edge)를 셉니다.
+  합이 TIER_THRESHOLD를 넘으면 백그라운드 스레드가 함수 본문을 컴파일하고
+  (transpiler.compile_function), 준비가 끝난 뒤의 호출부터 컴파일된 코드를 씁니다.
+- 컴파일 전까지 관찰한 인자가 항상 숫자였으면 그 인자를 숫자로 특수화합니다.
+  특수화와 내장 함수 바인딩 같은 가정은 함수 시작에서 검사하고, 어긋나면 그 호출은
+  트리 순회로 실행하고(탈최적화) 가정을 넓혀 다시 데워지기를 기다립니다.
+  MAX_DEOPTS번 탈최적화된 함수는 더 이상 컴파일하지 않습니다.
+- 중첩 함수나 import가 있는 함수는 컴파일하지 않습니다. step_hook이 설정된
+  인터프리터(asyncio 임베딩)에서는 단계별 실행을 하지 않습니다.
+"""
+
+import os
+import queue
+import threading
+import time
+from typing import Any, Callable, List, Optional
+
+from runtime import Function, GuardFailure
+from transpiler import NUM, ANY, Runtime, TranspileError, compile_function
+
+
+TIER_THRESHOLD = 1000  # 호출 수 + 반복 횟수가 이 값에 이르면 컴파일
+MAX_DEOPTS = 3  # 이만큼 탈최적화되면 트리 순회로 고정
+
+# 프로필 상태
+INTERPRETED = 'interpreted'  # 트리 순회로 실행 중 (데워지는 중)
+QUEUED = 'queued'  # 백그라운드 컴파일 대기/진행 중
+COMPILED = 'compiled'  # 컴파일된 코드로 실행
+REJECTED = 'rejected'  # 컴파일할 수 없거나 탈최적화가 반복됨
+
+
+class TierProfile:
+    """함수 하나의 실행 프로필과 단계 상태"""
+
+    __slots__ = ('function', 'tiering', 'calls', 'back_edges', 'kinds', 'state', 'code',
+                 'ready', 'deopts', 'events', 'total_calls')
+
+    def __init__(self, function: Function, tiering: 'Tiering'):
+        self.function = function
+        self.tiering = tiering
+        self.calls = 0  # 마지막 (탈)최적화 이후 호출 수
+        self.back_edges = 0
+        self.total_calls = 0
+        self.kinds: List[Optional[str]] = [None] * len(function.parameters)  # 인자별 관찰한 종류
+        self.state = INTERPRETED
+        self.code: Optional[Callable[[List[Any]], Any]] = None
+        self.ready: Optional[Callable] = None  # 백그라운드 컴파일 결과 (factory 또는 에러 메시지)
+        self.deopts = 0
+        self.events: List[str] = []
+
+    def enter(self, arguments: List[Any]) -> Optional[Callable[[List[Any]], Any]]:
+        """호출 한 번을 기록하고 컴파일된 코드가 있으면 반환"""
+        self.calls += 1
+        self.total_calls += 1
+        if self.code is not None:
+            return self.code
+        if self.state == INTERPRETED:
+            kinds = self.kinds
+            for i, arg in enumerate(arguments):
+                t = type(arg)
+                kind = NUM if t is int or t is float else ANY
+                if kinds[i] != kind and kinds[i] != ANY:
+                    kinds[i] = kind if kinds[i] is None else ANY
+            if self.calls + self.back_edges >= self.tiering.threshold:
+                self.tiering.submit(self)
+        elif self.state == QUEUED and self.ready is not None:
+            self._install()
+        return self.code
+
+    def _install(self):
+        ready, self.ready = self.ready, None
+        if isinstance(ready, str):
+            self.state = REJECTED
+            self.event(f"not compiled: {ready}")
+            return
+        self.code = ready(self.tiering.runtime, self.function.closure)
+        self.state = COMPILED
+        self.event("compiled code installed")
+
+    def deoptimize(self, failure: GuardFailure):
+        """가정이 어긋남: 트리 순회로 되돌리고 가정을 넓힘"""
+        self.code = None
+        self.deopts += 1
+        self.calls = self.back_edges = 0
+        if failure.parameter >= 0:
+            self.kinds[failure.parameter] = ANY
+        if self.deopts >= MAX_DEOPTS:
+            self.state = REJECTED
+            self.event(f"deoptimized: {failure.reason} (giving up after {self.deopts})")
+        else:
+            self.state = INTERPRETED
+            self.event(f"deoptimized: {failure.reason}")
+
+    def event(self, text: str):
+        elapsed = (time.perf_counter() - self.tiering.started) * 1000
+        self.events.append(f"+{elapsed:.1f} ms, call {self.total_calls}: {text}")
+
+
+class Tiering:
+    """인터프리터 하나의 단계별 실행 상태 (함수별 프로필과 통계)"""
+
+    def __init__(self, interpreter, threshold: int = TIER_THRESHOLD, background: bool = True):
+        self.threshold = threshold
+        self.background = background  # False이면 임계값에 이른 호출에서 바로 컴파일
+        self.runtime = Runtime(interpreter)
+        self.profiles: List[TierProfile] = []
+        self.started = time.perf_counter()
+
+    def profile(self, function: Function) -> TierProfile:
+        profile = TierProfile(function, self)
+        self.profiles.append(profile)
+        return profile
+
+    def submit(self, profile: TierProfile):
+        """컴파일 요청 (백그라운드이면 큐에 넣고 바로 반환)"""
+        profile.state = QUEUED
+        kinds = [kind if kind is not None else ANY for kind in profile.kinds]
+        specialized = [p for p, k in zip(profile.function.parameters, kinds) if k == NUM]
+        detail = f" [numbers: {', '.join(specialized)}]" if specialized else ""
+        profile.event(f"promoted after {profile.calls} calls, {profile.back_edges} loop iterations{detail}")
+        if self.background:
+            _COMPILER.submit(profile, kinds)
+        else:
+            profile.ready = _compile(profile.function, kinds)
+            profile._install()
+
+    def wait(self, timeout: float = 10.0):
+        """대기 중인 백그라운드 컴파일이 끝날 때까지 대기 (테스트/벤치마크용)"""
+        _COMPILER.wait(timeout)
+
+    def report(self) -> str:
+        """--stats 출력: 승격된(또는 데워진) 함수와 그 기록"""
+        lines = ["=== Tiered execution ==="]
+        profiles = [p for p in self.profiles if p.events]
+        if not profiles:
+            lines.append(f"  no function reached the threshold ({self.threshold} calls + loop iterations)")
+        for profile in profiles:
+            function = profile.function
+            lines.append(
+                f"  {function.name} (line {function.body.line}): {profile.total_calls} calls, "
+                f"state {profile.state}, deopts {profile.deopts}"
+            )
+            lines.extend(f"    {event}" for event in profile.events)
+        return "\n".join(lines)
+
+
+def _compile(function: Function, kinds: List[str]):
+    """컴파일 결과: factory, 또는 컴파일할 수 없는 이유(문자열)"""
+    try:
+        return compile_function(function, kinds)
+    except TranspileError as e:
+        return e.message
+    except RecursionError:
+        return "function too deeply nested"
+    except Exception as e:
+        return f"compiler error: {type(e).__name__}: {e}"
+
+
+class BackgroundCompiler:
+    """컴파일 요청을 처리하는 데몬 스레드 (처음 요청 때 시작, 프로세스에서 하나)"""
+
+    def __init__(self):
+        self._reset()
+
+    def _reset(self):
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def submit(self, profile: TierProfile, kinds: List[str]):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="minilang-tier", daemon=True)
+                self._thread.start()
+        self._queue.put((profile, kinds))
+
+    def wait(self, timeout: float):
+        deadline = time.perf_counter() + timeout
+        while self._queue.unfinished_tasks and time.perf_counter() < deadline:
+            time.sleep(0.001)
+
+    def _run(self):
+        while True:
+            profile, kinds = self._queue.get()
+            try:
+                profile.ready = _compile(profile.function, kinds)
+            finally:
+                self._queue.task_done()
+
+
+_COMPILER = BackgroundCompiler()
+# fork로 만든 자식 프로세스(pmap 작업자 등)에는 스레드가 복사되지 않으므로 새로 시작하게 함
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_COMPILER._reset)
@@ -25,6 +25,7 @@ class TokenType(Enum):
     ELSE = auto()           # else
     WHILE = auto()          # while
     FOR = auto()            # for
+    IN = auto()             # in (for-in 반복문)
     FUNC = auto()           # func (함수 정의)
     RETURN = auto()         # return
     PRINT = auto()          # print (내장 함수)
@@ -34,6 +35,8 @@ class TokenType(Enum):
     NULL = auto()           # null
     BREAK = auto()          # break
     CONTINUE = auto()       # continue
+    IMPORT = auto()         # import (모듈 불러오기)
+    YIELD = auto()          # yield (제너레이터)
     
     # 산술 연산자
     PLUS = auto()           # +
@@ -86,6 +89,7 @@ class Token:
     value: Any
     line: int
     column: int
+    offset: int = 0  # 소스 시작부터의 문자 위치 (증분 분석에서 사용)
     
     def __repr__(self):
         return f"Token({self.type.name}, {repr(self.value)}, line={self.line}, col={self.column})"
@@ -98,6 +102,7 @@ KEYWORDS = {
     'else': TokenType.ELSE,
     'while': TokenType.WHILE,
     'for': TokenType.FOR,
+    'in': TokenType.IN,
     'func': TokenType.FUNC,
     'return': TokenType.RETURN,
     'print': TokenType.PRINT,
@@ -110,6 +115,8 @@ KEYWORDS = {
     'not': TokenType.NOT,
     'break': TokenType.BREAK,
     'continue': TokenType.CONTINUE,
+    'import': TokenType.IMPORT,
+    'yield': TokenType.YIELD,
 }
 
 # 연산자 매핑 (길이 순으로 정렬 - 긴 것 먼저)
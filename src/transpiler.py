@@ -0,0 +1,1028 @@
+"""
+MiniLang Transpiler (파이썬 변환기)
+프로그램을 파이썬 소스 코드로 변환해 미리 컴파일한 뒤 실행합니다.
+
+- 이름은 정적으로 스코프를 해석해 고유한 파이썬 지역 변수(v_이름, 가려진 이름은 v_이름_1)로
+  바꿉니다. 최상위 변수는 _minilang_main 함수의 지역 변수가 되고, 중첩 함수는 nonlocal로
+  바깥 변수에 대입합니다.
+- 두 피연산자가 모두 숫자(또는 문자열)로 추론되는(typeinfer.py) 연산은 파이썬 연산자를 그대로 쓰고,
+  나머지는 인터프리터와 같은 규칙(문자열 연결, 타입 배열 일괄 연산, 범위 검사 인덱싱)을
+  따르는 rt_ 도우미 함수를 호출합니다. 참/거짓 판단은 파이썬과 MiniLang이 같습니다.
+- 생성 코드의 각 줄은 원본 .ml 줄 번호와 대응되어(LINE_MAP), 실행 중 에러를 원본 줄로 보고합니다.
+
+제한: 불러온 모듈의 함수는 인터프리터로 실행되고, step_hook은 호출되지 않습니다.
+반복문 본문의 스코프는 반복마다 새로 만들어지지만 파이썬 지역 변수는 하나이므로, 반복문 안에서
+선언한 함수가 그런 변수를 붙잡으면 변환하지 않습니다 (TranspileError).
+제너레이터 함수는 파이썬 제너레이터로 변환하지만, 작업(spawn)은 멈출 수 있는 엔진 프레임이,
+병렬 map(pmap)은 함수 본문 AST가 필요하므로 변환하지 않습니다.
+
+transpile_function/compile_function은 함수 하나만 변환합니다 (단계별 실행, tiering.py).
+함수 안에서 선언되지 않은 이름은 실행 시 클로저 환경에서 찾고, 변환 시점의 가정
+(인자가 숫자, 내장 함수가 그대로, 함수 안에서 정의하는 이름이 바깥에 없음)은 함수
+시작에서 검사해 어긋나면 GuardFailure를 발생시킵니다.
+"""
+
+import math
+import operator
+import os
+import re
+from dataclasses import dataclass
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Tuple
+
+from ast_nodes import *
+from runtime import *
+from runtime import RuntimeError
+from closures import child_nodes
+from numeric import BULK_TYPES, bulk_binary_op
+from interpreter import BUILTINS
+from typeinfer import (NUM, STR, BOOL, ANY, NUMBERS, ORDERING, Analyzer, FreeName, Scope, Variable,
+                       BUILTIN_TYPES, binary_type)
+
+
+# 도우미 함수가 발생시킨 에러의 줄 번호 (실행 시 생성 코드 위치로부터 원본 줄을 찾음)
+LOCATE = -1
+
+
+class TranspileError(Exception):
+    """변환할 수 없는 프로그램"""
+    def __init__(self, message: str, line: int = 0, column: int = 0):
+        self.message = message
+        self.line = line
+        self.column = column
+        super().__init__(f"Transpile Error at line {line}: {message}")
+
+
+# =====================================================
+# 런타임 도우미 (생성 코드가 호출)
+# =====================================================
+
+@dataclass
+class CompiledFunction(BuiltinFunction):
+    """변환된 사용자 정의 함수 (내장 함수처럼 sort 등의 콜백으로 전달 가능)"""
+    impl: Optional[Callable] = None
+    display_kind: ClassVar[str] = 'function'
+
+
+def rt_function(name: str, impl: Callable, arity: int) -> CompiledFunction:
+    """변환된 함수를 MiniLang 함수 값으로 감쌈"""
+    return CompiledFunction(name=name, func=lambda args: impl(*args), arity=arity, impl=impl)
+
+
+def rt_generator(name: str, source: Any) -> Generator:
+    """변환된 제너레이터 함수의 호출 결과 (파이썬 제너레이터를 MiniLang 제너레이터로 감쌈)"""
+    return Generator(name, source, source.close)
+
+
+def rt_undefined(name: str):
+    """정의되지 않은 이름 참조 (인터프리터처럼 줄 번호 없이 보고)"""
+    raise RuntimeError(f"Undefined variable: '{name}'")
+
+
+_NUMBERS = {int, float}
+
+
+def rt_add(left: Any, right: Any) -> Any:
+    if type(left) in _NUMBERS and type(right) in _NUMBERS:
+        return left + right
+    if isinstance(left, BULK_TYPES) or isinstance(right, BULK_TYPES):
+        return bulk_binary_op('+', left, right, LOCATE)
+    if isinstance(left, (str, StringBuilder)) or isinstance(right, (str, StringBuilder)):
+        return to_string(left) + to_string(right)
+    if isinstance(left, ARRAY_TYPES) and isinstance(right, ARRAY_TYPES):
+        return [*left, *right]
+    return left + right
+
+
+def rt_mul(left: Any, right: Any) -> Any:
+    if isinstance(left, BULK_TYPES) or isinstance(right, BULK_TYPES):
+        return bulk_binary_op('*', left, right, LOCATE)
+    if isinstance(left, ArrayLike) and isinstance(right, int):
+        return list(left) * right
+    return left * right
+
+
+def rt_div(left: Any, right: Any) -> Any:
+    if isinstance(left, BULK_TYPES) or isinstance(right, BULK_TYPES):
+        return bulk_binary_op('/', left, right, LOCATE)
+    if right == 0:
+        raise RuntimeError("Division by zero", LOCATE)
+    return left / right
+
+
+def rt_mod(left: Any, right: Any) -> Any:
+    if isinstance(left, BULK_TYPES) or isinstance(right, BULK_TYPES):
+        return bulk_binary_op('%', left, right, LOCATE)
+    if right == 0:
+        raise RuntimeError("Modulo by zero", LOCATE)
+    return left % right
+
+
+def _bulk_aware(op: str, apply: Callable[[Any, Any], Any]) -> Callable[[Any, Any], Any]:
+    """타입 배열이 섞이면 일괄 연산, 아니면 파이썬 연산을 그대로 적용하는 도우미 생성"""
+    def helper(left: Any, right: Any) -> Any:
+        if isinstance(left, BULK_TYPES) or isinstance(right, BULK_TYPES):
+            return bulk_binary_op(op, left, right, LOCATE)
+        return apply(left, right)
+    return helper
+
+
+rt_sub = _bulk_aware('-', operator.sub)
+rt_pow = _bulk_aware('**', operator.pow)
+rt_eq = _bulk_aware('==', operator.eq)
+rt_ne = _bulk_aware('!=', operator.ne)
+rt_lt = _bulk_aware('<', operator.lt)
+rt_gt = _bulk_aware('>', operator.gt)
+rt_le = _bulk_aware('<=', operator.le)
+rt_ge = _bulk_aware('>=', operator.ge)
+
+
+# 복합 대입 (인터프리터처럼 오른쪽 값을 먼저 평가하므로 값이 첫 인자)
+
+def rt_add_to(value: Any, current: Any) -> Any:
+    if isinstance(current, StringBuilder):
+        # 빌더는 제자리에서 추가 (복사 없음)
+        current.append(to_string(value))
+        return current
+    if isinstance(current, str) or isinstance(value, str):
+        return to_string(current) + to_string(value)
+    return current + value
+
+
+def rt_sub_to(value: Any, current: Any) -> Any:
+    return current - value
+
+
+def rt_mul_to(value: Any, current: Any) -> Any:
+    return current * value
+
+
+def rt_div_to(value: Any, current: Any) -> Any:
+    if value == 0:
+        raise RuntimeError("Division by zero", LOCATE)
+    return current / value
+
+
+def _check_map_key(key: Any):
+    if key is not None and (isinstance(key, bool) or not isinstance(key, (str, int, float))):
+        raise RuntimeError(f"Invalid map key type: {type_name(key)}", LOCATE)
+
+
+def rt_map(pairs: List[Tuple[Any, Any]]) -> dict:
+    """키가 리터럴이 아닌 맵 리터럴"""
+    result = {}
+    for key, value in pairs:
+        _check_map_key(key)
+        result[key] = value
+    return result
+
+
+def rt_index(array: Any, index: Any) -> Any:
+    """범위를 검사하는 인덱스 접근 (visit_ArrayAccess와 같은 규칙)"""
+    if type(array) is list and type(index) is int and 0 <= index < len(array):
+        return array[index]
+
+    if isinstance(array, dict):
+        _check_map_key(index)
+        if index not in array:
+            raise RuntimeError(f"Key not found: {to_string(index)}", LOCATE)
+        return array[index]
+
+    if isinstance(array, ARRAY_TYPES):
+        if not isinstance(index, int):
+            raise RuntimeError("Array index must be an integer", LOCATE)
+        if index < 0 or index >= len(array):
+            raise RuntimeError(f"Array index out of bounds: {index}", LOCATE)
+        return array[index]
+
+    if isinstance(array, StringBuilder):
+        array = array.build()
+
+    if isinstance(array, str):
+        if not isinstance(index, int):
+            raise RuntimeError("String index must be an integer", LOCATE)
+        if index < 0 or index >= len(array):
+            raise RuntimeError(f"String index out of bounds: {index}", LOCATE)
+        return array[index]
+
+    raise RuntimeError(f"Cannot index type: {type(array).__name__}", LOCATE)
+
+
+def rt_slice(array: Any, start: Any, stop: Any) -> Any:
+    """슬라이스: 배열은 저장 공간을 공유하는 뷰, 문자열은 부분 문자열"""
+    for bound in (start, stop):
+        if bound is not None and (isinstance(bound, bool) or not isinstance(bound, int)):
+            raise RuntimeError("Slice bounds must be integers", LOCATE)
+
+    if isinstance(array, StringBuilder):
+        array = array.build()
+    if isinstance(array, str):
+        return array[start:stop]
+    if isinstance(array, ARRAY_TYPES):
+        start, stop, _ = slice(start, stop).indices(len(array))
+        return ArrayView(array, start, stop)
+
+    raise RuntimeError(f"Cannot slice type: {type_name(array)}", LOCATE)
+
+
+def rt_store(array: Any, index: Any, op: str, value: Any) -> Any:
+    """인덱스 대입 (visit_ArrayIndexAssignment와 같은 규칙)"""
+    if isinstance(array, dict):
+        _check_map_key(index)
+        if op != '=' and index not in array:
+            raise RuntimeError(f"Key not found: {to_string(index)}", LOCATE)
+    else:
+        if not isinstance(array, ARRAY_TYPES):
+            raise RuntimeError("Cannot assign to index of non-array type", LOCATE)
+        if not isinstance(index, int):
+            raise RuntimeError("Array index must be an integer", LOCATE)
+        if index < 0 or index >= len(array):
+            raise RuntimeError(f"Array index out of bounds: {index}", LOCATE)
+
+    if op == '=':
+        array[index] = value
+    elif op == '+=':
+        array[index] = array[index] + value
+    elif op == '-=':
+        array[index] = array[index] - value
+    elif op == '*=':
+        array[index] = array[index] * value
+    else:
+        if value == 0:
+            raise RuntimeError("Division by zero", LOCATE)
+        array[index] = array[index] / value
+
+    return array[index]
+
+
+def rt_iter(iterable: Any) -> Any:
+    """for-in 대상 검사 (맵은 키 목록을 복사해 순회)"""
+    if not isinstance(iterable, (ARRAY_TYPES, str, dict, Stream)):
+        raise RuntimeError(f"Cannot iterate over type: {type(iterable).__name__}", LOCATE)
+    if isinstance(iterable, dict):
+        return list(iterable)
+    return iterable
+
+
+# 생성 코드가 불러오는 도우미 (이름 -> 생성 코드 안의 별칭)
+HELPERS = {
+    'rt_function': '_function', 'rt_generator': '_generator', 'rt_undefined': '_undefined',
+    'rt_add': '_add', 'rt_sub': '_sub', 'rt_mul': '_mul', 'rt_div': '_div', 'rt_mod': '_mod',
+    'rt_pow': '_pow', 'rt_eq': '_eq', 'rt_ne': '_ne', 'rt_lt': '_lt', 'rt_gt': '_gt',
+    'rt_le': '_le', 'rt_ge': '_ge', 'rt_add_to': '_add_to', 'rt_sub_to': '_sub_to',
+    'rt_mul_to': '_mul_to', 'rt_div_to': '_div_to', 'rt_map': '_map', 'rt_index': '_index',
+    'rt_slice': '_slice', 'rt_store': '_store', 'rt_iter': '_iter',
+}
+
+
+class Runtime:
+    """생성 코드의 실행 환경: 출력/입력, 모듈, 콜백 호출은 호스트 인터프리터가 담당"""
+
+    def __init__(self, interpreter):
+        self.interpreter = interpreter
+        self.write = interpreter._write
+        self.read_line = interpreter._read_line
+
+    def call(self, callee: Any, arguments: List[Any], name: str) -> Any:
+        """함수 값 호출 (visit_FunctionCall과 같은 인자 개수 검사)"""
+        if type(callee) is CompiledFunction:
+            if len(arguments) != callee.arity:
+                raise RuntimeError(
+                    f"Function '{callee.name}' expects {callee.arity} arguments, got {len(arguments)}",
+                    LOCATE
+                )
+            return callee.impl(*arguments)
+
+        if isinstance(callee, BuiltinFunction):
+            if callee.arity != -1 and len(arguments) != callee.arity:
+                raise RuntimeError(
+                    f"Function '{callee.name}' expects {callee.arity} arguments, got {len(arguments)}",
+                    LOCATE
+                )
+            if callee.needs_interpreter:
+                return callee.func(self.interpreter, arguments)
+            return callee.func(arguments)
+
+        if isinstance(callee, Function):
+            if len(arguments) != len(callee.parameters):
+                raise RuntimeError(
+                    f"Function '{callee.name}' expects {len(callee.parameters)} arguments, got {len(arguments)}",
+                    LOCATE
+                )
+            return self.interpreter.call_user_function(callee, arguments)
+
+        raise RuntimeError(f"'{name}' is not a function", LOCATE)
+
+    def import_names(self, path: str, names: List[str], line: int, column: int) -> List[Any]:
+        """모듈을 불러와(인터프리터가 실행) 내보낸 함수들을 names 순서로 반환"""
+        exports = self.interpreter.import_module(path, line, column)
+        return [exports.get(name) for name in names]
+
+
+def run_compiled(main: Callable, interpreter) -> None:
+    """변환된 프로그램 실행 (파이썬 예외를 MiniLang 런타임 에러와 원본 줄 번호로 변환)"""
+    try:
+        main(Runtime(interpreter))
+    except Exception as e:
+        translated = translate_error(e, main.__globals__)
+        if translated is None:
+            raise
+        raise translated from None
+    finally:
+        interpreter.writers.close_all()
+
+
+def translate_error(error: Exception, namespace: dict) -> Optional[RuntimeError]:
+    """생성 코드에서 발생한 예외를 인터프리터가 냈을 런타임 에러로 변환 (그대로 둘 예외면 None)"""
+    if isinstance(error, RuntimeError):
+        if error.line != LOCATE:
+            return None
+        return RuntimeError(error.message, _source_line(error, namespace), 0)
+    if isinstance(error, ZeroDivisionError):
+        if "modulo" in str(error):
+            return RuntimeError("Modulo by zero", _source_line(error, namespace), 0)
+        if "division by zero" in str(error):
+            return RuntimeError("Division by zero", _source_line(error, namespace), 0)
+        return None
+    if isinstance(error, NameError):
+        names = namespace['NAMES']
+        match = re.search(r"'(\w+)'", str(error))
+        if not match or match.group(1) not in names:
+            return None
+        return RuntimeError(f"Undefined variable: '{names[match.group(1)]}'")
+    return None
+
+
+def _source_line(error: BaseException, namespace: dict) -> int:
+    """예외가 지나간 생성 코드 중 가장 안쪽 줄의 원본 .ml 줄 번호"""
+    line = 0
+    tb = error.__traceback__
+    while tb is not None:
+        if tb.tb_frame.f_globals is namespace:
+            line = tb.tb_lineno
+        tb = tb.tb_next
+    line_map = namespace['LINE_MAP']
+    return line_map[line - 1] if 0 < line <= len(line_map) else 0
+
+
+def run_standalone(main: Callable, script_path: str) -> int:
+    """--emit-python으로 만든 파일을 직접 실행할 때의 진입점"""
+    from interpreter import Interpreter
+    interpreter = Interpreter()
+    interpreter.script_path = script_path
+    try:
+        run_compiled(main, interpreter)
+    except RuntimeError as e:
+        print(f"Runtime Error: {e}")
+        return 1
+    return 0
+
+
+# =====================================================
+# 정적 분석: 이름 해석과 타입 추론 (typeinfer.py)
+# =====================================================
+
+def _kind(value_type: Optional[str]) -> str:
+    """추론한 타입을 코드 생성에 쓰는 종류(NUM/STR/BOOL/ANY)로"""
+    if value_type in NUMBERS:
+        return NUM
+    if value_type in (STR, BOOL):
+        return value_type
+    return ANY
+
+
+class _Variable(Variable):
+    """파이썬 지역 변수 하나 (v_고유이름)"""
+
+    @property
+    def pyname(self) -> str:
+        return f"v_{self.uid}"
+
+    @property
+    def kind(self) -> str:
+        return _kind(self.type)
+
+
+class _Analyzer(Analyzer):
+    """변환용 분석 (함수 하나만 변환할 때는 중첩 함수와 import를 지원하지 않음)"""
+
+    variable_class = _Variable
+
+    @property
+    def pynames(self) -> Dict[str, str]:
+        """파이썬 이름 -> MiniLang 이름"""
+        return {f"v_{uid}": name for uid, name in self.uids.items()}
+
+    def statement(self, node: Statement, scope: Scope, position: int):
+        if self.closure is not None and isinstance(node, (FunctionDeclaration, ImportStatement)):
+            raise TranspileError("Nested functions and imports are not compiled", node.line, node.column)
+        if self.closure is not None and isinstance(node, YieldStatement):
+            raise TranspileError("Generators are not compiled", node.line, node.column)
+        super().statement(node, scope, position)
+
+    def unsupported(self, node: ASTNode):
+        kind = 'statement' if isinstance(node, Statement) else 'expression'
+        raise TranspileError(f"Unsupported {kind}: {type(node).__name__}", node.line, node.column)
+
+
+# =====================================================
+# 코드 생성
+# =====================================================
+
+# 파이썬 연산자 우선순위 (클수록 강하게 결합)
+P_OR, P_AND, P_NOT, P_COMPARE, P_SUM, P_PRODUCT, P_UNARY, P_POWER, P_ATOM = 4, 5, 6, 7, 11, 12, 13, 14, 100
+
+PRECEDENCE = {
+    'or': P_OR, 'and': P_AND,
+    '==': P_COMPARE, '!=': P_COMPARE, '<': P_COMPARE, '>': P_COMPARE, '<=': P_COMPARE, '>=': P_COMPARE,
+    '+': P_SUM, '-': P_SUM, '*': P_PRODUCT, '/': P_PRODUCT, '%': P_PRODUCT, '**': P_POWER,
+}
+
+BINARY_HELPERS = {
+    '+': '_add', '-': '_sub', '*': '_mul', '/': '_div', '%': '_mod', '**': '_pow',
+    '==': '_eq', '!=': '_ne', '<': '_lt', '>': '_gt', '<=': '_le', '>=': '_ge',
+}
+
+COMPOUND_HELPERS = {'+=': '_add_to', '-=': '_sub_to', '*=': '_mul_to', '/=': '_div_to'}
+
+# (코드, 종류, 우선순위)
+Code = Tuple[str, str, int]
+
+# 변환하지 않는 내장 함수 호출 (인터프리터의 함수 값이 필요: 작업은 멈출 수 있는 엔진 프레임,
+# pmap은 작업자 프로세스로 보낼 함수 본문 AST)
+NOT_COMPILED = {'spawn': "Tasks (spawn)", 'pmap': "Parallel maps (pmap)"}
+
+
+def _is_pure(node: Expression) -> bool:
+    """평가해도 변수를 바꾸지 않는 표현식인지 (함수 호출/대입이 없음)"""
+    if isinstance(node, (FunctionCall, Assignment, ArrayIndexAssignment)):
+        return False
+    if isinstance(node, BinaryOp):
+        return _is_pure(node.left) and _is_pure(node.right)
+    if isinstance(node, UnaryOp):
+        return _is_pure(node.operand)
+    if isinstance(node, ArrayLiteral):
+        return all(_is_pure(e) for e in node.elements)
+    if isinstance(node, MapLiteral):
+        return all(_is_pure(e) for e in node.keys + node.values)
+    if isinstance(node, ArrayAccess):
+        return _is_pure(node.array) and _is_pure(node.index)
+    if isinstance(node, SliceAccess):
+        return all(_is_pure(e) for e in (node.array, node.start, node.stop) if e)
+    return True
+
+
+class Transpiler:
+    """분석 결과를 바탕으로 파이썬 소스 생성"""
+
+    def __init__(self, program: Optional[Program], script_path: Optional[str] = None,
+                 closure: Optional[Environment] = None):
+        self.program = program
+        self.script_path = os.path.abspath(script_path) if script_path else None
+        base_dir = os.path.dirname(self.script_path) if self.script_path else os.getcwd()
+        self.analysis = _Analyzer(base_dir, closure)
+        self.lines: List[str] = []
+        self.line_map: List[int] = []
+        self.indent = 0
+        self.ml_line = 0
+        self.function = self.analysis.main
+        self.loops: List[Optional[Expression]] = []  # 반복문별 continue 전에 실행할 증감식
+        self.iteration_variables: set = set()  # 반복마다 새로 만들어지는 스코프의 변수
+        self.builtin_values: set = set()  # 값으로 쓰는 내장 함수
+        self.builtin_calls: set = set()  # 직접 호출하는 내장 함수
+        self.speculated: set = set()  # 호출 시작에서 그대로인지 검사하는 내장 함수 (함수 변환)
+
+    def transpile(self) -> str:
+        self.analysis.analyze(self.program)
+
+        self.indent = 1
+        for stmt in self.program.statements:
+            self.statement(stmt)
+        body, body_map = self.lines, self.line_map
+
+        self.lines, self.line_map, self.indent, self.ml_line = [], [], 0, 0
+        name = os.path.basename(self.script_path) if self.script_path else '<string>'
+        self.emit(f"# MiniLang에서 변환한 파이썬 코드 (원본: {name})")
+        self.header()
+        self.emit("def _minilang_main(_rt):")
+        self.indent = 1
+        self.prologue()
+        self.emit("_import = _rt.import_names")
+        for name, (_, variable) in self.analysis.root.declarations.items():
+            if name in BUILTINS:
+                self.emit(f"{variable.pyname} = _B[{name!r}]")
+        self.lines += body
+        self.line_map += body_map
+
+        self.indent, self.ml_line = 0, 0
+        self.emit("")
+        self.emit("")
+        self.emit(f"LINE_MAP = {self.line_map!r}")
+        self.emit(f"NAMES = {self._names()!r}")
+        self.emit("")
+        self.emit("if __name__ == '__main__':")
+        self.emit(f"    sys.exit(run_standalone(_minilang_main, {self.script_path!r}))")
+        return "\n".join(self.lines) + "\n"
+
+    def transpile_function(self, function: Function, parameter_kinds: List[str]) -> str:
+        """함수 하나를 _make(_rt, _env) -> 파이썬 함수 형태로 변환 (단계별 실행용)"""
+        analysis = self.analysis
+        analysis.analyze_function(function.parameters, function.body, parameter_kinds)
+        params = [analysis.root.declarations[p][1].pyname for p in function.parameters]
+
+        self.indent = 2
+        self.stmt_Block(function.body)
+        body, body_map = self.lines, self.line_map
+
+        self.lines, self.line_map, self.indent, self.ml_line = [], [], 0, 0
+        self.emit(f"# 단계별 실행: MiniLang 함수 {function.name}")
+        self.header()
+        self.emit("def _make(_rt, _env):")
+        self.indent = 1
+        self.prologue()
+        self.emit("_get = _env.get")
+        self.emit("_set = _env.set")
+        self.emit("_exists = _env.exists")
+        self.emit("")
+        self.emit("def _assign(name, value):")
+        self.emit("    _set(name, value)")
+        self.emit("    return value")
+        self.emit("")
+        self.emit(f"def f_{function.name}({', '.join(params)}):")
+        self.indent = 2
+        count = len(self.lines)
+        for name in dict.fromkeys(analysis.absent):
+            self.emit(f"if _exists({name!r}):")
+            self.emit(f"    raise _GuardFailure(\"'{name}' is now defined outside the function\")")
+        for name in sorted(self.speculated):
+            self.emit(f"if _get({name!r}) is not _b_{name}:")
+            self.emit(f"    raise _GuardFailure(\"'{name}' is no longer the builtin\")")
+        for index, (param, kind) in enumerate(zip(params, parameter_kinds)):
+            if kind == NUM:
+                self.emit(f"if type({param}) is not int and type({param}) is not float:")
+                self.emit(f"    raise _GuardFailure(\"argument '{function.parameters[index]}' "
+                          f"is not a number\", {index})")
+        if not body and len(self.lines) == count:
+            self.emit("pass")
+        self.lines += body
+        self.line_map += body_map
+        self.indent, self.ml_line = 1, 0
+        self.emit(f"return f_{function.name}")
+
+        self.indent = 0
+        self.emit("")
+        self.emit("")
+        self.emit(f"LINE_MAP = {self.line_map!r}")
+        self.emit(f"NAMES = {self._names()!r}")
+        return "\n".join(self.lines) + "\n"
+
+    def header(self):
+        """생성 코드 앞부분: 도우미 import"""
+        self.emit("import sys")
+        self.emit(f"sys.path.insert(0, {os.path.dirname(os.path.abspath(__file__))!r})")
+        aliases = ", ".join(f"{helper} as {alias}" for helper, alias in HELPERS.items())
+        self.emit(f"from transpiler import {aliases}, run_standalone")
+        self.emit("from runtime import ReturnValue as _ReturnValue, BreakException as _BreakException, "
+                  "ContinueException as _ContinueException, GuardFailure as _GuardFailure")
+        self.emit("from interpreter import BUILTINS as _B")
+        self.emit("")
+        self.emit("")
+
+    def prologue(self):
+        """진입 함수 앞부분: 런타임과 사용하는 내장 함수를 지역 이름으로"""
+        self.emit("_interp = _rt.interpreter")
+        self.emit("_write = _rt.write")
+        self.emit("_read_line = _rt.read_line")
+        self.emit("_call = _rt.call")
+        for name in sorted(self.builtin_calls):
+            self.emit(f"_bf_{name} = _B[{name!r}].func")
+        for name in sorted(self.builtin_values | self.speculated):
+            self.emit(f"_b_{name} = _B[{name!r}]")
+
+    def _names(self) -> Dict[str, str]:
+        names = dict(self.analysis.pynames)
+        for pyname, name in self.analysis.pynames.items():
+            names['f' + pyname[1:]] = name
+        return names
+
+    def emit(self, text: str):
+        self.lines.append("    " * self.indent + text if text else "")
+        self.line_map.append(self.ml_line)
+
+    # ----- 문장 -----
+
+    def body(self, node: Statement):
+        """들여쓴 블록 본문 (비어 있으면 pass)"""
+        self.indent += 1
+        count = len(self.lines)
+        self.statement(node)
+        if len(self.lines) == count:
+            self.emit("pass")
+        self.indent -= 1
+
+    def statement(self, node: Statement):
+        self.ml_line = node.line
+        method = getattr(self, 'stmt_' + type(node).__name__)
+        method(node)
+
+    def enter_scope(self, node: Statement):
+        """반복문 본문 안에서 만들어지는 스코프이면 그 변수들을 기록"""
+        scope = self.analysis.scopes.get(id(node))
+        if self.loops and scope is not None:
+            self.iteration_variables.update(variable for _, variable in scope.declarations.values())
+
+    def stmt_Block(self, node: Block):
+        self.enter_scope(node)
+        for stmt in node.statements:
+            self.statement(stmt)
+
+    def stmt_ExpressionStatement(self, node: ExpressionStatement):
+        expr = node.expression
+        if isinstance(expr, Assignment):
+            self.assignment_statement(expr)
+        else:
+            self.emit(self.expr(expr)[0])
+
+    def assignment_statement(self, node: Assignment):
+        variable = self.analysis.references[id(node)]
+        value, kind, _ = self.expr(node.value)
+        if isinstance(variable, FreeName):
+            name = repr(variable.name)
+            if node.operator != '=':
+                value = f"{COMPOUND_HELPERS[node.operator]}({value}, _get({name}))"
+            self.emit(f"_set({name}, {value})")
+            return
+        target = variable.pyname
+        if node.operator == '=':
+            self.emit(f"{target} = {value}")
+            return
+        current = variable.kind
+        if _is_pure(node.value) and (current == kind == NUM or (current == STR and kind in (STR, NUM))):
+            if current == STR and kind == NUM:
+                value = f"str({value})"
+            self.emit(f"{target} {node.operator} {value}")
+            return
+        self.emit(f"{target} = {COMPOUND_HELPERS[node.operator]}({value}, {target})")
+
+    def stmt_VariableDeclaration(self, node: VariableDeclaration):
+        variable = self.analysis.references[id(node)]
+        value = self.expr(node.initializer)[0] if node.initializer else "None"
+        self.emit(f"{variable.pyname} = {value}")
+
+    def stmt_PrintStatement(self, node: PrintStatement):
+        values = [self.string(arg) for arg in node.arguments]
+        if not values:
+            self.emit("_write('')")
+        elif len(values) == 1:
+            self.emit(f"_write({values[0]})")
+        else:
+            self.emit(f"_write(' '.join(({', '.join(values)})))")
+
+    def string(self, node: Expression) -> str:
+        """to_string으로 변환한 값의 코드"""
+        code, kind, _ = self.expr(node)
+        if kind == STR:
+            return code
+        if kind == NUM:
+            return f"str({code})"
+        self.builtin_calls.add('str')
+        return f"_bf_str([{code}])"
+
+    def stmt_IfStatement(self, node: IfStatement):
+        keyword = "if"
+        while True:
+            self.ml_line = node.line
+            self.emit(f"{keyword} {self.expr(node.condition)[0]}:")
+            self.body(node.then_branch)
+            else_branch = node.else_branch
+            if isinstance(else_branch, IfStatement):
+                node, keyword = else_branch, "elif"
+                continue
+            if else_branch is not None:
+                self.ml_line = else_branch.line
+                self.emit("else:")
+                self.body(else_branch)
+            return
+
+    def stmt_WhileStatement(self, node: WhileStatement):
+        self.emit(f"while {self.expr(node.condition)[0]}:")
+        self.loops.append(None)
+        self.body(node.body)
+        self.loops.pop()
+
+    def stmt_ForStatement(self, node: ForStatement):
+        self.enter_scope(node)
+        if node.initializer:
+            self.statement(node.initializer)
+            self.ml_line = node.line
+        condition = self.expr(node.condition)[0] if node.condition else "True"
+        self.emit(f"while {condition}:")
+        self.loops.append(node.increment)
+        self.indent += 1
+        count = len(self.lines)
+        self.statement(node.body)
+        if node.increment:
+            self.increment(node)
+        elif len(self.lines) == count:
+            self.emit("pass")
+        self.indent -= 1
+        self.loops.pop()
+
+    def increment(self, node: ForStatement):
+        self.ml_line = node.line
+        self.stmt_ExpressionStatement(ExpressionStatement(node.increment, node.line, node.column))
+
+    def stmt_ForInStatement(self, node: ForInStatement):
+        self.enter_scope(node)
+        variable = self.analysis.references[id(node)]
+        self.emit(f"for {variable.pyname} in _iter({self.expr(node.iterable)[0]}):")
+        self.loops.append(None)
+        self.body(node.body)
+        self.loops.pop()
+
+    def stmt_FunctionDeclaration(self, node: FunctionDeclaration):
+        variable = self.analysis.references[id(node)]
+        function = self.analysis.functions[id(node)]
+        body_scope = self.analysis.scopes[id(node)]
+        self.check_iteration_capture(node, variable)
+        params = [body_scope.declarations[p][1].pyname for p in node.parameters]
+        impl = 'f' + variable.pyname[1:]
+        # 제너레이터 함수: 본문은 파이썬 제너레이터 g_이름, f_이름은 그것을 Generator로 감쌈
+        body = 'g' + variable.pyname[1:] if node.is_generator else impl
+        self.emit(f"def {body}({', '.join(params)}):")
+
+        outer, loops = self.function, self.loops
+        self.function, self.loops = function, []
+        self.indent += 1
+        if function.outer_writes:
+            self.emit(f"nonlocal {', '.join(v.pyname for v in function.outer_writes)}")
+        count = len(self.lines)
+        self.stmt_Block(node.body)
+        if len(self.lines) == count:
+            self.emit("pass")
+        self.indent -= 1
+        self.function, self.loops = outer, loops
+
+        self.ml_line = node.line
+        if node.is_generator:
+            self.emit(f"def {impl}({', '.join(params)}):")
+            self.emit(f"    return _generator({node.name!r}, {body}({', '.join(params)}))")
+        self.emit(f"{variable.pyname} = _function({node.name!r}, {impl}, {len(node.parameters)})")
+
+    def check_iteration_capture(self, node: FunctionDeclaration, variable: Variable):
+        """반복마다 따로 있는 변수를 붙잡는 함수는 파이썬 클로저로 같게 만들 수 없음"""
+        if not self.iteration_variables:
+            return
+        pending = list(child_nodes(node))
+        while pending:
+            child = pending.pop()
+            used = self.analysis.references.get(id(child))
+            if used is not variable and isinstance(used, Variable) and used in self.iteration_variables:
+                raise TranspileError(
+                    f"Functions declared in a loop that capture '{used.name}' are not compiled "
+                    f"(each iteration has its own '{used.name}')", node.line, node.column)
+            pending.extend(child_nodes(child))
+
+    def stmt_ReturnStatement(self, node: ReturnStatement):
+        value = self.expr(node.value)[0] if node.value else "None"
+        if self.function.node is None and self.analysis.closure is None:
+            # 함수 밖의 return은 인터프리터처럼 ReturnValue 예외로
+            self.emit(f"raise _ReturnValue({value})")
+        else:
+            self.emit(f"return {value}" if node.value else "return")
+
+    def stmt_YieldStatement(self, node: YieldStatement):
+        self.emit(f"yield {self.expr(node.value)[0]}" if node.value else "yield None")
+
+    def stmt_BreakStatement(self, node: BreakStatement):
+        self.emit("break" if self.loops else "raise _BreakException()")
+
+    def stmt_ContinueStatement(self, node: ContinueStatement):
+        if not self.loops:
+            self.emit("raise _ContinueException()")
+            return
+        if self.loops[-1] is not None:
+            self.increment(ForStatement(None, None, self.loops[-1], None, node.line, node.column))
+        self.emit("continue")
+
+    def stmt_ImportStatement(self, node: ImportStatement):
+        variables = self.analysis.references[id(node)]
+        names = [v.name for v in variables]
+        call = f"_import({node.path!r}, {names!r}, {node.line}, {node.column})"
+        if not variables:
+            self.emit(call)
+        elif len(variables) == 1:
+            self.emit(f"{variables[0].pyname}, = {call}")
+        else:
+            self.emit(f"{', '.join(v.pyname for v in variables)} = {call}")
+
+    # ----- 표현식 -----
+
+    def expr(self, node: Expression) -> Code:
+        method = getattr(self, 'expr_' + type(node).__name__, None)
+        if method is None:
+            raise TranspileError(f"Unsupported expression: {type(node).__name__}", node.line, node.column)
+        return method(node)
+
+    def operand(self, node: Expression, minimum: int) -> Tuple[str, str]:
+        """우선순위가 minimum 이상이 되도록 괄호를 친 피연산자 코드와 종류"""
+        code, kind, precedence = self.expr(node)
+        if precedence < minimum:
+            code = f"({code})"
+        return code, kind
+
+    def expr_NumberLiteral(self, node: NumberLiteral) -> Code:
+        value = node.value
+        if isinstance(value, float) and not math.isfinite(value):
+            return f"float({str(value)!r})", NUM, P_ATOM
+        return repr(value), NUM, P_ATOM
+
+    def expr_StringLiteral(self, node: StringLiteral) -> Code:
+        return repr(node.value), STR, P_ATOM
+
+    def expr_BooleanLiteral(self, node: BooleanLiteral) -> Code:
+        return ("True" if node.value else "False"), BOOL, P_ATOM
+
+    def expr_NullLiteral(self, node: NullLiteral) -> Code:
+        return "None", ANY, P_ATOM
+
+    def expr_Identifier(self, node: Identifier) -> Code:
+        variable = self.analysis.references[id(node)]
+        if isinstance(variable, FreeName):
+            return f"_get({node.name!r})", ANY, P_ATOM
+        if variable is not None:
+            return variable.pyname, variable.kind, P_ATOM
+        if node.name in BUILTINS:
+            self.builtin_values.add(node.name)
+            return f"_b_{node.name}", ANY, P_ATOM
+        return f"_undefined({node.name!r})", ANY, P_ATOM
+
+    def expr_BinaryOp(self, node: BinaryOp) -> Code:
+        op = node.operator
+        precedence = PRECEDENCE[op]
+        if op in ('and', 'or'):
+            left, left_kind = self.operand(node.left, precedence)
+            right, right_kind = self.operand(node.right, precedence + 1)
+            return f"{left} {op} {right}", _kind(binary_type(op, left_kind, right_kind)), precedence
+
+        if precedence == P_COMPARE:
+            minimum = (P_COMPARE + 1, P_COMPARE + 1)
+        elif op == '**':
+            minimum = (P_ATOM, P_UNARY)
+        else:
+            minimum = (precedence, precedence + 1)
+        left, left_kind = self.operand(node.left, minimum[0])
+        right, right_kind = self.operand(node.right, minimum[1])
+        kind = _kind(binary_type(op, left_kind, right_kind))
+
+        known = (NUM, STR, BOOL)
+        raw = (
+            left_kind == right_kind == NUM
+            or (op == '+' and left_kind == right_kind == STR)
+            or (op in ORDERING and left_kind == right_kind == STR)
+            or (op in ('==', '!=') and left_kind in known and right_kind in known)
+        )
+        if raw:
+            return f"{left} {op} {right}", kind, precedence
+        if op == '+' and (left_kind == STR and right_kind == NUM or left_kind == NUM and right_kind == STR):
+            left = left if left_kind == STR else f"str({self.expr(node.left)[0]})"
+            right = right if right_kind == STR else f"str({self.expr(node.right)[0]})"
+            return f"{left} + {right}", STR, P_SUM
+        return f"{BINARY_HELPERS[op]}({self.expr(node.left)[0]}, {self.expr(node.right)[0]})", kind, P_ATOM
+
+    def expr_UnaryOp(self, node: UnaryOp) -> Code:
+        if node.operator == 'not':
+            operand, _ = self.operand(node.operand, P_NOT)
+            return f"not {operand}", BOOL, P_NOT
+        operand, kind = self.operand(node.operand, P_UNARY)
+        return f"-{operand}", (NUM if kind == NUM else ANY), P_UNARY
+
+    def expr_Assignment(self, node: Assignment) -> Code:
+        """식 안의 대입은 대입 표현식(:=)으로"""
+        variable = self.analysis.references[id(node)]
+        value, kind, _ = self.expr(node.value)
+        if isinstance(variable, FreeName):
+            name = repr(variable.name)
+            if node.operator != '=':
+                value, kind = f"{COMPOUND_HELPERS[node.operator]}({value}, _get({name}))", ANY
+            return f"_assign({name}, {value})", kind, P_ATOM
+        target = variable.pyname
+        if node.operator == '=':
+            return f"({target} := {value})", kind, P_ATOM
+        return f"({target} := {COMPOUND_HELPERS[node.operator]}({value}, {target}))", ANY, P_ATOM
+
+    def expr_FunctionCall(self, node: FunctionCall) -> Code:
+        if node.name == 'input':
+            prompt = self.string(node.arguments[0]) if node.arguments else "''"
+            return f"_read_line({prompt})", STR, P_ATOM
+
+        args = [self.expr(arg)[0] for arg in node.arguments]
+        arg_list = ", ".join(args)
+        variable = self.analysis.references.get(id(node))
+        if isinstance(variable, FreeName):
+            if not variable.builtin:
+                return f"_call(_get({node.name!r}), [{arg_list}], {node.name!r})", ANY, P_ATOM
+            self.speculated.add(node.name)
+        elif variable is not None:
+            declaration = variable.direct_function()
+            if declaration is not None and len(declaration.parameters) == len(args):
+                kind = _kind(self.analysis.functions[id(declaration)].type)
+                return f"f{variable.pyname[1:]}({arg_list})", kind, P_ATOM
+            return f"_call({variable.pyname}, [{arg_list}], {node.name!r})", ANY, P_ATOM
+
+        builtin = BUILTINS.get(node.name)
+        if builtin is None:
+            return f"_call(_undefined({node.name!r}), [{arg_list}], {node.name!r})", ANY, P_ATOM
+        if node.name in NOT_COMPILED:
+            raise TranspileError(f"{NOT_COMPILED[node.name]} are not compiled", node.line, node.column)
+        kind = _kind(BUILTIN_TYPES.get(node.name))
+        if builtin.arity != -1 and builtin.arity != len(args):
+            self.builtin_values.add(node.name)
+            return f"_call(_b_{node.name}, [{arg_list}], {node.name!r})", kind, P_ATOM
+        if node.name == 'len':
+            return f"len({arg_list})", NUM, P_ATOM
+        self.builtin_calls.add(node.name)
+        if builtin.needs_interpreter:
+            return f"_bf_{node.name}(_interp, [{arg_list}])", kind, P_ATOM
+        return f"_bf_{node.name}([{arg_list}])", kind, P_ATOM
+
+    def expr_ArrayLiteral(self, node: ArrayLiteral) -> Code:
+        return f"[{', '.join(self.expr(e)[0] for e in node.elements)}]", ANY, P_ATOM
+
+    def expr_MapLiteral(self, node: MapLiteral) -> Code:
+        literal_keys = all(
+            isinstance(k, (StringLiteral, NumberLiteral, NullLiteral)) for k in node.keys
+        )
+        pairs = [(self.expr(k)[0], self.expr(v)[0]) for k, v in zip(node.keys, node.values)]
+        if literal_keys:
+            return "{" + ", ".join(f"{k}: {v}" for k, v in pairs) + "}", ANY, P_ATOM
+        return "_map([" + ", ".join(f"({k}, {v})" for k, v in pairs) + "])", ANY, P_ATOM
+
+    def expr_ArrayAccess(self, node: ArrayAccess) -> Code:
+        return f"_index({self.expr(node.array)[0]}, {self.expr(node.index)[0]})", ANY, P_ATOM
+
+    def expr_SliceAccess(self, node: SliceAccess) -> Code:
+        start = self.expr(node.start)[0] if node.start else "None"
+        stop = self.expr(node.stop)[0] if node.stop else "None"
+        return f"_slice({self.expr(node.array)[0]}, {start}, {stop})", ANY, P_ATOM
+
+    def expr_ArrayIndexAssignment(self, node: ArrayIndexAssignment) -> Code:
+        array, index, value = (self.expr(n)[0] for n in (node.array, node.index, node.value))
+        return f"_store({array}, {index}, {node.operator!r}, {value})", ANY, P_ATOM
+
+
+class CompiledProgram:
+    """변환된 프로그램 (생성된 파이썬 소스와 컴파일된 진입 함수)"""
+
+    def __init__(self, source: str, script_path: Optional[str] = None):
+        self.source = source
+        name = os.path.basename(script_path) if script_path else '<string>'
+        namespace = {'__name__': 'minilang_transpiled'}
+        exec(compile(source, f"<transpiled {name}>", 'exec'), namespace)
+        self.main = namespace['_minilang_main']
+
+    def run(self, interpreter) -> None:
+        """인터프리터를 호스트로 실행 (출력, 입력, 모듈, 쓰기 파일을 공유)"""
+        run_compiled(self.main, interpreter)
+
+
+def transpile_function(function: Function, parameter_kinds: List[str]) -> str:
+    """함수 하나를 파이썬 소스 코드로 변환 (parameter_kinds: 인자별 NUM 또는 ANY)"""
+    return Transpiler(None, closure=function.closure).transpile_function(function, parameter_kinds)
+
+
+def compile_function(function: Function, parameter_kinds: List[str]) -> Callable:
+    """함수 하나를 컴파일해 factory(runtime, closure) -> invoke(arguments)를 반환
+
+    invoke는 가정이 맞지 않으면 아무 부작용 없이 GuardFailure를 발생시키고, 실행 중
+    에러는 인터프리터와 같은 런타임 에러(원본 줄 번호)로 바꿉니다.
+    """
+    source = transpile_function(function, parameter_kinds)
+    namespace = {'__name__': 'minilang_tier'}
+    exec(compile(source, f"<tier {function.name}>", 'exec'), namespace)
+    make = namespace['_make']
+
+    def factory(runtime: Runtime, closure: Environment) -> Callable[[List[Any]], Any]:
+        impl = make(runtime, closure)
+
+        def invoke(arguments: List[Any]) -> Any:
+            try:
+                return impl(*arguments)
+            except Exception as e:
+                translated = translate_error(e, namespace)
+                if translated is None:
+                    raise
+                raise translated from None
+        return invoke
+
+    factory.source = source
+    return factory
+
+
+def transpile(program: Program, script_path: Optional[str] = None) -> str:
+    """프로그램을 파이썬 소스 코드로 변환"""
+    return Transpiler(program, script_path).transpile()
+
+
+def compile_program(program: Program, script_path: Optional[str] = None) -> CompiledProgram:
+    """프로그램을 파이썬 코드로 변환해 컴파일"""
+    return CompiledProgram(transpile(program, script_path), script_path)
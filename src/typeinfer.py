@@ -0,0 +1,650 @@
+"""
+MiniLang Type Inference (정적 타입 추론)
+실행하지 않고 프로그램의 이름을 선언에 연결하고, 변수와 표현식 값의 타입을 추론합니다.
+
+- 타입: integer, float, number(정수 또는 실수), string, boolean, array, map, function,
+  null, unknown(알 수 없음). 이름은 내장 함수 type()이 돌려주는 이름과 같습니다.
+- 리터럴, 내장 함수의 결과 타입(BUILTIN_TYPES), let/대입으로 들어오는 값을 따라
+  변수 타입을 고정점까지 합칩니다 (흐름 무관: 변수 하나에 타입 하나).
+- 값으로 쓰이지 않고 직접 호출만 되는 함수(단일 형태 호출)는 모든 호출 지점의 인자
+  타입을 매개변수 타입으로, return 값들의 타입을 호출 결과 타입으로 씁니다.
+
+추론 결과(TypeInfo)는 노드별 타입이라 어떤 실행 방식이든 타입에 특수화된 연산을 고를 때
+쓸 수 있습니다. 파이썬 변환기(transpiler.py)는 이 분석을 그대로 이어받아, 두 피연산자가
+숫자로 추론된 연산을 파이썬 연산자로 바로 계산합니다. --types는 추론 결과와 범위를 출력합니다.
+"""
+
+import math
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from ast_nodes import *
+from runtime import Environment, RuntimeError
+from modules import MODULE_CACHE, resolve_path
+from interpreter import BUILTINS
+
+
+INT, FLOAT, NUM = 'integer', 'float', 'number'
+STR, BOOL, ARRAY, MAP, FUNC, NULL = 'string', 'boolean', 'array', 'map', 'function', 'null'
+ANY = 'unknown'
+
+NUMBERS = (INT, FLOAT, NUM)
+
+# 결과 타입이 항상 같은 내장 함수
+BUILTIN_TYPES = {
+    'len': INT, 'int': INT, 'floor': INT, 'ceil': INT, 'index_of': INT, 'find': INT,
+    'float': FLOAT, 'sqrt': FLOAT,
+    'str': STR, 'type': STR, 'join': STR, 'replace': STR, 'substr': STR, 'trim': STR,
+    'upper': STR, 'lower': STR, 'repeat': STR, 'format': STR, 'regex_replace': STR, 'build': STR,
+    'has': BOOL, 'contains': BOOL, 'starts_with': BOOL, 'ends_with': BOOL,
+    'keys': ARRAY, 'values': ARRAY, 'split': ARRAY, 'find_all': ARRAY, 'pmap': ARRAY,
+}
+
+ARITHMETIC = ('-', '*', '/', '%', '**')
+ORDERING = ('<', '>', '<=', '>=')
+
+
+class InferenceError(Exception):
+    """분석할 수 없는 노드"""
+    def __init__(self, message: str, line: int = 0, column: int = 0):
+        self.message = message
+        self.line = line
+        self.column = column
+        super().__init__(f"Type Error at line {line}, column {column}: {message}")
+
+
+def join(a: Optional[str], b: Optional[str]) -> Optional[str]:
+    """두 타입을 모두 담는 가장 좁은 타입 (None은 아직 모름)"""
+    if a is None:
+        return b
+    if b is None or a == b:
+        return a
+    if a in NUMBERS and b in NUMBERS:
+        return NUM
+    return ANY
+
+
+def _numeric(op: str, left: str, right: str) -> str:
+    """숫자끼리의 산술 결과 (/는 항상 실수, **는 음수 지수면 실수가 되므로 number)"""
+    if op == '/':
+        return FLOAT
+    if op == '**':
+        return NUM
+    if left == right == INT:
+        return INT
+    if FLOAT in (left, right):
+        return FLOAT
+    return NUM
+
+
+def binary_type(op: str, left: Optional[str], right: Optional[str]) -> Optional[str]:
+    """이항 연산 결과 타입 (인터프리터의 visit_BinaryOp 규칙)"""
+    if op in ('==', '!='):
+        return BOOL
+    if left is None or right is None:
+        return None
+    if op in ('and', 'or'):
+        return join(left, right)
+    if op == '+':
+        if left == STR or right == STR:
+            return STR
+        if left == right == ARRAY:
+            return ARRAY
+    if op == '*' and INT in (left, right) and STR in (left, right):
+        return STR
+    if op == '+' or op in ARITHMETIC:
+        return _numeric(op, left, right) if left in NUMBERS and right in NUMBERS else ANY
+    if op in ORDERING:
+        both_numbers = left in NUMBERS and right in NUMBERS
+        return BOOL if both_numbers or left == right == STR else ANY
+    return ANY
+
+
+def compound_type(op: str, current: Optional[str], value: Optional[str]) -> Optional[str]:
+    """복합 대입 결과 타입 (문자열 빌더에 +=하면 빌더가 그대로 남으므로 현재 값을 모르면 unknown)"""
+    if op == '+=' and current == ANY:
+        return ANY
+    return binary_type(op[0], current, value)
+
+
+def _always_returns(node: Statement) -> bool:
+    """실행하면 반드시 return으로 끝나는 문장인지"""
+    if isinstance(node, ReturnStatement):
+        return True
+    if isinstance(node, Block):
+        return any(_always_returns(stmt) for stmt in node.statements)
+    if isinstance(node, IfStatement):
+        return (node.else_branch is not None and _always_returns(node.then_branch)
+                and _always_returns(node.else_branch))
+    return False
+
+
+# =====================================================
+# 스코프와 이름 해석
+# =====================================================
+
+class FunctionInfo:
+    """함수 하나 (최상위 코드는 node가 None)"""
+
+    def __init__(self, node: Optional[FunctionDeclaration], parent: Optional['FunctionInfo']):
+        self.node = node
+        self.parent = parent
+        self.parameters: List['Variable'] = []
+        self.outer_writes: List['Variable'] = []  # 대입하는 바깥 함수 소유 변수
+        self.returns: List[Optional[Expression]] = []  # return 값 (None은 값 없는 return)
+        self.call_sites: List[FunctionCall] = []  # 직접 호출하는 곳 (인자 개수가 맞는 것)
+        self.monomorphic = False  # 값으로 쓰이지 않고 직접 호출만 됨
+        self.type: Optional[str] = None  # 호출 결과 타입
+
+    def assigns(self, variable: 'Variable'):
+        if variable.owner is not self and variable not in self.outer_writes:
+            self.outer_writes.append(variable)
+
+
+class Variable:
+    """선언 하나에 대응하는 변수"""
+
+    def __init__(self, name: str, uid: str, owner: FunctionInfo, line: int):
+        self.name = name
+        self.uid = uid  # 프로그램 안에서 고유한 이름 (가려진 이름은 이름_1, 이름_2, ...)
+        self.owner = owner
+        self.line = line
+        self.sources: List[tuple] = []  # 값이 들어오는 곳 (타입 추론용)
+        self.value_uses = 0  # 호출이 아닌 값으로 읽은 횟수
+        self.type: Optional[str] = None
+
+    def direct_function(self) -> Optional[FunctionDeclaration]:
+        """func 선언 한 번으로만 값이 정해지는 변수이면 그 선언 (직접 호출 가능)"""
+        if len(self.sources) == 1 and self.sources[0][0] == 'function':
+            return self.sources[0][1]
+        return None
+
+
+class FreeName:
+    """함수 하나만 분석할 때 함수 밖에서 찾는 이름 (실행 시 클로저 환경에서 조회)"""
+
+    def __init__(self, name: str, builtin: bool = False):
+        self.name = name
+        self.builtin = builtin  # 분석 시점에 내장 함수였음 (호출 시작에서 검사하고 직접 호출)
+
+
+class Scope:
+    """실행 시 Environment 하나에 대응하는 스코프
+
+    선언은 스코프 안의 문장 위치와 함께 기록되어, 같은 스코프에서 선언보다 앞선 문장은
+    바깥 스코프의 같은 이름을 봅니다 (인터프리터에서 그 시점엔 아직 정의되지 않았으므로).
+    """
+
+    def __init__(self, parent: Optional['Scope'], owner: FunctionInfo, position: int,
+                 is_function: bool = False):
+        self.parent = parent
+        self.owner = owner
+        self.position = position  # 부모 스코프에서 이 스코프를 만든 문장의 위치
+        self.is_function = is_function
+        self.declarations: Dict[str, Tuple[float, Variable]] = {}
+
+    def lookup(self, name: str, position: float) -> Optional[Variable]:
+        scope = self
+        while scope is not None:
+            entry = scope.declarations.get(name)
+            if entry is not None and entry[0] < position:
+                return entry[1]
+            # 함수 본문은 호출될 때 실행되므로 바깥 스코프의 모든 선언을 봄
+            position = math.inf if scope.is_function else scope.position
+            scope = scope.parent
+        return None
+
+
+def _module_exports(path: str) -> List[str]:
+    """모듈이 내보내는 함수 이름 (_로 시작하지 않는 최상위 func 선언)"""
+    try:
+        program = MODULE_CACHE.get(path)
+    except RuntimeError:
+        return []
+    return [
+        stmt.name for stmt in program.statements
+        if isinstance(stmt, FunctionDeclaration) and not stmt.name.startswith('_')
+    ]
+
+
+class Analyzer:
+    """이름 해석과 타입 추론
+
+    함수 본문은 바깥 코드를 모두 분석한 뒤에 분석합니다. 대입으로 암묵적으로 정의되는
+    변수가 함수 호출 시점에는 이미 있으리라고 보는 것입니다.
+    closure가 주어지면 함수 하나만 분석하며, 함수 밖의 이름은 FreeName이 됩니다.
+    """
+
+    variable_class = Variable
+    function_class = FunctionInfo
+
+    def __init__(self, base_dir: str, closure: Optional[Environment] = None):
+        self.base_dir = base_dir
+        self.closure = closure  # 함수 하나만 분석할 때 그 함수의 클로저 환경
+        self.absent: List[str] = []  # 함수 안에서 정의되므로 클로저에 없어야 하는 이름
+        self.main = self.function_class(None, None)
+        self.root = Scope(None, self.main, 0, is_function=True)
+        self.references: Dict[int, Any] = {}  # id(노드) -> Variable (None이면 내장 함수/미정의)
+        self.scopes: Dict[int, Scope] = {}
+        self.functions: Dict[int, FunctionInfo] = {}
+        self.variables: List[Variable] = []
+        self.uids: Dict[str, str] = {}  # 고유 이름 -> MiniLang 이름
+        self.expressions: List[Expression] = []  # 분석한 모든 표현식 (범위 계산용)
+        self._calls: List[Tuple[FunctionCall, Variable]] = []
+        self._pending: List[Tuple[FunctionDeclaration, Scope]] = []
+        self._cache: Optional[Dict[int, str]] = None  # 고정점 이후 표현식 타입 캐시
+
+    def analyze(self, program: Program):
+        self.statements(program.statements, self.root)
+        while self._pending:
+            node, scope = self._pending.pop(0)
+            self.statements(node.body.statements, scope)
+        self._link_calls()
+        self._infer_types()
+
+    def analyze_function(self, parameters: List[str], body: Block, parameter_types: List[str]):
+        """함수 하나 분석 (최상위 스코프가 함수 본문, 매개변수 타입은 호출자가 보장)"""
+        for param, param_type in zip(parameters, parameter_types):
+            self.declare(self.root, param, -1, body.line).sources.append(('type', param_type))
+        self.statements(body.statements, self.root)
+        self._infer_types()
+
+    def free_name(self, name: str, called: bool = False) -> FreeName:
+        """함수 밖의 이름 (호출하는 이름이 지금 내장 함수이면 내장 함수로 특수화)"""
+        builtin = (
+            called and name in BUILTINS and self.closure.exists(name)
+            and self.closure.get(name) is BUILTINS[name]
+        )
+        return FreeName(name, builtin)
+
+    def unsupported(self, node: ASTNode):
+        kind = 'statement' if isinstance(node, Statement) else 'expression'
+        raise InferenceError(f"Unsupported {kind}: {type(node).__name__}", node.line, node.column)
+
+    # ----- 선언 -----
+
+    def declare(self, scope: Scope, name: str, position: float, line: int = 0) -> Variable:
+        entry = scope.declarations.get(name)
+        if entry is not None:
+            return entry[1]
+        uid = name
+        suffix = 0
+        while uid in self.uids:
+            suffix += 1
+            uid = f"{name}_{suffix}"
+        self.uids[uid] = name
+        variable = self.variable_class(name, uid, scope.owner, line)
+        scope.declarations[name] = (position, variable)
+        self.variables.append(variable)
+        return variable
+
+    # ----- 문장 -----
+
+    def statements(self, statements: List[Statement], scope: Scope):
+        for position, stmt in enumerate(statements):
+            self.statement(stmt, scope, position)
+
+    def statement(self, node: Statement, scope: Scope, position: int):
+        if isinstance(node, ExpressionStatement):
+            self.expression(node.expression, scope, position)
+        elif isinstance(node, VariableDeclaration):
+            if node.initializer:
+                self.expression(node.initializer, scope, position)
+            variable = self.declare(scope, node.name, position, node.line)
+            variable.sources.append(('value', node.initializer) if node.initializer else ('type', NULL))
+            self.references[id(node)] = variable
+        elif isinstance(node, PrintStatement):
+            for arg in node.arguments:
+                self.expression(arg, scope, position)
+        elif isinstance(node, Block):
+            block = Scope(scope, scope.owner, position)
+            self.scopes[id(node)] = block
+            self.statements(node.statements, block)
+        elif isinstance(node, IfStatement):
+            self.expression(node.condition, scope, position)
+            self.statement(node.then_branch, scope, position)
+            if node.else_branch:
+                self.statement(node.else_branch, scope, position)
+        elif isinstance(node, WhileStatement):
+            self.expression(node.condition, scope, position)
+            self.statement(node.body, scope, position)
+        elif isinstance(node, ForStatement):
+            loop = Scope(scope, scope.owner, position)
+            self.scopes[id(node)] = loop
+            if node.initializer:
+                self.statement(node.initializer, loop, 0)
+            if node.condition:
+                self.expression(node.condition, loop, 1)
+            if node.increment:
+                self.expression(node.increment, loop, 1)
+            self.statement(node.body, loop, 1)
+        elif isinstance(node, ForInStatement):
+            self.expression(node.iterable, scope, position)
+            loop = Scope(scope, scope.owner, position)
+            self.scopes[id(node)] = loop
+            variable = self.declare(loop, node.variable, 0, node.line)
+            variable.sources.append(('type', INT if self.is_range(node.iterable) else ANY))
+            self.references[id(node)] = variable
+            self.statement(node.body, loop, 1)
+        elif isinstance(node, FunctionDeclaration):
+            variable = self.declare(scope, node.name, position, node.line)
+            variable.sources.append(('function', node))
+            self.references[id(node)] = variable
+            function = self.function_class(node, scope.owner)
+            self.functions[id(node)] = function
+            body = Scope(scope, function, position, is_function=True)
+            self.scopes[id(node)] = body
+            for index, param in enumerate(node.parameters):
+                parameter = self.declare(body, param, -1, node.line)
+                parameter.sources.append(('param', function, index))
+                function.parameters.append(parameter)
+            if not _always_returns(node.body):
+                function.returns.append(None)
+            if node.is_generator:
+                function.type = ANY  # 호출 결과는 제너레이터 (return 값은 호출자에게 가지 않음)
+            self._pending.append((node, body))
+        elif isinstance(node, ReturnStatement):
+            if node.value:
+                self.expression(node.value, scope, position)
+            scope.owner.returns.append(node.value)
+        elif isinstance(node, YieldStatement):
+            if node.value:
+                self.expression(node.value, scope, position)
+        elif isinstance(node, ImportStatement):
+            path = resolve_path(node.path, self.base_dir)
+            variables = []
+            for name in _module_exports(path):
+                variable = self.declare(scope, name, position, node.line)
+                variable.sources.append(('function', None))
+                variables.append(variable)
+            self.references[id(node)] = variables
+        elif isinstance(node, (BreakStatement, ContinueStatement)):
+            pass
+        else:
+            self.unsupported(node)
+
+    def is_range(self, node: Expression) -> bool:
+        """내장 range 호출 결과를 바로 순회하는지 (루프 변수가 항상 정수)"""
+        variable = self.references.get(id(node)) if isinstance(node, FunctionCall) else None
+        return (isinstance(node, FunctionCall) and node.name == 'range'
+                and (variable is None or (isinstance(variable, FreeName) and variable.builtin)))
+
+    # ----- 표현식 -----
+
+    def expression(self, node: Expression, scope: Scope, position: int):
+        self.expressions.append(node)
+        if isinstance(node, Identifier):
+            variable = scope.lookup(node.name, position)
+            if variable is None and self.closure is not None:
+                variable = self.free_name(node.name)
+            elif variable is not None:
+                variable.value_uses += 1
+            self.references[id(node)] = variable
+        elif isinstance(node, Assignment):
+            self.expression(node.value, scope, position)
+            name = node.target.name
+            variable = scope.lookup(name, position)
+            if variable is None and self.closure is not None:
+                # 클로저에 이미 있는 이름은 계속 있으므로 (환경에서 이름이 지워지지 않음) 바깥 변수
+                if self.closure.exists(name):
+                    self.references[id(node)] = self.free_name(name)
+                    return
+                self.absent.append(name)
+            if variable is None:
+                variable = self.declare_implicit(scope, name, position, node.line)
+            variable.sources.append(('value', node.value) if node.operator == '=' else
+                                    ('compound', node.operator, node.value))
+            scope.owner.assigns(variable)
+            self.references[id(node)] = variable
+        elif isinstance(node, FunctionCall):
+            if node.name != 'input':
+                variable = scope.lookup(node.name, position)
+                if variable is None and self.closure is not None:
+                    variable = self.free_name(node.name, called=True)
+                elif variable is not None:
+                    self._calls.append((node, variable))
+                self.references[id(node)] = variable
+            for arg in node.arguments:
+                self.expression(arg, scope, position)
+        elif isinstance(node, BinaryOp):
+            self.expression(node.left, scope, position)
+            self.expression(node.right, scope, position)
+        elif isinstance(node, UnaryOp):
+            self.expression(node.operand, scope, position)
+        elif isinstance(node, ArrayLiteral):
+            for elem in node.elements:
+                self.expression(elem, scope, position)
+        elif isinstance(node, MapLiteral):
+            for key, value in zip(node.keys, node.values):
+                self.expression(key, scope, position)
+                self.expression(value, scope, position)
+        elif isinstance(node, ArrayAccess):
+            self.expression(node.array, scope, position)
+            self.expression(node.index, scope, position)
+        elif isinstance(node, SliceAccess):
+            self.expression(node.array, scope, position)
+            for bound in (node.start, node.stop):
+                if bound:
+                    self.expression(bound, scope, position)
+        elif isinstance(node, ArrayIndexAssignment):
+            self.expression(node.array, scope, position)
+            self.expression(node.index, scope, position)
+            self.expression(node.value, scope, position)
+        elif isinstance(node, (NumberLiteral, StringLiteral, BooleanLiteral, NullLiteral)):
+            pass
+        else:
+            self.unsupported(node)
+
+    def declare_implicit(self, scope: Scope, name: str, position: int, line: int) -> Variable:
+        """정의되지 않은 이름에 대입: 현재 스코프에 정의
+
+        내장 함수 이름은 전역 환경에 이미 있으므로 최상위 변수(초깃값은 내장 함수)가 됩니다.
+        """
+        if name not in BUILTINS:
+            # 같은 문장의 뒤쪽(예: print(x = 5, x))에서도 보이도록 문장 바로 앞 위치로 기록
+            return self.declare(scope, name, position - 0.5, line)
+        while scope.parent is not None:
+            position = scope.position
+            scope = scope.parent
+        variable = self.declare(scope, name, position, line)
+        variable.sources.append(('function', None))
+        return variable
+
+    # ----- 타입 추론 -----
+
+    def _link_calls(self):
+        """값으로 쓰이지 않는 함수의 호출 지점 연결 (매개변수 타입은 호출 인자에서)"""
+        for node, variable in self._calls:
+            declaration = variable.direct_function()
+            if declaration is not None and len(declaration.parameters) == len(node.arguments):
+                self.functions[id(declaration)].call_sites.append(node)
+        for function in self.functions.values():
+            variable = self.references[id(function.node)]
+            function.monomorphic = variable.direct_function() is function.node and variable.value_uses == 0
+
+    def _infer_types(self):
+        """변수마다 들어오는 값의 타입과 함수의 결과 타입을 고정점까지 합침 (None은 아직 모름)"""
+        functions = list(self.functions.values())
+        changed = True
+        while changed:
+            changed = False
+            for variable in self.variables:
+                new = variable.type
+                for source in variable.sources:
+                    new = join(new, self._source_type(variable, source))
+                    if new == ANY:
+                        break
+                if new != variable.type:
+                    variable.type = new
+                    changed = True
+            for function in functions:
+                new = function.type
+                for value in function.returns:
+                    new = join(new, NULL if value is None else self.type_of(value))
+                if new != function.type:
+                    function.type = new
+                    changed = True
+        for item in self.variables + functions:
+            if item.type is None:
+                item.type = ANY
+        self._cache = {}
+
+    def _source_type(self, variable: Variable, source: tuple) -> Optional[str]:
+        tag = source[0]
+        if tag == 'value':
+            return self.type_of(source[1])
+        if tag == 'compound':
+            return compound_type(source[1], variable.type, self.type_of(source[2]))
+        if tag == 'param':
+            function, index = source[1], source[2]
+            if not function.monomorphic:
+                return ANY
+            param_type = None
+            for call in function.call_sites:
+                param_type = join(param_type, self.type_of(call.arguments[index]))
+            return param_type
+        if tag == 'function':
+            return FUNC
+        return source[1]
+
+    def type_of(self, node: Expression) -> Optional[str]:
+        """표현식 값의 타입 (고정점 이전에 아직 모르면 None)"""
+        cache = self._cache
+        if cache is not None:
+            result = cache.get(id(node))
+            if result is None:
+                result = cache[id(node)] = self._type_of(node) or ANY
+            return result
+        return self._type_of(node)
+
+    def _type_of(self, node: Expression) -> Optional[str]:
+        if isinstance(node, NumberLiteral):
+            return FLOAT if isinstance(node.value, float) else INT
+        if isinstance(node, StringLiteral):
+            return STR
+        if isinstance(node, BooleanLiteral):
+            return BOOL
+        if isinstance(node, NullLiteral):
+            return NULL
+        if isinstance(node, (ArrayLiteral, MapLiteral)):
+            return ARRAY if isinstance(node, ArrayLiteral) else MAP
+        if isinstance(node, Identifier):
+            variable = self.references.get(id(node))
+            if isinstance(variable, Variable):
+                return variable.type
+            return FUNC if variable is None and node.name in BUILTINS else ANY
+        if isinstance(node, BinaryOp):
+            return binary_type(node.operator, self.type_of(node.left), self.type_of(node.right))
+        if isinstance(node, UnaryOp):
+            if node.operator == 'not':
+                return BOOL
+            operand = self.type_of(node.operand)
+            return operand if operand is None or operand in NUMBERS else ANY
+        if isinstance(node, FunctionCall):
+            return self._call_type(node)
+        if isinstance(node, Assignment):
+            if node.operator == '=':
+                return self.type_of(node.value)
+            variable = self.references.get(id(node))
+            current = variable.type if isinstance(variable, Variable) else ANY
+            return compound_type(node.operator, current, self.type_of(node.value))
+        if isinstance(node, ArrayAccess):
+            # 문자열의 한 글자 (배열/맵의 원소는 무엇이든 될 수 있음)
+            return STR if self.type_of(node.array) == STR else ANY
+        if isinstance(node, SliceAccess):
+            return STR if self.type_of(node.array) == STR else ANY
+        return ANY
+
+    def _call_type(self, node: FunctionCall) -> Optional[str]:
+        if node.name == 'input':
+            return STR
+        variable = self.references.get(id(node))
+        if isinstance(variable, Variable):
+            declaration = variable.direct_function()
+            if declaration is not None and len(declaration.parameters) == len(node.arguments):
+                return self.functions[id(declaration)].type
+            return ANY
+        if variable is None or variable.builtin:
+            return BUILTIN_TYPES.get(node.name, ANY)
+        return ANY
+
+
+# =====================================================
+# 추론 결과
+# =====================================================
+
+class TypeInfo:
+    """프로그램 하나의 타입 추론 결과"""
+
+    def __init__(self, program: Program, analyzer: Analyzer):
+        self.program = program  # 노드 id가 유효하도록 붙잡아 둠
+        self.analyzer = analyzer
+        self.types: Dict[int, str] = {id(node): analyzer.type_of(node) for node in analyzer.expressions}
+
+    def type_of(self, node: Expression) -> str:
+        """표현식의 타입 (분석하지 않은 노드는 unknown)"""
+        return self.types.get(id(node), ANY)
+
+    def variable(self, node: ASTNode) -> Optional[Variable]:
+        """선언/참조/대입 노드가 가리키는 변수"""
+        variable = self.analyzer.references.get(id(node))
+        return variable if isinstance(variable, Variable) else None
+
+    def function(self, node: FunctionDeclaration) -> FunctionInfo:
+        return self.analyzer.functions[id(node)]
+
+    def coverage(self) -> Tuple[int, int, int, int]:
+        """(타입을 아는 표현식 수, 전체 표현식 수, 타입을 아는 변수 수, 전체 변수 수)"""
+        typed = sum(1 for t in self.types.values() if t != ANY)
+        variables = self.analyzer.variables
+        typed_variables = sum(1 for v in variables if v.type != ANY)
+        return typed, len(self.types), typed_variables, len(variables)
+
+    def dump(self, name: str = '<string>') -> str:
+        """--types 출력: 함수 시그니처와 변수 타입, 범위"""
+        lines = [f"=== Types: {name} ==="]
+        owned: Dict[int, List[Variable]] = {}
+        for variable in self.analyzer.variables:
+            owned.setdefault(id(variable.owner), []).append(variable)
+        functions = sorted(self.analyzer.functions.values(), key=lambda f: (f.node.line, f.node.column))
+
+        def depth(function: FunctionInfo) -> int:
+            count = 0
+            while function.parent is not None:
+                function, count = function.parent, count + 1
+            return count
+
+        def entry(text: str, line: int, indent: int) -> str:
+            return f"{'  ' * indent + text:<56} line {line}"
+
+        for function in [self.analyzer.main] + functions:
+            indent = depth(function)
+            if function.node is None:
+                lines.append("(top level)")
+            else:
+                params = ", ".join(f"{p.name}: {p.type}" for p in function.parameters)
+                lines.append(entry(f"func {function.node.name}({params}) -> {function.type}",
+                                   function.node.line, indent - 1))
+            for variable in owned.get(id(function), []):
+                if variable in function.parameters or variable.direct_function() is not None:
+                    continue  # 매개변수는 시그니처에, func 선언은 자기 줄에 표시
+                lines.append(entry(f"{variable.name}: {variable.type}", variable.line, indent))
+
+        typed, total, typed_variables, variables = self.coverage()
+        lines.append(
+            f"Coverage: {typed}/{total} expressions typed ({_percent(typed, total)}), "
+            f"{typed_variables}/{variables} variables typed ({_percent(typed_variables, variables)})"
+        )
+        return "\n".join(lines)
+
+
+def _percent(part: int, whole: int) -> str:
+    return f"{part / whole * 100:.1f}%" if whole else "-"
+
+
+def infer_types(program: Program, script_path: Optional[str] = None) -> TypeInfo:
+    """프로그램 전체의 타입 추론 (import 경로는 script_path 기준)"""
+    base_dir = os.path.dirname(os.path.abspath(script_path)) if script_path else os.getcwd()
+    analyzer = Analyzer(base_dir)
+    analyzer.analyze(program)
+    return TypeInfo(program, analyzer)
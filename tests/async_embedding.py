@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+asyncio 임베딩 테스트
+목적: 1) 두 스크립트를 한 이벤트 루프에서 실행해 출력이 번갈아 나오는지(한 스크립트가 끝나기 전에
+         다른 스크립트가 진행하는지) 확인
+      2) print/input이 asyncio.StreamReader/StreamWriter(소켓 쌍)를 통해 처리되는지 확인
+      3) 끝나지 않는 스크립트의 run() 태스크를 취소해도 다른 스크립트는 끝까지 실행되는지 확인
+      4) 많은 스크립트를 동시에 실행해도 스레드가 늘지 않는지(스크립트가 루프 위에서만 실행되는지) 확인
+기대 결과: 출력이 번갈아 기록되고, 입력한 줄이 출력에 반영되며, 취소한 태스크만 CancelledError로 끝나고,
+          실행 중 스레드 수가 시작 전과 같음
+
+실행: python tests/async_embedding.py
+"""
+
+import asyncio
+import os
+import socket
+import sys
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from lexer import tokenize
+from parser import parse
+from async_interpreter import AsyncInterpreter
+
+
+COUNTER = '''
+let total = 0
+for (let i = 0; i < 40; i += 1) {
+    print("%s", i)
+    total += i
+}
+total
+'''
+
+GREETER = '''
+let name = input("name? ")
+print("hello", name)
+let count = int(input())
+print(count * 2)
+'''
+
+FOREVER = '''
+let x = 0
+while true { x += 1 }
+'''
+
+# 동시에 실행하는 스크립트 수
+MANY_SCRIPTS = 1000
+
+FINITE = '''
+let total = 0
+for (let i = 0; i < 20000; i += 1) { total += i }
+print(total)
+total
+'''
+
+
+class Recorder:
+    """StreamWriter 대신 쓰는 기록기 (여러 스크립트의 출력 순서를 한 목록에 기록)"""
+
+    def __init__(self, log: list, name: str):
+        self.log = log
+        self.name = name
+
+    def write(self, data: bytes):
+        self.log.append((self.name, data.decode('utf-8').rstrip('\n')))
+
+    async def drain(self):
+        pass
+
+
+def check(label: str, ok: bool, detail: str = "") -> bool:
+    print(f"  [{'OK' if ok else 'FAIL'}] {label}{': ' + detail if detail else ''}")
+    return ok
+
+
+async def check_interleaving() -> bool:
+    log = []
+    scripts = [AsyncInterpreter(stdout=Recorder(log, name), yield_interval=5) for name in "ab"]
+    results = await asyncio.gather(*(
+        script.run(parse(tokenize(COUNTER % name))) for script, name in zip(scripts, "ab")
+    ))
+    order = [name for name, _ in log]
+    first_b = order.index('b')
+    last_a = len(order) - 1 - order[::-1].index('a')
+    passed = check("both scripts finished", results == [780, 780], str(results))
+    passed &= check("outputs interleaved", first_b < last_a,
+                    f"first b at {first_b}, last a at {last_a} of {len(order)}")
+    return passed
+
+
+async def check_streams() -> bool:
+    script_side, test_side = socket.socketpair()
+    reader, writer = await asyncio.open_connection(sock=script_side)
+    test_reader, test_writer = await asyncio.open_connection(sock=test_side)
+    try:
+        test_writer.write(b"kim\n21\n")
+        await test_writer.drain()
+        interpreter = AsyncInterpreter(stdin=reader, stdout=writer)
+        await interpreter.run(parse(tokenize(GREETER)))
+        writer.close()
+        received = (await test_reader.read()).decode('utf-8')
+    finally:
+        test_writer.close()
+    expected = "name? hello kim\n42\n"
+    passed = check("input and print through streams", received == expected, repr(received))
+    passed &= check("output buffer", interpreter.output == ["hello kim", "42"], str(interpreter.output))
+    return passed
+
+
+async def check_cancel() -> bool:
+    forever = asyncio.create_task(AsyncInterpreter(yield_interval=100).run(parse(tokenize(FOREVER))))
+    log = []
+    finite = asyncio.create_task(
+        AsyncInterpreter(stdout=Recorder(log, 'finite'), yield_interval=100).run(parse(tokenize(FINITE))))
+    await asyncio.sleep(0.05)
+    forever.cancel()
+    result = await finite
+    try:
+        await forever
+        cancelled = False
+    except asyncio.CancelledError:
+        cancelled = True
+
+    passed = check("other script completed", result == 199990000 and log == [('finite', '199990000')],
+                   str(result))
+    passed &= check("cancelled task raised CancelledError", cancelled)
+    return passed
+
+
+async def check_many() -> bool:
+    program = parse(tokenize(COUNTER % "many"))
+    threads = threading.active_count()
+    peak = threads
+    log = []
+    tasks = [asyncio.create_task(AsyncInterpreter(stdout=Recorder(log, i), yield_interval=10).run(program))
+             for i in range(MANY_SCRIPTS)]
+    while not all(task.done() for task in tasks):
+        peak = max(peak, threading.active_count())
+        await asyncio.sleep(0)
+    results = [task.result() for task in tasks]
+    # 모든 스크립트가 첫 줄을 출력한 뒤에야 어느 스크립트든 마지막 줄을 출력함 (번갈아 실행)
+    first_last = next(k for k, (_, text) in enumerate(log) if text == "many 39")
+    started = {name for name, _ in log[:first_last]}
+
+    passed = check(f"{MANY_SCRIPTS} scripts finished", results == [780] * MANY_SCRIPTS)
+    passed &= check("no extra threads", peak == threads, f"{peak} threads (before {threads})")
+    passed &= check("all scripts progressed together", len(started) == MANY_SCRIPTS,
+                    f"{len(started)} started before the first finished")
+    return passed
+
+
+async def run_checks() -> bool:
+    print("=== 두 스크립트 번갈아 실행 ===")
+    passed = await check_interleaving()
+    print("=== StreamReader/StreamWriter ===")
+    passed &= await check_streams()
+    print("=== 취소 ===")
+    passed &= await check_cancel()
+    print("=== 많은 스크립트 동시 실행 ===")
+    passed &= await check_many()
+    return passed
+
+
+def main() -> int:
+    return 0 if asyncio.run(run_checks()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+협력적 작업(spawn/channel/send/recv) 테스트
+목적: 1) 생산자-필터-소비자 파이프라인, 핑퐁, 크기 제한 채널, 최상위 코드의 recv, 제너레이터 안의 recv를
+         기본 설정과 반복 엔진 전용(max_depth=0)으로 실행해 기대한 출력과 비교
+      2) 아무도 보내지 않는 채널을 기다릴 때의 교착 상태 에러와 작업 안의 에러 전달
+      3) 깊은 재귀(5000단계) 안에서 멈춘 작업이 파이썬 재귀 없이 재개되는지 확인
+      4) 채널에서 멈춘 작업 1만 개의 메모리 (작업마다 스레드나 파이썬 스택을 쓰지 않음)
+기대 결과: 출력이 모두 같고, 교착 상태는 에러로 보고되며, 멈춘 작업 하나가 쓰는 메모리가 수 KB 이하
+
+실행: python tests/coroutine_tasks.py
+"""
+
+import gc
+import os
+import sys
+import threading
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from lexer import tokenize
+from parser import parse
+from interpreter import Interpreter
+from runtime import RuntimeError as MiniLangRuntimeError
+
+
+TASKS = 10000
+# 멈춘 작업 하나가 쓸 수 있는 메모리 상한 (바이트)
+TASK_BUDGET = 8 * 1024
+
+CASES = {
+    "pipeline": ('''
+let numbers = channel()
+let squares = channel(4)
+func produce(n) {
+    for (let i = 1; i <= n; i += 1) { send(numbers, i) }
+    send(numbers, null)
+}
+func square() {
+    while true {
+        let v = recv(numbers)
+        if v == null { break }
+        if v % 2 == 1 { send(squares, v * v) }
+    }
+    send(squares, null)
+}
+func consume(done) {
+    let total = 0
+    while true {
+        let v = recv(squares)
+        if v == null { break }
+        total += v
+    }
+    send(done, total)
+}
+let done = channel()
+spawn(consume, done)
+spawn(square)
+spawn(produce, 100)
+print("total", recv(done))
+''', ["total 166650"]),
+
+    "ping-pong": ('''
+let ping = channel()
+let pong = channel()
+let done = channel()
+func player(name, inbox, outbox, rounds) {
+    for (let i = 0; i < rounds; i += 1) {
+        let ball = recv(inbox)
+        print(name, ball)
+        send(outbox, ball + 1)
+    }
+    send(done, name)
+}
+spawn(player, "ping", ping, pong, 2)
+spawn(player, "pong", pong, ping, 2)
+send(ping, 0)
+print("finished", recv(done), recv(done), recv(ping))
+''', ["ping 0", "pong 1", "ping 2", "pong 3", "finished ping pong 4"]),
+
+    "bounded channel": ('''
+let box = channel(2)
+func fill() {
+    for (let i = 0; i < 4; i += 1) {
+        send(box, i)
+        print("sent", i)
+    }
+}
+spawn(fill)
+for (let i = 0; i < 4; i += 1) { print("got", recv(box)) }
+''', ["sent 0", "sent 1", "got 0", "got 1", "got 2", "sent 2", "sent 3", "got 3"]),
+
+    "round robin and leftover tasks": ('''
+func worker(name, n) {
+    let ch = channel(1)
+    for (let i = 0; i < n; i += 1) {
+        print(name, i)
+        send(ch, i)
+        send(ch, i)
+    }
+}
+spawn(worker, "a", 2)
+spawn(worker, "b", 2)
+print("main")
+''', ["main", "a 0", "b 0"]),
+
+    "recv inside a generator": ('''
+let ch = channel()
+func feed() {
+    for (let i = 0; i < 3; i += 1) { send(ch, i * 10) }
+}
+func received(n) {
+    for (let i = 0; i < n; i += 1) { yield recv(ch) }
+}
+spawn(feed)
+for v in received(3) { print(v) }
+''', ["0", "10", "20"]),
+}
+
+ERROR_CASES = {
+    "deadlock": ('let c = channel()\nprint(recv(c))\n', "Deadlock"),
+    "deadlock between tasks": ('''
+let a = channel()
+let b = channel()
+func left() { send(b, recv(a)) }
+func right() { send(a, recv(b)) }
+spawn(left)
+spawn(right)
+print(recv(a))
+''', "Deadlock"),
+    "error inside a task": ('''
+func bad(n) { return 1 / n }
+func task() { print(bad(0)) }
+spawn(task)
+''', "Division by zero"),
+    "spawn of a builtin": ('spawn(len, [1])\n', "spawn requires a user-defined function"),
+}
+
+DEEP_SCRIPT = '''
+let ch = channel()
+let out = channel()
+func dive(n) {
+    if n == 0 { return recv(ch) }
+    return 1 + dive(n - 1)
+}
+func task() { send(out, dive(5000)) }
+spawn(task)
+send(ch, 7)
+print(recv(out))
+'''
+
+PARKED_SCRIPT = '''
+let gate = channel()
+func waiter(i) {
+    let mine = i * 2
+    let v = recv(gate)
+    return v + mine
+}
+for (let i = 0; i < %d; i += 1) { spawn(waiter, i) }
+'''
+
+
+def run(source: str, max_depth=None):
+    """(출력 줄들, 에러 메시지) 반환"""
+    interpreter = Interpreter(echo=False, max_depth=max_depth)
+    try:
+        interpreter.execute(parse(tokenize(source)))
+    except MiniLangRuntimeError as e:
+        return interpreter.output, e.message
+    return interpreter.output, None
+
+
+def check(label: str, ok: bool, detail: str = "") -> bool:
+    print(f"  [{'OK' if ok else 'FAIL'}] {label}{': ' + detail if detail else ''}")
+    return ok
+
+
+def check_cases() -> bool:
+    passed = True
+    for label, (source, expected) in CASES.items():
+        results = [run(source), run(source, max_depth=0)]
+        ok = all(result == (expected, None) for result in results)
+        passed &= check(label, ok, f"{len(expected)} lines")
+        if not ok:
+            print(f"         expected: {expected}")
+            for result in results:
+                print(f"         actual:   {result}")
+    for label, (source, message) in ERROR_CASES.items():
+        errors = [run(source)[1], run(source, max_depth=0)[1]]
+        ok = all(error is not None and message in error for error in errors)
+        passed &= check(label, ok, str(errors[0]))
+    return passed
+
+
+def check_deep() -> bool:
+    limit = sys.getrecursionlimit()
+    output, error = run(DEEP_SCRIPT)
+    return check(f"task suspended 5000 calls deep (recursion limit {limit})",
+                 output == ["5007"] and error is None, str(output or error))
+
+
+def check_parked_memory() -> bool:
+    threads = threading.active_count()
+    interpreter = Interpreter(echo=False)
+    program = parse(tokenize(PARKED_SCRIPT % TASKS))
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    interpreter.execute(program)
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    gate = interpreter.global_env.get('gate')
+    parked = len(gate.receivers)
+    used = sum(stat.size_diff for stat in after.compare_to(before, 'filename'))
+    per_task = used / TASKS
+    passed = check(f"{TASKS} tasks parked on one channel", parked == TASKS, f"{parked} waiting")
+    passed &= check("no thread per task", threading.active_count() == threads)
+    passed &= check("memory per parked task", per_task < TASK_BUDGET,
+                    f"{per_task / 1024:.2f} KB (budget {TASK_BUDGET // 1024} KB)")
+    return passed
+
+
+def main() -> int:
+    passed = True
+    print("=== 작업과 채널 (기본 / 반복 엔진 전용) ===")
+    passed &= check_cases()
+    print("=== 깊은 호출 안에서 멈춘 작업 ===")
+    passed &= check_deep()
+    print("=== 멈춘 작업의 메모리 ===")
+    passed &= check_parked_memory()
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+반복 실행 엔진 적합성 테스트
+목적: 1) tests/와 examples/의 모든 .ml 프로그램과 transpile_conformance.py의 스코프/에러 프로그램을
+         재귀 방문자와 반복 엔진(max_depth=0, 모든 코드를 엔진으로 실행)으로 실행해 비교
+      2) 파이썬 재귀 한도를 넘는 깊은 표현식(10만 항의 덧셈)과 깊은 재귀(10만 단계)를
+         기본 설정(방문자로 시작해 한도에서 엔진으로 전환)과 단계별 실행(임계값 1)으로 실행
+기대 결과: 출력과 에러(메시지, 원본 줄 번호)가 모두 같고, 깊은 프로그램이 RecursionError 없이
+          기대한 값을 출력함
+
+실행: python tests/engine_conformance.py
+"""
+
+import glob
+import io
+import os
+import sys
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(TESTS_DIR, '..', 'src'))
+
+from lexer import tokenize
+from parser import parse
+from interpreter import Interpreter
+from runtime import RuntimeError as MiniLangRuntimeError
+from strings import PATTERN_CACHE
+from tiering import Tiering
+from transpile_conformance import ERROR_CASES, SCOPE_CASES
+
+
+DEPTH = 100000
+
+DEEP_CASES = {
+    "long + chain": ("let x = " + " + ".join(["1"] * DEPTH) + "\nprint(x)\n", [str(DEPTH)]),
+    "nested calls in expression": (
+        "func id(v) { return v }\nprint(" + "id(" * 100 + "7" + ")" * 100 + ")\n", ["7"]
+    ),
+    "deep recursion": (
+        "func down(n) {\n    if n == 0 { return 0 }\n    return 1 + down(n - 1)\n}\n"
+        f"print(down({DEPTH}))\n",
+        [str(DEPTH)]
+    ),
+    "mutual recursion with loops": (
+        "func isEven(n) {\n    if n == 0 { return true }\n    return isOdd(n - 1)\n}\n"
+        "func isOdd(n) {\n    for (let i = 0; i < 1; i += 1) {\n        if n == 0 { return false }\n    }\n"
+        "    return isEven(n - 1)\n}\n"
+        f"print(isEven({DEPTH}), isOdd(7))\n",
+        ["true true"]
+    ),
+    "deep recursion through sort comparator": (
+        "func depth(n) {\n    if n == 0 {\n        let a = [3, 1, 2]\n        sort(a, cmp)\n        return a\n    }\n"
+        "    return depth(n - 1)\n}\nfunc cmp(a, b) { return a - b }\n"
+        f"print(depth({DEPTH}))\n",
+        ["[1, 2, 3]"]
+    ),
+    "error at depth": (
+        "func fail(n) {\n    if n == 0 { return 1 / n }\n    return fail(n - 1)\n}\n"
+        f"print(fail({DEPTH}))\n",
+        []
+    ),
+}
+
+
+def run(program, max_depth=None, tiered=False, script_path: str = None):
+    """(출력 줄들, 에러) 반환"""
+    interpreter = Interpreter(echo=False, tiering=tiered, max_depth=max_depth)
+    if tiered:
+        interpreter.tiering = Tiering(interpreter, threshold=1, background=False)
+    interpreter.script_path = script_path
+    sys.stdin = io.StringIO("")
+    PATTERN_CACHE.clear()
+    error = None
+    try:
+        interpreter.execute(program)
+    except MiniLangRuntimeError as e:
+        error = (e.message, e.line)
+    except Exception as e:
+        error = (f"{type(e).__name__}: {e}", None)
+    return interpreter.output, error
+
+
+def compare(label: str, source: str, script_path: str = None) -> bool:
+    program = parse(tokenize(source))
+    expected = run(program, script_path=script_path)
+    actual = run(program, max_depth=0, script_path=script_path)
+    ok = actual == expected
+    print(f"  [{'OK' if ok else 'FAIL'}] {label}: {len(expected[0])} lines")
+    if not ok:
+        print(f"         visitor: {expected}")
+        print(f"         engine:  {actual}")
+    return ok
+
+
+def check_deep(label: str, source: str, expected_output) -> bool:
+    program = parse(tokenize(source))
+    results = [run(program), run(program, tiered=True), run(program, max_depth=0)]
+    outputs = {(tuple(output), error) for output, error in results}
+    output, error = results[0]
+    ok = len(outputs) == 1 and output == expected_output
+    ok &= (error is None) == bool(expected_output)
+    ok &= error is None or not error[0].startswith("RecursionError")
+    print(f"  [{'OK' if ok else 'FAIL'}] {label}: {output or error}")
+    if not ok:
+        for result in results:
+            print(f"         {str(result)[:200]}")
+    return ok
+
+
+def main() -> int:
+    stdin = sys.stdin
+    passed = True
+    try:
+        print("=== 테스트/예제 프로그램 (방문자와 엔진 비교) ===")
+        paths = sorted(glob.glob(os.path.join(TESTS_DIR, '*.ml')))
+        paths += sorted(glob.glob(os.path.join(TESTS_DIR, '..', 'examples', '*.ml')))
+        for path in paths:
+            with open(path, 'r', encoding='utf-8') as f:
+                passed &= compare(os.path.basename(path), f.read(), path)
+
+        print("=== 스코프와 에러 ===")
+        for label, source in {**SCOPE_CASES, **ERROR_CASES}.items():
+            passed &= compare(label, source)
+
+        print(f"=== 깊은 표현식과 재귀 (파이썬 재귀 한도 {sys.getrecursionlimit()}) ===")
+        for label, (source, expected_output) in DEEP_CASES.items():
+            passed &= check_deep(label, source, expected_output)
+    finally:
+        sys.stdin = stdin
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
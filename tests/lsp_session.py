@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+언어 서버 세션 테스트
+목적: main.py --lsp를 실행해 열기/편집/진단/정의로 이동/호버/문서 심볼/종료를 차례로 요청하고,
+      열지 않은 문서의 편집 알림과 잘못된 Content-Length 헤더를 보내 서버가 계속 동작하는지 확인
+기대 결과: 모든 응답이 기대값과 일치하고, 알림 에러는 표준 에러에 기록되며, 서버가 종료 코드 0으로 끝남
+
+실행: python tests/lsp_session.py
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+MAIN = os.path.join(TESTS_DIR, '..', 'src', 'main.py')
+URI = 'file://' + os.path.join(os.path.realpath(TESTS_DIR), 'lsp_example.ml')
+MATHLIB_URI = 'file://' + os.path.join(os.path.realpath(TESTS_DIR), 'modules', 'mathlib.ml')
+
+SOURCE = """import "modules/mathlib.ml"
+
+func area(w, h) {
+    let result = w * h
+    return result
+}
+let total = area(3, 4) @
+print(abs(total) + gcd(12, 8))
+"""
+
+
+class Client:
+    def __init__(self):
+        self.process = subprocess.Popen(
+            [sys.executable, MAIN, '--lsp'], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE
+        )
+        self.next_id = 0
+
+    def send(self, message: dict):
+        body = json.dumps(message).encode('utf-8')
+        self.send_raw(b"Content-Length: %d\r\n\r\n" % len(body) + body)
+
+    def send_raw(self, data: bytes):
+        self.process.stdin.write(data)
+        self.process.stdin.flush()
+
+    def receive(self) -> dict:
+        length = 0
+        while True:
+            line = self.process.stdout.readline().strip()
+            if not line:
+                break
+            if line.lower().startswith(b'content-length:'):
+                length = int(line.split(b':')[1])
+        return json.loads(self.process.stdout.read(length))
+
+    def request(self, method: str, params: dict):
+        self.next_id += 1
+        self.send({'jsonrpc': '2.0', 'id': self.next_id, 'method': method, 'params': params})
+        while True:
+            message = self.receive()
+            if message.get('id') == self.next_id:
+                if 'error' in message:
+                    raise AssertionError(f"{method} failed: {message['error']}")
+                return message['result']
+
+    def notify(self, method: str, params: dict):
+        self.send({'jsonrpc': '2.0', 'method': method, 'params': params})
+
+    def diagnostics(self) -> list:
+        while True:
+            message = self.receive()
+            if message.get('method') == 'textDocument/publishDiagnostics':
+                return message['params']['diagnostics']
+
+
+def position(line: int, character: int) -> dict:
+    return {'textDocument': {'uri': URI}, 'position': {'line': line, 'character': character}}
+
+
+def change(version: int, start: tuple, end: tuple, text: str) -> dict:
+    return {
+        'textDocument': {'uri': URI, 'version': version},
+        'contentChanges': [{
+            'range': {
+                'start': {'line': start[0], 'character': start[1]},
+                'end': {'line': end[0], 'character': end[1]},
+            },
+            'text': text,
+        }],
+    }
+
+
+def check(label: str, actual, expected):
+    status = "OK" if actual == expected else "FAIL"
+    print(f"  [{status}] {label}: {actual}")
+    if actual != expected:
+        raise AssertionError(f"{label}: expected {expected}")
+
+
+def main() -> int:
+    client = Client()
+    print("=== 초기화 ===")
+    result = client.request('initialize', {'capabilities': {}})
+    check("incremental sync", result['capabilities']['textDocumentSync']['change'], 2)
+    client.notify('initialized', {})
+
+    print("=== 진단 (어휘 분석 에러에서도 계속 분석) ===")
+    client.notify('textDocument/didOpen', {
+        'textDocument': {'uri': URI, 'languageId': 'minilang', 'version': 1, 'text': SOURCE}
+    })
+    diagnostics = client.diagnostics()
+    check("messages", [d['message'] for d in diagnostics], ["Unexpected character: '@'"])
+    check("range", diagnostics[0]['range']['start'], {'line': 6, 'character': 23})
+
+    print("=== 정의로 이동 ===")
+    location = client.request('textDocument/definition', position(6, 13))
+    check("area", (location['uri'] == URI, location['range']['start']), (True, {'line': 2, 'character': 5}))
+    location = client.request('textDocument/definition', position(4, 13))
+    check("local result", location['range']['start'], {'line': 3, 'character': 8})
+    location = client.request('textDocument/definition', position(3, 17))
+    check("parameter w", location['range']['start'], {'line': 2, 'character': 10})
+    location = client.request('textDocument/definition', position(7, 20))
+    check("imported gcd", (location['uri'] == MATHLIB_URI, location['range']['start']['line']), (True, 11))
+    check("keyword", client.request('textDocument/definition', position(2, 1)), None)
+
+    print("=== 호버 ===")
+    hover = client.request('textDocument/hover', position(7, 11))
+    check("total", hover['contents']['value'].splitlines()[0], "let total")
+    hover = client.request('textDocument/hover', position(7, 7))
+    check("builtin", hover['contents']['value'], "builtin abs")
+
+    print("=== 증분 편집 ===")
+    client.notify('textDocument/didChange', change(2, (6, 22), (6, 24), ""))
+    check("fixed", client.diagnostics(), [])
+    client.notify('textDocument/didChange', change(3, (1, 0), (1, 0), "let scale = 2\n"))
+    location = client.request('textDocument/definition', position(8, 11))
+    check("total after insert", location['range']['start'], {'line': 7, 'character': 4})
+    client.notify('textDocument/didChange', change(4, (4, 19), (4, 19), " * scale"))
+    location = client.request('textDocument/definition', position(4, 22))
+    check("scale", location['range']['start'], {'line': 1, 'character': 4})
+    client.notify('textDocument/didChange', change(5, (6, 0), (7, 0), ""))
+    diagnostics = client.diagnostics()
+    check("unclosed brace", len(diagnostics) > 0, True)
+    client.notify('textDocument/didChange', change(6, (6, 0), (6, 0), "}\n"))
+    check("closed again", client.diagnostics(), [])
+
+    print("=== 문서 심볼 ===")
+    symbols = client.request('textDocument/documentSymbol', {'textDocument': {'uri': URI}})
+    check("symbols", [(s['name'], s['range']['start']['line']) for s in symbols],
+          [('scale', 1), ('area', 3), ('total', 7)])
+
+    print("=== 잘못된 메시지 ===")
+    other = 'file://' + os.path.join(os.path.realpath(TESTS_DIR), 'never_opened.ml')
+    client.notify('textDocument/didChange', {
+        'textDocument': {'uri': other, 'version': 2}, 'contentChanges': [{'text': "let x = 1\n"}]
+    })
+    symbols = client.request('textDocument/documentSymbol', {'textDocument': {'uri': URI}})
+    check("alive after failed notification", len(symbols), 3)
+    client.send_raw(b"Content-Length: abc\r\n\r\n")
+    error = client.receive()
+    check("invalid Content-Length", (error['id'], error['error']['code']), (None, -32700))
+    symbols = client.request('textDocument/documentSymbol', {'textDocument': {'uri': URI}})
+    check("alive after invalid header", len(symbols), 3)
+
+    print("=== 종료 ===")
+    client.request('shutdown', {})
+    client.notify('exit', {})
+    check("exit code", client.process.wait(timeout=10), 0)
+    log = client.process.stderr.read().decode('utf-8')
+    check("notification error logged", "Document is not open" in log, True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
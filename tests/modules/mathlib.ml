@@ -0,0 +1,34 @@
+// 테스트 23에서 불러오는 모듈: 수학 함수
+
+import "strutil.ml"
+
+let calls = 0
+
+func square(x) {
+    calls = calls + 1
+    return x * x
+}
+
+func gcd(a, b) {
+    while b != 0 {
+        let t = b
+        b = a % b
+        a = t
+    }
+    return a
+}
+
+func describe(x) {
+    return pad("square(" + str(x) + ") = " + str(square(x)), 20) + "|"
+}
+
+func call_count() {
+    return calls
+}
+
+// _로 시작하는 함수는 내보내지 않음
+func _helper() {
+    return "private"
+}
+
+print("mathlib loaded")
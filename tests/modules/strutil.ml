@@ -0,0 +1,7 @@
+// 테스트 23에서 불러오는 모듈: 문자열 함수
+
+func pad(s, width) {
+    return s + repeat(" ", width - len(s))
+}
+
+print("strutil loaded")
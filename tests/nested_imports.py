@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+함수/블록 안의 import 테스트
+목적: 1) 함수 본문과 블록 안에서 import하는 모듈(그 모듈이 다시 import하는 모듈 포함)이
+         번들에 들어가, 소스를 다른 곳으로 옮긴 뒤 번들만으로 실행되는지 확인
+      2) 모듈을 처음 불러올 때 그 모듈의 함수 안에서 import하는 모듈들도 의존 그래프로
+         한 번에 미리 파싱되는지 (호출할 때 하나씩 파싱하지 않는지) 확인
+기대 결과: 번들에 모든 모듈이 포함되고, 소스 없이 실행한 출력이 소스에서 실행한 출력과 같으며,
+          함수 안의 import 대상이 첫 import 때 모두 캐시에 들어 있음
+
+실행: python tests/nested_imports.py
+"""
+
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+MAIN = os.path.join(TESTS_DIR, '..', 'src', 'main.py')
+sys.path.insert(0, os.path.join(TESTS_DIR, '..', 'src'))
+
+from lexer import tokenize
+from parser import parse
+from interpreter import Interpreter
+from modules import MODULE_CACHE
+
+# 함수마다 다른 모듈을 import하는 허브 모듈의 의존 모듈 수
+HUB_MODULES = 10
+
+FILES = {
+    'app.ml': '''
+func go(n) {
+    import "lib/shapes.ml"
+    return area(n)
+}
+if true {
+    import "lib/text.ml"
+    print(shout("start"))
+}
+print(go(3))
+''',
+    'lib/shapes.ml': '''
+import "units.ml"
+func area(n) { return label(n * n) }
+''',
+    'lib/units.ml': 'func label(v) { return str(v) + " m2" }\n',
+    'lib/text.ml': 'func shout(s) { return upper(s) + "!" }\n',
+}
+
+
+def check(label: str, ok: bool, detail: str = "") -> bool:
+    print(f"  [{'OK' if ok else 'FAIL'}] {label}{': ' + detail if detail else ''}")
+    return ok
+
+
+def minilang(*args: str, cwd: str) -> str:
+    result = subprocess.run([sys.executable, os.path.abspath(MAIN), *args], cwd=cwd,
+                            capture_output=True, text=True, timeout=60)
+    return result.stdout
+
+
+def write_sources(root: str):
+    for name, source in FILES.items():
+        path = os.path.join(root, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(source)
+
+
+def check_bundle() -> bool:
+    with tempfile.TemporaryDirectory() as work:
+        project = os.path.join(work, 'project')
+        deploy = os.path.join(work, 'deploy')
+        write_sources(project)
+        os.makedirs(deploy)
+        expected = minilang('app.ml', cwd=project)
+        built = minilang('--bundle', 'app.mlb', 'app.ml', cwd=project)
+        shutil.move(os.path.join(project, 'app.mlb'), os.path.join(deploy, 'app.mlb'))
+        shutil.rmtree(project)
+        actual = minilang(os.path.join(deploy, 'app.mlb'), cwd=work)
+
+    passed = check("all nested modules bundled", "(4 modules" in built, built.strip())
+    passed &= check("bundle runs without sources", actual == expected == "START!\n9 m2\n",
+                    repr(actual))
+    return passed
+
+
+def check_prefetch() -> bool:
+    with tempfile.TemporaryDirectory() as work:
+        hub = ["func pick(i) {"]
+        for i in range(HUB_MODULES):
+            with open(os.path.join(work, f'part{i}.ml'), 'w', encoding='utf-8') as f:
+                f.write(f'func value{i}() {{ return {i} }}\n')
+            hub.append(f'    if i == {i} {{\n        import "part{i}.ml"\n        return value{i}()\n    }}')
+        hub.append("}")
+        with open(os.path.join(work, 'hub.ml'), 'w', encoding='utf-8') as f:
+            f.write("\n".join(hub) + "\n")
+
+        interpreter = Interpreter(echo=False)
+        interpreter.script_path = os.path.join(work, 'main.ml')
+        parsed = MODULE_CACHE.parsed
+        interpreter.execute(parse(tokenize('import "hub.ml"\n')))
+        prefetched = MODULE_CACHE.parsed - parsed
+        interpreter.execute(parse(tokenize(
+            'let got = []\nfor (let i = 0; i < %d; i += 1) { push(got, pick(i)) }\n' % HUB_MODULES)))
+        on_call = MODULE_CACHE.parsed - parsed - prefetched
+        got = interpreter.global_env.get('got')
+
+    passed = check("imports in function bodies parsed with the first import",
+                   prefetched == HUB_MODULES + 1, f"{prefetched} files")
+    passed &= check("no parsing at call time", on_call == 0, f"{on_call} files")
+    passed &= check("results", got == list(range(HUB_MODULES)), str(got))
+    return passed
+
+
+def main() -> int:
+    print("=== 번들 ===")
+    passed = check_bundle()
+    print("=== 의존 모듈 미리 파싱 ===")
+    passed &= check_prefetch()
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+병렬 map(pmap) 테스트
+목적: 1) 클로저 값, 다른 사용자 함수, 재귀, 내장 함수 별칭을 쓰는 함수를 pmap으로 실행한 결과가
+         for-in으로 하나씩 호출한 결과와 같은지 작업자 1개/2개, 여러 조각 크기로 비교
+      2) 큰 타입 배열/실수 배열(입력과 캡처한 값)이 공유 메모리로 전달되고 결과가 같은지 확인
+      3) 순수하지 않은 함수(출력, 캡처한 변수 대입, 매개변수/캡처한 배열 수정, 입출력 함수 호출,
+         부르는 함수의 부작용), 제너레이터, 인자 개수, 보낼 수 없는 값의 에러
+      4) 작업자에서 난 에러가 원본 줄 번호로 보고되고, 작업자 풀이 pmap 호출 사이에 유지되는지 확인
+      5) 큰 값을 캡처한 함수를 여러 조각으로 보낼 때 조각 작업마다 함수를 다시 보내지 않는지 확인
+기대 결과: 결과가 모두 순차 실행과 같고, 에러는 함수 이름/이유/줄 번호와 함께 RuntimeError로 보고됨
+
+실행: python tests/parallel_map.py
+"""
+
+import os
+import pickle
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from lexer import tokenize
+from parser import parse
+from interpreter import Interpreter
+from runtime import RuntimeError as MiniLangRuntimeError
+import parallel
+
+
+PROGRAM = '''
+let offset = 3
+let table = {"a": 1, "b": 2}
+let size = len
+func helper(x) { return x * 2 + offset }
+func fact(n) {
+    if n <= 1 { return 1 }
+    return n * fact(n - 1)
+}
+func score(x) {
+    let acc = []
+    for (let k = 0; k < 5; k += 1) { push(acc, helper(x + k) %% 7) }
+    acc[0] = fact(x %% 6)
+    return [sum(acc), size(acc), str(x) + "!", table["b"]]
+}
+let data = range(%(n)d)
+let expected = []
+for x in data { push(expected, score(x)) }
+'''
+
+SHARED = '''
+let weights = float_array(%(n)d)
+for (let i = 0; i < %(n)d; i += 1) { weights[i] = i * 0.25 }
+let ints = int_array(range(%(n)d))
+let floats = []
+for (let i = 0; i < %(n)d; i += 1) { push(floats, i / 2) }
+func weigh(i) { return weights[(i * 7) %% %(n)d] + 1 }
+func twice(v) { return v * 2 }
+let expected_weights = []
+for x in ints { push(expected_weights, weigh(x)) }
+let expected_twice = []
+for x in floats { push(expected_twice, twice(x)) }
+'''
+
+IMPURE = {
+    "print": ('func f(x) { print(x) }', "'f' prints output", 1),
+    "captured assignment": ('let t = 0\nfunc f(x) {\n    t += x\n    return t\n}', "assigns to captured variable 't'", 3),
+    "parameter mutation": ('func f(x) {\n    push(x, 1)\n    return x\n}', "modifies 'x'", 2),
+    "captured index assignment": ('let cache = [0]\nfunc f(x) {\n    cache[0] = x\n    return x\n}', "modifies 'cache'", 3),
+    "file output": ('func f(x) { return write_file("out.txt", x) }', "calls 'write_file'", 1),
+    "impure helper": ('func log(x) { print(x) }\nfunc f(x) {\n    log(x)\n    return x\n}', "'log' prints output", 1),
+    "generator": ('func f(x) { yield x }', "generator function 'f'", 0),
+    "two parameters": ('func f(x, y) { return x }', "must take 1 argument", 0),
+    "captured channel": ('let c = channel()\nfunc f(x) { return c }', "cannot send a channel", 0),
+}
+
+
+def run(source: str) -> Interpreter:
+    interpreter = Interpreter(echo=False)
+    interpreter.execute(parse(tokenize(source)))
+    return interpreter
+
+
+def check(label: str, ok: bool, detail: str = "") -> bool:
+    print(f"  [{'OK' if ok else 'FAIL'}] {label}{': ' + detail if detail else ''}")
+    return ok
+
+
+def check_results() -> bool:
+    passed = True
+    interpreter = run(PROGRAM % {'n': 600})
+    expected = interpreter.global_env.get('expected')
+    for workers in (1, 2):
+        parallel.configure(workers)
+        for chunk in (1, 37, 600, None):
+            call = 'pmap(score, data)' if chunk is None else f'pmap(score, data, {chunk})'
+            interpreter.execute(parse(tokenize(f'let result = {call}\n')))
+            result = interpreter.global_env.get('result')
+            passed &= check(f"{workers} worker(s), chunk {chunk or 'default'}", result == expected,
+                            f"{len(result)} results")
+    interpreter.execute(parse(tokenize('let empty = pmap(score, [])\n')))
+    passed &= check("empty array", interpreter.global_env.get('empty') == [])
+    return passed
+
+
+def check_shared() -> bool:
+    n = parallel.SHARED_MIN + 100
+    interpreter = run(SHARED % {'n': n})
+    env = interpreter.global_env
+    passed = check("typed and float arrays use shared memory",
+                   parallel._numeric_buffer(env.get('ints')) is not None
+                   and parallel._numeric_buffer(env.get('floats')) is not None)
+    interpreter.execute(parse(tokenize(
+        'let got_weights = pmap(weigh, ints, 5000)\nlet got_twice = pmap(twice, floats, 5000)\n')))
+    passed &= check("int_array input with a captured float_array",
+                    list(env.get('got_weights')) == list(env.get('expected_weights')))
+    passed &= check("float list input", env.get('got_twice') == env.get('expected_twice'))
+    return passed
+
+
+def check_errors() -> bool:
+    passed = True
+    for label, (declaration, message, line) in IMPURE.items():
+        try:
+            run(declaration + '\nlet r = pmap(f, [[1], [2], [3]], 1)\n')
+            passed &= check(label, False, "no error")
+        except MiniLangRuntimeError as e:
+            passed &= check(label, message in e.message and e.line == line, f"line {e.line}: {e.message}")
+
+    try:
+        run('func f(x) {\n    let y = x - 5\n    return 10 / y\n}\nlet r = pmap(f, range(10), 2)\n')
+        passed &= check("error inside a worker", False, "no error")
+    except MiniLangRuntimeError as e:
+        passed &= check("error inside a worker", e.message == "Division by zero" and e.line == 3,
+                        f"line {e.line}: {e.message}")
+    return passed
+
+
+def check_pool_reuse() -> bool:
+    parallel.configure(2)
+    interpreter = run('func inc(x) { return x + 1 }\nlet a = pmap(inc, range(100), 10)\n')
+    executor = parallel._executor
+    interpreter.execute(parse(tokenize('let b = pmap(inc, a, 10)\n')))
+    ok = parallel._executor is executor and interpreter.global_env.get('b') == list(range(2, 102))
+    return check("worker pool is kept between calls", ok)
+
+
+class RecordingExecutor:
+    """작업자 풀이 받은 조각 작업의 pickle 크기를 기록"""
+
+    def __init__(self, executor, sizes: list):
+        self.executor = executor
+        self.sizes = sizes
+
+    def map(self, fn, tasks):
+        tasks = list(tasks)
+        self.sizes.extend(len(pickle.dumps(task)) for task in tasks)
+        return self.executor.map(fn, tasks)
+
+
+def check_payload_once() -> bool:
+    parallel.configure(2)
+    interpreter = run('let names = []\nfor i in range(20000) { push(names, "name" + str(i)) }\n'
+                      'func pick(i) { return names[i * 13 % 20000] }\n')
+    sizes = []
+    get_executor = parallel._get_executor
+    parallel._get_executor = lambda: RecordingExecutor(get_executor(), sizes)
+    try:
+        interpreter.execute(parse(tokenize('let picked = pmap(pick, range(400), 10)\n')))
+    finally:
+        parallel._get_executor = get_executor
+    names = interpreter.global_env.get('names')
+    ok = interpreter.global_env.get('picked') == [names[i * 13 % 20000] for i in range(400)]
+    passed = check("results with a large captured array", ok)
+    passed &= check("chunk tasks do not carry the function", len(sizes) == 40 and max(sizes) < 2000,
+                    f"{len(sizes)} tasks, largest {max(sizes)} bytes")
+    return passed
+
+
+def main() -> int:
+    passed = True
+    try:
+        print("=== 순차 실행과 비교 ===")
+        passed &= check_results()
+        print("=== 공유 메모리 ===")
+        passed &= check_shared()
+        print("=== 순수성 검사와 에러 ===")
+        passed &= check_errors()
+        print("=== 작업자 풀 ===")
+        passed &= check_pool_reuse()
+        print("=== 함수는 한 번만 전달 ===")
+        passed &= check_payload_once()
+    finally:
+        parallel.shutdown()
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+스냅숏 저장/복원 테스트
+목적: 1) 초기화 스크립트(배열, 맵, 공유 배열, 자기 참조 배열, 클로저 카운터, 내장 함수 별칭, 타입 배열,
+         행렬, range, 뷰, 빌더, 모듈 import, 자주 호출되어 컴파일된 함수)를 실행해 스냅숏을 저장하고,
+         새 인터프리터에서 복원한 뒤 이어서 실행한 결과를 한 인터프리터에서 둘 다 실행한 결과와 비교
+      2) 같은 비교를 main.py --snapshot-after-init / --restore로 다른 프로세스에서 실행
+      3) 공유 구조와 순환이 같은 객체로 복원되는지, 변수를 처음 사용할 때만 레코드를 읽는지 확인
+      4) 깊게 중첩된 배열, 복원한 상태의 재저장, 스트림을 저장하려 할 때의 에러
+기대 결과: 출력이 모두 같고, 복원 직후에는 모듈이 내보낸 함수의 레코드만 읽으며, 스트림은 변수 이름과 함께
+          SnapshotError가 발생함
+
+실행: python tests/snapshot_roundtrip.py
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_DIR = os.path.join(TESTS_DIR, '..', 'src')
+sys.path.insert(0, SRC_DIR)
+
+from lexer import tokenize
+from parser import parse
+from interpreter import Interpreter
+from snapshot import SnapshotError
+
+
+MATHLIB = os.path.join(TESTS_DIR, 'modules', 'mathlib.ml').replace('\\', '/')
+
+INIT_SCRIPT = '''
+import "%s"
+
+let squares = []
+for (let i = 0; i < 1000; i += 1) { push(squares, i * i) }
+let alias = squares
+let index = {"squares": squares, "count": len(squares)}
+let ring = [1, 2]
+push(ring, ring)
+let nested = [[1, 2], [3, [4, 5]]]
+
+func makeCounter(start) {
+    let count = start
+    func inc() {
+        count += 1
+        return count
+    }
+    return inc
+}
+let counter = makeCounter(10)
+counter()
+let counters = [counter, makeCounter(100)]
+
+let size = len
+let len = 3
+let greeting = "hello, " + repeat("x", 5)
+let ints = int_array(5)
+ints[2] = 7
+let grid = matrix(2, 2)
+grid[1][0] = 4.5
+let firstRow = grid[0]
+let lazy = range(5, 50)
+let view = squares[10:13]
+let sb = builder()
+append(sb, "ab")
+append(sb, "cd")
+
+func lookup(k) { return squares[k] + index["count"] }
+for (let i = 0; i < 200; i += 1) { lookup(i) }
+let sq = square(6)
+''' % MATHLIB
+
+USE_SCRIPT = '''
+let other = counters[1]
+let first = counters[0]
+print(lookup(7), counter(), counter(), other(), first())
+print(size(greeting), len, greeting)
+push(alias, -1)
+print(size(squares), index["squares"][1000], view)
+print(ring[2][2][0], nested)
+print(ints, grid, firstRow, lazy[3], size(lazy))
+append(sb, "ef")
+print(build(sb))
+print(square(9), call_count(), sq, describe(2))
+import "%s"
+print(call_count())
+''' % MATHLIB
+
+
+def run(source: str, interpreter: Interpreter):
+    interpreter.execute(parse(tokenize(source)))
+    return interpreter.output
+
+
+def check(label: str, ok: bool, detail: str = "") -> bool:
+    print(f"  [{'OK' if ok else 'FAIL'}] {label}{': ' + detail if detail else ''}")
+    return ok
+
+
+def check_roundtrip(directory: str) -> bool:
+    expected = Interpreter(echo=False)
+    run(INIT_SCRIPT, expected)
+    init_output = list(expected.output)
+    expected = run(USE_SCRIPT, expected)[len(init_output):]
+
+    path = os.path.join(directory, 'state.snap')
+    init = Interpreter(echo=False)
+    run(INIT_SCRIPT, init)
+    init.snapshot(path)
+
+    restored = Interpreter(echo=False)
+    restored.restore(path)
+    loader = restored.global_env.loader
+    exports = sum(len(functions) for functions in restored.modules.values())
+    passed = check("restore reads only module exports until variables are used",
+                   loader.loaded_records == exports, f"{exports} of {len(loader.records)} records")
+
+    squares = restored.global_env.get('squares')
+    loaded = loader.loaded_records - exports
+    passed &= check("one variable loads only what it references", loaded == 1,
+                    f"{loaded} of {len(loader.records)} records")
+    env = restored.global_env
+    ring = env.get('ring')
+    counters = env.get('counters')
+    passed &= check("shared structure and cycles keep identity",
+                    env.get('alias') is squares and env.get('index')['squares'] is squares
+                    and ring[2] is ring and counters[0] is env.get('counter')
+                    and env.get('view').parent is squares and env.get('firstRow').matrix is env.get('grid'))
+    passed &= check("functions do not carry compiled code", env.get('lookup').profile is None)
+
+    actual = run(USE_SCRIPT, restored)
+    passed &= check("restored interpreter continues like the original", actual == expected,
+                    f"{len(actual)} lines")
+    if actual != expected:
+        print(f"         expected: {expected}")
+        print(f"         actual:   {actual}")
+
+    # 복원한 상태(일부만 로드됨)를 다시 저장해도 같은 상태
+    again = os.path.join(directory, 'again.snap')
+    second = Interpreter(echo=False)
+    second.restore(path)
+    second.snapshot(again)
+    third = Interpreter(echo=False)
+    third.restore(again)
+    passed &= check("a restored state can be snapshotted again", run(USE_SCRIPT, third) == expected)
+    return passed
+
+
+def check_processes(directory: str) -> bool:
+    paths = {}
+    for name, source in (('init.ml', INIT_SCRIPT), ('use.ml', USE_SCRIPT)):
+        paths[name] = os.path.join(directory, name)
+        with open(paths[name], 'w', encoding='utf-8') as f:
+            f.write(source)
+    snap_path = os.path.join(directory, 'cli.snap')
+    main = os.path.join(SRC_DIR, 'main.py')
+    first = subprocess.run([sys.executable, main, '--snapshot-after-init', snap_path, paths['init.ml']],
+                           capture_output=True, text=True)
+    second = subprocess.run([sys.executable, main, '--restore', snap_path, paths['use.ml']],
+                            capture_output=True, text=True)
+
+    expected = Interpreter(echo=False)
+    run(INIT_SCRIPT, expected)
+    skip = len(expected.output)
+    expected = run(USE_SCRIPT, expected)[skip:]
+    actual = second.stdout.splitlines()
+    ok = first.returncode == 0 and second.returncode == 0 and actual == expected
+    passed = check("--snapshot-after-init then --restore in a new process", ok, f"{len(actual)} lines")
+    if not ok:
+        print(f"         init:    {first.stdout.strip()} {first.stderr.strip()}")
+        print(f"         restore: {second.stdout.strip()} {second.stderr.strip()}")
+    return passed
+
+
+def check_deep(directory: str) -> bool:
+    path = os.path.join(directory, 'deep.snap')
+    init = Interpreter(echo=False)
+    run('''
+let deep = []
+let cur = deep
+for (let i = 0; i < 20000; i += 1) {
+    let next = []
+    push(cur, next)
+    cur = next
+}
+''', init)
+    init.snapshot(path)
+    restored = Interpreter(echo=False)
+    restored.restore(path)
+    output = run('''
+let depth = 0
+let node = deep
+while len(node) > 0 {
+    node = node[0]
+    depth += 1
+}
+push(cur, "end")
+print(depth, node)
+''', restored)
+    return check("deeply nested arrays", output == ['20000 [end]'], str(output))
+
+
+def check_stream(directory: str) -> bool:
+    init = Interpreter(echo=False)
+    run('let lines = read_lines("%s")' % MATHLIB, init)
+    try:
+        init.snapshot(os.path.join(directory, 'stream.snap'))
+    except SnapshotError as e:
+        return check("open streams are rejected", "'lines'" in str(e), str(e))
+    return check("open streams are rejected", False, "no error")
+
+
+def main() -> int:
+    passed = True
+    with tempfile.TemporaryDirectory() as directory:
+        print("=== 같은 프로세스에서 복원 ===")
+        passed &= check_roundtrip(directory)
+        print("=== 다른 프로세스에서 복원 (main.py) ===")
+        passed &= check_processes(directory)
+        print("=== 깊은 구조와 저장할 수 없는 값 ===")
+        passed &= check_deep(directory)
+        passed &= check_stream(directory)
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+클로저 메모리 테스트
+목적: 1) 큰 배열이 있는 스코프에서 클로저 10만 개를 만든 뒤(반복문 안에서 선언) 스코프가 끝나면
+         클로저가 쓰지 않는 배열이 해제되는지 확인
+      2) 팩토리 함수가 반환한 클로저들이 팩토리 안의 큰 배열을 붙잡지 않는지 확인
+      3) 최상위 함수와 자유 변수가 없는 중첩 함수는 전역 환경만 참조하는지 확인
+기대 결과: 큰 배열이 있을 때와 없을 때 남아 있는 메모리 차이가 배열 크기보다 훨씬 작고,
+          클로저가 캡처한 값은 그대로 읽힘
+
+실행: python tests/stress_closure_memory.py
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from lexer import tokenize
+from parser import parse
+from interpreter import Interpreter
+
+
+CLOSURES = 100000
+BIG = 1000000
+
+LOOP_SCRIPT = '''
+func build(n, size) {
+    let big = copy(range(size))
+    let out = []
+    for (let i = 0; i < n; i += 1) {
+        let id = i
+        func get() { return id }
+        push(out, get)
+    }
+    return out
+}
+let closures = build(%d, %d)
+let first = closures[0]
+let last = closures[len(closures) - 1]
+print(first(), last(), len(closures))
+'''
+
+FACTORY_SCRIPT = '''
+func makeScaler(k, size) {
+    let table = copy(range(size))
+    let scale = k * 2
+    func apply(x) { return x * scale }
+    return apply
+}
+let scalers = []
+for (let k = 0; k < %d; k += 1) {
+    push(scalers, makeScaler(k, %d))
+}
+let s = scalers[len(scalers) - 1]
+print(s(3))
+'''
+
+
+def retained(source: str):
+    """프로그램을 실행한 뒤 (출력, 인터프리터가 붙잡고 있는 메모리 바이트)"""
+    program = parse(tokenize(source))
+    gc.collect()
+    tracemalloc.start()
+    interpreter = Interpreter(echo=False, tiering=False)
+    interpreter.execute(program)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return interpreter.output, current
+
+
+def check_scope(label: str, script: str, count: int, size: int, arrays: int) -> bool:
+    output, with_big = retained(script % (count, size))
+    expected, without_big = retained(script % (count, 0))
+    big_bytes = arrays * size * (8 + 28)  # 리스트 슬롯 + int 객체
+    extra = with_big - without_big
+    ok = output == expected and extra < big_bytes // 10
+    print(f"  [{'OK' if ok else 'FAIL'}] {label}: {output[0]}")
+    print(f"         retained {with_big / 1e6:.1f} MB with arrays, {without_big / 1e6:.1f} MB without "
+          f"(arrays alone would be {big_bytes / 1e6:.1f} MB)")
+    return ok
+
+
+def check_top_level() -> bool:
+    interpreter = Interpreter(echo=False, tiering=False)
+    interpreter.execute(parse(tokenize('''
+let limit = 10
+func top(x) { return x < limit }
+func factory() {
+    let big = copy(range(1000))
+    func pure(a) { return a * 2 }
+    func uses() { return len(big) }
+    return [pure, uses]
+}
+let pair = factory()
+''')))
+    env = interpreter.global_env
+    pure, uses = env.get('pair')
+    ok = env.get('top').closure is env and pure.closure is env and uses.closure is not env
+    ok &= list(uses.closure.variables) == ['big']
+    print(f"  [{'OK' if ok else 'FAIL'}] top-level and pure nested functions capture only the global scope")
+    return ok
+
+
+def main() -> int:
+    passed = True
+    print(f"=== 반복문 안의 클로저 {CLOSURES}개 ===")
+    passed &= check_scope("closures declared in a loop", LOOP_SCRIPT, CLOSURES, BIG, 1)
+    print("=== 팩토리가 반환한 클로저 ===")
+    passed &= check_scope("closures returned from factories", FACTORY_SCRIPT, 200, 50000, 200)
+    print("=== 캡처 범위 ===")
+    passed &= check_top_level()
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+스레드 스트레스 테스트
+목적: 하나의 파싱된 Program을 32개 스레드에서 동시에 실행
+기대 결과: 모든 실행의 출력이 단일 스레드 실행 결과와 동일
+
+실행: python tests/stress_threads.py
+"""
+
+import os
+import queue
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from lexer import tokenize
+from parser import parse
+from interpreter import Interpreter
+
+
+THREADS = 32
+RUNS_PER_THREAD = 8
+SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test11_algorithms.ml')
+
+
+def main() -> int:
+    with open(SCRIPT, 'r', encoding='utf-8') as f:
+        program = parse(tokenize(f.read()))
+
+    reference = Interpreter(echo=False)
+    reference.execute(program)
+    expected = reference.output
+
+    # 인터프리터 풀: 스레드 수만큼 만들어 reset()으로 재사용
+    pool: "queue.SimpleQueue[Interpreter]" = queue.SimpleQueue()
+    for _ in range(THREADS):
+        pool.put(Interpreter(echo=False))
+
+    def run_once(_):
+        interpreter = pool.get()
+        try:
+            interpreter.reset()
+            interpreter.execute(program)
+            return interpreter.output == expected
+        finally:
+            pool.put(interpreter)
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        results = list(executor.map(run_once, range(THREADS * RUNS_PER_THREAD)))
+
+    failures = results.count(False)
+    print(f"{len(results)} runs on {THREADS} threads: {failures} mismatches")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
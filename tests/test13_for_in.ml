@@ -0,0 +1,70 @@
+// Test 13: for-in 반복문과 지연 range
+// 목적: 배열, 문자열, range를 for-in으로 순회하고 range가 배열처럼 동작하는지 테스트
+// 기대 결과: 각 순회 결과와 range 연산 결과가 올바르게 출력됨
+
+print("=== for-in 반복문 테스트 ===")
+
+// 1. 배열 순회
+print("\n--- 배열 순회 ---")
+let fruits = ["apple", "banana", "cherry"]
+for fruit in fruits {
+    print("과일:", fruit)
+}
+
+// 2. 문자열 순회
+print("\n--- 문자열 순회 ---")
+let word = "abc"
+let chars = []
+for ch in word {
+    push(chars, ch)
+}
+print("문자들:", chars)
+
+// 3. range 순회
+print("\n--- range 순회 ---")
+let total = 0
+for i in range(1, 101) {
+    total += i
+}
+print("1부터 100까지 합:", total)
+
+for (i in range(10, 0, -3)) {
+    print("i =", i)
+}
+
+// 4. break / continue
+print("\n--- break / continue ---")
+for n in range(10) {
+    if n % 2 == 0 {
+        continue
+    }
+    if n > 7 {
+        break
+    }
+    print("홀수:", n)
+}
+
+// 5. 중첩 순회
+print("\n--- 중첩 순회 ---")
+for row in [[1, 2], [3, 4]] {
+    for x in row {
+        print(x * 10)
+    }
+}
+
+// 6. 큰 range는 원소를 미리 만들지 않음
+print("\n--- 지연 range ---")
+let big = range(10000000)
+print("len(big) =", len(big))
+print("big[9999999] =", big[9999999])
+print("type(big) =", type(big))
+
+// 7. 수정하면 배열로 바뀜
+let r = range(5)
+r[0] = 100
+push(r, 5)
+print("수정된 range:", r)
+print("range(3) == [0, 1, 2]:", range(3) == [0, 1, 2])
+print("range(2) + [9]:", range(2) + [9])
+
+print("\n=== 테스트 13 완료 ===")
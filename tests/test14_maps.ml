@@ -0,0 +1,68 @@
+// Test 14: 맵 (해시 맵)
+// 목적: 맵 리터럴, 키 접근/대입, keys/values/has/del 내장 함수 테스트
+// 기대 결과: 맵 연산 결과가 올바르게 출력됨
+
+print("=== 맵 테스트 ===")
+
+// 1. 맵 리터럴과 접근
+print("\n--- 맵 리터럴 ---")
+let ages = {"alice": 30, "bob": 25}
+print("ages =", ages)
+print("ages[\"alice\"] =", ages["alice"])
+print("len(ages) =", len(ages))
+print("type(ages) =", type(ages))
+
+// 2. 여러 줄 리터럴과 다양한 키 타입
+let mixed = {
+    1: "one",
+    "two": 2,
+    2.5: "float",
+}
+print("mixed[1] =", mixed[1])
+print("mixed[\"two\"] =", mixed["two"])
+
+// 3. 대입과 복합 대입
+print("\n--- 대입 ---")
+ages["carol"] = 41
+ages["bob"] += 1
+print("ages =", ages)
+
+// 4. 내장 함수
+print("\n--- 내장 함수 ---")
+print("keys:", keys(ages))
+print("values:", values(ages))
+print("has(ages, \"bob\"):", has(ages, "bob"))
+print("has(ages, \"dave\"):", has(ages, "dave"))
+print("del(ages, \"alice\"):", del(ages, "alice"))
+print("ages =", ages)
+
+// 5. 참/거짓과 순회
+print("\n--- 순회 ---")
+let empty = {}
+if not empty {
+    print("빈 맵은 거짓")
+}
+for name in ages {
+    print(name, "->", ages[name])
+}
+
+// 6. 단어 세기
+print("\n--- 단어 세기 ---")
+let counts = {}
+for w in ["a", "b", "a", "c", "b", "a"] {
+    if has(counts, w) {
+        counts[w] += 1
+    } else {
+        counts[w] = 1
+    }
+}
+print("counts =", counts)
+
+// 7. 숫자 키와 불리언 (true/false는 키가 될 수 없으므로 1/0 키와 섞이지 않음)
+print("\n--- 숫자 키 ---")
+let nums = {1: "one", 0: "zero"}
+nums[1.5] = "one and a half"
+print(nums[1], nums[0], nums[1.5])
+print(has(nums, true), has(nums, false), len(keys(nums)))
+
+print("\n=== 테스트 14 완료 ===")
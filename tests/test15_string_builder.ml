@@ -0,0 +1,58 @@
+// Test 15: 문자열 빌더
+// 목적: builder/append/build 내장 함수, 빌더에 대한 +=, 빌더와 문자열의 비교와 + 연결 테스트
+// 기대 결과: 빌더로 만든 문자열이 올바르게 출력됨
+
+print("=== 문자열 빌더 테스트 ===")
+
+// 1. 기본 사용
+print("\n--- append / build ---")
+let sb = builder("Hello")
+append(sb, ", ", "World", "!")
+print("build(sb) =", build(sb))
+print("len(sb) =", len(sb))
+print("type(sb) =", type(sb))
+
+// 2. += 는 제자리에서 추가
+print("\n--- += ---")
+let report = builder()
+for i in range(1, 6) {
+    report += i
+    if i < 5 {
+        report += ","
+    }
+}
+print("report =", report)
+print("report[2] =", report[2])
+print("report == \"1,2,3,4,5\":", report == "1,2,3,4,5")
+
+// 3. 별칭은 같은 빌더를 공유
+let alias = report
+alias += "!"
+print("report =", build(report))
+
+// 4. 빈 빌더
+let empty = builder()
+if not empty {
+    print("빈 빌더는 거짓")
+}
+print("문자열과 연결:", "[" + empty + "]")
+
+// 5. 크기 비교는 합친 문자열로
+let first = builder("apple")
+let second = builder("ban")
+second += "ana"
+print("first < \"banana\":", first < "banana")
+print("\"cherry\" > second:", "cherry" > second)
+print("first >= second:", first >= second)
+let fruits = [second, "cherry", first]
+sort(fruits)
+print("sorted =", fruits)
+
+// 6. + 는 합친 문자열로 연결한 새 문자열 (빌더는 그대로)
+let joined = first + second
+print("first + second =", joined, type(joined))
+print("first + \"!\" =", first + "!")
+print("빌더 + 숫자 =", second + 1)
+print("first =", first, type(first))
+
+print("\n=== 테스트 15 완료 ===")
@@ -0,0 +1,51 @@
+// Test 16: 배열 일괄 처리 내장 함수
+// 목적: sort, slice, reverse, index_of, contains, sum, extend, fill 테스트
+// 기대 결과: 각 함수의 결과가 올바르게 출력됨
+
+print("=== 배열 내장 함수 테스트 ===")
+
+// 1. 정렬
+print("\n--- sort ---")
+let nums = [64, 34, 25, 12, 22, 11, 90]
+sort(nums)
+print("오름차순:", nums)
+
+func descending(a, b) {
+    return b - a
+}
+print("내림차순:", sort(nums, descending))
+
+func byLength(a, b) {
+    return len(a) < len(b)
+}
+print("길이순:", sort(["ccc", "a", "bb", "dddd"], byLength))
+print("range 정렬:", sort(range(5, 0, -1)))
+
+// 2. 부분 배열과 뒤집기
+print("\n--- slice / reverse ---")
+let letters = ["a", "b", "c", "d", "e"]
+print("slice(letters, 1, 3):", slice(letters, 1, 3))
+print("slice(letters, 2):", slice(letters, 2))
+print("slice(\"MiniLang\", 0, 4):", slice("MiniLang", 0, 4))
+print("reverse(letters):", reverse(letters))
+print("reverse(\"abc\"):", reverse("abc"))
+
+// 3. 탐색
+print("\n--- index_of / contains ---")
+print("index_of(letters, \"c\"):", index_of(letters, "c"))
+print("index_of(letters, \"z\"):", index_of(letters, "z"))
+print("index_of(range(100), 42):", index_of(range(100), 42))
+print("contains(letters, \"a\"):", contains(letters, "a"))
+print("contains(\"hello\", \"ell\"):", contains("hello", "ell"))
+print("contains({\"k\": 1}, \"k\"):", contains({"k": 1}, "k"))
+
+// 4. 합계, 확장, 채우기
+print("\n--- sum / extend / fill ---")
+print("sum(range(1, 101)):", sum(range(1, 101)))
+print("sum([1.5, 2.5]):", sum([1.5, 2.5]))
+let base = [1, 2]
+extend(base, [3, 4])
+print("extend:", base)
+print("fill:", fill(base, 0))
+
+print("\n=== 테스트 16 완료 ===")
@@ -0,0 +1,56 @@
+// Test 17: 타입 배열과 일괄 연산
+// 목적: int_array/float_array 생성, 인덱스 접근, 원소별 연산, 집계 함수 테스트
+// 기대 결과: 일괄 연산과 집계 결과가 올바르게 출력됨
+
+print("=== 타입 배열 테스트 ===")
+
+// 1. 생성과 인덱스 접근
+print("\n--- 생성 ---")
+let zeros = int_array(5)
+print("int_array(5) =", zeros)
+let xs = float_array([1, 2, 3, 4])
+print("float_array([1, 2, 3, 4]) =", xs)
+print("type(xs) =", type(xs), ", len(xs) =", len(xs))
+
+for i in range(len(zeros)) {
+    zeros[i] = i * i
+}
+zeros[1] += 10
+print("zeros =", zeros)
+print("zeros[4] =", zeros[4])
+
+// 2. 원소별 연산
+print("\n--- 원소별 연산 ---")
+let a = int_array([1, 2, 3])
+let b = int_array([10, 20, 30])
+print("a + b =", a + b)
+print("b - a =", b - a)
+print("a * 2 =", a * 2)
+print("a * 0.5 =", a * 0.5)
+print("b / a =", b / a)
+print("10 - a =", 10 - a)
+print("a ** 2 =", a ** 2)
+print("b % 7 =", b % 7)
+print("a == [1, 2, 3]:", a == [1, 2, 3])
+print("설명: " + a)
+
+// 3. 집계
+print("\n--- 집계 ---")
+print("sum(b) =", sum(b))
+print("min(b) =", min(b), ", max(b) =", max(b))
+print("dot(a, b) =", dot(a, b))
+print("dot([1, 2], [3, 4]) =", dot([1, 2], [3, 4]))
+print("min([4, 2, 8]) =", min([4, 2, 8]))
+
+// 4. 배열 함수와 순회
+print("\n--- 배열 함수 ---")
+push(a, 4)
+print("push(a, 4) =", a)
+print("sort(int_array([3, 1, 2])) =", sort(int_array([3, 1, 2])))
+let total = 0.0
+for v in xs {
+    total += v
+}
+print("for-in 합계 =", total)
+
+print("\n=== 테스트 17 완료 ===")
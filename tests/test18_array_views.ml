@@ -0,0 +1,62 @@
+// Test 18: 배열 뷰 (슬라이스)
+// 목적: arr[a:b] 슬라이스 문법, 부모 배열과 저장 공간 공유, copy() 테스트
+// 기대 결과: 뷰를 통한 읽기/쓰기가 부모 배열에 반영되고 copy()는 독립된 배열을 만듦
+
+print("=== 배열 뷰 테스트 ===")
+
+// 1. 슬라이스 문법
+print("\n--- 슬라이스 ---")
+let arr = [10, 20, 30, 40, 50, 60]
+print("arr[1:4] =", arr[1:4])
+print("arr[:2] =", arr[:2])
+print("arr[4:] =", arr[4:])
+print("arr[:] =", arr[:])
+print("arr[-2:] =", arr[-2:])
+print("len(arr[2:5]) =", len(arr[2:5]))
+print("\"MiniLang\"[4:] =", "MiniLang"[4:])
+
+// 2. 부모와 저장 공간 공유
+print("\n--- 쓰기 반영 ---")
+let view = arr[1:4]
+view[0] = 21
+view[2] += 5
+print("view =", view)
+print("arr =", arr)
+
+// 3. 뷰의 뷰와 순회
+let inner = view[1:]
+print("inner =", inner, ", inner[0] =", inner[0])
+let total = 0
+for x in inner {
+    total += x
+}
+print("inner 합계 =", total)
+
+// 4. 제자리 정렬은 부모의 해당 구간만 정렬
+let data = [9, 7, 5, 3, 1, 0]
+sort(data[1:5])
+print("data =", data)
+
+// 5. copy()는 독립된 배열
+print("\n--- copy ---")
+let snapshot = copy(arr[0:3])
+snapshot[0] = 0
+push(snapshot, 99)
+print("snapshot =", snapshot)
+print("arr =", arr)
+
+// 6. 분할 정복: 뷰를 이용한 재귀 합계
+print("\n--- 분할 정복 ---")
+func rangeSum(a) {
+    if len(a) == 0 {
+        return 0
+    }
+    if len(a) == 1 {
+        return a[0]
+    }
+    let mid = floor(len(a) / 2)
+    return rangeSum(a[:mid]) + rangeSum(a[mid:])
+}
+print("rangeSum(range(1, 101)) =", rangeSum(range(1, 101)))
+
+print("\n=== 테스트 18 완료 ===")
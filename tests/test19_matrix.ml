@@ -0,0 +1,60 @@
+// Test 19: 행렬
+// 목적: matrix 생성, m[i][j] 인덱싱, 행렬 곱셈/전치, 행/열 추출, 원소별 연산 테스트
+// 기대 결과: 행렬 연산 결과가 올바르게 출력됨
+
+print("=== 행렬 테스트 ===")
+
+// 1. 생성과 인덱싱
+print("\n--- 생성 ---")
+let m = matrix(2, 3)
+print("matrix(2, 3) =", m)
+print("type(m) =", type(m), ", len(m) =", len(m))
+m[0][1] = 5
+m[1][2] = 2.5
+m[1][0] += 1
+print("m =", m)
+print("m[0][1] =", m[0][1])
+
+let a = matrix([[1, 2], [3, 4]])
+let b = matrix([[5, 6], [7, 8]])
+print("a =", a)
+a[1] = [30, 40]
+print("a[1] = [30, 40] ->", a)
+a[1] = [3, 4]
+
+// 2. 행렬 곱셈과 전치
+print("\n--- 곱셈/전치 ---")
+print("matmul(a, b) =", matmul(a, b))
+print("transpose(m) =", transpose(m))
+let identity = matrix([[1, 0], [0, 1]])
+print("matmul(a, I) == a:", matmul(a, identity) == a)
+let v = matrix([[1], [1]])
+print("matmul(a, v) =", matmul(a, v))
+
+// 3. 행/열 추출
+print("\n--- 행/열 ---")
+print("row(a, 1) =", row(a, 1))
+print("col(a, 0) =", col(a, 0))
+print("type(row(a, 0)) =", type(row(a, 0)))
+for r in a {
+    print("  row:", r)
+}
+
+// 4. 원소별 연산
+print("\n--- 원소별 연산 ---")
+print("a + b =", a + b)
+print("b - a =", b - a)
+print("a * 2 =", a * 2)
+print("a * b =", a * b)
+print("10 - a =", 10 - a)
+print("a[0] + a[1] =", a[0] + a[1])
+
+// 5. 집계와 복사
+print("\n--- 집계/복사 ---")
+print("sum(a) =", sum(a), ", max(b) =", max(b), ", min(b) =", min(b))
+print("sum(a[1]) =", sum(a[1]))
+let c = copy(a)
+c[0][0] = 100
+print("a[0][0] =", a[0][0], ", c[0][0] =", c[0][0])
+
+print("\n=== 행렬 테스트 완료 ===")
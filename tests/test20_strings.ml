@@ -0,0 +1,52 @@
+// Test 20: 문자열 라이브러리
+// 목적: split, join, find, replace, substr, trim, upper/lower, starts_with/ends_with, repeat, format 테스트
+// 기대 결과: 각 문자열 함수의 결과가 올바르게 출력됨
+
+print("=== 문자열 라이브러리 테스트 ===")
+
+// 1. 분리와 결합
+print("\n--- split/join ---")
+let fields = split("alice,30,seoul", ",")
+print("split =", fields, ", len =", len(fields))
+print("split (공백) =", split("  a  b\tc \n"))
+print("split (문자) =", split("abc", ""))
+print("join =", join(fields, " | "))
+print("join (숫자) =", join([1, 2, 3], "-"))
+print("join (구분자 없음) =", join(["x", "y", "z"]))
+
+// 2. 검색과 치환
+print("\n--- find/replace ---")
+let text = "the cat sat on the mat"
+print("find(text, \"at\") =", find(text, "at"))
+print("find(text, \"at\", 6) =", find(text, "at", 6))
+print("find(text, \"dog\") =", find(text, "dog"))
+print("replace =", replace(text, "at", "og"))
+print("replace (1회) =", replace(text, "the", "a", 1))
+
+// 3. 부분 문자열과 공백 제거
+print("\n--- substr/trim ---")
+print("substr(text, 4, 3) =", substr(text, 4, 3))
+print("substr(text, 19) =", substr(text, 19))
+print("substr(text, -3) =", substr(text, -3))
+print("trim =", "[" + trim("   padded  \n") + "]")
+print("trim (문자 지정) =", trim("--name--", "-"))
+
+// 4. 대소문자, 접두사/접미사, 반복
+print("\n--- upper/lower/starts_with/ends_with/repeat ---")
+print(upper("MiniLang"), lower("MiniLang"))
+print(starts_with("error: disk full", "error"), ends_with("report.csv", ".txt"))
+print(repeat("ab", 3), "[" + repeat("x", 0) + "]")
+
+// 5. 형식화
+print("\n--- format ---")
+print(format("{} + {} = {}", 1, 2, 3))
+print(format("{1} {0}", "world", "hello"))
+print(format("pi = {:.3f}, [{:>5}], [{:<4}]", 3.14159, 42, "ab"))
+print(format("{} {} {{literal}}", true, [1, 2]))
+
+// 6. 문자열 빌더 인자
+let sb = builder("a,b")
+append(sb, ",c")
+print("split(builder) =", split(sb, ","))
+
+print("\n=== 문자열 라이브러리 테스트 완료 ===")
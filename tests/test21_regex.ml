@@ -0,0 +1,46 @@
+// Test 21: 정규식
+// 목적: match, search, find_all, regex_replace와 컴파일된 패턴 캐시 통계 테스트
+// 기대 결과: 일치 결과 맵과 치환 결과가 올바르게 출력되고, 반복 사용한 패턴은 캐시에서 재사용됨
+
+print("=== 정규식 테스트 ===")
+
+// 1. match (문자열 시작에서 일치)
+print("\n--- match ---")
+let m = match("(\\w+)-(\\d+)", "item-42 rest")
+print("text =", m["text"], ", start =", m["start"], ", end =", m["end"])
+print("groups =", m["groups"])
+print("match 실패 =", match("\\d+", "abc 123"))
+
+// 2. search (어디서든 일치, 이름 있는 그룹)
+print("\n--- search ---")
+let s = search("(?P<user>\\w+)@(?P<host>[\\w.]+)", "contact: kim@example.com")
+print("named =", s["named"])
+print("user =", s["named"]["user"], ", at =", s["start"])
+print("플래그 i =", search("WARN", "disk warn", "i")["text"])
+
+// 3. find_all
+print("\n--- find_all ---")
+print(find_all("\\d+", "a1 b22 c333"))
+print(find_all("(\\w)=(\\d)", "x=1, y=2"))
+print(find_all("z", "abc"))
+
+// 4. regex_replace
+print("\n--- regex_replace ---")
+print(regex_replace("\\s+", "a   b \t c", " "))
+print(regex_replace("(\\w+)@(\\w+)", "kim@home lee@work", "\\2:\\1"))
+print(regex_replace("^", "line1\nline2", "> ", "m"))
+
+// 5. 반복문 안의 같은 패턴은 한 번만 컴파일
+print("\n--- 캐시 ---")
+let before = regex_cache_stats()
+let count = 0
+for i in range(100) {
+    if match("^id\\d+$", "id" + str(i)) != null {
+        count = count + 1
+    }
+}
+let after = regex_cache_stats()
+print("matched =", count)
+print("misses +", after["misses"] - before["misses"], ", hits +", after["hits"] - before["hits"])
+
+print("\n=== 정규식 테스트 완료 ===")
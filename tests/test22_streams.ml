@@ -0,0 +1,74 @@
+// Test 22: 파일 스트림 I/O
+// 목적: write_file/append_file, read_file, read_lines 스트림의 for-in/next 순회, remove_file 테스트,
+//       break/return으로 중간에 끝난 for-in 뒤에도 스트림을 이어서 읽을 수 있는지 확인
+// 기대 결과: 쓴 내용이 그대로 읽히고, 스트림은 끝에서(또는 close 이후) null을 반환함
+
+print("=== 파일 스트림 테스트 ===")
+
+let path = "test22_streams.tmp"
+
+// 1. 쓰기 (버퍼 쓰기 파일을 재사용)
+print("\n--- 쓰기 ---")
+write_file(path, "id,score\n")
+for i in range(1, 6) {
+    append_file(path, format("{},{}\n", i, i * 10))
+}
+print("read_file 길이 =", len(read_file(path)))
+
+// 2. for-in으로 줄 순회
+print("\n--- for-in ---")
+let total = 0
+let first = true
+for line in read_lines(path) {
+    if first {
+        first = false
+        continue
+    }
+    total += int(split(line, ",")[1])
+}
+print("total =", total)
+
+// 3. next()로 한 줄씩 읽기
+print("\n--- next ---")
+let lines = read_lines(path)
+print("type =", type(lines))
+let line = next(lines)
+while line != null {
+    print(" ", line)
+    line = next(lines)
+}
+print("끝 이후 next =", next(lines))
+
+// 4. 반복문을 중간에 벗어나도 스트림은 열려 있어 이어서 읽을 수 있음
+print("\n--- 중간에 끝난 for-in ---")
+let header = read_lines(path)
+for line in header {
+    print("첫 줄 =", line)
+    break
+}
+print("break 이후 next =", next(header))
+close(header)
+print("close 이후 next =", next(header))
+func first_score(p) {
+    let rows = read_lines(p)
+    for row in rows {
+        if row != "id,score" { return [row, rows] }
+    }
+}
+let found = first_score(path)
+let rest = []
+for row in found[1] { push(rest, row) }
+print("return한 줄 =", found[0], "/ 나머지 =", rest)
+
+// 5. 덮어쓰기
+print("\n--- 덮어쓰기 ---")
+write_file(path, "replaced")
+print(read_file(path))
+
+// 6. 중간에 닫기와 삭제
+let s = read_lines(path)
+close(s)
+print("close 이후 next =", next(s))
+remove_file(path)
+
+print("\n=== 파일 스트림 테스트 완료 ===")
@@ -0,0 +1,33 @@
+// Test 23: 모듈 import
+// 목적: import 문으로 모듈의 함수를 불러오고, 모듈이 한 번만 실행되며 자체 환경을 갖는지 테스트
+// 기대 결과: 모듈 로드 메시지는 한 번씩만 출력되고, 모듈 함수가 모듈의 전역 변수를 사용함
+
+print("=== 모듈 테스트 ===")
+
+import "modules/mathlib.ml"
+
+// 1. 모듈 함수 호출
+print("\n--- 함수 호출 ---")
+print("square(7) =", square(7))
+print("gcd(84, 36) =", gcd(84, 36))
+print(describe(3))
+
+// 2. 다시 import해도 모듈은 다시 실행되지 않음
+print("\n--- 재import ---")
+import "modules/mathlib.ml"
+print("call_count() =", call_count())
+
+// 3. 모듈의 전역 변수는 모듈 환경에 있음
+// (모듈이 import한 함수와 _로 시작하는 함수는 내보내지 않음)
+print("\n--- 스코프 ---")
+let calls = 100
+print("calls =", calls, ", call_count() =", call_count())
+
+// 4. 함수 안에서 import하면 그 스코프에만 정의됨
+func local_import() {
+    import "modules/strutil.ml"
+    return pad("x", 3) + "|"
+}
+print(local_import())
+
+print("\n=== 모듈 테스트 완료 ===")
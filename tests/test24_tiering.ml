@@ -0,0 +1,71 @@
+// Test 24: 단계별 실행 (자주 호출되는 함수의 컴파일과 탈최적화)
+// 목적: 임계값(1000번)을 넘게 호출/반복된 함수가 컴파일된 뒤에도 트리 순회와 같은 결과를 내는지,
+//       숫자 특수화나 내장 함수 가정이 깨지면 올바르게 트리 순회로 되돌아가는지 테스트
+// 기대 결과: 모든 값이 트리 순회 실행과 같음 (--stats로 승격/탈최적화 기록 확인 가능)
+
+print("=== 재귀 함수 ===")
+func fib(n) {
+    if n < 2 { return n }
+    return fib(n - 1) + fib(n - 2)
+}
+print(fib(18))
+print(fib(10))
+
+print("=== 숫자 특수화와 탈최적화 ===")
+func add(a, b) {
+    return a + b
+}
+let total = 0
+for (let i = 0; i < 1500; i += 1) {
+    total = add(total, i)
+}
+print(total)
+print(add("tier", "ing"))
+print(add("n = ", 3))
+print(add(0.5, 0.25))
+
+print("=== 반복문이 많은 함수 ===")
+func sumTo(n) {
+    let s = 0
+    let i = 0
+    while i < n {
+        s += i
+        i += 1
+    }
+    return s
+}
+for (let k = 0; k < 5; k += 1) {
+    print(sumTo(500))
+}
+
+print("=== 전역 변수와 내장 함수 ===")
+let scale = 2
+func scaled(arr) {
+    return len(arr) * scale
+}
+for (let i = 0; i < 1200; i += 1) {
+    scaled([1, 2, 3])
+}
+print(scaled([1, 2, 3]))
+scale = 10
+print(scaled([1, 2, 3]))
+func fakeLen(arr) {
+    return 100
+}
+len = fakeLen
+print(scaled([1, 2, 3]))
+
+print("=== 컴파일된 함수의 에러 ===")
+func safeDiv(x, y) {
+    if y == 0 {
+        return "div by zero"
+    }
+    return x / y
+}
+for (let i = 1; i < 1200; i += 1) {
+    safeDiv(i, i)
+}
+print(safeDiv(9, 3))
+print(safeDiv(1, 0))
+
+print("=== 완료 ===")
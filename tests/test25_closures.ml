@@ -0,0 +1,123 @@
+// Test 25: 클로저 캡처
+// 목적: 클로저가 쓰는 변수만 캡처하도록 바뀐 뒤에도 카운터 공유, 반복문 안의 클로저,
+//       중첩 클로저, 재귀 중첩 함수, 나중에 선언된 변수, 매개변수 캡처가 그대로 동작하는지 테스트
+// 기대 결과: 각 클로저가 선언된 스코프의 현재 값을 읽고 바꿈
+
+print("=== 카운터 ===")
+func makeCounter() {
+    let count = 0
+    let unused = [1, 2, 3]
+    func inc() {
+        count += 1
+        return count
+    }
+    return inc
+}
+let c1 = makeCounter()
+let c2 = makeCounter()
+print(c1(), c1(), c2())
+
+func sharedPair() {
+    let n = 0
+    func add() { n += 1 }
+    func get() { return n }
+    return [add, get]
+}
+let pair = sharedPair()
+let add = pair[0]
+let get = pair[1]
+add()
+add()
+print(get())
+
+print("=== 반복문 안의 클로저 ===")
+let fs = []
+for (let i = 0; i < 3; i += 1) {
+    let big = copy(range(1000))
+    func last() { return i * 10 }
+    push(fs, last)
+}
+for f in fs { print(f()) }
+
+let gs = []
+for x in ["a", "b", "c"] {
+    func gx() { return x }
+    push(gs, gx)
+}
+for g in gs { print(g()) }
+
+func total(values) {
+    let sum = 0
+    for v in values {
+        func addV() { sum += v }
+        addV()
+    }
+    return sum
+}
+print(total([1, 2, 3, 4]))
+
+print("=== 중첩 클로저 ===")
+func outer(a) {
+    func mid(b) {
+        func inner(c) { return a + b + c }
+        return inner
+    }
+    return mid
+}
+let m = outer(1)
+let inner = m(2)
+print(inner(3))
+
+func blockValue() {
+    if true {
+        let inBlock = 7
+        func readBlock() { return inBlock }
+        return readBlock
+    }
+}
+let rb = blockValue()
+print(rb())
+
+print("=== 재귀 중첩 함수 ===")
+func factorial(k) {
+    func fact(n) {
+        if n <= 1 { return 1 }
+        return n * fact(n - 1)
+    }
+    return fact(k)
+}
+print(factorial(5))
+
+print("=== 선언 순서와 매개변수 ===")
+func lateDef() {
+    func useLater() { return later }
+    let later = 42
+    return useLater()
+}
+print(lateDef())
+
+func shadow() {
+    let v = "before"
+    func show() { return v }
+    let first = show()
+    v = "after"
+    return [first, show()]
+}
+print(shadow())
+
+func bump(k) {
+    func next() {
+        k += 1
+        return k
+    }
+    next()
+    return next() + k
+}
+print(bump(10))
+
+let scale = 1
+func scaled(x) { return x * scale }
+scale = 3
+print(scaled(5))
+
+print("=== 완료 ===")
@@ -0,0 +1,107 @@
+// Test 26: 제너레이터
+// 목적: yield가 있는 함수가 제너레이터를 반환하고, for-in과 next()로 값을 하나씩 꺼낼 때
+//       본문이 다음 yield까지만 실행되는지, 무한 제너레이터, 제너레이터를 감싸는 제너레이터,
+//       매개변수와 클로저, 중간에 닫기, 본문의 return이 제대로 동작하는지 테스트
+// 기대 결과: 요청한 만큼만 값이 만들어지고, 끝난 제너레이터의 next()는 null
+
+print("=== 기본 ===")
+func countTo(n) {
+    for (let i = 1; i <= n; i += 1) {
+        yield i
+    }
+}
+for x in countTo(3) {
+    print(x)
+}
+let g = countTo(2)
+print(type(g), g)
+print(next(g), next(g), next(g), next(g))
+
+print("=== 실행 순서 ===")
+func traced() {
+    print("  start")
+    yield "a"
+    print("  after a")
+    yield "b"
+    print("  end")
+}
+let t = traced()
+print("created")
+print(next(t))
+print(next(t))
+print(next(t))
+
+print("=== 무한 제너레이터 ===")
+func fib() {
+    let a = 0
+    let b = 1
+    while true {
+        yield a
+        let next_a = b
+        b = a + b
+        a = next_a
+    }
+}
+let f = fib()
+let first = []
+for (let i = 0; i < 10; i += 1) {
+    push(first, next(f))
+}
+print(first)
+for v in f {
+    if v > 100 { break }
+}
+print(next(f))
+close(f)
+print(next(f))
+
+print("=== 제너레이터 조합 ===")
+func take(source, n) {
+    let count = 0
+    for v in source {
+        if count >= n {
+            return
+        }
+        yield v
+        count += 1
+    }
+}
+func evens(source) {
+    for v in source {
+        if v % 2 == 0 {
+            yield v
+        }
+    }
+}
+let picked = []
+for v in take(evens(fib()), 6) {
+    push(picked, v)
+}
+print(picked)
+
+print("=== 클로저와 값 없는 yield ===")
+func makeTicker(label) {
+    let ticks = 0
+    func ticker() {
+        while ticks < 3 {
+            ticks += 1
+            yield label + str(ticks)
+        }
+        yield
+    }
+    return ticker
+}
+let tick = makeTicker("t")
+for v in tick() {
+    print(v)
+}
+
+print("=== 맵과 배열 순회 ===")
+func pairs(m) {
+    for k in keys(m) {
+        yield [k, m[k]]
+    }
+}
+for p in pairs({"x": 1, "y": 2}) {
+    print(p[0], p[1])
+}
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+단계별 실행 적합성 테스트
+목적: tests/와 examples/의 모든 .ml 프로그램과 transpile_conformance.py의 스코프/에러 프로그램을
+      단계별 실행 없이, 그리고 임계값 1(모든 함수를 첫 호출에 컴파일)로 실행해 비교
+기대 결과: 출력과 에러(메시지, 원본 줄 번호)가 모두 같고, 컴파일된 함수가 하나 이상 있음
+
+실행: python tests/tiering_conformance.py
+"""
+
+import glob
+import io
+import os
+import sys
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(TESTS_DIR, '..', 'src'))
+
+from lexer import tokenize
+from parser import parse
+from interpreter import Interpreter
+from runtime import RuntimeError as MiniLangRuntimeError
+from strings import PATTERN_CACHE
+from tiering import COMPILED, Tiering
+from transpile_conformance import ERROR_CASES, SCOPE_CASES
+
+
+def run(program, tiered: bool, script_path: str = None):
+    """(출력 줄들, 에러, 컴파일된 함수 수) 반환"""
+    interpreter = Interpreter(echo=False, tiering=tiered)
+    if tiered:
+        interpreter.tiering = Tiering(interpreter, threshold=1, background=False)
+    interpreter.script_path = script_path
+    sys.stdin = io.StringIO("")
+    PATTERN_CACHE.clear()
+    error = None
+    try:
+        interpreter.execute(program)
+    except MiniLangRuntimeError as e:
+        error = (e.message, e.line)
+    except Exception as e:
+        error = (f"{type(e).__name__}: {e}", None)
+    compiled = sum(1 for p in interpreter.tiering.profiles if p.state == COMPILED) if tiered else 0
+    return interpreter.output, error, compiled
+
+
+def compare(label: str, source: str, script_path: str = None) -> int:
+    """일치하면 컴파일된 함수 수, 다르면 -1"""
+    program = parse(tokenize(source))
+    expected = run(program, False, script_path)
+    actual = run(program, True, script_path)
+    ok = actual[:2] == expected[:2]
+    print(f"  [{'OK' if ok else 'FAIL'}] {label}: {len(expected[0])} lines, {actual[2]} functions compiled")
+    if not ok:
+        print(f"         tree-walking: {expected[:2]}")
+        print(f"         tiered:       {actual[:2]}")
+    return actual[2] if ok else -1
+
+
+def main() -> int:
+    stdin = sys.stdin
+    results = []
+    try:
+        print("=== 테스트/예제 프로그램 ===")
+        paths = sorted(glob.glob(os.path.join(TESTS_DIR, '*.ml')))
+        paths += sorted(glob.glob(os.path.join(TESTS_DIR, '..', 'examples', '*.ml')))
+        for path in paths:
+            with open(path, 'r', encoding='utf-8') as f:
+                results.append(compare(os.path.basename(path), f.read(), path))
+
+        print("=== 스코프와 에러 ===")
+        for label, source in {**SCOPE_CASES, **ERROR_CASES}.items():
+            results.append(compare(label, source))
+    finally:
+        sys.stdin = stdin
+    return 0 if min(results) >= 0 and sum(results) > 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+파이썬 변환 적합성 테스트
+목적: tests/와 examples/의 모든 .ml 프로그램, 그리고 에러가 나는 짧은 프로그램들을
+      인터프리터와 파이썬 변환(--transpile) 두 방식으로 실행해 비교
+      반복문 안에서 선언한 함수가 반복마다 따로 있는 변수를 붙잡으면 변환을 거부하는지 확인
+기대 결과: 출력과 에러(메시지, 원본 줄 번호)가 모두 같고, 같게 만들 수 없는 프로그램은 TranspileError
+
+실행: python tests/transpile_conformance.py
+"""
+
+import glob
+import io
+import os
+import sys
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(TESTS_DIR, '..', 'src'))
+
+from lexer import tokenize
+from parser import parse
+from interpreter import Interpreter
+from runtime import RuntimeError as MiniLangRuntimeError
+from strings import PATTERN_CACHE
+from transpiler import TranspileError, compile_program
+
+
+ERROR_CASES = {
+    "index out of bounds": "let a = [1, 2, 3]\nprint(a[1])\n\nprint(a[5])\n",
+    "division in function": "func f(x) {\n    return 10 / x\n}\nprint(f(2))\nprint(f(0))\n",
+    "modulo by zero": "let n = 5\nlet m = n % 0\n",
+    "arity": "func h(a, b) { return a }\nprint(h(1))\n",
+    "undefined": "let x = 1\nprint(x)\nprint(y)\n",
+    "undefined function": "print(1)\nmissing(2)\n",
+    "not a function": "let v = 3\nv(1)\n",
+    "key not found": 'let m = {"a": 1}\nprint(m["a"])\nprint(m["b"])\n',
+    "map key type": "let m = {}\n\nm[[1]] = 2\n",
+    "boolean map key": 'let m = {}\nm[1] = "one"\nprint(has(m, true))\nm[true] = "t"\n',
+    "boolean key in literal": 'let m = {1: "one", false: "f"}\n',
+    "iterate number": "for x in 5 {\n    print(x)\n}\n",
+    "slice bounds": 'let s = "hello"\nprint(s[1:3])\nprint(s[1.5:3])\n',
+    "compound divide": "let t = 4\nt /= 2\nprint(t)\nt /= 0\n",
+    "callback error": "func cmp(a, b) {\n    return a[0] - b\n}\nlet arr = [3, 1]\nsort(arr, cmp)\n",
+    "builtin error": 'let z = int("abc")\n',
+    "slice builtin indices": 'let a = [1, 2, 3]\nprint(slice(a, 1, null))\nprint(slice(a, 1.7))\n',
+    "slice builtin string index": 'print(slice("abc", "x", 2))\n',
+    "matrix row index": 'let m = matrix(2, 2)\nprint(row(m, 1))\nprint(row(m, 1.5))\n',
+    "matrix column index": 'let m = matrix(2, 2)\nprint(col(m, true))\n',
+}
+
+SCOPE_CASES = {
+    "shadowing": "let x = 1\nif true {\n    print(x)\n    let x = 2\n    print(x)\n}\nprint(x)\n",
+    "implicit global": "func g() { return later }\nlater = 7\nprint(g())\n",
+    "closure counter": (
+        "func make() {\n    let count = 0\n    func inc() { count += 1\n return count }\n    return inc\n}\n"
+        "let c = make()\nc()\nprint(c(), c)\n"
+    ),
+    "builtin shadow": "len = 4\nfunc k() { return len }\nprint(k(), type(len))\n",
+    "assignment expression": "print(x = 5, x)\nlet y = 0\nlet z = (y = y + 1) * 2\nprint(y, z)\n",
+    "continue in for": (
+        "let s = \"\"\nfor (let i = 0; i < 6; i += 1) {\n    if i % 2 == 0 { continue }\n    s += i\n}\nprint(s)\n"
+    ),
+}
+
+# 반복문 안의 클로저: 반복문 변수는 반복 사이에 공유되므로 변환 가능
+LOOP_CLOSURE_CASES = {
+    "for-in variable": (
+        "let fs = []\nfor y in [0, 2] {\n    func h() { return y }\n    push(fs, h)\n}\n"
+        "let a = fs[0]\nlet b = fs[1]\nprint(a(), b())\n"
+    ),
+    "loop body using outer names": (
+        "let base = 10\nlet fs = []\nfor x in [1, 2] {\n    func add(v) { return v + base }\n"
+        "    func fact(n) { if n <= 1 { return 1 }\n return n * fact(n - 1) }\n    push(fs, add(fact(x)))\n}\n"
+        "print(fs)\n"
+    ),
+}
+
+# 반복마다 새로 만들어지는 변수를 붙잡는 함수: (소스, 변수 이름, 함수 줄)
+PER_ITERATION_CASES = {
+    "let in for-in body": (
+        "let fs = []\nfor x in [0, 2] {\n    let j = x\n    func g() { return j }\n    push(fs, g)\n}\n"
+        "let a = fs[0]\nlet b = fs[1]\nprint(a(), b())\n", "j", 4
+    ),
+    "let in while body": (
+        "let n = 0\nwhile n < 3 {\n    let m = n\n    func w() { return m }\n    n += 2\n}\n", "m", 4
+    ),
+    "inner loop variable": (
+        "for a in [1, 2] {\n    for b in [3] {\n        func g() { return a + b }\n    }\n}\n", "b", 3
+    ),
+    "nested function": (
+        "for x in [1] {\n    if true {\n        let k = x\n        func outer() {\n"
+        "            func inner() { return k }\n            return inner\n        }\n    }\n}\n", "k", 4
+    ),
+}
+
+
+def run(program, transpiled: bool, script_path: str = None):
+    """(출력 줄들, 에러) 반환"""
+    interpreter = Interpreter(echo=False)
+    interpreter.script_path = script_path
+    sys.stdin = io.StringIO("")
+    PATTERN_CACHE.clear()  # 두 실행이 같은 캐시 통계를 보도록
+    error = None
+    try:
+        if transpiled:
+            compile_program(program, script_path).run(interpreter)
+        else:
+            interpreter.execute(program)
+    except MiniLangRuntimeError as e:
+        error = (e.message, e.line)
+    except Exception as e:
+        error = (f"{type(e).__name__}: {e}", None)
+    return interpreter.output, error
+
+
+def compare(label: str, source: str, script_path: str = None, expect_error: bool = False) -> bool:
+    program = parse(tokenize(source))
+    expected = run(program, False, script_path)
+    actual = run(program, True, script_path)
+    ok = actual == expected and (expected[1] is not None) == expect_error
+    status = "OK" if ok else "FAIL"
+    detail = f"{len(expected[0])} lines" + (f", {expected[1][0]} (line {expected[1][1]})" if expected[1] else "")
+    print(f"  [{status}] {label}: {detail}")
+    if not ok:
+        print(f"         interpreter: {expected}")
+        print(f"         transpiled:  {actual}")
+    return ok
+
+
+def refuses(label: str, source: str, name: str, line: int) -> bool:
+    try:
+        compile_program(parse(tokenize(source)))
+        detail = "transpiled without error"
+        ok = False
+    except TranspileError as e:
+        detail = f"line {e.line}: {e.message}"
+        ok = f"capture '{name}'" in e.message and e.line == line
+    print(f"  [{'OK' if ok else 'FAIL'}] {label}: {detail}")
+    return ok
+
+
+def main() -> int:
+    stdin = sys.stdin
+    passed = True
+    try:
+        print("=== 테스트/예제 프로그램 ===")
+        paths = sorted(glob.glob(os.path.join(TESTS_DIR, '*.ml')))
+        paths += sorted(glob.glob(os.path.join(TESTS_DIR, '..', 'examples', '*.ml')))
+        for path in paths:
+            with open(path, 'r', encoding='utf-8') as f:
+                passed &= compare(os.path.basename(path), f.read(), path)
+
+        print("=== 스코프 ===")
+        for label, source in SCOPE_CASES.items():
+            passed &= compare(label, source)
+
+        print("=== 반복문 안의 클로저 ===")
+        for label, source in LOOP_CLOSURE_CASES.items():
+            passed &= compare(label, source)
+        for label, (source, name, line) in PER_ITERATION_CASES.items():
+            passed &= refuses(label, source, name, line)
+
+        print("=== 에러와 줄 번호 ===")
+        for label, source in ERROR_CASES.items():
+            passed &= compare(label, source, expect_error=True)
+    finally:
+        sys.stdin = stdin
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+타입 추론 테스트
+목적: 1) tests/와 examples/의 모든 .ml 프로그램을 실행하면서 각 표현식이 실제로 낸 값의
+         타입이 추론한 타입에 들어가는지 확인 (추론이 틀리면 특수화한 코드가 잘못 동작함)
+      2) 짧은 프로그램에서 리터럴, 내장 함수, 대입, 호출 지점을 통한 추론 결과 확인
+기대 결과: 어긋나는 표현식이 없고, 기대한 타입이 모두 일치함
+
+실행: python tests/type_inference.py
+"""
+
+import glob
+import io
+import os
+import sys
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(TESTS_DIR, '..', 'src'))
+
+from lexer import tokenize
+from parser import parse
+from ast_nodes import Expression, FunctionDeclaration, VariableDeclaration
+from interpreter import Interpreter
+from runtime import RuntimeError as MiniLangRuntimeError, type_name
+from typeinfer import ANY, NUM, INT, FLOAT, infer_types
+
+
+class RecordingInterpreter(Interpreter):
+    """표현식마다 실제로 나온 값의 타입 이름을 기록"""
+
+    def __init__(self):
+        super().__init__(echo=False, tiering=False)
+        self.observed = {}
+
+    def visit(self, node):
+        value = super().visit(node)
+        if isinstance(node, Expression):
+            self.observed.setdefault(id(node), (node, set()))[1].add(type_name(value))
+        return value
+
+
+def admits(inferred: str, observed: str) -> bool:
+    if inferred == ANY or inferred == observed:
+        return True
+    return inferred == NUM and observed in (INT, FLOAT)
+
+
+def check_program(path: str) -> bool:
+    with open(path, 'r', encoding='utf-8') as f:
+        program = parse(tokenize(f.read()))
+    info = infer_types(program, path)
+    interpreter = RecordingInterpreter()
+    interpreter.script_path = path
+    sys.stdin = io.StringIO("")
+    try:
+        interpreter.execute(program)
+    except MiniLangRuntimeError:
+        pass
+    wrong = [
+        (node, info.type_of(node), observed)
+        for node, names in interpreter.observed.values()
+        for observed in names
+        if not admits(info.type_of(node), observed)
+    ]
+    typed, total, _, _ = info.coverage()
+    status = "OK" if not wrong else "FAIL"
+    print(f"  [{status}] {os.path.basename(path)}: {typed}/{total} expressions typed")
+    for node, inferred, observed in wrong[:5]:
+        print(f"         line {node.line}: {type(node).__name__} inferred {inferred}, saw {observed}")
+    return not wrong
+
+
+EXPECTED = '''
+func fib(n) {
+    if n < 2 { return n }
+    return fib(n - 1) + fib(n - 2)
+}
+func half(x) { return x / 2 }
+func greet(name) { return "hi " + name }
+func maybe(flag) {
+    if flag { return 1 }
+}
+func apply(f, v) { return f(v) }
+let a = fib(10)
+let b = half(a)
+let c = greet("kim")
+let d = len([1, 2]) * 3
+let e = 1
+e = 2.5
+let f = "x"
+f += 1
+let g = maybe(true)
+let h = apply(half, 4)
+let words = split("a b", " ")
+for k in range(3) { print(k) }
+'''
+
+# half는 값으로도 쓰이므로(apply(half, 4)) 호출 지점으로 매개변수를 추론하지 않고,
+# maybe는 return 없이 끝날 수 있으므로 결과가 정수 또는 null,
+# apply는 한 곳에서 직접 호출되므로 그 인자 타입을 받지만 f(v)의 결과는 알 수 없음
+EXPECTED_TYPES = {
+    'fib': 'func fib(n: integer) -> integer',
+    'half': 'func half(x: unknown) -> unknown',
+    'greet': 'func greet(name: string) -> string',
+    'maybe': 'func maybe(flag: boolean) -> unknown',
+    'apply': 'func apply(f: function, v: integer) -> unknown',
+    'a': 'integer', 'b': 'unknown', 'c': 'string', 'd': 'integer', 'e': 'number',
+    'f': 'string', 'g': 'unknown', 'h': 'unknown', 'words': 'array', 'k': 'integer',
+}
+
+
+def check_expected() -> bool:
+    program = parse(tokenize(EXPECTED))
+    info = infer_types(program)
+    actual = {}
+    for stmt in program.statements:
+        if isinstance(stmt, FunctionDeclaration):
+            function = info.function(stmt)
+            params = ", ".join(f"{p.name}: {p.type}" for p in function.parameters)
+            actual[stmt.name] = f"func {stmt.name}({params}) -> {function.type}"
+        elif isinstance(stmt, VariableDeclaration):
+            actual[stmt.name] = info.variable(stmt).type
+    actual['k'] = next(v.type for v in info.analyzer.variables if v.name == 'k')  # for-in 변수
+    passed = True
+    for name, expected in EXPECTED_TYPES.items():
+        ok = actual.get(name) == expected
+        passed &= ok
+        print(f"  [{'OK' if ok else 'FAIL'}] {name}: {actual.get(name)}" + ("" if ok else f" (expected {expected})"))
+    return passed
+
+
+def main() -> int:
+    stdin = sys.stdin
+    passed = True
+    try:
+        print("=== 실행 결과와 추론 비교 ===")
+        paths = sorted(glob.glob(os.path.join(TESTS_DIR, '*.ml')))
+        paths += sorted(glob.glob(os.path.join(TESTS_DIR, '..', 'examples', '*.ml')))
+        for path in paths:
+            passed &= check_program(path)
+    finally:
+        sys.stdin = stdin
+
+    print("=== 추론 결과 ===")
+    passed &= check_expected()
+    return 0 if passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())